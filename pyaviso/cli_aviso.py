@@ -7,11 +7,12 @@
 # nor does it submit to any jurisdiction.
 
 import functools
+import json
 import signal
 import sys
 import threading
 import time
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 import click
 
@@ -324,18 +325,33 @@ def value(parameters: str, configuration: conf.UserConfig):
 
 
 @click.command(context_settings=CONTEXT_SETTINGS)
-@click.argument("parameters", required=True)
+@click.argument("parameters", required=False)
 @user_config_setup
 @notification_server_setup
-def notify(parameters: str, configuration: conf.UserConfig):
+@click.option(
+    "--batch",
+    "batch",
+    type=click.File("r"),
+    help="File of notifications to submit, one JSON object per line. Use - to read from the standard input.",
+)
+def notify(parameters: str, configuration: conf.UserConfig, batch):
     """
     Create a notification with the parameters passed and submit it to the notification server
     :param parameters: key1=value1,key2=value2,...
     """
 
+    if parameters is None and batch is None:
+        raise click.UsageError("Missing argument 'PARAMETERS' or option '--batch'.")
+    if parameters is not None and batch is not None:
+        raise click.UsageError("Argument 'PARAMETERS' and option '--batch' are mutually exclusive.")
+
     try:
-        parsed_param = _parse_inline_params(parameters)
-        manager.notify(parsed_param, config=configuration)
+        if batch is not None:
+            n = manager.notify_many(_read_batch(batch), config=configuration)
+            logger.debug(f"{n} notifications submitted")
+        else:
+            parsed_param = _parse_inline_params(parameters)
+            manager.notify(parsed_param, config=configuration)
         print("Done")
 
     except KNOWN_EXCEPTION as e:
@@ -343,7 +359,7 @@ def notify(parameters: str, configuration: conf.UserConfig):
         logger.debug("", exc_info=True)
         sys.exit(-1)
     except Exception as e:
-        logger.error(f"Error occurred while notifying the notification {parameters}, " f"{e}")
+        logger.error(f"Error occurred while notifying the notification {parameters or batch.name}, " f"{e}")
         logger.debug("", exc_info=True)
         sys.exit(-1)
 
@@ -373,3 +389,23 @@ def _parse_inline_params(params: str) -> Dict[str, any]:
         parsed_param[pair[0]] = pair[1]
     logger.debug("Notification string successfully parsed")
     return parsed_param
+
+
+def _read_batch(batch) -> Iterator[Dict[str, any]]:
+    """
+    This helper method parses the notifications of a batch file, one JSON object per line. The lines are read lazily
+    so that the notifications can be streamed. The values are turned into strings like the inline parameters
+    :param batch: file object to read
+    :return: iterator of the notifications as dictionaries
+    """
+    logger.debug(f"Reading the notifications from {batch.name}...")
+    for number, line in enumerate(batch, start=1):
+        if line.strip() == "":
+            continue
+        try:
+            notification = json.loads(line)
+        except ValueError as e:
+            raise InvalidInputError(f"Wrong structure for the notification at line {number}, {e}")
+        if not isinstance(notification, dict):
+            raise InvalidInputError(f"Wrong structure for the notification at line {number}, it should be an object")
+        yield {k: v if isinstance(v, str) else json.dumps(v) for k, v in notification.items()}
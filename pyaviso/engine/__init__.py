@@ -6,7 +6,17 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
-__all__ = ["engine", "engine_factory", "etcd_grpc_engine", "etcd_rest_engine", "file_based_engine", "EngineType"]
+__all__ = [
+    "engine",
+    "engine_factory",
+    "etcd_async_engine",
+    "etcd_grpc_engine",
+    "etcd_rest_engine",
+    "file_based_engine",
+    "in_memory_engine",
+    "EngineType",
+    "LoadBalancing",
+]
 
 import importlib
 from enum import Enum
@@ -21,6 +31,7 @@ class EngineType(Enum):
     ETCD_GRPC = ("etcd_grpc_engine", "EtcdGrpcEngine")
     ETCD_REST = ("etcd_rest_engine", "EtcdRestEngine")
     FILE_BASED = ("file_based_engine", "FileBasedEngine")
+    IN_MEMORY = ("in_memory_engine", "InMemoryEngine")
 
     def __str__(self):
         return self.name.lower()
@@ -28,3 +39,12 @@ class EngineType(Enum):
     def get_class(self):
         module = importlib.import_module("pyaviso.engine." + self.value[0])
         return getattr(module, self.value[1])
+
+
+class LoadBalancing(Enum):
+    """
+    This Enum describes the strategies available to spread the read requests across the members of a cluster
+    """
+
+    ROUND_ROBIN = "round_robin"  # the members are used in turn
+    LEAST_LATENCY = "least_latency"  # the member responding faster is used
@@ -0,0 +1,260 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import itertools
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .. import logger
+from ..instrumentation import Stage, instrumentation
+from .checkpoint_store import checkpoint_name
+from .engine import Engine
+
+# function or coroutine function requesting a range of keys, as EtcdEngine._range
+RangeRequest = Callable[..., Tuple[List[Dict[str, any]], bool, int]]
+AsyncRangeRequest = Callable[..., Awaitable[Tuple[List[Dict[str, any]], bool, int]]]
+
+
+def prefix_range_end(path: any) -> bytes:
+    """
+    This function determines the end of the range required for a range call with the etcd3 API
+    By incrementing the last byte of the input path, it allows to make a range call describing the input
+    path as a branch rather than a leaf path.
+
+    :param path: the path representing the start of the range
+    :return: the path representing the end of the range
+    """
+    bytes_types = (bytes, bytearray)
+    if not isinstance(path, bytes_types):
+        if not isinstance(path, str):
+            path = str(path)
+        path = path.encode("utf-8")
+    s = bytearray(path)
+    # increment the last byte
+    s[-1] = s[-1] + 1
+    return bytes(s)
+
+
+class PagedRange:
+    """
+    This class holds the state of a prefix retrieved in pages of key-value pairs, sorted by key, each page starting
+    after the last key of the previous one. All the pages are read at the revision of the first one so that no change
+    is missed or repeated. It only defines the requests, these are sent by range_pages or range_pages_async.
+    """
+
+    def __init__(self, key: str, page_size: int, rev: int = None, serializable: bool = False):
+        """
+        :param key: prefix of the keys to retrieve
+        :param page_size: max number of key-value pairs per page
+        :param rev: revision to pull, the one of the first page if None
+        :param serializable: if True the first page is served by any member of the cluster
+        """
+        self.key = key
+        self.rev = rev
+        self.serializable = serializable
+        self.done = False
+        self._page_size = page_size
+        self._start_key = key
+        self._range_end = prefix_range_end(key)
+
+    def request(self) -> Dict[str, any]:
+        """
+        :return: the arguments of the range request of the next page
+        """
+        return {
+            "key": self._start_key,
+            "range_end": self._range_end,
+            "rev": self.rev,
+            "limit": self._page_size,
+            "sort_order": "ASCEND",
+            "serializable": self.serializable,
+        }
+
+    def received(self, kvs: List[Dict[str, any]], more: bool, revision: int) -> int:
+        """
+        This method moves the range after a page received
+        :param kvs: key-value pairs of the page
+        :param more: True if more pairs are in the range
+        :param revision: revision of the server when the page was served
+        :return: the revision the page is read at
+        """
+        if self.rev is None:  # the first page is served at the current revision
+            self.rev = revision
+            # the member serving the next pages may be behind this revision, they are read through the leader
+            self.serializable = False
+        if not more or len(kvs) == 0:
+            self.done = True
+        else:
+            logger.debug(f"More key-value pairs to pull for {self.key}, requesting the next page...")
+            # the next page starts just after the last key received
+            self._start_key = kvs[-1]["key"] + "\0"
+        return self.rev
+
+
+def range_pages(
+    range_request: RangeRequest, key: str, page_size: int, rev: int = None, serializable: bool = False, **filters
+) -> Iterator[Tuple[List[Dict[str, any]], int]]:
+    """
+    This function retrieves the key-value pairs starting with the key in pages, see PagedRange. The first page is
+    returned even if empty, so that the revision read is always known
+    :param range_request: function sending a range request, as EtcdEngine._range
+    :param key: prefix of the keys to retrieve
+    :param page_size: max number of key-value pairs per page
+    :param rev: revision to pull
+    :param serializable: if True the pages are served by any member of the cluster
+    :param filters: additional arguments of the range requests, as key_only, min_rev or max_rev
+    :return: Iterator of the pages of key-value pairs formatted as dictionary, each with the revision it is read at
+    """
+    paged_range = PagedRange(key, page_size, rev, serializable)
+    while not paged_range.done:
+        start = instrumentation.start()
+        kvs, more, revision = range_request(**paged_range.request(), **filters)
+        instrumentation.stop(Stage.RANGE, start)
+        yield kvs, paged_range.received(kvs, more, revision)
+
+
+async def range_pages_async(
+    range_request: AsyncRangeRequest,
+    key: str,
+    page_size: int,
+    rev: int = None,
+    serializable: bool = False,
+    **filters,
+) -> AsyncIterator[Tuple[List[Dict[str, any]], int]]:
+    """
+    This function is the asyncio variant of range_pages
+    :param range_request: coroutine function sending a range request, as EtcdAsyncEngine._range
+    :param key: prefix of the keys to retrieve
+    :param page_size: max number of key-value pairs per page
+    :param rev: revision to pull
+    :param serializable: if True the pages are served by any member of the cluster
+    :param filters: additional arguments of the range requests, as key_only, min_rev or max_rev
+    :return: Asynchronous iterator of the pages of key-value pairs, each with the revision it is read at
+    """
+    paged_range = PagedRange(key, page_size, rev, serializable)
+    while not paged_range.done:
+        start = instrumentation.start()
+        kvs, more, revision = await range_request(**paged_range.request(), **filters)
+        instrumentation.stop(Stage.RANGE, start)
+        yield kvs, paged_range.received(kvs, more, revision)
+
+
+def pages(kvs: Iterable[Dict[str, any]], page_size: int) -> Iterator[List[Dict[str, any]]]:
+    """
+    :param kvs: key-value pairs
+    :param page_size: max number of key-value pairs per page
+    :return: iterator of lists of at most page size key-value pairs
+    """
+    kvs = iter(kvs)
+    while True:
+        page = list(itertools.islice(kvs, page_size))
+        if len(page) == 0:
+            return
+        yield page
+
+
+async def pages_async(kvs: AsyncIterator[Dict[str, any]], page_size: int) -> AsyncIterator[List[Dict[str, any]]]:
+    """
+    :param kvs: key-value pairs
+    :param page_size: max number of key-value pairs per page
+    :return: asynchronous iterator of lists of at most page size key-value pairs
+    """
+    page = []
+    async for kv in kvs:
+        page.append(kv)
+        if len(page) == page_size:
+            yield page
+            page = []
+    if len(page) > 0:
+        yield page
+
+
+class ChangeTracker:
+    """
+    This class tracks the revision reached by the processing of the key-value pairs changed since the last revision
+    for a key listened. The pages are sorted by key, not by revision, so the revision reached is saved only once all
+    of them have been processed, otherwise an interruption would skip the changes of the pages not processed yet
+    """
+
+    def __init__(self, key: str, next_rev: int, listener: str = None):
+        """
+        :param key: key listened
+        :param next_rev: revision from which the changes have been requested
+        :param listener: name of the listener, see checkpoint_name
+        """
+        self.key = key
+        self.next_rev = next_rev
+        self.listener = listener
+        self._start_rev = next_rev
+
+    def page(self, kvs: List[Dict[str, any]]) -> Tuple[List[Dict[str, any]], Optional[Dict[int, float]]]:
+        """
+        This method reads a page of the key-value pairs changed. The status of the key is removed from the
+        notifications and the revision reached is moved after the remaining ones
+        :param kvs: key-value pairs changed
+        :return: the notifications, the submission time of their revisions if measuring their lag
+        """
+        # the status tells when the notifications have been submitted, only read if measuring their lag
+        submit_times = None
+        if instrumentation.enabled:
+            status = next((kv for kv in kvs if kv["key"] == self.key), None)
+            submit_times = Engine.submit_times(status) if status else None
+        # remove the status from the result
+        notifications = [kv for kv in kvs if kv["key"] != self.key]
+        for kv in notifications:
+            self.next_rev = max(self.next_rev, kv["mod_rev"] + 1)
+        return notifications, submit_times
+
+    @property
+    def changed(self) -> bool:
+        return self.next_rev != self._start_rev
+
+    def checkpoint(self, save: Callable[[str, int], any]) -> int:
+        """
+        This method saves the revision reached, if any change has been processed
+        :param save: function saving the revision under the name of the key and listener, as CheckpointStore.update
+        :return: the revision from which the next changes should be requested
+        """
+        if self.changed:
+            save(checkpoint_name(self.key, self.listener), self.next_rev)
+        return self.next_rev
+
+
+def deliveries(
+    notifications: List[Dict[str, any]], submit_times: Dict[int, float] = None, key: str = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    This function prepares the notifications for the callback, measuring their delivery if requested. The caller
+    triggers the callback for each key and value yielded, before requesting the next one
+    :param notifications: key-value pairs changed
+    :param submit_times: submission time of the revisions of the notifications, if measuring their lag
+    :param key: key listened
+    :return: iterator of the keys and values of the notifications
+    """
+    start = instrumentation.start()
+    for notification in notifications:
+        k = notification["key"]
+        logger.debug(f"Notification received for key {k}")
+        if submit_times is not None:
+            submit_time = submit_times.get(notification["mod_rev"])
+            instrumentation.lag(Stage.RECEIPT_LAG, submit_time, key)
+            instrumentation.delivering(submit_time, key)
+        yield k, notification["value"].decode()
+    if submit_times is not None:
+        instrumentation.delivering(None)
+    instrumentation.count(Stage.RECEIVED, len(notifications))
+    instrumentation.stop(Stage.DISPATCH, start)
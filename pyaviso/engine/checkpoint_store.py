@@ -0,0 +1,174 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import atexit
+import fcntl
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from .. import logger
+from .engine import DATE_FORMAT
+
+DEFAULT_CHECKPOINT_INTERVAL = 5  # seconds
+
+
+def checkpoint_name(key: str, listener: str = None) -> str:
+    """
+    This function names the revision saved for a key. Different listeners of the same key, possibly in different
+    processes, may have processed different revisions, so each of them saves its own
+    :param key: key listened
+    :param listener: name of the listener, if None the revision is shared by all the listeners of the key
+    :return: the name under which the last revision processed is saved
+    """
+    return key if listener is None else f"{listener}:{key}"
+
+
+class CheckpointStore:
+    """
+    This class holds the last revision processed for each key listened on a notification server. The revisions
+    updated are kept in memory and written together to a single file, at most once per interval and when flushed
+    explicitly. The file is replaced atomically and synced to disk so that it is never left partially written, and the
+    updates of concurrent processes are merged under a file lock.
+    """
+
+    def __init__(self, folder: str, server: str, interval: int = DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        :param folder: folder where the checkpoints are saved
+        :param server: identifier of the notification server, used as file name
+        :param interval: max number of seconds between an update and its writing to disk
+        """
+        self._folder = folder
+        self._path = os.path.join(folder, f"{server}.json")
+        self._interval = interval
+        # revisions updated and keys deleted not yet written to disk
+        self._pending: Dict[str, Dict[str, any]] = {}
+        self._deleted = set()
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        # the pending updates are not lost at the exit of the process
+        atexit.register(self.flush)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def get(self, key: str) -> int:
+        """
+        :param key: key listened
+        :return: the last revision saved for the key, or -1 if not available
+        """
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]["last_revision"]
+            if key in self._deleted:
+                return -1
+        checkpoint = self._read().get(key)
+        return checkpoint["last_revision"] if checkpoint else -1
+
+    def update(self, key: str, rev: int):
+        """
+        This method records the revision as the last processed for the key. This is written to disk within the interval
+        :param key: key listened
+        :param rev: last revision processed
+        """
+        with self._lock:
+            self._pending[key] = {"last_revision": rev, "date_time": datetime.utcnow().strftime(DATE_FORMAT)}
+            self._deleted.discard(key)
+            self._schedule()
+
+    def delete(self, key: str):
+        """
+        This method removes the revision saved for the key. This is written to disk within the interval
+        :param key: key listened
+        """
+        with self._lock:
+            self._pending.pop(key, None)
+            self._deleted.add(key)
+            self._schedule()
+
+    def _schedule(self):
+        # the lock must be held
+        if self._timer is None:
+            self._timer = threading.Timer(self._interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """
+        This method writes to disk the pending updates, merging them with the ones saved by other processes
+        :return: True if saved otherwise False
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if len(self._pending) == 0 and len(self._deleted) == 0:
+                return True
+            pending, deleted = self._pending, self._deleted
+            self._pending, self._deleted = {}, set()
+
+            try:
+                os.makedirs(self._folder, exist_ok=True)
+                # the lock file serialises the processes updating the checkpoints
+                with open(self._path + ".lock", "w") as lock_file:
+                    fcntl.lockf(lock_file, fcntl.LOCK_EX)
+                    checkpoints = self._read()
+                    for key in deleted:
+                        checkpoints.pop(key, None)
+                    for key, checkpoint in pending.items():
+                        # the revisions only move forward, a process behind does not overwrite the others
+                        if key not in checkpoints or checkpoints[key]["last_revision"] < checkpoint["last_revision"]:
+                            checkpoints[key] = checkpoint
+                    self._write(checkpoints)
+                    fcntl.lockf(lock_file, fcntl.LOCK_UN)
+                logger.debug(f"{len(pending)} last revisions saved to {self._path}")
+                return True
+            except Exception:
+                logger.warning(f"Saving of the last revisions has failed: {self._path}")
+                logger.debug("", exc_info=True)
+                # retry with the next flush, without overriding the newer updates
+                for key, checkpoint in pending.items():
+                    self._pending.setdefault(key, checkpoint)
+                self._deleted |= deleted - set(self._pending)
+                return False
+
+    def _read(self) -> Dict[str, Dict[str, any]]:
+        """
+        :return: the checkpoints saved on disk, by key
+        """
+        if not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Error occurred while reading the last revisions saved: {e}")
+            logger.debug("", exc_info=True)
+            return {}
+
+    def _write(self, checkpoints: Dict[str, Dict[str, any]]):
+        """
+        This method replaces the file of the checkpoints. The new content is synced to a temporary file that is then
+        renamed, so that the file is either the old or the new version after a crash
+        :param checkpoints: checkpoints to save, by key
+        """
+        tmp_path = f"{self._path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoints, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
+        # sync the folder to make the rename durable
+        dir_fd = os.open(self._folder, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -0,0 +1,214 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+from .. import logger
+from . import LoadBalancing
+from .retry_policy import CircuitBreaker
+
+LATENCY_SMOOTHING = 0.2  # weight of the last response time in the moving average
+
+
+def member_failed(status: int) -> bool:
+    """
+    :param status: HTTP status of a response
+    :return: True if the status reports a failure of the member, which may not affect the other members
+    """
+    return status == 408 or 500 <= status < 600
+
+
+class Endpoint:
+    """
+    This class holds the state of a member of the notification server cluster
+    """
+
+    def __init__(self, host: str, port: int, reset_timeout: float):
+        """
+        :param host: host of the member
+        :param port: port of the member
+        :param reset_timeout: number of seconds the member is avoided once found unreachable
+        """
+        self.host = host
+        self.port = port
+        # the member is avoided from the first connection failure
+        self.breaker = CircuitBreaker(str(self), threshold=1, reset_timeout=reset_timeout)
+        self.latency: Optional[float] = None  # moving average of the response time, in seconds
+
+    def __str__(self):
+        return f"{self.host}:{self.port}"
+
+    def available(self) -> bool:
+        # the state is only read, the trial request is taken when a request is actually sent
+        return self.breaker.remaining_time() == 0
+
+
+class EndpointPool:
+    """
+    This class holds the members of the notification server cluster an engine connects to. The read requests are
+    spread across the members, in turn or preferring the fastest one, while the write requests are sent to the member
+    that accepted the last one. The members found unreachable are tried last until their reset timeout expires.
+    """
+
+    def __init__(self, endpoints: List[Endpoint], load_balancing: LoadBalancing = LoadBalancing.ROUND_ROBIN):
+        """
+        :param endpoints: members of the cluster, the first one is the first to receive the write requests
+        :param load_balancing: strategy to spread the read requests across the members
+        """
+        assert len(endpoints) > 0, "At least one endpoint is required"
+        self._endpoints = endpoints
+        self._load_balancing = load_balancing
+        self._next_reader = 0
+        self._writer = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def from_config(
+        host: str,
+        port: int,
+        endpoints: Optional[List[str]],
+        load_balancing: Optional[LoadBalancing],
+        reset_timeout: float,
+    ) -> "EndpointPool":
+        """
+        :param host: host of the first member
+        :param port: port of the first member
+        :param endpoints: other members of the cluster, as host:port
+        :param load_balancing: strategy to spread the read requests across the members
+        :param reset_timeout: number of seconds a member is avoided once found unreachable
+        :return: the pool of the members, without duplicates
+        """
+        members = [f"{host}:{port}"]
+        for endpoint in endpoints or []:
+            if endpoint not in members:
+                members.append(endpoint)
+        pool = []
+        for member in members:
+            member_host, _, member_port = member.rpartition(":")
+            assert member_host != "" and member_port.isdigit(), f"Invalid endpoint {member}, expected host:port"
+            pool.append(Endpoint(member_host, int(member_port), reset_timeout))
+        return EndpointPool(pool, load_balancing if load_balancing else LoadBalancing.ROUND_ROBIN)
+
+    @property
+    def endpoints(self) -> List[Endpoint]:
+        return self._endpoints
+
+    def __str__(self):
+        return ", ".join(str(e) for e in self._endpoints)
+
+    def read_order(self) -> List[Endpoint]:
+        """
+        :return: the members in the order they should be tried for a read request
+        """
+        if len(self._endpoints) == 1:
+            return list(self._endpoints)
+        with self._lock:
+            if self._load_balancing == LoadBalancing.LEAST_LATENCY:
+                # the members never used are tried first to measure them
+                ordered = sorted(self._endpoints, key=lambda e: e.latency if e.latency is not None else 0)
+            else:
+                ordered = self._endpoints[self._next_reader :] + self._endpoints[: self._next_reader]
+                self._next_reader = (self._next_reader + 1) % len(self._endpoints)
+        return self._available_first(ordered)
+
+    def write_order(self) -> List[Endpoint]:
+        """
+        :return: the members in the order they should be tried for a write request
+        """
+        if len(self._endpoints) == 1:
+            return list(self._endpoints)
+        with self._lock:
+            ordered = self._endpoints[self._writer :] + self._endpoints[: self._writer]
+        return self._available_first(ordered)
+
+    def attempts(self, read: bool) -> Iterator[Tuple[Endpoint, Optional[Endpoint]]]:
+        """
+        This method defines the members to try for a request, in order. Each member is recorded as receiving the
+        request when returned, the caller moves to the next one only if the request could not be served
+        :param read: True if the request does not change the state of the server
+        :return: iterator of the members, each with the next one to try or None if it is the last one
+        """
+        endpoints = self.read_order() if read else self.write_order()
+        for i, endpoint in enumerate(endpoints):
+            self.sending(endpoint)
+            yield endpoint, endpoints[i + 1] if i < len(endpoints) - 1 else None
+
+    def unreachable(self, endpoint: Endpoint, next_endpoint: Optional[Endpoint], resend: bool, reason: any) -> bool:
+        """
+        This method records a member not reachable by a request
+        :param endpoint: member unreachable
+        :param next_endpoint: next member to try, if any
+        :param resend: True if the request can be sent to another member, as it does not change the state of the
+        server or it has not reached this member
+        :param reason: error raised by the request
+        :return: True if the request should move to the next member
+        """
+        self.failed(endpoint)
+        if next_endpoint is None or not resend:
+            return False
+        logger.debug(f"Member {endpoint} unreachable, {reason}, trying {next_endpoint}...")
+        return True
+
+    def responded(
+        self, endpoint: Endpoint, next_endpoint: Optional[Endpoint], status: int, latency: float, read: bool
+    ) -> bool:
+        """
+        This method records the response of a member to a request, failed if its status is a failure of the member
+        :param endpoint: member responding
+        :param next_endpoint: next member to try, if any
+        :param status: HTTP status of the response
+        :param latency: response time, in seconds
+        :param read: True if the request does not change the state of the server
+        :return: True if the request should move to the next member, only the read ones as the others may have been
+        already executed
+        """
+        if not member_failed(status):
+            self.succeeded(endpoint, latency, write=not read)
+            return False
+        self.failed(endpoint)
+        if next_endpoint is None or not read:
+            return False
+        logger.debug(f"Member {endpoint} failed with status {status}, trying {next_endpoint}...")
+        return True
+
+    def sending(self, endpoint: Endpoint):
+        """
+        This method records a request sent to a member, this is the trial one if the member is avoided and its reset
+        timeout has expired
+        :param endpoint: member receiving the request
+        """
+        endpoint.breaker.request_sent()
+
+    def succeeded(self, endpoint: Endpoint, latency: float, write: bool = False):
+        """
+        This method records a response of a member
+        :param endpoint: member responding
+        :param latency: response time, in seconds
+        :param write: True if the request was a write, the next ones are sent to the same member
+        """
+        endpoint.breaker.record_success()
+        with self._lock:
+            if endpoint.latency is None:
+                endpoint.latency = latency
+            else:
+                endpoint.latency = LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * endpoint.latency
+            if write:
+                self._writer = self._endpoints.index(endpoint)
+
+    def failed(self, endpoint: Endpoint):
+        """
+        This method records a failure of a member, unreachable or answering with an error status
+        :param endpoint: member failing
+        """
+        endpoint.breaker.record_failure()
+
+    @staticmethod
+    def _available_first(endpoints: List[Endpoint]) -> List[Endpoint]:
+        available = [e for e in endpoints if e.available()]
+        return available + [e for e in endpoints if e not in available]
@@ -11,9 +11,9 @@ import json
 import os
 import threading
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from queue import Queue
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 
 from .. import __version__, exit_channel, logger
 from ..authentication.auth import Auth
@@ -21,6 +21,8 @@ from ..user_config import EngineConfig
 from . import EngineType
 
 DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+# number of previous statuses of which the status keeps the revision and the submission date
+RECENT_STATUSES = 32
 
 
 class Engine(ABC):
@@ -89,6 +91,28 @@ class Engine(ABC):
         """
         pass
 
+    def pull_iter(
+        self,
+        key: str,
+        key_only: bool = False,
+        rev: int = None,
+        prefix: bool = True,
+        min_rev: int = None,
+        max_rev: int = None,
+    ) -> Iterator[Dict[str, any]]:
+        """
+        This method is the lazy variant of pull, the key-values are returned one by one and the specialisations can
+        retrieve them in pages to keep the memory bounded
+        :param key: input in the query
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param prefix: if true the function will retrieve all the KV pairs starting with the key passed
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :return: Iterator of key-value pairs formatted as dictionary
+        """
+        yield from self.pull(key, key_only=key_only, rev=rev, prefix=prefix, min_rev=min_rev, max_rev=max_rev)
+
     @abstractmethod
     def push(self, kvs: List[Dict[str, any]], ks_delete: List[str] = None, ttl: int = None) -> bool:
         """
@@ -118,6 +142,7 @@ class Engine(ABC):
         channel: Queue,
         from_date: datetime = None,
         to_date: datetime = None,
+        listener: str = None,
     ):
         """
         This method implements the active polling
@@ -126,12 +151,18 @@ class Engine(ABC):
         :param channel: global communication channel among threads
         :param from_date: date from when to request notifications, if None it will be from now
         :param to_date: date until when to request notifications, if None it will be until now
+        :param listener: name of the listener, the last revision processed is saved separately for each listener
         :return:
         """
         pass
 
     def listen(
-        self, keys: List[str], callback: callable([str, str]), from_date: datetime = None, to_date: datetime = None
+        self,
+        keys: List[str],
+        callback: callable([str, str]),
+        from_date: datetime = None,
+        to_date: datetime = None,
+        listener: str = None,
     ) -> bool:
         """
         This method allows to listen for changes to specific keys. Note that the key is always considered as a prefix.
@@ -142,13 +173,16 @@ class Engine(ABC):
         :param callback: function to trigger in case of changes
         :param from_date: date from when to request notifications, if None it will be from now
         :param to_date: date until when to request notifications, if None it will be until now
+        :param listener: name of the listener, the last revision processed is saved separately for each listener
         :return: True if the listener is in execution, False otherwise
         """
         logger.debug("Calling listen...")
         for key in keys:
             try:
                 # create a background thread for the polling
-                t = threading.Thread(target=self._polling, args=(key, callback, exit_channel, from_date, to_date))
+                t = threading.Thread(
+                    target=self._polling, args=(key, callback, exit_channel, from_date, to_date, listener)
+                )
                 t.setDaemon(True)
                 # adding the thread to the global list
                 logger.debug(f"Starting thread to listen to {key}")
@@ -207,21 +241,8 @@ class Engine(ABC):
         :param ttl: time to leave of the keys pushed, once expired the keys will be deleted
         :return: True if successful
         """
-        # create the status payload
-        status = {
-            "etcd_user": self.auth.username,
-            "message": message,
-            "unix_user": getpass.getuser(),
-            "aviso_version": __version__,
-            "engine": self._engine_type.name,
-            "hostname": os.uname().nodename,
-            "date_time": datetime.utcnow().strftime(DATE_FORMAT),
-        }
-
-        # update the status with the revision of the current status. This helps creating a linked list
-        old_status_kvs = self.pull(base_key, prefix=False)
-        if len(old_status_kvs) == 1:
-            self._status_as_linked_list(status, old_status_kvs)
+        # create the status payload, linked to the current status
+        status = self.build_status(message, self.pull(base_key, prefix=False))
 
         status_kv = {"key": base_key, "value": json.dumps(status)}  # push it as a json
         kvs.append(status_kv)
@@ -233,6 +254,33 @@ class Engine(ABC):
 
         return self.push(kvs, ks_delete, ttl)
 
+    def build_status(self, message: str, old_status_kvs: List[Dict[str, any]]) -> Dict[str, any]:
+        """
+        :param message: message to be part of the status update
+        :param old_status_kvs: current status of the base key, as list of at most one key-value pair
+        :return: the status payload to push to the base key
+        """
+        status = self._new_status(message)
+        # update the status with the revision of the current status. This helps creating a linked list
+        if len(old_status_kvs) == 1:
+            self._status_as_linked_list(status, old_status_kvs)
+        return status
+
+    def _new_status(self, message: str) -> Dict[str, any]:
+        """
+        :param message: message to be part of the status update
+        :return: the status payload to push to the base key, not yet linked to the previous status
+        """
+        return {
+            "etcd_user": self.auth.username,
+            "message": message,
+            "unix_user": getpass.getuser(),
+            "aviso_version": __version__,
+            "engine": self._engine_type.name,
+            "hostname": os.uname().nodename,
+            "date_time": datetime.utcnow().strftime(DATE_FORMAT),
+        }
+
     def _status_as_linked_list(self, new_status, old_status_kvs):
         if "mod_rev" in old_status_kvs[0]:  # test engine does not have it
             new_status["prev_rev"] = old_status_kvs[0]["mod_rev"]
@@ -251,6 +299,48 @@ class Engine(ABC):
                 # new day -> use the previous status as last_prev_day
                 new_status["last_prev_day_rev"] = new_status["prev_rev"]
 
+            # update the status with the skip revisions. The one of level i points to the last status with sequence
+            # number multiple of 2^i, this allows searching the history in a logarithmic number of requests
+            old_seq = old_status.get("seq", 0)
+            old_skip_revs = old_status.get("skip_revs", [])
+            new_status["seq"] = old_seq + 1
+            skip_revs = []
+            level = 0
+            while 2**level <= new_status["seq"]:
+                if old_seq % 2**level == 0:
+                    skip_revs.append([new_status["prev_rev"], old_status["date_time"]])
+                elif level < len(old_skip_revs):
+                    skip_revs.append(old_skip_revs[level])
+                else:  # the previous status was created without this level
+                    break
+                level += 1
+            new_status["skip_revs"] = skip_revs
+
+            # update the status with revision and date of the last statuses, so that the listeners can find when each
+            # notification retrieved with it has been submitted
+            recent_revs = [[new_status["prev_rev"], old_status["date_time"]]] + old_status.get("recent_revs", [])
+            new_status["recent_revs"] = recent_revs[:RECENT_STATUSES]
+
+    @staticmethod
+    def submit_times(status_kv: Dict[str, any]) -> Optional[Dict[int, float]]:
+        """
+        :param status_kv: status of a base key, as key-value pair with its revision
+        :return: the submission time, as UNIX timestamp, of the revisions of the status and of the previous statuses
+        it keeps. None if the status cannot be read
+        """
+
+        def timestamp(date_time: str) -> float:
+            return datetime.strptime(date_time, DATE_FORMAT).replace(tzinfo=timezone.utc).timestamp()
+
+        try:
+            status = json.loads(status_kv["value"].decode())
+            submit_times = {rev: timestamp(date_time) for rev, date_time in status.get("recent_revs", [])}
+            submit_times[status_kv["mod_rev"]] = timestamp(status["date_time"])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Status of {status_kv.get('key')} not readable, {e}")
+            return None
+        return submit_times
+
     def _add_listener(self, key: str):
         with self._listeners_lock:
             self._listeners.append(key)
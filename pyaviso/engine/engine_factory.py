@@ -6,6 +6,8 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import importlib
+
 from .. import logger
 from ..authentication.auth import Auth
 from ..custom_exceptions import EngineException
@@ -48,6 +50,9 @@ class EngineFactory:
         elif self._conf.type == EngineType.FILE_BASED:
             # connect to the test file based server
             logger.debug("Setting up file-based test engine")
+        elif self._conf.type == EngineType.IN_MEMORY:
+            # store the notifications in this process
+            logger.debug(f"Setting up in-memory engine {self._conf.host}:{self._conf.port}")
         else:
             raise EngineException(f"Configuration error - Engine: {self._conf.type} is not recognised")
 
@@ -58,3 +63,25 @@ class EngineFactory:
             return engine_class(config=self._conf, auth=self._auth)
         except Exception as e:
             raise EngineException(f"Error in creating the engine {engine_class.__name__}: {e}")
+
+    def create_async_engine(self):
+        """
+        The asyncio engine always connects to the etcd server via the gRPC gateway, served by etcd on the same port as
+        gRPC, so the etcd_grpc engine type is accepted but its requests go through the gateway as for etcd_rest
+        :return: an instance of the asyncio engine, connecting to the etcd server via the gRPC gateway
+        """
+        if self._conf.type not in [EngineType.ETCD_REST, EngineType.ETCD_GRPC]:
+            raise EngineException(
+                f"Configuration error - Engine: {self._conf.type} is not supported by the asyncio API"
+            )
+        if self._conf.type == EngineType.ETCD_GRPC:
+            logger.info("The asyncio API connects to the etcd server via the gRPC gateway instead of gRPC")
+        logger.debug(
+            f"Setting up asyncio REST interface to connect to the etcd server " f"{self._conf.host}:{self._conf.port}"
+        )
+        # the module is imported only when required as it depends on the optional aiohttp
+        engine_class = importlib.import_module("pyaviso.engine.etcd_async_engine").EtcdAsyncEngine
+        try:
+            return engine_class(config=self._conf, auth=self._auth)
+        except Exception as e:
+            raise EngineException(f"Error in creating the engine {engine_class.__name__}: {e}")
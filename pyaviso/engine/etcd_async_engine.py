@@ -0,0 +1,796 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import asyncio
+import codecs
+import inspect
+import json
+import time
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Tuple
+
+from .. import logger
+from ..authentication.auth import Auth
+from ..authentication.etcd_auth import EtcdAuth
+from ..custom_exceptions import EngineException, EngineHistoryNotAvailableError
+from ..instrumentation import Stage, instrumentation
+from ..user_config import EngineConfig
+from . import EngineType
+from .changes import (
+    ChangeTracker,
+    deliveries,
+    pages_async,
+    prefix_range_end,
+    range_pages_async,
+)
+from .etcd_engine import MAX_KV_RETURNED
+from .etcd_gateway import (
+    api_url,
+    decode_buffer,
+    encode,
+    history_not_available,
+    parse_kv,
+    parse_range,
+    range_body,
+    retry_status,
+    watch_kvs,
+)
+from .etcd_rest_engine import EtcdRestEngine
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, only required by the asyncio API
+    aiohttp = None
+
+DEFAULT_POOL_SIZE = 100
+
+
+class EtcdAsyncEngine:
+    """
+    This class is the asyncio counterpart of the EtcdRestEngine. It connects to a etcd3 server via the gRPC gateway by
+    relying on the aiohttp library, so that all its operations and the listening of any number of keys run as
+    coroutines on a single event loop, without any thread. The state saved locally and the search of the history of
+    the statuses are shared with an EtcdRestEngine created with the same configuration.
+    """
+
+    def __init__(self, config: EngineConfig, auth: Auth):
+        if aiohttp is None:
+            raise EngineException(
+                "aiohttp is required by the asyncio engine, install it with pip install pyaviso[async]"
+            )
+        # the REST engine provides the local state, the authentication token and the history search
+        self._rest = EtcdRestEngine(config, auth)
+        self._base_url = api_url(self._rest.endpoints.endpoints[0], self.https)
+        self._page_size = config.page_size if config.page_size else MAX_KV_RETURNED
+        self._pool_size = config.pool_size if config.pool_size else DEFAULT_POOL_SIZE
+        self._keep_alive = config.keep_alive is not False
+        self.timeout = config.timeout
+        self.watch = config.watch
+        self.serializable_reads = config.serializable_reads
+        self.automatic_retry_delay = config.automatic_retry_delay
+        # the sessions and the lock are bound to the event loop, they are created at the first request
+        self._session = None
+        self._stream_session = None
+        self._token_lock = None
+        # listening tasks, by callback
+        self._tasks: Dict[callable, List[asyncio.Future]] = {}
+
+    @property
+    def engine_type(self) -> EngineType:
+        return self._rest.engine_type
+
+    @property
+    def host(self) -> str:
+        return self._rest.host
+
+    @property
+    def port(self) -> int:
+        return self._rest.port
+
+    @property
+    def auth(self) -> Auth:
+        return self._rest.auth
+
+    @property
+    def https(self) -> bool:
+        return self._rest.https
+
+    @property
+    def catchup(self) -> bool:
+        return self._rest.catchup
+
+    @catchup.setter
+    def catchup(self, catchup: bool):
+        self._rest.catchup = catchup
+
+    def _get_session(self, stream: bool = False):
+        """
+        Internal method to retrieve the HTTP session shared by the requests of this engine, this is created in the
+        current event loop if not already available. The watch streams hold their connection as long as they are open,
+        they use a separate session without limit so that they do not starve the other requests
+        :param stream: if True the session for the watch streams is returned
+        :return: the session
+        """
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        if stream:
+            if self._stream_session is None or self._stream_session.closed:
+                self._stream_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+            return self._stream_session
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._pool_size, force_close=not self._keep_alive)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def close(self):
+        """
+        This method stops all the listening tasks and closes the connections to the server
+        """
+        await self.stop()
+        self._rest.checkpoints.flush()
+        for session in [self._session, self._stream_session]:
+            if session is not None:
+                await session.close()
+        self._session = None
+        self._stream_session = None
+
+    async def pull(
+        self,
+        key: str,
+        key_only: bool = False,
+        rev: int = None,
+        prefix: bool = True,
+        min_rev: int = None,
+        max_rev: int = None,
+    ) -> List[Dict[str, any]]:
+        """
+        This method implements a query to the notification server for all the key-values associated to the key as input.
+        This key by default is a prefix, it can therefore return a set of key-values
+        :param key: input in the query
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param prefix: if true the function will retrieve all the KV pairs starting with the key passed
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :return: List of key-value pairs formatted as dictionary
+        """
+        logger.debug(f"Calling pull for {key}...")
+
+        # determine the range_end
+        range_end = prefix_range_end(key) if prefix else None
+
+        new_kvs, _, _ = await self._range(key, range_end, key_only=key_only, rev=rev, min_rev=min_rev, max_rev=max_rev)
+        return new_kvs
+
+    async def pull_iter(
+        self,
+        key: str,
+        key_only: bool = False,
+        rev: int = None,
+        prefix: bool = True,
+        min_rev: int = None,
+        max_rev: int = None,
+        serializable: bool = False,
+    ) -> AsyncIterator[Dict[str, any]]:
+        """
+        This method is the lazy variant of pull. The key-values are retrieved in pages of page size pairs, sorted by
+        key, each page starting after the last key of the previous one. All the pages are read at the revision of the
+        first one so that no change is missed or repeated.
+        :param key: input in the query
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param prefix: if true the function will retrieve all the KV pairs starting with the key passed
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :param serializable: if True the pages are served by any member of the cluster, see _range
+        :return: Asynchronous iterator of key-value pairs formatted as dictionary
+        """
+        if not prefix:
+            for kv in await self.pull(key, key_only=key_only, rev=rev, prefix=False, min_rev=min_rev, max_rev=max_rev):
+                yield kv
+            return
+
+        async for kvs, _ in range_pages_async(
+            self._range,
+            key,
+            self._page_size,
+            rev=rev,
+            serializable=serializable,
+            key_only=key_only,
+            min_rev=min_rev,
+            max_rev=max_rev,
+        ):
+            for kv in kvs:
+                yield kv
+
+    async def _range(
+        self,
+        key: str,
+        range_end: bytes = None,
+        key_only: bool = False,
+        rev: int = None,
+        min_rev: int = None,
+        max_rev: int = None,
+        limit: int = MAX_KV_RETURNED,
+        sort_order: str = "DESCEND",
+        serializable: bool = False,
+    ) -> Tuple[List[Dict[str, any]], bool, int]:
+        """
+        This method implements a range request to the notification server, sorted by key
+        :param key: first key of the range
+        :param range_end: end of the range, excluded, if None only the key is requested
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :param limit: max number of key-value pairs to return
+        :param sort_order: ASCEND or DESCEND
+        :param serializable: if True the request is served by the member receiving it, without going through the
+        leader, so it may not reflect the latest changes
+        :return: List of key-value pairs formatted as dictionary, True if more pairs are in the range, revision of
+        the server when the request was served
+        """
+        # create the body for the get range on the etcd sever
+        body = range_body(key, range_end, key_only, rev, min_rev, max_rev, limit, sort_order, serializable)
+        logger.debug(f"Pull request: {body}")
+        resp_body = await self._call("kv/range", body, f"pull key {key}", retry=True, read=True)
+        logger.debug(f"Query for {key} completed")
+
+        # parse the result to return just key-value pairs
+        return parse_range(resp_body, key_only)
+
+    async def push(self, kvs: List[Dict[str, any]], ks_delete: List[str] = None, ttl: int = None) -> bool:
+        """
+        Method to submit a list of key-value pairs and delete a list of keys from the server as a single transaction
+        :param kvs: List of KV pair
+        :param ks_delete: List of keys to delete before the push of the new ones. Note that each key is read as a folder
+        :param ttl: time to leave of the keys pushed, once expired the keys will be deleted
+        :return: True if successful
+        """
+        logger.debug("Calling push...")
+
+        # check if we need to request a lease for the ttl
+        lease = await self._lease(ttl) if ttl else None
+
+        logger.debug("Preparing the transaction statement")
+        ops = []
+        # first delete the keys requested
+        for kd in ks_delete or []:
+            # every key is deleted with prefix=True
+            range_end = encode(prefix_range_end(kd))
+            ops.append({"requestDeleteRange": {"key": encode(kd), "range_end": range_end}})
+
+        # Prepare the transaction with a put operation for each KV pair
+        for kv in kvs:
+            put = {
+                "key": encode(kv["key"]),
+                "value": encode(kv["value"]),
+            }
+            if lease:
+                put["lease"] = lease
+            ops.append({"requestPut": put})
+
+        resp_body = await self._call("kv/txn", {"success": ops}, "execute the transaction")
+        logger.debug("Transaction completed")
+        if "header" in resp_body:
+            logger.debug(f"New server revision {resp_body['header']['revision']}")
+        return True
+
+    async def push_with_status(
+        self,
+        kvs: List[Dict[str, any]],
+        base_key: str,
+        message: str = "",
+        admin_key: str = None,
+        ks_delete: List[str] = None,
+        ttl: int = None,
+    ) -> bool:
+        """
+        Method to submit a list of key-value pairs and delete a list of keys from the server as a
+        single transaction. This method also updates the status of the base key.
+        :param kvs: List of KV pair
+        :param base_key: base key where to push the status
+        :param message: message to be part of the status update
+        :param admin_key: admin key to push together with the status
+        :param ks_delete: List of keys to delete before the push of the new ones. Note that each key is read as a folder
+        :param ttl: time to leave of the keys pushed, once expired the keys will be deleted
+        :return: True if successful
+        """
+        # create the status payload, linked to the current status
+        status = self._rest.build_status(message, await self.pull(base_key, prefix=False))
+
+        kvs.append({"key": base_key, "value": json.dumps(status)})
+        if admin_key:
+            kvs.append({"key": admin_key, "value": "None"})
+
+        return await self.push(kvs, ks_delete, ttl)
+
+    async def delete(self, key: str, prefix: bool = True) -> List[Dict[str, bytes]]:
+        """
+        This method deletes all the keys associated to this key, the key is a prefix as default
+        :param key: key prefix to delete
+        :param prefix: if true the function will delete all the KV pairs starting with the key passed
+        :return: kvs deleted
+        """
+        logger.debug(f"Calling delete for {key}...")
+
+        range_end = encode(prefix_range_end(key)) if prefix else None
+        body = {"key": encode(key), "range_end": range_end, "prev_kv": True}
+        resp_body = await self._call("kv/deleterange", body, f"delete key {key}")
+        logger.debug(f"Delete request for key {key} completed")
+
+        return [parse_kv(kv) for kv in resp_body.get("prev_kvs", [])]
+
+    async def _latest_revision(self, key: str) -> int:
+        """
+        :param: key used for the server request
+        :return: latest revision of the notification server.
+        """
+        logger.debug("Querying notification server for latest revision")
+
+        # we need just the header back from the server
+        body = {"key": encode(key), "keys_only": True}
+        resp_body = await self._call("kv/range", body, "request latest revision", retry=True, read=True)
+        if "header" not in resp_body:
+            raise EngineException("Error in reading server revision. Response does not contain header")
+        rev = int(resp_body["header"]["revision"])
+        logger.debug(f"Latest revision {rev}")
+        return rev
+
+    async def _lease(self, ttl) -> str:
+        """
+        This method requests a Lease for the TTL specified
+        :param ttl: Lease TTL
+        :return: lease id
+        """
+        logger.debug(f"Calling lease for ttl {ttl}...")
+
+        resp_body = await self._call("lease/grant", {"TTL": ttl, "ID": 0}, "request a lease")
+        if "ID" not in resp_body:
+            logger.error(f"Not able to read lease id from {resp_body}")
+            raise EngineException("Not able to acquire lease")
+        logger.debug(f"Lease {resp_body.get('ID')} acquired")
+        return resp_body.get("ID")
+
+    async def _call(
+        self, path: str, body: Dict[str, any], action: str, retry: bool = False, read: bool = False
+    ) -> Dict[str, any]:
+        """
+        Internal method to send a request to the server and read its response. If requested, the request is retried
+        as long as the server is unreachable, within the retry budget, otherwise it fails immediately if the server is
+        unreachable
+        :param path: path of the request, relative to the API root
+        :param body: body of the request
+        :param action: description of the request, used for the errors
+        :param retry: if True the request is sent again in case of connection errors
+        :param read: True if the request does not change the state of the server
+        :return: the body of the response as dictionary
+        """
+        policy = self._rest.retry_policy
+        if not retry:
+            policy.check(action)
+        operation_retry = policy.start(action)
+        while True:
+            if retry:
+                await operation_retry.wait_async()
+            try:
+                async with await self._post(path, body, read=read) as resp:
+                    status = resp.status
+                    content = await resp.text()
+                    url = resp.url
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                if not retry:
+                    policy.breaker.record_failure()
+                    raise EngineException(f"Not able to {action}, {str(err)}")
+                logger.debug(f"Not able to {action}, {str(err)}, trying again...")
+                await asyncio.sleep(operation_retry.failed(f"Unable to connect to {self._rest.endpoints}"))
+                continue
+
+            if retry and retry_status(status):
+                logger.debug(f"Not able to {action}, status {status}, trying again...")
+                await asyncio.sleep(operation_retry.failed(f"Unable to connect to {url}"))
+                continue
+            operation_retry.succeeded()
+            if history_not_available(status, content):
+                raise EngineHistoryNotAvailableError()
+            elif status != 200:
+                raise EngineException(f"Not able to {action}, status {status}, {content}")
+
+            return json.loads(content)
+
+    async def _post(
+        self, path: str, body: Dict[str, any], read: bool = False, stream: bool = False, **kwargs
+    ) -> "aiohttp.ClientResponse":
+        """
+        Internal method to send a request to the server with the authentication header. The members of the cluster are
+        tried in the order defined by the endpoint pool of the REST engine: the read requests move to the next member
+        if one is unreachable or failing, the write requests only if the connection could not be established
+        :param path: path of the request, relative to the API root
+        :param body: body of the request
+        :param read: True if the request does not change the state of the server
+        :param stream: if True the request opens a stream
+        :param kwargs: additional arguments for the request, as timeout
+        :return: the response of the server, to release once read
+        """
+        pool = self._rest.endpoints
+        for endpoint, next_endpoint in pool.attempts(read):
+            start = time.time()
+            try:
+                resp = await self._post_to(api_url(endpoint, self.https), path, body, stream, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+                # the connector errors are raised before the request is sent
+                if not pool.unreachable(
+                    endpoint, next_endpoint, read or isinstance(err, aiohttp.ClientConnectorError), err
+                ):
+                    raise
+                continue
+            if pool.responded(endpoint, next_endpoint, resp.status, time.time() - start, read):
+                resp.release()
+                continue
+            return resp
+
+    async def _post_to(
+        self, base_url: str, path: str, body: Dict[str, any], stream: bool = False, **kwargs
+    ) -> "aiohttp.ClientResponse":
+        """
+        Internal method to send a request to a member of the cluster. If the member rejects the token, this is renewed
+        and the request sent once more
+        :param base_url: API root of the member
+        :param path: path of the request, relative to the API root
+        :param body: body of the request
+        :param stream: if True the request opens a stream
+        :param kwargs: additional arguments for the request
+        :return: the response of the member, to release once read
+        """
+        session = self._get_session(stream)
+        # first authenticate and use the token for the header
+        await self._authenticate(base_url)
+        header = self.auth.header()
+        resp = await session.post(base_url + path, json=body, headers=header, **kwargs)
+        if resp.status == 401 and isinstance(self.auth, EtcdAuth):
+            logger.debug(f"Authentication token of user {self.auth.username} rejected, authenticating again...")
+            resp.release()
+            await self._authenticate(base_url, invalid_token=header.get("Authorization"))
+            resp = await session.post(base_url + path, json=body, headers=self.auth.header(), **kwargs)
+        return resp
+
+    async def _authenticate(self, base_url: str = None, invalid_token: str = None) -> bool:
+        """
+        This method authenticates  the user and set the internal token, this is only done for Etcd authentication.
+        The token is shared with the REST engine and it is renewed only if expired or rejected by the server
+        :param base_url: API root of the member of the cluster to authenticate with, the first one if None
+        :param invalid_token: token rejected by the server, if any
+        :return: True if successfully authenticated
+        """
+        if isinstance(self.auth, EtcdAuth):
+            if self._rest.token.valid(invalid_token):
+                return True
+            # only one coroutine renews the token, the others wait for it and then use the new one
+            async with self._token_lock:
+                if self._rest.token.valid(invalid_token):
+                    return True
+                logger.debug(f"Authenticating user {self.auth.username}...")
+
+                url = (base_url if base_url else self._base_url) + "auth/authenticate"
+                try:
+                    async with self._get_session().post(url, json=self._rest.token.request()) as resp:
+                        resp.raise_for_status()
+                        resp_body = await resp.json(content_type=None)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                    raise EngineException(f"Not able to authenticate {self.auth.username}, {str(err)}")
+                assert resp_body.get("token") is not None, "No token found in authentication response"
+                self._rest.token.update(resp_body["token"])
+
+                logger.debug(f"User {self.auth.username} successfully authenticated")
+
+        return True
+
+    async def listen(
+        self,
+        keys: List[str],
+        callback: callable([str, str]),
+        from_date: datetime = None,
+        to_date: datetime = None,
+        listener: str = None,
+    ) -> bool:
+        """
+        This method allows to listen for changes to specific keys. Note that the key is always considered as a prefix.
+        The listening of each key is implemented with a task of the current event loop. The callback can be a
+        coroutine function, in which case it is awaited.
+
+        :param keys: keys to watch
+        :param callback: function to trigger in case of changes
+        :param from_date: date from when to request notifications, if None it will be from now
+        :param to_date: date until when to request notifications, if None it will be until now
+        :param listener: name of the listener, the last revision processed is saved separately for each listener
+        :return: True if the listener is in execution, False otherwise
+        """
+        logger.debug("Calling listen...")
+        for key in keys:
+            logger.debug(f"Starting task to listen to {key}")
+            task = asyncio.ensure_future(self._polling(key, callback, from_date, to_date, listener))
+            self._tasks.setdefault(callback, []).append(task)
+        return True
+
+    async def stop(self, callback: callable([str, str]) = None) -> bool:
+        """
+        This method is used to stop the listening tasks of a callback. If no callback is provided all the listening
+        tasks will be stopped
+
+        :param callback: the callback passed to listen
+        :return: True if the listener is cancelled, False otherwise
+        """
+        logger.debug("Calling stop...")
+        if callback is None:
+            tasks = [t for c_tasks in self._tasks.values() for t in c_tasks]
+            self._tasks.clear()
+        elif callback in self._tasks:
+            tasks = self._tasks.pop(callback)
+        else:
+            logger.debug(f"Cannot find listening of callback {callback}")
+            return False
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return True
+
+    async def wait(self) -> bool:
+        """
+        This method waits for all the listening tasks to terminate. This happens when they are stopped or, if an end
+        date was requested, when all the past notifications have been retrieved
+        :return: True if all the tasks terminated successfully, False otherwise
+        """
+        tasks = [t for c_tasks in self._tasks.values() for t in c_tasks]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return all(r is True or isinstance(r, asyncio.CancelledError) for r in results)
+
+    async def _polling(
+        self,
+        key: str,
+        callback: callable([str, str]),
+        from_date: datetime = None,
+        to_date: datetime = None,
+        listener: str = None,
+    ) -> bool:
+        """
+        This method implements the active polling, or the watching if requested
+        :param key: key to watch as a prefix
+        :param callback: function to call if any change happen
+        :param from_date: date from when to request notifications, if None it will be from now
+        :param to_date: date until when to request notifications, if None it will be until now
+        :param listener: name of the listener, see checkpoint_name
+        :return: True if the listening completed successfully, False otherwise
+        """
+        try:
+            # initialise the revisions
+            final_rev = None
+
+            # check start date
+            if from_date is None:  # no start date defined
+                next_rev = await self._initial_revision(key, listener)
+
+            else:  # start date defined
+                logger.info("Searching for past notifications...")
+                # the search walks the status history with the REST engine, sharing its cache, in a worker thread
+                next_rev, final_rev = await asyncio.get_running_loop().run_in_executor(
+                    None, self._rest.from_to_revisions, key, from_date, to_date
+                )
+                if next_rev == -1 and final_rev == -1:
+                    logger.warning("No history available in the time period selected")
+                    return True
+                elif next_rev:
+                    logger.info("Search completed, retrieving...")
+                else:
+                    logger.error("Error in one of the listening process")
+                    return False
+
+            # check end date
+            if to_date:  # end date defined, retrieve only past notifications
+                if final_rev:
+                    async for kvs in self._pages(self.pull_iter(key, min_rev=next_rev, max_rev=final_rev)):
+                        # remove the status from the result
+                        kvs = [kv for kv in kvs if kv["key"] != key]
+                        await self._trigger_callback(callback, kvs)
+                logger.info("Search and retrieval completed")
+
+            elif self.watch:  # no end date defined, watch the server for new notifications
+                await self._watching(key, callback, next_rev, listener)
+
+            else:  # no end date defined, start the polling for new notifications
+                interval = self._rest.adaptive_polling_interval()
+                while True:  # this stops when the task is cancelled
+                    # retrieve any change since the last revision
+                    start_rev = next_rev
+                    kvs = self.pull_iter(key, min_rev=next_rev, serializable=self.serializable_reads)
+                    next_rev = await self._process_pages(key, callback, kvs, next_rev, listener)
+                    # wait the polling interval before trying again, shorter if new notifications have been found
+                    start = instrumentation.start()
+                    await asyncio.sleep(interval.next(next_rev != start_rev))
+                    instrumentation.stop(Stage.POLL_WAIT, start)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error while listening to key {key}: {e}")
+            logger.debug("", exc_info=True)
+            return False
+        return True
+
+    async def _initial_revision(self, key: str, listener: str = None) -> int:
+        """
+        This method defines the revision from which to start listening when no start date is requested. This is the
+        last revision saved if catchup is enabled, the latest revision of the server otherwise
+        :param key: key to listen
+        :param listener: name of the listener, see checkpoint_name
+        :return: the first revision to request
+        """
+        saved_rev = self._rest.resume_revision(key, listener)
+        if saved_rev != -1:
+            return saved_rev
+        # we start from now
+        return await self._latest_revision(key) + 1
+
+    async def _process_pages(
+        self,
+        key: str,
+        callback: callable([str, str]),
+        kvs: AsyncIterator[Dict[str, any]],
+        next_rev: int,
+        listener: str = None,
+    ) -> int:
+        """
+        This method processes page by page the key-value pairs changed since the last revision for the key listened,
+        the revision reached is saved once all of them have been processed, see ChangeTracker
+        :param key: key listened
+        :param callback: function to call for each key-value pair changed
+        :param kvs: key-value pairs changed
+        :param next_rev: revision from which the changes have been requested
+        :param listener: name of the listener, see checkpoint_name
+        :return: the revision from which the next changes should be requested
+        """
+        tracker = ChangeTracker(key, next_rev, listener)
+        async for page in self._pages(kvs):
+            await self._process_page(tracker, callback, page)
+        return tracker.checkpoint(self._rest.checkpoints.update)
+
+    async def _process_changes(
+        self, key: str, callback: callable([str, str]), kvs: List[Dict[str, any]], next_rev: int, listener: str = None
+    ) -> int:
+        """
+        This method processes a page of the key-value pairs changed since the last revision for the key listened and
+        saves the revision reached
+        :param key: key listened
+        :param callback: function to call for each key-value pair changed
+        :param kvs: key-value pairs changed
+        :param next_rev: revision from which the changes have been requested
+        :param listener: name of the listener, see checkpoint_name
+        :return: the revision from which the next changes should be requested
+        """
+        tracker = ChangeTracker(key, next_rev, listener)
+        await self._process_page(tracker, callback, kvs)
+        return tracker.checkpoint(self._rest.checkpoints.update)
+
+    async def _process_page(self, tracker: ChangeTracker, callback: callable([str, str]), kvs: List[Dict[str, any]]):
+        """
+        :param tracker: revision reached by the processing of the changes of the key listened
+        :param callback: function to call for each key-value pair changed
+        :param kvs: key-value pairs changed
+        """
+        notifications, submit_times = tracker.page(kvs)
+        if len(notifications) > 0:
+            # trigger the callback
+            await self._trigger_callback(callback, notifications, submit_times, tracker.key)
+
+    def _pages(self, kvs: AsyncIterator[Dict[str, any]]) -> AsyncIterator[List[Dict[str, any]]]:
+        """
+        :param kvs: key-value pairs
+        :return: asynchronous iterator of lists of at most page size key-value pairs
+        """
+        return pages_async(kvs, self._page_size)
+
+    @staticmethod
+    async def _trigger_callback(
+        callback: callable([str, str]),
+        notifications: List[Dict[str, any]],
+        submit_times: Dict[int, float] = None,
+        key: str = None,
+    ):
+        """
+        :param callback: function to call for each notification
+        :param notifications: key-value pairs changed
+        :param submit_times: submission time of the revisions of the notifications, if measuring their lag
+        :param key: key listened
+        """
+        for k, v in deliveries(notifications, submit_times, key):
+            try:
+                result = callback(k, v)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as err:
+                logger.error(f"Error with notification trigger: {err}")
+                logger.debug("", exc_info=True)
+
+    async def _watching(self, key: str, callback: callable([str, str]), next_rev: int, listener: str = None):
+        """
+        This method implements the listening by watching the server. In case of disconnection the watch is resumed from
+        the last revision processed. If this revision has been compacted in the meantime, the changes missed are first
+        retrieved by pulling the key and the watch is resumed from the latest revision.
+        :param key: key to watch as a prefix
+        :param callback: function to call if any change happen
+        :param next_rev: revision from which the changes are requested
+        :param listener: name of the listener, see checkpoint_name
+        """
+        retry = self._rest.retry_policy.start(f"watch key {key}")
+        while True:  # this stops when the task is cancelled
+            try:
+                await retry.wait_async()
+                async for kvs in self._watch(key, next_rev):
+                    retry.succeeded()
+                    next_rev = await self._process_changes(key, callback, kvs, next_rev, listener)
+            except EngineHistoryNotAvailableError:
+                logger.warning(f"Revision {next_rev} not available anymore, retrieving the changes to key {key}...")
+                latest_rev = await self._latest_revision(key)
+                kvs = self.pull_iter(key, min_rev=next_rev, serializable=self.serializable_reads)
+                next_rev = max(await self._process_pages(key, callback, kvs, next_rev, listener), latest_rev + 1)
+                continue
+
+            await asyncio.sleep(retry.failed(f"Watch of key {key} interrupted"))
+
+    async def _watch(self, key: str, start_rev: int) -> AsyncIterator[List[Dict[str, any]]]:
+        """
+        This method opens a watch stream on the gRPC gateway for all the keys starting with the key passed. The stream
+        ends when the task is cancelled or the connection to the server is lost.
+        :param key: key to watch as a prefix
+        :param start_rev: revision from which the changes are requested
+        :return: asynchronous iterator of the lists of key-value pairs created or modified, formatted as dictionary.
+        An empty list is yielded once the watch is created
+        """
+        logger.debug(f"Calling watch for {key} from revision {start_rev}...")
+
+        # create the body for the watch request, deleted keys are not notifications so we only need the puts
+        body = {
+            "create_request": {
+                "key": encode(key),
+                "range_end": encode(prefix_range_end(key)),
+                "start_revision": start_rev,
+                "filters": ["NODELETE"],
+            }
+        }
+        try:
+            # the stream stays open, only the connection is subject to the timeout
+            resp = await self._post(
+                "watch",
+                body,
+                read=True,
+                stream=True,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout),
+            )
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+            logger.debug(f"Not able to watch key {key}, {str(err)}")
+            return
+
+        async with resp:
+            if resp.status == 408 or resp.status == 404 or 500 <= resp.status < 600:
+                logger.debug(f"Not able to watch key {key}, status {resp.status}")
+                return
+            elif resp.status != 200:
+                raise EngineException(f"Not able to watch key {key}, status {resp.status}, {await resp.text()}")
+
+            utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+            buffer = ""
+            try:
+                async for chunk in resp.content.iter_any():
+                    watch_resps, buffer = decode_buffer(buffer + utf8_decoder.decode(chunk))
+                    for watch_resp in watch_resps:
+                        kvs = watch_kvs(key, watch_resp)
+                        if len(kvs) > 0 or watch_resp.get("result", {}).get("created"):
+                            yield kvs
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                logger.debug(f"Watch of key {key} interrupted, {str(err)}", exc_info=True)
@@ -7,23 +7,38 @@
 # nor does it submit to any jurisdiction.
 
 import fcntl
+import hashlib
 import json
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from queue import Queue
-from typing import Any, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .. import HOME_FOLDER, logger
+from .. import HOME_FOLDER, exit_channel, logger
 from ..authentication.auth import Auth
 from ..custom_exceptions import EngineException, EngineHistoryNotAvailableError
+from ..instrumentation import Stage, instrumentation
 from ..user_config import EngineConfig
+from .changes import ChangeTracker, deliveries, pages, prefix_range_end, range_pages
+from .checkpoint_store import (
+    DEFAULT_CHECKPOINT_INTERVAL,
+    CheckpointStore,
+    checkpoint_name,
+)
+from .endpoint_pool import EndpointPool
 from .engine import DATE_FORMAT, Engine
+from .polling_scheduler import AdaptiveInterval, PollingScheduler
+from .retry_policy import DEFAULT_CIRCUIT_BREAKER_THRESHOLD, CircuitBreaker, RetryPolicy
 
 MAX_KV_RETURNED = 10000
 LOCAL_STATE_FOLDER = "etcd/last"
-LAST_REVISION_FILE = "revision.json"
+LAST_REVISION_FILE = "revision.json"  # saved by the previous versions, for all the keys
+CHECKPOINTS_FOLDER = "checkpoints"
+STATUS_CACHE_FOLDER = "etcd/status"
+MAX_CACHED_STATUSES = 10000  # per base key
 
 
 class EtcdEngine(Engine, ABC):
@@ -32,8 +47,67 @@ class EtcdEngine(Engine, ABC):
     Etcd specialisation.
     """
 
-    def __init__(self, config: EngineConfig, auth: Auth):
+    def __init__(self, config: EngineConfig, auth: Auth, checkpoint_server: str = None):
+        """
+        :param config: engine configuration
+        :param auth: authentication
+        :param checkpoint_server: identifier of the server in the checkpoints saved, host and port if None
+        """
         super(EtcdEngine, self).__init__(config, auth)
+        self.watch = config.watch
+        # the polling only needs the revisions to grow, it can be served by the followers
+        self.serializable_reads = config.serializable_reads
+        self._page_size = config.page_size if config.page_size else MAX_KV_RETURNED
+        # the polling interval adapts between these bounds to the notifications found
+        self._min_polling_interval = (
+            config.min_polling_interval if config.min_polling_interval is not None else config.polling_interval
+        )
+        self._polling_jitter = config.polling_jitter if config.polling_jitter else 0
+        # retries of the requests to the server, all the requests go through the same circuit breaker
+        retry_delay = self.automatic_retry_delay if self.automatic_retry_delay else 0
+        breaker = CircuitBreaker(
+            f"{self.host}:{self.port}",
+            config.circuit_breaker_threshold if config.circuit_breaker_threshold else DEFAULT_CIRCUIT_BREAKER_THRESHOLD,
+            retry_delay,
+        )
+        self._retry_policy = RetryPolicy(breaker, retry_delay, budget=config.retry_budget)
+        # members of the cluster, each one avoided for the retry delay once found unreachable
+        self._endpoints = EndpointPool.from_config(
+            self.host, self.port, config.endpoints, config.load_balancing, retry_delay
+        )
+        # cancel functions of the watch streams currently open, by key
+        self._watches: Dict[str, List[callable]] = {}
+        self._watches_lock = threading.Lock()
+        # single polling thread shared by all the keys listened from now
+        self._scheduler = PollingScheduler(self)
+        # statuses of past revisions never change, they are cached on disk by base key
+        self._status_caches: Dict[str, Dict[str, Dict[str, any]]] = {}
+        self._compacted_revs: Dict[str, int] = {}  # last compacted revision found, by base key
+        self._modified_status_caches = set()
+        self._status_caches_lock = threading.Lock()
+        # last revisions processed, by key
+        full_state_path = os.path.join(os.path.expanduser(HOME_FOLDER), LOCAL_STATE_FOLDER, CHECKPOINTS_FOLDER)
+        self._checkpoints = CheckpointStore(
+            full_state_path,
+            checkpoint_server if checkpoint_server else f"{self.host}_{self.port}",
+            config.checkpoint_interval if config.checkpoint_interval else DEFAULT_CHECKPOINT_INTERVAL,
+        )
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        return self._retry_policy.breaker
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    @property
+    def endpoints(self) -> EndpointPool:
+        return self._endpoints
+
+    @property
+    def checkpoints(self) -> CheckpointStore:
+        return self._checkpoints
 
     @abstractmethod
     def _latest_revision(self, key: str) -> int:
@@ -52,6 +126,149 @@ class EtcdEngine(Engine, ABC):
         """
         pass
 
+    @abstractmethod
+    def _range(
+        self,
+        key: str,
+        range_end: bytes = None,
+        key_only: bool = False,
+        rev: int = None,
+        min_rev: int = None,
+        max_rev: int = None,
+        limit: int = MAX_KV_RETURNED,
+        sort_order: str = "DESCEND",
+        serializable: bool = False,
+    ) -> Tuple[List[Dict[str, any]], bool, int]:
+        """
+        This method implements a range request to the notification server, sorted by key
+        :param key: first key of the range
+        :param range_end: end of the range, excluded, if None only the key is requested
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :param limit: max number of key-value pairs to return
+        :param sort_order: ASCEND or DESCEND
+        :param serializable: if True the request is served by the member receiving it, without going through the
+        leader, so it may not reflect the latest changes
+        :return: List of key-value pairs formatted as dictionary, True if more pairs are in the range, revision of
+        the server when the request was served
+        """
+        pass
+
+    def pull_iter(
+        self,
+        key: str,
+        key_only: bool = False,
+        rev: int = None,
+        prefix: bool = True,
+        min_rev: int = None,
+        max_rev: int = None,
+        serializable: bool = False,
+    ) -> Iterator[Dict[str, any]]:
+        """
+        This method is the lazy variant of pull. The key-values are retrieved in pages of page size pairs, sorted by
+        key, each page starting after the last key of the previous one. All the pages are read at the revision of the
+        first one so that no change is missed or repeated.
+        :param key: input in the query
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param prefix: if true the function will retrieve all the KV pairs starting with the key passed
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :param serializable: if True the pages are served by any member of the cluster, see _range
+        :return: Iterator of key-value pairs formatted as dictionary
+        """
+        if not prefix:
+            yield from self.pull(key, key_only=key_only, rev=rev, prefix=False, min_rev=min_rev, max_rev=max_rev)
+            return
+
+        for kvs, _ in self.pull_pages(
+            key, key_only=key_only, rev=rev, min_rev=min_rev, max_rev=max_rev, serializable=serializable
+        ):
+            yield from kvs
+
+    def pull_pages(
+        self,
+        key: str,
+        key_only: bool = False,
+        rev: int = None,
+        min_rev: int = None,
+        max_rev: int = None,
+        serializable: bool = False,
+    ) -> Iterator[Tuple[List[Dict[str, any]], int]]:
+        """
+        This method retrieves the key-value pairs starting with the key in pages of page size pairs, sorted by key,
+        each page starting after the last key of the previous one. All the pages are read at the revision of the first
+        one so that no change is missed or repeated. The first page is returned even if empty, so that the revision
+        read is always known
+        :param key: prefix of the keys to retrieve
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :param serializable: if True the pages are served by any member of the cluster, see _range
+        :return: Iterator of the pages of key-value pairs formatted as dictionary, each with the revision it is read at
+        """
+        return range_pages(
+            self._range,
+            key,
+            self._page_size,
+            rev=rev,
+            serializable=serializable,
+            key_only=key_only,
+            min_rev=min_rev,
+            max_rev=max_rev,
+        )
+
+    def _watch(self, key: str, start_rev: int) -> Iterator[List[Dict[str, any]]]:
+        """
+        This method opens a watch stream on the server for all the keys starting with the key passed. The stream ends
+        when the watch is cancelled or the connection to the server is lost.
+        :param key: key to watch as a prefix
+        :param start_rev: revision from which the changes are requested
+        :return: iterator of the lists of key-value pairs created or modified, formatted as dictionary.
+        An empty list is yielded once the watch is created
+        """
+        raise EngineException(f"Watch is not supported by {self.__class__.__name__}")
+
+    def listen(
+        self,
+        keys: List[str],
+        callback: callable([str, str]),
+        from_date: datetime = None,
+        to_date: datetime = None,
+        listener: str = None,
+    ) -> bool:
+        """
+        This method allows to listen for changes to specific keys. Note that the key is always considered as a prefix.
+        The keys listened from now, or from the last notification received, are polled by a single background thread
+        shared by all the keys of this engine. The other listenings are implemented with a background thread per key.
+
+        :param keys: keys to watch
+        :param callback: function to trigger in case of changes
+        :param from_date: date from when to request notifications, if None it will be from now
+        :param to_date: date until when to request notifications, if None it will be until now
+        :param listener: name of the listener, the last revision processed is saved separately for each listener
+        :return: True if the listener is in execution, False otherwise
+        """
+        if from_date is not None or to_date is not None or self.watch:
+            return super(EtcdEngine, self).listen(keys, callback, from_date, to_date, listener)
+
+        logger.debug("Calling listen...")
+        try:
+            for key in keys:
+                self._add_listener(key)
+            self._scheduler.subscribe(keys, callback, exit_channel, listener)
+        except Exception as e:
+            logger.error(f"Error in listening to {keys}: {e}")
+            logger.debug("", exc_info=True)
+            for key in keys:
+                if key in self._listeners:
+                    self._remove_listener(key)
+            return False
+        return True
+
     def _polling(
         self,
         key: str,
@@ -59,6 +276,7 @@ class EtcdEngine(Engine, ABC):
         channel: Queue,
         from_date: datetime = None,
         to_date: datetime = None,
+        listener: str = None,
     ):
         """
         This method implements the active polling
@@ -67,19 +285,12 @@ class EtcdEngine(Engine, ABC):
         :param channel: global communication channel among threads
         :param from_date: date from when to request notifications, if None it will be from now
         :param to_date: date until when to request notifications, if None it will be until now
+        :param listener: name of the listener, the last revision processed is saved separately for each listener
         :return:
         """
 
-        def trigger_callback(notifications):
-            for notification in notifications:
-                v = notification["value"].decode()
-                k = notification["key"]
-                logger.debug(f"Notification received for key {k}")
-                try:
-                    callback(k, v)
-                except Exception as err:
-                    logger.error(f"Error with notification trigger: {err}")
-                    logger.debug("", exc_info=True)
+        def process_changes(kvs, next_rev) -> int:
+            return self._process_changes(key, callback, kvs, next_rev, listener=listener)
 
         try:
             # initialise the revisions
@@ -87,23 +298,11 @@ class EtcdEngine(Engine, ABC):
 
             # check start date
             if from_date is None:  # no start date defined
-                if self.catchup is None:
-                    raise EngineException("catchup not defined for notification engine")
-                if self.catchup:  # we start from the saved one
-                    saved_rev = self._last_saved_revision()
-                    if saved_rev != -1:
-                        logger.info("Starting from last notification received")
-                        next_rev = saved_rev
-                    else:  # if it's the first time we start from now
-                        next_rev = self._latest_revision(key) + 1
-                else:  # delete the saved state
-                    self._delete_saved_revision()
-                    # we start from now
-                    next_rev = self._latest_revision(key) + 1
+                next_rev = self._initial_revision(key, listener=listener)
 
             else:  # start date defined
                 logger.info("Searching for past notifications...")
-                next_rev, final_rev = self._from_to_revisions(key, from_date=from_date, to_date=to_date)
+                next_rev, final_rev = self.from_to_revisions(key, from_date=from_date, to_date=to_date)
                 if next_rev == -1 and final_rev == -1:
                     logger.warning("No history available in the time period selected")
                     channel.put(True)
@@ -118,14 +317,12 @@ class EtcdEngine(Engine, ABC):
             # check end date
             if to_date:  # end date defined, retrieve only past notifications
                 if final_rev:
-                    kvs = self.pull(key, min_rev=next_rev, max_rev=final_rev)
-                    # remove the status from the result
-                    for kv in kvs:
-                        if kv["key"] == key:  # this is the status
-                            kvs.remove(kv)
-                            break
-                    # trigger the callback
-                    trigger_callback(kvs)
+                    # retrieve the changes page by page to keep the memory bounded
+                    for kvs in self._pages(self.pull_iter(key, min_rev=next_rev, max_rev=final_rev)):
+                        # remove the status from the result
+                        kvs = [kv for kv in kvs if kv["key"] != key]
+                        # trigger the callback
+                        self._trigger_callback(callback, kvs)
                 # de-register this pooling thread as we have finished
                 self.stop(key)
                 logger.info("Search and retrieval completed")
@@ -134,37 +331,216 @@ class EtcdEngine(Engine, ABC):
                     channel.put(True)
                     return
 
+            elif self.watch:  # no end date defined, watch the server for new notifications
+                self._watching(key, next_rev, process_changes)
+
             else:  # no end date defined, start the polling for new notifications
+                interval = self.adaptive_polling_interval()
                 while key in self._listeners:  # this is the stop condition
                     # retrieve any change since the last revision
-                    kvs = self.pull(key, min_rev=next_rev)
-                    # remove the status from the result
-                    for kv in kvs:
-                        if kv["key"] == key:  # this is the status
-                            kvs.remove(kv)
-                            break
-                    if len(kvs) > 0:
-                        # update the current revision
-                        for kv in kvs:
-                            if next_rev < kv["mod_rev"] + 1:
-                                next_rev = kv["mod_rev"] + 1
-                        # save current rev
-                        self._save_last_revision(next_rev)
-                        # trigger the callback
-                        trigger_callback(kvs)
-                    # wait the polling interval before trying again
-                    time.sleep(self._polling_interval)
+                    kvs = self.pull_iter(key, min_rev=next_rev, serializable=self.serializable_reads)
+                    start_rev, next_rev = next_rev, process_changes(kvs, next_rev)
+                    # wait the polling interval before trying again, shorter if new notifications have been found
+                    start = instrumentation.start()
+                    time.sleep(interval.next(next_rev != start_rev))
+                    instrumentation.stop(Stage.POLL_WAIT, start)
 
         except Exception as e:
             logger.error(f"Error while listening to key {key}: {e}")
             logger.debug("", exc_info=True)
             channel.put(False)
 
-    def _last_saved_revision(self) -> int:
+    def _initial_revision(self, key: str, latest_rev: int = None, listener: str = None) -> int:
+        """
+        This method defines the revision from which to start listening when no start date is requested. This is the
+        last revision saved for the key if catchup is enabled, the latest revision of the server otherwise
+        :param key: key to listen
+        :param latest_rev: latest revision of the server, if already known
+        :param listener: name of the listener, see checkpoint_name
+        :return: the first revision to request
+        """
+        saved_rev = self.resume_revision(key, listener)
+        if saved_rev != -1:
+            return saved_rev
+        # if it's the first time we start from now
+        if latest_rev is None:
+            latest_rev = self._latest_revision(key)
+        return latest_rev + 1
+
+    def resume_revision(self, key: str, listener: str = None) -> int:
+        """
+        This method reads the revision from which to resume the listening of the key. This is the last revision saved
+        by the listener if catchup is enabled, otherwise the saved state is deleted
+        :param key: key to listen
+        :param listener: name of the listener, see checkpoint_name
+        :return: the revision saved or -1 if the listening starts from the latest revision of the server
+        """
+        if self.catchup is None:
+            raise EngineException("catchup not defined for notification engine")
+        if self.catchup:  # we start from the saved one
+            saved_rev = self._last_saved_revision(checkpoint_name(key, listener))
+            if saved_rev != -1:
+                logger.info(f"Starting {key} from last notification received")
+                return saved_rev
+        else:
+            # delete the saved state
+            self._delete_saved_revision(checkpoint_name(key, listener))
+        return -1
+
+    def adaptive_polling_interval(self) -> AdaptiveInterval:
+        """
+        :return: a new polling interval, adapting to the notifications found by a polling loop
+        """
+        return AdaptiveInterval(self._min_polling_interval, self._polling_interval, self._polling_jitter)
+
+    def _process_changes(
+        self,
+        key: str,
+        callback: callable([str, str]),
+        kvs: Iterable[Dict[str, any]],
+        next_rev: int,
+        checkpoint: bool = True,
+        listener: str = None,
+    ) -> int:
+        """
+        This method processes the key-value pairs changed since the last revision for the key listened. The status of
+        the key is removed and the callback is triggered for the remaining ones. The key-value pairs are processed
+        page by page, so they can be retrieved lazily. The pages are sorted by key, not by revision, so the revision
+        reached is saved only once all of them have been processed, otherwise an interruption would skip the changes
+        of the pages not processed yet
+        :param key: key listened
+        :param callback: function to call for each key-value pair changed
+        :param kvs: key-value pairs changed
+        :param next_rev: revision from which the changes have been requested
+        :param checkpoint: if False the revision reached is not saved, the caller saves it once its range is processed
+        :param listener: name of the listener, see checkpoint_name
+        :return: the revision from which the next changes should be requested
+        """
+        tracker = ChangeTracker(key, next_rev, listener)
+        for page in self._pages(kvs):
+            notifications, submit_times = tracker.page(page)
+            if len(notifications) > 0:
+                # trigger the callback
+                self._trigger_callback(callback, notifications, submit_times, key)
+        if checkpoint:
+            # save current rev
+            tracker.checkpoint(self._save_last_revision)
+        return tracker.next_rev
+
+    def _pages(self, kvs: Iterable[Dict[str, any]]) -> Iterator[List[Dict[str, any]]]:
+        """
+        :param kvs: key-value pairs
+        :return: iterator of lists of at most page size key-value pairs
+        """
+        return pages(kvs, self._page_size)
+
+    @staticmethod
+    def _trigger_callback(
+        callback: callable([str, str]),
+        notifications: List[Dict[str, any]],
+        submit_times: Dict[int, float] = None,
+        key: str = None,
+    ):
+        """
+        :param callback: function to call for each notification
+        :param notifications: key-value pairs changed
+        :param submit_times: submission time of the revisions of the notifications, if measuring their lag
+        :param key: key listened
+        """
+        for k, v in deliveries(notifications, submit_times, key):
+            try:
+                callback(k, v)
+            except Exception as err:
+                logger.error(f"Error with notification trigger: {err}")
+                logger.debug("", exc_info=True)
+
+    def _watching(self, key: str, next_rev: int, process_changes: callable([List[Dict[str, any]], int])):
         """
-        This method is used to read the last revision saved to file in the home folder
+        This method implements the listening by watching the server. In case of disconnection the watch is resumed from
+        the last revision processed. If this revision has been compacted in the meantime, the changes missed are first
+        retrieved by pulling the key, as for the catchup, and the watch is resumed from the latest revision.
+        :param key: key to watch as a prefix
+        :param next_rev: revision from which the changes are requested
+        :param process_changes: function processing the key-value pairs changed and returning the next revision
+        :return:
+        """
+        retry = self._retry_policy.start(f"watch key {key}")
+        while key in self._listeners:  # this is the stop condition
+            try:
+                retry.wait()
+                for kvs in self._watch(key, next_rev):
+                    retry.succeeded()
+                    next_rev = process_changes(kvs, next_rev)
+            except EngineHistoryNotAvailableError:
+                logger.warning(f"Revision {next_rev} not available anymore, retrieving the changes to key {key}...")
+                latest_rev = self._latest_revision(key)
+                kvs = self.pull_iter(key, min_rev=next_rev, serializable=self.serializable_reads)
+                next_rev = max(process_changes(kvs, next_rev), latest_rev + 1)
+                continue
+
+            if key in self._listeners:  # the stream has been interrupted without being cancelled
+                time.sleep(retry.failed(f"Watch of key {key} interrupted"))
+
+    def _add_watch(self, key: str, cancel: callable):
+        with self._watches_lock:
+            self._watches.setdefault(key, []).append(cancel)
+
+    def _remove_watch(self, key: str, cancel: callable):
+        with self._watches_lock:
+            cancels = self._watches.get(key, [])
+            if cancel in cancels:
+                cancels.remove(cancel)
+            if len(cancels) == 0:
+                self._watches.pop(key, None)
+
+    def _cancel_watches(self, key: str = None):
+        """
+        This method cancels the watch streams open for the key passed, or all of them if no key is passed
+        :param key: key watched
+        """
+        with self._watches_lock:
+            if key is None:
+                cancels = [c for k_cancels in self._watches.values() for c in k_cancels]
+            else:
+                cancels = list(self._watches.get(key, []))
+        for cancel in cancels:
+            cancel()
+
+    def _remove_all_listeners(self):
+        super(EtcdEngine, self)._remove_all_listeners()
+        self._scheduler.unsubscribe()
+        self._cancel_watches()
+        self._checkpoints.flush()
+
+    def _remove_listener(self, key: str):
+        super(EtcdEngine, self)._remove_listener(key)
+        if key not in self._listeners:
+            self._scheduler.unsubscribe(key)
+            self._cancel_watches(key)
+        self._checkpoints.flush()
+
+    def _last_saved_revision(self, name: str) -> int:
+        """
+        This method is used to read the last revision saved for a key. The revision saved by the previous versions
+        for all the keys is used if the key has none
+        :param name: name of the revision saved, see checkpoint_name
         :return: last revision or -1 if no revision could be read
         """
+        last_rev = self._checkpoints.get(name)
+        if last_rev == -1:
+            last_rev = self._legacy_saved_revision()
+        if last_rev != -1:
+            logger.debug(f"Last revision saved for {name} is {last_rev}")
+        return last_rev
+
+    def _legacy_saved_revision(self) -> int:
+        """
+        This method is used to read the last revision saved to file by the previous versions, shared by all the keys.
+        This is only used until the revisions of the keys are saved for the first time
+        :return: last revision or -1 if no revision could be read
+        """
+        if os.path.exists(self._checkpoints.path):
+            return -1
         # build the path where the last revision is saved
         full_home_path = os.path.expanduser(HOME_FOLDER)
         full_rev_path = os.path.join(full_home_path, LOCAL_STATE_FOLDER, LAST_REVISION_FILE)
@@ -174,11 +550,12 @@ class EtcdEngine(Engine, ABC):
                     # acquire a file lock to avoid concurrency among processes
                     fcntl.lockf(f, fcntl.LOCK_SH)
                     rev_dict = json.loads(f.read())
-                    last_rev = rev_dict["last_revision"]
                     # release file lock
                     fcntl.lockf(f, fcntl.LOCK_UN)
-                logger.debug(f"Last revision saved is {last_rev}")
-                return last_rev
+                if rev_dict.get("server_host", self.host) == self.host and rev_dict.get(
+                    "server_port", self.port
+                ) == int(self.port):
+                    return rev_dict["last_revision"]
             except Exception as e:
                 logger.warning(f"Error occurred while reading the last revision saved: {e}")
                 logger.debug("", exc_info=True)
@@ -186,15 +563,17 @@ class EtcdEngine(Engine, ABC):
         # default return
         return -1
 
-    def _delete_saved_revision(self):
+    def _delete_saved_revision(self, name: str):
         """
-        This method is used to delete the file where the last revision is saved
+        This method is used to delete the last revision saved for a key, together with the one saved by the previous
+        versions for all the keys
+        :param name: name of the revision saved, see checkpoint_name
         """
-        # build the path where the last revision is saved
-        full_home_path = os.path.expanduser(HOME_FOLDER)
-        full_state_path = os.path.join(full_home_path, LOCAL_STATE_FOLDER)
-        full_rev_path = os.path.join(full_state_path, LAST_REVISION_FILE)
+        self._checkpoints.delete(name)
 
+        # build the path where the last revision was saved by the previous versions
+        full_home_path = os.path.expanduser(HOME_FOLDER)
+        full_rev_path = os.path.join(full_home_path, LOCAL_STATE_FOLDER, LAST_REVISION_FILE)
         with self._state_lock:  # multiple listing threads could access this simultaneously
             if os.path.exists(full_rev_path):
                 try:
@@ -204,78 +583,192 @@ class EtcdEngine(Engine, ABC):
                 except Exception:
                     logger.warning(f"Deleting the last revision file has failed: {full_rev_path}")
                     logger.debug("", exc_info=True)
-                    return False
 
-    def _save_last_revision(self, rev: int) -> bool:
+    def _save_last_revision(self, name: str, rev: int) -> bool:
         """
-        This method is used to save to file the revision passed as the last revision pulled
+        This method is used to save the revision passed as the last revision pulled for a key. The revisions are
+        written to disk together, at most once per checkpoint interval and when the listening stops
+        :param name: name of the revision saved, see checkpoint_name
         :param rev: last revision to save
         :return: True if saved otherwise False
         """
         if rev is not None:
-            rev_dict = {
-                "last_revision": rev,
-                "date_time": datetime.utcnow().strftime(DATE_FORMAT),
-                "server_host": self.host,
-                "server_port": self.port,
-            }
-            # build the path where the last revision will be saved
-            full_home_path = os.path.expanduser(HOME_FOLDER)
-            full_state_path = os.path.join(full_home_path, LOCAL_STATE_FOLDER)
-
-            with self._state_lock:  # multiple listing threads could access this simultaneously
-                if not os.path.exists(full_state_path):
-                    try:
-                        os.makedirs(full_state_path, exist_ok=True)
-                    except OSError:
-                        logger.warning(f"Cannot create the directory for the last revision: {full_state_path}")
-                        logger.debug("", exc_info=True)
-                        return False
-                try:
-                    full_rev_path = os.path.join(full_state_path, LAST_REVISION_FILE)
-                    with open(full_rev_path, "w") as f:
-                        # acquire a file lock to avoid concurrency among processes
-                        fcntl.lockf(f, fcntl.LOCK_EX)
-                        # write the revision in the file
-                        json.dump(rev_dict, f)
-                        # release file lock
-                        fcntl.lockf(f, fcntl.LOCK_UN)
-                    logger.debug(f"Last revision pulled {rev} has been successfully saved")
-                except Exception:
-                    logger.warning(f"Saving of the last revision has failed: {full_state_path}")
-                    logger.debug("", exc_info=True)
-                    return False
+            self._checkpoints.update(name, rev)
         return True
 
-    def _retrieve_status_history(self, key, rev=None) -> Tuple[int, Any, int, Any]:
+    def _retrieve_status(self, key: str, rev: int = None) -> Optional[Dict[str, any]]:
         """
         :param key: key for which to return the status
-        :param rev: revision of the status requested
-        :return: a tuple: status's revision, status's date, previous status's revision,
-        revision of the last status of the previous day
+        :param rev: revision of the status requested, the statuses of past revisions are first searched in the cache
+        :return: the status as dictionary with its revision, date, previous status's revision, revision of the last
+        status of the previous day and skip revisions. The date is None if the revision has been compacted. None is
+        returned if there is no status
         """
+        if rev is not None:
+            with self._status_caches_lock:
+                cached = self._status_cache(key).get(str(rev))
+            if cached is not None:
+                logger.debug(f"Status of {key} at revision {rev} found in cache")
+                return self._parse_status(rev, cached)
         try:
             kvs = self.pull(key=key, prefix=False, rev=rev)
         # in case of retrieving a compacted revision we will get a 400 error with a proper reason
         except EngineHistoryNotAvailableError:
             logger.debug(f"Revision {rev} too old for current history")
-            return rev, None, rev, None  # return in a way that is clear that we arrived at the end of the history
+            # the history before this revision is not available anymore, no need to keep it
+            self._drop_cached_statuses(key, rev)
+            return {"rev": rev, "date": None}  # return in a way that is clear that we arrived at the end of the history
 
         # look inside what returned
         if len(kvs) == 0:
-            return -1, None, -1, None
+            return None
         assert len(kvs) == 1, f"Error in finding revision for {key}, more then one kv found or none"
-        s_rev = kvs[0]["mod_rev"]
         s = json.loads(kvs[0]["value"].decode())
-        if "prev_rev" in s:
-            s_prev_rev = s["prev_rev"]
-        else:
-            s_prev_rev = -1  # this means that this is the first revision of the status. We cannot go further back
-        s_date = datetime.strptime(s["date_time"], DATE_FORMAT)
-        s_last_prev_day_rev = s.get("last_prev_day_rev")
-        return s_rev, s_date, s_prev_rev, s_last_prev_day_rev
+        s_rev = kvs[0]["mod_rev"]
+        # keep only what is needed to navigate the history
+        cached = {k: s[k] for k in ["date_time", "prev_rev", "last_prev_day_rev", "skip_revs"] if k in s}
+        with self._status_caches_lock:
+            self._status_cache(key)[str(s_rev)] = cached
+            self._modified_status_caches.add(key)
+        return self._parse_status(s_rev, cached)
+
+    @staticmethod
+    def _parse_status(rev: int, s: Dict[str, any]) -> Dict[str, any]:
+        return {
+            "rev": rev,
+            "date": datetime.strptime(s["date_time"], DATE_FORMAT),
+            # -1 means that this is the first revision of the status. We cannot go further back
+            "prev_rev": s.get("prev_rev", -1),
+            "last_prev_day_rev": s.get("last_prev_day_rev"),
+            "skip_revs": [(rev, datetime.strptime(date, DATE_FORMAT)) for rev, date in s.get("skip_revs", [])],
+        }
+
+    def _status_cache_path(self, key: str) -> str:
+        """
+        :param key: base key of the status
+        :return: path of the file caching the statuses of the key for this server
+        """
+        full_home_path = os.path.expanduser(HOME_FOLDER)
+        file_name = hashlib.sha1(key.encode()).hexdigest() + ".json"
+        return os.path.join(full_home_path, STATUS_CACHE_FOLDER, f"{self.host}_{self.port}", file_name)
+
+    def _status_cache(self, key: str) -> Dict[str, Dict[str, any]]:
+        """
+        This method returns the statuses of the key cached, by revision. They are read from file the first time.
+        It must be called holding the status caches lock
+        :param key: base key of the status
+        :return: the cached statuses
+        """
+        if key not in self._status_caches:
+            statuses = {}
+            full_cache_path = self._status_cache_path(key)
+            if os.path.exists(full_cache_path):
+                try:
+                    with open(full_cache_path, "r") as f:
+                        # acquire a file lock to avoid concurrency among processes
+                        fcntl.lockf(f, fcntl.LOCK_SH)
+                        statuses = json.loads(f.read())["statuses"]
+                        # release file lock
+                        fcntl.lockf(f, fcntl.LOCK_UN)
+                    logger.debug(f"{len(statuses)} statuses of {key} read from cache")
+                except Exception as e:
+                    logger.warning(f"Error occurred while reading the status cache: {e}")
+                    logger.debug("", exc_info=True)
+            self._status_caches[key] = statuses
+        return self._status_caches[key]
+
+    def _drop_cached_statuses(self, key: str, rev: int):
+        """
+        This method drops from the cache the statuses of the key up to the revision passed
+        :param key: base key of the status
+        :param rev: revision compacted
+        """
+        with self._status_caches_lock:
+            cache = self._status_cache(key)
+            for r in [r for r in cache if int(r) <= rev]:
+                del cache[r]
+            self._compacted_revs[key] = max(rev, self._compacted_revs.get(key, 0))
+            self._modified_status_caches.add(key)
+
+    def _save_status_cache(self, key: str) -> bool:
+        """
+        This method is used to save to file the statuses of the key cached, if modified. The ones saved by other
+        processes are kept, the oldest revisions are dropped if the cache exceeds MAX_CACHED_STATUSES
+        :param key: base key of the status
+        :return: True if saved otherwise False
+        """
+        if key not in self._modified_status_caches:
+            return True
+        full_cache_path = self._status_cache_path(key)
+        try:
+            os.makedirs(os.path.dirname(full_cache_path), exist_ok=True)
+            with self._status_caches_lock, open(full_cache_path, "a+") as f:
+                # acquire a file lock to avoid concurrency among processes
+                fcntl.lockf(f, fcntl.LOCK_EX)
+                f.seek(0)
+                content = f.read()
+                statuses = json.loads(content)["statuses"] if content else {}
+                statuses.update(self._status_cache(key))
+                # drop the statuses compacted in the meantime and the oldest ones if too many
+                compacted = self._compacted_revs.get(key, 0)
+                revs = sorted([int(r) for r in statuses if int(r) > compacted])[-MAX_CACHED_STATUSES:]
+                statuses = {str(r): statuses[str(r)] for r in revs}
+                self._status_caches[key] = statuses
+                self._modified_status_caches.discard(key)
+                f.seek(0)
+                f.truncate()
+                json.dump({"key": key, "server_host": self.host, "server_port": self.port, "statuses": statuses}, f)
+                # release file lock
+                fcntl.lockf(f, fcntl.LOCK_UN)
+            logger.debug(f"{len(statuses)} statuses of {key} saved in cache")
+        except Exception:
+            logger.warning(f"Saving of the status cache has failed: {full_cache_path}")
+            logger.debug("", exc_info=True)
+            return False
+        return True
+
+    def _search_status(self, key: str, status: Dict[str, any], date: datetime, inclusive: bool) -> Tuple[str, int]:
+        """
+        This method searches the history of the statuses, backwards from the status passed that is after the date, for
+        the last status not after the date. At each step it jumps to the farthest skip revision still after the date.
+        For the statuses without skip revisions it follows the previous status or the last one of the previous day.
+        :param key: key of the status
+        :param status: status after the date from which to start
+        :param date: date searched
+        :param inclusive: if True the statuses at the date are also considered after it
+        :return: a tuple: the outcome and a revision. The outcome is "before" if the status has been found, "first" if
+        the first status is after the date, "compacted" if the history is not available anymore. The revision is the
+        one of the status found, of the first status or of the compacted one respectively
+        """
+
+        def after(d: datetime) -> bool:
+            return d > date or (inclusive and d == date)
+
+        while True:
+            if len(status["skip_revs"]) > 0:
+                # the skip revisions are sorted by distance, level 0 is the previous status
+                candidates = [rev for rev, d in status["skip_revs"] if after(d)]
+                if len(candidates) == 0:  # the previous status is already before the date
+                    return "before", status["skip_revs"][0][0]
+                next_rev = candidates[-1]
+            elif status["prev_rev"] == -1:
+                return "first", status["rev"]
+            elif status["last_prev_day_rev"] and date.date() < status["date"].date():
+                # go back to the revision of the last of the previous day -> we skip a day
+                next_rev = status["last_prev_day_rev"]
+            else:
+                # go back one revision
+                next_rev = status["prev_rev"]
+
+            logger.debug(f"Searching the status of {key} at revision {next_rev}")
+            next_status = self._retrieve_status(key, next_rev)
+            if next_status is None or next_status["date"] is None:
+                return "compacted", next_rev
+            if not after(next_status["date"]):
+                return "before", next_status["rev"]
+            status = next_status
 
-    def _from_to_revisions(self, key: str, from_date: datetime, to_date: datetime = None) -> Tuple[Any, Any]:
+    def from_to_revisions(self, key: str, from_date: datetime, to_date: datetime = None) -> Tuple[Any, Any]:
         """
         This methods search for revisions corresponding to the interval (from_date, to_date)
         :param key:
@@ -286,68 +779,65 @@ class EtcdEngine(Engine, ABC):
         logger.debug(f"Querying notification server to find historic revisions for key {key}")
 
         # first retrieve the current status
-        to_rev = None
-        status_rev, status_date, status_prev_rev, status_last_prev_day_rev = self._retrieve_status_history(key)
+        status = self._retrieve_status(key)
 
         # check all limit cases first
         # limit case - check if there is no status
-        if status_rev == -1:
+        if status is None:
             logger.debug("No status available")
             return None, None
         # limit case - check if this revision is before from_date and to_date
-        if status_date <= from_date:
+        if status["date"] <= from_date:
             # return the revisions as this is the last point
-            from_rev = status_rev + 1
-            to_rev = from_rev
-            return from_rev, to_rev
-        else:
-            # limit case - check if this revision is after from_date and to_date and it's the only point
-            if status_prev_rev == -1 and to_date and status_date >= to_date:
-                # return the revisions as this is the only point
-                from_rev = status_rev - 1
-                to_rev = from_rev
-                return from_rev, to_rev
-            # limit case - check if this revision is inside from_date and to_date and it's the only point
-            elif status_prev_rev == -1:
-                # return the revisions as this is the only point
-                from_rev = status_rev
-                to_rev = from_rev
-                return from_rev, to_rev
+            from_rev = status["rev"] + 1
+            return from_rev, from_rev
+        # limit case - check if this revision is after from_date and to_date and it's the only point
+        if status["prev_rev"] == -1 and to_date and status["date"] >= to_date:
+            # return the revisions as this is the only point
+            from_rev = status["rev"] - 1
+            return from_rev, from_rev
+        # limit case - check if this revision is inside from_date and to_date and it's the only point
+        elif status["prev_rev"] == -1:
+            # return the revisions as this is the only point
+            return status["rev"], status["rev"]
 
         # if we have not returned yet search for older status revisions
+        try:
+            return self._search_from_to_revisions(key, status, from_date, to_date)
+        finally:
+            self._save_status_cache(key)
 
-        # check if we are inside the interval
-        if to_date and status_date < to_date:
-            to_rev = status_rev
-
-        # start navigating the history
-        while status_date > from_date and status_prev_rev != -1:
-            if status_date.date() == from_date.date():  # same day
-                # go back one revision
-                status_rev, status_date, status_prev_rev, status_last_prev_day_rev = self._retrieve_status_history(
-                    key, status_prev_rev
-                )
-            elif status_last_prev_day_rev:
-                # go back to the revision of the last of the previous day -> we skip a day
-                status_rev, status_date, status_prev_rev, status_last_prev_day_rev = self._retrieve_status_history(
-                    key, status_last_prev_day_rev
-                )
-            elif status_last_prev_day_rev is None:  # it is the last point of history
+    def _search_from_to_revisions(
+        self, key: str, status: Dict[str, any], from_date: datetime, to_date: datetime = None
+    ) -> Tuple[Any, Any]:
+        """
+        This methods search the history of the statuses for revisions corresponding to the interval
+        (from_date, to_date)
+        :param key:
+        :param status: current status
+        :param from_date:
+        :param to_date:
+        :return: a tuple: revision just after from_date, revision just before to_date
+        """
+        # search the last status before to_date
+        to_rev = None
+        if to_date and status["date"] < to_date:
+            to_rev = status["rev"]
+        elif to_date:
+            outcome, rev = self._search_status(key, status, to_date, inclusive=True)
+            if outcome == "before":
+                to_rev = rev
+
+        # search the last status before from_date
+        outcome, rev = self._search_status(key, status, from_date, inclusive=False)
+        if outcome == "first":  # this is the last point but we are inside the interval
+            from_rev = rev
+        else:
+            if outcome == "compacted":
                 logger.warning("Reached the end of history available")
-                break
+            # increment the revision so we stay just inside the interval
+            from_rev = rev + 1
 
-            if status_date is None:  # if we reached a compacted revision status_date will be None,
-                logger.warning("Reached the end of history available")
-                break
-            # check if this revision satisfies to_date and has not been previously saved
-            if to_date and status_date < to_date and to_rev is None:
-                to_rev = status_rev
-
-        if status_date is None or status_date <= from_date:  # we exit the loop because we went out of the interval
-            # save the revision in from_rev but increment it so we stay just inside the interval
-            from_rev = status_rev + 1
-        else:  # we exit because is the last point but we are inside the interval
-            from_rev = status_rev
         if to_date and to_rev is None:  # this means there are no point inside the interval - limit case
             logger.debug("No keys found")
             return -1, -1
@@ -356,19 +846,7 @@ class EtcdEngine(Engine, ABC):
 
     def _incr_last_byte(self, path: str) -> bytes:
         """
-        This function determines the end of the range required for a range call with the etcd3 API
-        By incrementing the last byte of the input path, it allows to make a range call describing the input
-        path as a branch rather than a leaf path.
-
         :param path: the path representing the start of the range
-        :return: the path representing the end of the range
-        """
-        bytes_types = (bytes, bytearray)
-        if not isinstance(path, bytes_types):
-            if not isinstance(path, str):
-                path = str(path)
-            path = path.encode("utf-8")
-        s = bytearray(path)
-        # increment the last byte
-        s[-1] = s[-1] + 1
-        return bytes(s)
+        :return: the path representing the end of the range, see prefix_range_end
+        """
+        return prefix_range_end(path)
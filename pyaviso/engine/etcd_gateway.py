@@ -0,0 +1,252 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import base64
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .. import logger
+from ..authentication.etcd_auth import EtcdAuth
+from ..custom_exceptions import EngineException, EngineHistoryNotAvailableError
+from .endpoint_pool import Endpoint
+
+TOKEN_EXPIRY_MARGIN = 10  # seconds
+
+
+def api_url(endpoint: Endpoint, https: bool) -> str:
+    """
+    :param endpoint: member of the cluster
+    :param https: if True the member is reached with HTTPS
+    :return: API root of the member
+    """
+    scheme = "https" if https else "http"
+    return f"{scheme}://{endpoint}/v3/"
+
+
+def encode(obj: any) -> str:
+    """
+    This function translates the object passed in a field that could be accepted by etcd and the request library for
+    the key or value. The request library accepts only strings encoded in base64 while etcd wants binaries for the key
+    and value fields.
+    :param obj:
+    :return: a base64 string representation of the binary translation
+    """
+    if type(obj) is bytes:
+        binary = obj
+    elif type(obj) is str:
+        binary = obj.encode()
+    else:
+        binary = str(obj).encode()
+
+    return str(base64.b64encode(binary), "utf-8")
+
+
+def decode(string: str) -> bytes:
+    """
+    This function translates what is coming back from the notification server, the gateway returns only strings
+    base64 encoded
+    :param string:
+    :return: the payload decoded from the base64 string representation
+    """
+    return base64.decodebytes(string.encode())
+
+
+def parse_kv(kv: Dict[str, any], key_only: bool = False) -> Dict[str, any]:
+    """
+    This function translates the kv pair coming from the etcd server into a dictionary that fits better this
+    application
+    :param kv: raw kv pair from the etcd server
+    :param key_only:
+    :return: translated kv pair as dictionary
+    """
+    new_kv = {}
+    if not key_only:
+        new_kv["value"] = decode(kv["value"])  # leave it as binary
+    new_kv["key"] = decode(kv["key"]).decode()
+    new_kv["version"] = int(kv["version"])
+    new_kv["create_rev"] = int(kv["create_revision"])
+    new_kv["mod_rev"] = int(kv["mod_revision"])
+    return new_kv
+
+
+def range_body(
+    key: str,
+    range_end: bytes = None,
+    key_only: bool = False,
+    rev: int = None,
+    min_rev: int = None,
+    max_rev: int = None,
+    limit: int = None,
+    sort_order: str = "DESCEND",
+    serializable: bool = False,
+) -> Dict[str, any]:
+    """
+    This function builds the body of a range request to the gateway, see EtcdEngine._range for the parameters
+    :return: the body of the request as dictionary
+    """
+    return {
+        "key": encode(key),
+        "range_end": encode(range_end) if range_end is not None else None,
+        "limit": limit,
+        "sort_order": sort_order,
+        "sort_target": "KEY",
+        "keys_only": key_only,
+        "revision": rev,
+        "min_mod_revision": min_rev,
+        "max_mod_revision": max_rev,
+        "serializable": serializable,
+    }
+
+
+def parse_range(resp_body: Dict[str, any], key_only: bool = False) -> Tuple[List[Dict[str, any]], bool, int]:
+    """
+    :param resp_body: response of a range request, as dictionary
+    :param key_only: True if no values have been requested
+    :return: List of key-value pairs formatted as dictionary, True if more pairs are in the range, revision of
+    the server when the request was served
+    """
+    new_kvs = [parse_kv(kv, key_only) for kv in resp_body.get("kvs", [])]
+    logger.debug(f"{len(new_kvs)} keys found")
+    return new_kvs, resp_body.get("more", False), int(resp_body["header"]["revision"])
+
+
+def retry_status(status: int) -> bool:
+    """
+    :param status: HTTP status of a response
+    :return: True if the request can be sent again, as the server is not reachable or not ready yet
+    """
+    return status == 408 or status == 404 or 500 <= status < 600
+
+
+def history_not_available(status: int, content: str) -> bool:
+    """
+    :param status: HTTP status of a response
+    :param content: body of the response
+    :return: True if the revision requested has been compacted
+    """
+    return status == 400 and ("History not available" in content or "required revision has been compacted" in content)
+
+
+def watch_kvs(key: str, watch_resp: Dict[str, any]) -> List[Dict[str, any]]:
+    """
+    This function reads the key-value pairs created or modified from a response of the watch stream
+    :param key: key watched
+    :param watch_resp: response of the watch stream, as dictionary
+    :return: list of key-value pairs formatted as dictionary
+    """
+    if "error" in watch_resp:
+        error = json.dumps(watch_resp["error"])
+        if "required revision has been compacted" in error:
+            raise EngineHistoryNotAvailableError()
+        raise EngineException(f"Not able to watch key {key}, {error}")
+    result = watch_resp.get("result", {})
+    if int(result.get("compact_revision", 0)) > 0:
+        raise EngineHistoryNotAvailableError()
+    if result.get("canceled"):
+        raise EngineException(f"Watch of key {key} cancelled by the server, {result.get('cancel_reason')}")
+    # the gateway omits the type for the puts as it is the default
+    events = [e for e in result.get("events", []) if e.get("type", "PUT") == "PUT"]
+    if len(events) > 0:
+        logger.debug(f"Watch of key {key} received {len(events)} events")
+    return [parse_kv(event["kv"]) for event in events]
+
+
+def decode_buffer(buffer: str) -> Tuple[List[Dict[str, any]], str]:
+    """
+    This function decodes the complete JSON objects at the beginning of the buffer of a stream. The objects are
+    normally delimited by a new line but the gateway can also concatenate them.
+    :param buffer: text received and not decoded yet
+    :return: list of the JSON objects decoded as dictionary, remaining text of the incomplete object
+    """
+    decoder = json.JSONDecoder()
+    objs = []
+    while True:
+        buffer = buffer.lstrip()
+        if buffer == "":
+            break
+        try:
+            obj, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:  # the object is not complete yet, wait for the next chunk
+            break
+        buffer = buffer[end:]
+        objs.append(obj)
+    return objs, buffer
+
+
+def parse_token_expiry(token: str) -> Optional[float]:
+    """
+    This function reads the expiry time of the token. This is only available for JWT tokens, the simple tokens do not
+    carry it and they are therefore renewed only when rejected by the server
+    :param token: token returned by the server
+    :return: expiry time in seconds since the epoch, anticipated by a safety margin, or None if not available
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+        return float(payload["exp"]) - TOKEN_EXPIRY_MARGIN
+    except (ValueError, KeyError, TypeError):
+        logger.debug("Not able to read the expiry time of the token", exc_info=True)
+        return None
+
+
+class GatewayToken:
+    """
+    This class holds the etcd authentication token of the user on the gateway. The tokens are shared by all the
+    engines of the process created with the same authentication and server, see get, so the token is renewed once for
+    all of them and only if expired or rejected by the server
+    """
+
+    _tokens: Dict[Tuple[int, str], "GatewayToken"] = {}
+    _tokens_lock = threading.Lock()
+
+    def __init__(self, auth: EtcdAuth):
+        self._auth = auth
+        self._expiry = None
+        # held by the thread renewing the token, the others wait for it and then use the new one
+        self.lock = threading.Lock()
+
+    @classmethod
+    def get(cls, auth: EtcdAuth, server: str) -> "GatewayToken":
+        """
+        :param auth: authentication of the user
+        :param server: identifier of the server
+        :return: the token of this process for the authentication and server passed, created if not existing yet
+        """
+        with cls._tokens_lock:
+            # the token keeps a reference to the authentication, so its id is not reused
+            name = (id(auth), server)
+            if name not in cls._tokens:
+                cls._tokens[name] = GatewayToken(auth)
+            return cls._tokens[name]
+
+    def valid(self, invalid_token: str = None) -> bool:
+        """
+        :param invalid_token: token rejected by the server, if any
+        :return: True if the token is set, not expired and not rejected
+        """
+        token = self._auth.token
+        if token is None or token == invalid_token:
+            return False
+        return self._expiry is None or time.time() < self._expiry
+
+    def request(self) -> Dict[str, str]:
+        """
+        :return: the body of the authentication request of the user
+        """
+        return {"name": self._auth.username, "password": self._auth.password}
+
+    def update(self, token: str):
+        """
+        :param token: new token returned by the server
+        """
+        self._expiry = parse_token_expiry(token)
+        self._auth.token = token
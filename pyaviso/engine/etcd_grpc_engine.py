@@ -6,7 +6,9 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
-from typing import Dict, List
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
 
 import grpc
 from etcd3 import Etcd3Client, etcdrpc
@@ -16,8 +18,14 @@ from ..authentication.auth import Auth
 from ..authentication.etcd_auth import EtcdAuth
 from ..custom_exceptions import EngineException, EngineHistoryNotAvailableError
 from ..user_config import EngineConfig
+from .endpoint_pool import Endpoint
 from .etcd_engine import MAX_KV_RETURNED, EtcdEngine
 
+# status codes of the requests that did not reach the server
+UNREACHABLE_CODES = ("UNAVAILABLE", "DEADLINE_EXCEEDED")
+# details of an UNAVAILABLE error raised when the channel could not connect, so the request has not reached the server
+NOT_SENT_DETAILS = ("failed to connect", "DNS resolution failed")
+
 
 class EtcdGrpcEngine(EtcdEngine):
     """
@@ -27,18 +35,43 @@ class EtcdGrpcEngine(EtcdEngine):
 
     def __init__(self, config: EngineConfig, auth: Auth):
         super(EtcdGrpcEngine, self).__init__(config, auth)
-        self._initialise_server()
+        # clients of the members of the cluster, created at their first use
+        self._clients: Dict[str, Etcd3Client] = {}
+        self._clients_lock = threading.Lock()
+        # client of the first member, only used to build the requests as this does not need a connection
+        self._server = Etcd3Client(self.host, self.port, timeout=self.timeout)
         self._listening_list = []
         # set base url
         self._base_url = f"http://{self._host}:{self._port}/v3/"
 
     def _initialise_server(self):
-        if type(self.auth) == EtcdAuth:
-            self._server = Etcd3Client(
-                self.host, self.port, user=self.auth.username, password=self.auth.password, timeout=self.timeout
-            )
-        else:
-            self._server = Etcd3Client(self.host, self.port, timeout=self.timeout)
+        """
+        This method drops the clients of the members of the cluster, they are created again, and authenticated, at
+        their next use
+        """
+        with self._clients_lock:
+            self._clients = {}
+
+    def _client(self, endpoint: Endpoint) -> Etcd3Client:
+        """
+        :param endpoint: member of the cluster
+        :return: the client connected to the member
+        """
+        with self._clients_lock:
+            client = self._clients.get(str(endpoint))
+            if client is None:
+                if isinstance(self.auth, EtcdAuth):
+                    client = Etcd3Client(
+                        endpoint.host,
+                        endpoint.port,
+                        user=self.auth.username,
+                        password=self.auth.password,
+                        timeout=self.timeout,
+                    )
+                else:
+                    client = Etcd3Client(endpoint.host, endpoint.port, timeout=self.timeout)
+                self._clients[str(endpoint)] = client
+            return client
 
     def pull(
         self,
@@ -68,42 +101,68 @@ class EtcdGrpcEngine(EtcdEngine):
         else:
             range_end = None
 
-        # call the get range on the ETCD_GRPC sever, order them newest first
+        new_kvs, _, _ = self._range(key, range_end, key_only=key_only, rev=rev, min_rev=min_rev, max_rev=max_rev)
+        return new_kvs
+
+    def _range(
+        self,
+        key: str,
+        range_end: bytes = None,
+        key_only: bool = False,
+        rev: int = None,
+        min_rev: int = None,
+        max_rev: int = None,
+        limit: int = MAX_KV_RETURNED,
+        sort_order: str = "DESCEND",
+        serializable: bool = False,
+    ) -> Tuple[List[Dict[str, any]], bool, int]:
+        """
+        This method implements a range request to the notification server, sorted by key
+        :param key: first key of the range
+        :param range_end: end of the range, excluded, if None only the key is requested
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :param limit: max number of key-value pairs to return
+        :param sort_order: ASCEND or DESCEND
+        :param serializable: if True the request is served by the member receiving it, without going through the
+        leader, so it may not reflect the latest changes
+        :return: List of key-value pairs formatted as dictionary, True if more pairs are in the range, revision of
+        the server when the request was served
+        """
+        # call the get range on the ETCD_GRPC sever
         range_request = self._server._build_get_range_request(
-            key=key, range_end=range_end, sort_order="descend", sort_target="key", keys_only=key_only
+            key=key, range_end=range_end, sort_order=sort_order.lower(), sort_target="key", keys_only=key_only
         )
 
-        range_request.limit = MAX_KV_RETURNED
+        range_request.limit = limit
         if rev:
             range_request.revision = rev
         if min_rev:
             range_request.min_mod_revision = min_rev
         if max_rev:
             range_request.max_mod_revision = max_rev
+        range_request.serializable = serializable
         # make the call
         logger.debug(f"Pull request: {range_request}")
-        try_again = True
-        while try_again:
-            try:
-                try_again = False
-                range_result = self._server.kvstub.Range(
+        try:
+            range_result = self._call(
+                f"pull key {key}",
+                lambda server: server.kvstub.Range(
                     range_request,
-                    self._server.timeout,
-                    credentials=self._server.call_credentials,
-                    metadata=self._server.metadata,
-                )
-            except grpc._channel._InactiveRpcError as e:
-                if e._state.code.name == "UNAUTHENTICATED":
-                    # it seems that sometimes the token expires, so re-init the server and try again
-                    try_again = True
-                    logger.debug(f"Error {e}, trying again", exc_info=True)
-                    self._initialise_server()
-                elif (
-                    e._state.code.name == "OUT_OF_RANGE" and "required revision has been compacted" in e._state.details
-                ):
-                    raise EngineHistoryNotAvailableError()
-                else:
-                    raise EngineException(e)
+                    server.timeout,
+                    credentials=server.call_credentials,
+                    metadata=server.metadata,
+                ),
+                retried=True,
+                read=True,
+            )
+        except grpc._channel._InactiveRpcError as e:
+            if e._state.code.name == "OUT_OF_RANGE" and "required revision has been compacted" in e._state.details:
+                raise EngineHistoryNotAvailableError()
+            else:
+                raise EngineException(e)
         logger.debug(f"Query for {key} completed")
 
         # parse the result to return just key-value pairs
@@ -115,7 +174,7 @@ class EtcdGrpcEngine(EtcdEngine):
             logger.debug(f"Key: {new_kv['key']} pulled successfully")
 
         logger.debug(f"{len(new_kvs)} keys found")
-        return new_kvs
+        return new_kvs, range_result.more, range_result.header.revision
 
     def delete(self, key: str, prefix: bool = True) -> List[Dict[str, bytes]]:
         """
@@ -132,29 +191,19 @@ class EtcdGrpcEngine(EtcdEngine):
             range_end = None
 
         # call the delete range on the ETCD_GRPC sever
-        try_again = False
         del_request = self._server._build_delete_request(key=key, range_end=range_end, prev_kv=True)
 
         # make the call
         logger.debug(f"Deleting key range associated to key {key}")
-        try_again = True
-        while try_again:
-            try:
-                try_again = False
-                del_result = self._server.kvstub.DeleteRange(
-                    del_request,
-                    self._server.timeout,
-                    credentials=self._server.call_credentials,
-                    metadata=self._server.metadata,
-                )
-            except grpc._channel._InactiveRpcError as e:
-                if e._state.code.name == "UNAUTHENTICATED":
-                    # it seems that sometimes the token expires, so re-init the server and try again
-                    try_again = True
-                    logger.debug(f"Error {e}, trying again", exc_info=True)
-                    self._initialise_server()
-                else:
-                    raise e
+        del_result = self._call(
+            f"delete key {key}",
+            lambda server: server.kvstub.DeleteRange(
+                del_request,
+                server.timeout,
+                credentials=server.call_credentials,
+                metadata=server.metadata,
+            ),
+        )
         logger.debug(f"Delete request for key {key} completed")
 
         # parse the result to return just key-value pairs of what has been deleted
@@ -210,24 +259,15 @@ class EtcdGrpcEngine(EtcdEngine):
 
         # commit transaction
         # logger.debug(f"Committing the transaction statement: {ops}")
-        try_again = True
-        while try_again:
-            try:
-                try_again = False
-                txn_response = self._server.kvstub.Txn(
-                    transaction_request,
-                    self._server.timeout,
-                    credentials=self._server.call_credentials,
-                    metadata=self._server.metadata,
-                )
-            except grpc._channel._InactiveRpcError as e:
-                if e._state.code.name == "UNAUTHENTICATED":
-                    # it seems that sometimes the token expires, so re-init the server and try again
-                    try_again = True
-                    logger.debug(f"Error {e}, trying again", exc_info=True)
-                    self._initialise_server()
-                else:
-                    raise e
+        txn_response = self._call(
+            "execute the transaction",
+            lambda server: server.kvstub.Txn(
+                transaction_request,
+                server.timeout,
+                credentials=server.call_credentials,
+                metadata=server.metadata,
+            ),
+        )
         assert txn_response.succeeded, "Not able to execute the transaction"
         logger.debug("Transaction completed")
         # read the header
@@ -245,22 +285,17 @@ class EtcdGrpcEngine(EtcdEngine):
         :return: Lock if acquired otherwise exception if not acquired by the time the timeout expires
         """
         logger.debug("Calling lock...")
-        try_again = True
-        while try_again:
-            try:
-                try_again = False
-                lock = self._server.lock(lock_id)
-                res = lock.acquire(timeout=10)
-            except grpc._channel._InactiveRpcError as e:
-                if e._state.code.name == "UNAUTHENTICATED":
-                    # it seems that sometimes the token expires, so re-init the server and try again
-                    try_again = True
-                    logger.debug(f"Error {e}, trying again", exc_info=True)
-                    self._initialise_server()
-                else:
-                    raise e
-            except Exception as e:
-                raise EngineException(f"Not able to acquire lock {id}, {e}")
+
+        def acquire(server: Etcd3Client):
+            lock = server.lock(lock_id)
+            return lock, lock.acquire(timeout=10)
+
+        try:
+            lock, res = self._call(f"acquire lock {lock_id}", acquire)
+        except grpc._channel._InactiveRpcError as e:
+            raise e
+        except Exception as e:
+            raise EngineException(f"Not able to acquire lock {id}, {e}")
         if res:
             logger.debug(f"Lock {id} acquired")
             return lock
@@ -274,19 +309,7 @@ class EtcdGrpcEngine(EtcdEngine):
         :return: True once released
         """
         logger.debug("Calling unlock...")
-        try_again = True
-        while try_again:
-            try:
-                try_again = False
-                res = lock.release()
-            except grpc._channel._InactiveRpcError as e:
-                if e._state.code.name == "UNAUTHENTICATED":
-                    # it seems that sometimes the token expires, so re-init the server and try again
-                    try_again = True
-                    logger.debug(f"Error {e}, trying again", exc_info=True)
-                    self._initialise_server()
-                else:
-                    raise e
+        res = self._call("release lock", lambda server: lock.release())
 
         logger.debug("Lock released")
         return res
@@ -301,24 +324,17 @@ class EtcdGrpcEngine(EtcdEngine):
         range_request = self._server._build_get_range_request(key=key, keys_only=True)
 
         # make the call
-        try_again = True
-        while try_again:
-            try:
-                try_again = False
-                range_result = self._server.kvstub.Range(
-                    range_request,
-                    self._server.timeout,
-                    credentials=self._server.call_credentials,
-                    metadata=self._server.metadata,
-                )
-            except grpc._channel._InactiveRpcError as e:
-                if e._state.code.name == "UNAUTHENTICATED":
-                    # it seems that sometimes the token expires, so re-init the server and try again
-                    try_again = True
-                    logger.debug(f"Error {e}, trying again", exc_info=True)
-                    self._initialise_server()
-                else:
-                    raise e
+        range_result = self._call(
+            "request latest revision",
+            lambda server: server.kvstub.Range(
+                range_request,
+                server.timeout,
+                credentials=server.call_credentials,
+                metadata=server.metadata,
+            ),
+            retried=True,
+            read=True,
+        )
         logger.debug("Query for latest revision completed")
 
         # read the header
@@ -343,29 +359,160 @@ class EtcdGrpcEngine(EtcdEngine):
         lease_grant_request = etcdrpc.LeaseGrantRequest(TTL=ttl, ID=None)
 
         # make the call
-        try_again = True
-        while try_again:
+        res = self._call(
+            "request a lease",
+            lambda server: server.leasestub.LeaseGrant(
+                lease_grant_request,
+                server.timeout,
+                credentials=server.call_credentials,
+                metadata=server.metadata,
+            ),
+        )
+        if res:
+            logger.debug(f"Lease {res.ID} acquired")
+            return res.ID
+        else:
+            raise EngineException("Not able to acquire lease")
+
+    def _call(
+        self, operation: str, call: Callable[[Etcd3Client], any], retried: bool = False, read: bool = False
+    ) -> any:
+        """
+        Internal method to send a request to the server. The requests rejected because the token has expired are sent
+        again once the connection is re-initialised. If requested, the requests are also sent again as long as the
+        server is unreachable, within the retry budget, otherwise they fail immediately if the server is unreachable
+        :param operation: description of the request, used for the errors
+        :param call: function sending the request through the client passed
+        :param retried: if True the request is sent again in case of connection errors
+        :param read: True if the request does not change the state of the server
+        :return: the response of the server
+        """
+        if not retried:
+            self._retry_policy.check(operation)
+        retry = self._retry_policy.start(operation)
+        while True:
+            if retried:
+                retry.wait()
             try:
-                try_again = False
-                res = self._server.leasestub.LeaseGrant(
-                    lease_grant_request,
-                    self._server.timeout,
-                    credentials=self._server.call_credentials,
-                    metadata=self._server.metadata,
-                )
+                result = self._call_members(call, read)
             except grpc._channel._InactiveRpcError as e:
                 if e._state.code.name == "UNAUTHENTICATED":
                     # it seems that sometimes the token expires, so re-init the server and try again
-                    try_again = True
                     logger.debug(f"Error {e}, trying again", exc_info=True)
+                    time.sleep(retry.backoff(f"authentication rejected, {e._state.details}"))
                     self._initialise_server()
-                else:
-                    raise e
-        if res:
-            logger.debug(f"Lease {res.ID} acquired")
-            return res.ID
-        else:
-            raise EngineException("Not able to acquire lease")
+                    continue
+                elif e._state.code.name in UNREACHABLE_CODES:
+                    if retried:
+                        logger.debug(f"Not able to {operation}, {e._state.details}, trying again...")
+                        time.sleep(retry.failed(f"Unable to connect to {self._endpoints}"))
+                        continue
+                    self._retry_policy.breaker.record_failure()
+                raise e
+            retry.succeeded()
+            return result
+
+    def _call_members(self, call: Callable[[Etcd3Client], any], read: bool) -> any:
+        """
+        Internal method to send a request to the members of the cluster, in the order defined by the endpoint pool.
+        The read requests move to the next member if one is unreachable, the write requests only if the connection
+        could not be established, otherwise they fail as they may have been already executed
+        :param call: function sending the request through the client passed
+        :param read: True if the request does not change the state of the server
+        :return: the response of the first member serving the request
+        """
+        for endpoint, next_endpoint in self._endpoints.attempts(read):
+            start = time.time()
+            try:
+                result = call(self._client(endpoint))
+            except grpc._channel._InactiveRpcError as e:
+                if e._state.code.name in UNREACHABLE_CODES and self._endpoints.unreachable(
+                    endpoint, next_endpoint, read or self._not_sent(e), e._state.details
+                ):
+                    continue
+                raise e
+            self._endpoints.succeeded(endpoint, time.time() - start, write=not read)
+            return result
+
+    @staticmethod
+    def _not_sent(err: grpc._channel._InactiveRpcError) -> bool:
+        """
+        :param err: error raised by a request
+        :return: True if the connection could not be established, so the request has not reached the server
+        """
+        details = err._state.details or ""
+        return err._state.code.name == "UNAVAILABLE" and any(d in details for d in NOT_SENT_DETAILS)
+
+    def _watch(self, key: str, start_rev: int) -> Iterator[List[Dict[str, any]]]:
+        """
+        This method opens a Watch stream on the server for all the keys starting with the key passed. The stream ends
+        when the watch is cancelled or the connection to the server is lost.
+        :param key: key to watch as a prefix
+        :param start_rev: revision from which the changes are requested
+        :return: iterator of the lists of key-value pairs created or modified, formatted as dictionary.
+        An empty list is yielded once the watch is created
+        """
+        logger.debug(f"Calling watch for {key} from revision {start_rev}...")
+
+        # deleted keys are not notifications, we only need the puts
+        create_request = etcdrpc.WatchCreateRequest(
+            key=key.encode(),
+            range_end=self._incr_last_byte(key),
+            start_revision=start_rev,
+            filters=[etcdrpc.WatchCreateRequest.NODELETE],
+        )
+        cancelled = threading.Event()
+        endpoint = self._endpoints.read_order()[0]
+        self._endpoints.sending(endpoint)
+        start = time.time()
+        try:
+            server = self._client(endpoint)
+        except grpc.RpcError as e:
+            self._endpoints.failed(endpoint)
+            logger.debug(f"Not able to watch key {key}, {e}")
+            return
+
+        def request_iterator():
+            yield etcdrpc.WatchRequest(create_request=create_request)
+            # keep the request stream open until the watch is cancelled
+            cancelled.wait()
+
+        # pythonEtcd3 only exposes its callback-based watcher, we use the stub directly to follow the revisions
+        responses = etcdrpc.WatchStub(server.channel).Watch(
+            request_iterator(), credentials=server.call_credentials, metadata=server.metadata
+        )
+
+        def cancel():
+            cancelled.set()
+            responses.cancel()
+
+        self._add_watch(key, cancel)
+        try:
+            for response in responses:
+                if response.compact_revision:
+                    raise EngineHistoryNotAvailableError()
+                if response.canceled:
+                    raise EngineException(f"Watch of key {key} cancelled by the server, {response.cancel_reason}")
+                if len(response.events) > 0:
+                    logger.debug(f"Watch of key {key} received {len(response.events)} events")
+                    yield [self._parse_raw_kv(event.kv) for event in response.events]
+                elif response.created:
+                    self._endpoints.succeeded(endpoint, time.time() - start)
+                    yield []
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.CANCELLED:
+                logger.debug(f"Watch of key {key} cancelled")
+            elif e.code() == grpc.StatusCode.UNAUTHENTICATED:
+                # it seems that sometimes the token expires, so re-init the server before the watch is resumed
+                logger.debug(f"Error {e}, re-initialising the server", exc_info=True)
+                self._initialise_server()
+            else:
+                if e.code().name in UNREACHABLE_CODES:
+                    self._endpoints.failed(endpoint)
+                logger.debug(f"Watch of key {key} interrupted, {e}", exc_info=True)
+        finally:
+            cancel()
+            self._remove_watch(key, cancel)
 
     def _parse_raw_kv(self, kv, key_only: bool = False) -> Dict[str, any]:
         """
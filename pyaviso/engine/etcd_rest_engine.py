@@ -6,13 +6,18 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
-import base64
+import codecs
 import http.client
 import logging
+import socket
+import threading
 import time
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
 
 from .. import logger
 from ..authentication.auth import Auth
@@ -20,6 +25,18 @@ from ..authentication.etcd_auth import EtcdAuth
 from ..custom_exceptions import EngineException, EngineHistoryNotAvailableError
 from ..user_config import EngineConfig
 from .etcd_engine import MAX_KV_RETURNED, EtcdEngine
+from .etcd_gateway import (
+    GatewayToken,
+    api_url,
+    decode_buffer,
+    encode,
+    history_not_available,
+    parse_kv,
+    parse_range,
+    range_body,
+    retry_status,
+    watch_kvs,
+)
 
 
 class EtcdRestEngine(EtcdEngine):
@@ -30,11 +47,34 @@ class EtcdRestEngine(EtcdEngine):
 
     def __init__(self, config: EngineConfig, auth: Auth):
         super(EtcdRestEngine, self).__init__(config, auth)
-        # set base url
-        if self.https:
-            self._base_url = f"https://{self._host}:{self._port}/v3/"
-        else:
-            self._base_url = f"http://{self._host}:{self._port}/v3/"
+        # set base url, of the first member of the cluster
+        self._base_url = api_url(self._endpoints.endpoints[0], self.https)
+        # connection pool shared by all the requests of this engine, including the ones of the listening threads
+        self._session = self._create_session(config)
+        # authentication token shared by all the threads of the engines with the same authentication and server
+        self._token = GatewayToken.get(auth, f"{self.host}:{self.port}")
+
+    @property
+    def token(self) -> GatewayToken:
+        return self._token
+
+    @staticmethod
+    def _create_session(config: EngineConfig) -> requests.Session:
+        """
+        Internal method to create the HTTP session used to communicate with the server. Only the requests failing to
+        connect are retried, as the others may have been already executed by the server
+        :param config: engine configuration defining the pool size, keep-alive and retries
+        :return: the session
+        """
+        session = requests.Session()
+        pool_size = config.pool_size if config.pool_size else requests.adapters.DEFAULT_POOLSIZE
+        max_retries = Retry(total=config.max_retries if config.max_retries else 0, read=False, redirect=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=max_retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if config.keep_alive is False:
+            session.headers["Connection"] = "close"
+        return session
 
     def pull(
         self,
@@ -58,61 +98,66 @@ class EtcdRestEngine(EtcdEngine):
         """
         logger.debug(f"Calling pull for {key}...")
 
-        url = self._base_url + "kv/range"
-
         # determine the range_end
         if prefix:
-            range_end = self._encode_to_str_base64(str(self._incr_last_byte(key), "utf-8"))
+            range_end = self._incr_last_byte(key)
         else:
             range_end = None
 
-        # first authenticate and use the token for the header
-        self._authenticate()
-
-        # encode key
-        encoded_key = self._encode_to_str_base64(key)
+        new_kvs, _, _ = self._range(key, range_end, key_only=key_only, rev=rev, min_rev=min_rev, max_rev=max_rev)
+        return new_kvs
 
-        # create the body for the get range on the etcd sever, order them newest first
-        body = {
-            "key": encoded_key,
-            "range_end": range_end,
-            "limit": MAX_KV_RETURNED,
-            "sort_order": "DESCEND",
-            "sort_target": "KEY",
-            "keys_only": key_only,
-            "revision": rev,
-            "min_mod_revision": min_rev,
-            "max_mod_revision": max_rev,
-        }
+    def _range(
+        self,
+        key: str,
+        range_end: bytes = None,
+        key_only: bool = False,
+        rev: int = None,
+        min_rev: int = None,
+        max_rev: int = None,
+        limit: int = MAX_KV_RETURNED,
+        sort_order: str = "DESCEND",
+        serializable: bool = False,
+    ) -> Tuple[List[Dict[str, any]], bool, int]:
+        """
+        This method implements a range request to the notification server, sorted by key
+        :param key: first key of the range
+        :param range_end: end of the range, excluded, if None only the key is requested
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :param limit: max number of key-value pairs to return
+        :param sort_order: ASCEND or DESCEND
+        :param serializable: if True the request is served by the member receiving it, without going through the
+        leader, so it may not reflect the latest changes
+        :return: List of key-value pairs formatted as dictionary, True if more pairs are in the range, revision of
+        the server when the request was served
+        """
+        # create the body for the get range on the etcd sever
+        body = range_body(key, range_end, key_only, rev, min_rev, max_rev, limit, sort_order, serializable)
         # make the call
         logger.debug(f"Pull request: {body}")
 
-        # start an infinite loop of request if the server side is unreachable
+        # retry the request as long as the server side is unreachable, within the retry budget
+        retry = self._retry_policy.start(f"pull key {key}")
         while True:
+            retry.wait()
             try:
-                resp = requests.post(url, json=body, headers=self.auth.header(), timeout=self.timeout)
+                resp = self._post("kv/range", body, read=True)
                 resp.raise_for_status()
             except requests.exceptions.HTTPError as err:
-                if (
-                    resp.status_code == 408
-                    or resp.status_code == 404
-                    or (resp.status_code >= 500 and resp.status_code < 600)
-                ):
-                    logger.warning(f"Unable to connect to {url}, trying again in {self.automatic_retry_delay}s...")
+                if retry_status(resp.status_code):
                     logger.debug(f"Not able to pull key {key}, {str(err)}, trying again...")
-                    time.sleep(self.automatic_retry_delay)
+                    time.sleep(retry.failed(f"Unable to connect to {resp.url}"))
                     continue
-                elif resp.status_code == 400 and (
-                    "History not available" in resp.content.decode()
-                    or "required revision has been compacted" in resp.content.decode()
-                ):
+                elif history_not_available(resp.status_code, resp.content.decode()):
                     raise EngineHistoryNotAvailableError()
                 else:
                     raise EngineException(f"Not able to pull key {key}, {str(err)}")
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
-                logger.warning(f"Unable to connect to {url}, trying again in {self.automatic_retry_delay}s...")
                 logger.debug(f"Not able to pull key {key}, {str(err)}, trying again...")
-                time.sleep(self.automatic_retry_delay)
+                time.sleep(retry.failed(f"Unable to connect to {err.request.url}"))
                 continue
             except Exception as e:
                 logger.exception(e)
@@ -121,22 +166,13 @@ class EtcdRestEngine(EtcdEngine):
                 )
 
             # we got a good response, exit from the loop
+            retry.succeeded()
             break
 
         logger.debug(f"Query for {key} completed")
 
         # parse the result to return just key-value pairs
-        new_kvs: List[Dict[str, bytes]] = []
-        resp_body = resp.json()
-        if "kvs" in resp_body:
-            logger.debug("Building key-value list")
-            for kv in resp_body["kvs"]:
-                new_kv = self._parse_raw_kv(kv, key_only)
-                new_kvs.append(new_kv)
-                logger.debug(f"Key: {new_kv['key']} pulled successfully")
-
-        logger.debug(f"{len(new_kvs)} keys found")
-        return new_kvs
+        return parse_range(resp.json(), key_only)
 
     def delete(self, key: str, prefix: bool = True) -> List[Dict[str, bytes]]:
         """
@@ -147,29 +183,29 @@ class EtcdRestEngine(EtcdEngine):
         """
         logger.debug(f"Calling delete for {key}...")
 
-        url = self._base_url + "kv/deleterange"
-
         # determine the range_end
         if prefix:
-            range_end = self._encode_to_str_base64(str(self._incr_last_byte(key), "utf-8"))
+            range_end = encode(str(self._incr_last_byte(key), "utf-8"))
         else:
             range_end = None
 
-        # first authenticate and use the token for the header
-        self._authenticate()
-
         # encode key
-        encoded_key = self._encode_to_str_base64(key)
+        encoded_key = encode(key)
 
         # create the body for the delete range
         body = {"key": encoded_key, "range_end": range_end, "prev_kv": True}
         # make the call
         logger.debug(f"Deleting key range associated to key {key}")
+        self._retry_policy.check(f"delete key {key}")
         try:
-            resp = requests.post(url, json=body, headers=self.auth.header(), timeout=self.timeout)
+            resp = self._post("kv/deleterange", body)
             resp.raise_for_status()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+            self._retry_policy.breaker.record_failure()
+            raise EngineException(f"Not able to delete key {key}, {str(err)}")
         except Exception as err:
             raise EngineException(f"Not able to delete key {key}, {str(err)}")
+        self._retry_policy.breaker.record_success()
 
         logger.debug(f"Delete request for key {key} completed")
 
@@ -179,7 +215,7 @@ class EtcdRestEngine(EtcdEngine):
         if "prev_kvs" in resp_body:
             logger.debug("Building key-value list")
             for kv in resp_body["prev_kvs"]:
-                new_kv = self._parse_raw_kv(kv)
+                new_kv = parse_kv(kv)
                 del_kvs.append(new_kv)
                 logger.debug(f"Key: {new_kv['key']} deleted successfully")
 
@@ -194,10 +230,6 @@ class EtcdRestEngine(EtcdEngine):
         :return: True if successful
         """
         logger.debug("Calling push...")
-        url = self._base_url + "kv/txn"
-
-        # first authenticate and use the token for the header
-        self._authenticate()
 
         # check if we need to request a lease for the ttl
         if ttl:
@@ -209,15 +241,15 @@ class EtcdRestEngine(EtcdEngine):
         if ks_delete is not None and len(ks_delete) != 0:
             for kd in ks_delete:
                 # every key is deleted with prefix=True
-                range_end = self._encode_to_str_base64(str(self._incr_last_byte(kd), "utf-8"))
-                k = self._encode_to_str_base64(kd)
+                range_end = encode(str(self._incr_last_byte(kd), "utf-8"))
+                k = encode(kd)
                 delete = {"requestDeleteRange": {"key": k, "range_end": range_end}}
                 ops.append(delete)
 
         # Prepare the transaction with a put operation for each KV pair
         for kv in kvs:
-            k = self._encode_to_str_base64(kv["key"])
-            v = self._encode_to_str_base64(kv["value"])
+            k = encode(kv["key"])
+            v = encode(kv["value"])
             put = {"requestPut": {"key": k, "value": v}}
             if ttl:
                 put["requestPut"]["lease"] = lease
@@ -226,11 +258,16 @@ class EtcdRestEngine(EtcdEngine):
         body = {"success": ops}
         # commit transaction
         # logger.debug(f"Committing the transaction statement: {body}")
+        self._retry_policy.check("execute the transaction")
         try:
-            resp = requests.post(url, json=body, headers=self.auth.header(), timeout=self.timeout)
+            resp = self._post("kv/txn", body)
             resp.raise_for_status()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+            self._retry_policy.breaker.record_failure()
+            raise EngineException(f"Not able to execute the transaction, {str(err)}")
         except Exception as err:
             raise EngineException(f"Not able to execute the transaction, {str(err)}")
+        self._retry_policy.breaker.record_success()
 
         logger.debug("Transaction completed")
         resp_body = resp.json()
@@ -242,25 +279,92 @@ class EtcdRestEngine(EtcdEngine):
 
         return True
 
-    def _authenticate(self) -> bool:
+    def _post(self, path: str, body: Dict[str, any], read: bool = False, **kwargs) -> requests.Response:
         """
-        This method authenticates  the user and set the internal token, this is only done for Etcd authentication
-        :return: True if successfully authenticated
+        Internal method to send a request to the server with the authentication header. The members of the cluster are
+        tried in the order defined by the endpoint pool: the read requests move to the next member if one is
+        unreachable or failing, the write requests only if the connection could not be established, as otherwise
+        they may have been already executed
+        :param path: path of the request, relative to the API root
+        :param body: body of the request
+        :param read: True if the request does not change the state of the server
+        :param kwargs: additional arguments for the request, as stream or timeout
+        :return: the response of the server
         """
-        if type(self.auth) == EtcdAuth:
-            logger.debug(f"Authenticating user {self.auth.username}...")
-
-            url = self._base_url + "auth/authenticate"
-            body = {"name": self.auth.username, "password": self.auth.password}
+        kwargs.setdefault("timeout", self.timeout)
+        for endpoint, next_endpoint in self._endpoints.attempts(read):
+            start = time.time()
             try:
-                resp = requests.post(url, json=body, headers=self.auth.header(), timeout=self.timeout)
-                resp.raise_for_status()
-            except Exception as err:
-                raise EngineException(f"Not able to authenticate {self.auth.username}, {str(err)}")
-            assert resp.json().get("token") is not None, "No token found in authentication response"
-            self.auth.token = resp.json()["token"]
+                resp = self._post_to(api_url(endpoint, self.https), path, body, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+                if not self._endpoints.unreachable(endpoint, next_endpoint, read or self._not_sent(err), err):
+                    raise
+                continue
+            if self._endpoints.responded(endpoint, next_endpoint, resp.status_code, time.time() - start, read):
+                resp.close()
+                continue
+            return resp
+
+    def _post_to(self, base_url: str, path: str, body: Dict[str, any], **kwargs) -> requests.Response:
+        """
+        Internal method to send a request to a member of the cluster. If the member rejects the token, this is renewed
+        and the request sent once more
+        :param base_url: API root of the member
+        :param path: path of the request, relative to the API root
+        :param body: body of the request
+        :param kwargs: additional arguments for the request
+        :return: the response of the member
+        """
+        # first authenticate and use the token for the header
+        self._authenticate(base_url)
+        header = self.auth.header()
+        resp = self._session.post(base_url + path, json=body, headers=header, **kwargs)
+        if resp.status_code == 401 and isinstance(self.auth, EtcdAuth):
+            logger.debug(f"Authentication token of user {self.auth.username} rejected, authenticating again...")
+            resp.close()
+            self._authenticate(base_url, invalid_token=header.get("Authorization"))
+            resp = self._session.post(base_url + path, json=body, headers=self.auth.header(), **kwargs)
+        return resp
+
+    @staticmethod
+    def _not_sent(err: requests.exceptions.RequestException) -> bool:
+        """
+        :param err: error raised by a request
+        :return: True if the connection could not be established, so the request has not reached the server
+        """
+        if isinstance(err, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(err.args[0], "reason", None) if len(err.args) > 0 else None
+        return isinstance(reason, NewConnectionError)
 
-            logger.debug(f"User {self.auth.username} successfully authenticated")
+    def _authenticate(self, base_url: str = None, invalid_token: str = None) -> bool:
+        """
+        This method authenticates  the user and set the internal token, this is only done for Etcd authentication.
+        The token is shared by all the engines with the same authentication and server and it is renewed only if
+        expired or rejected by the server
+        :param base_url: API root of the member of the cluster to authenticate with, the first one if None
+        :param invalid_token: token rejected by the server, if any
+        :return: True if successfully authenticated
+        """
+        if isinstance(self.auth, EtcdAuth):
+            if self._token.valid(invalid_token):
+                return True
+            # only one thread renews the token, the others wait for it and then use the new one
+            with self._token.lock:
+                if self._token.valid(invalid_token):
+                    return True
+                logger.debug(f"Authenticating user {self.auth.username}...")
+
+                url = (base_url if base_url else self._base_url) + "auth/authenticate"
+                try:
+                    resp = self._session.post(url, json=self._token.request(), timeout=self.timeout)
+                    resp.raise_for_status()
+                except Exception as err:
+                    raise EngineException(f"Not able to authenticate {self.auth.username}, {str(err)}")
+                assert resp.json().get("token") is not None, "No token found in authentication response"
+                self._token.update(resp.json()["token"])
+
+                logger.debug(f"User {self.auth.username} successfully authenticated")
 
         return True
 
@@ -271,31 +375,26 @@ class EtcdRestEngine(EtcdEngine):
         """
         logger.debug("Querying notification server for latest revision")
 
-        url = self._base_url + "kv/range"
-
-        # first authenticate and use the token for the header
-        self._authenticate()
-
         # we need just the header back from the server
-        encoded_key = self._encode_to_str_base64(key)
+        encoded_key = encode(key)
         body = {"key": encoded_key, "keys_only": True}
         # make the call
+        retry = self._retry_policy.start("request latest revision")
         while True:
+            retry.wait()
             try:
-                resp = requests.post(url, json=body, headers=self.auth.header(), timeout=self.timeout)
+                resp = self._post("kv/range", body, read=True)
                 resp.raise_for_status()
             except requests.exceptions.HTTPError as err:
                 if resp.status_code == 408 or (resp.status_code >= 500 and resp.status_code < 600):
-                    logger.warning(f"Unable to connect to {url}, trying again in {self.automatic_retry_delay}s...")
                     logger.debug(f"Not able to request latest revision, {str(err)}, trying again...")
-                    time.sleep(self.automatic_retry_delay)
+                    time.sleep(retry.failed(f"Unable to connect to {resp.url}"))
                     continue
                 else:
                     raise EngineException(f"Not able to request latest revision, {str(err)}")
             except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
-                logger.warning(f"Unable to connect to {url}, trying again in {self.automatic_retry_delay}s...")
                 logger.debug(f"Not able to request latest revision, {str(err)}, trying again...")
-                time.sleep(self.automatic_retry_delay)
+                time.sleep(retry.failed(f"Unable to connect to {err.request.url}"))
                 continue
             except Exception as e:
                 logger.exception(e)
@@ -305,6 +404,7 @@ class EtcdRestEngine(EtcdEngine):
                 )
 
             # we got a good response, exit from the loop
+            retry.succeeded()
             break
 
         logger.debug("Query for latest revision completed")
@@ -326,20 +426,20 @@ class EtcdRestEngine(EtcdEngine):
         """
         logger.debug(f"Calling lease for ttl {ttl}...")
 
-        url = self._base_url + "lease/grant"
-
-        # first authenticate and use the token for the header
-        self._authenticate()
-
         # create the request body
         body = {"TTL": ttl, "ID": 0}
 
         # make the call
+        self._retry_policy.check("request a lease")
         try:
-            resp = requests.post(url, json=body, headers=self.auth.header(), timeout=self.timeout)
+            resp = self._post("lease/grant", body)
             resp.raise_for_status()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+            self._retry_policy.breaker.record_failure()
+            raise EngineException(f"Not able to request a lease, {str(err)}")
         except Exception as err:
             raise EngineException(f"Not able to request a lease, {str(err)}")
+        self._retry_policy.breaker.record_success()
 
         logger.debug("Lease request completed")
         resp_body = resp.json()
@@ -350,48 +450,81 @@ class EtcdRestEngine(EtcdEngine):
             logger.error(f"Not able to read lease id from {resp_body}")
             raise EngineException("Not able to acquire lease")
 
-    def _parse_raw_kv(self, kv: Dict[str, any], key_only: bool = False) -> Dict[str, any]:
-        """
-        Internal method to translate the kv pair coming from the etcd server into a dictionary that fits better this
-        application
-        :param kv: raw kv pair from the etcd server
-        :param key_only:
-        :return: translated kv pair as dictionary
+    def _watch(self, key: str, start_rev: int) -> Iterator[List[Dict[str, any]]]:
         """
-        new_kv = {}
-        if not key_only:
-            new_kv["value"] = self._decode_to_bytes(kv["value"])  # leave it as binary
-        new_kv["key"] = self._decode_to_bytes(kv["key"]).decode()
-        new_kv["version"] = int(kv["version"])
-        new_kv["create_rev"] = int(kv["create_revision"])
-        new_kv["mod_rev"] = int(kv["mod_revision"])
-        return new_kv
-
-    def _encode_to_str_base64(self, obj: any) -> str:
+        This method opens a watch stream on the gRPC gateway for all the keys starting with the key passed. The stream
+        ends when the watch is cancelled or the connection to the server is lost.
+        :param key: key to watch as a prefix
+        :param start_rev: revision from which the changes are requested
+        :return: iterator of the lists of key-value pairs created or modified, formatted as dictionary.
+        An empty list is yielded once the watch is created
         """
-        Internal method to translate the object passed in a field that could be accepted by etcd and the request library
-        for the key or value. The request library accepts only strings encoded in base64 while etcd wants binaries for
-        the key and value fields.
-        :param obj:
-        :return: a base64 string representation of the binary translation
-        """
-        if type(obj) is bytes:
-            binary = obj
-        elif type(obj) is str:
-            binary = obj.encode()
-        else:
-            binary = str(obj).encode()
+        logger.debug(f"Calling watch for {key} from revision {start_rev}...")
 
-        return str(base64.b64encode(binary), "utf-8")
-
-    def _decode_to_bytes(self, string: str) -> any:
+        # create the body for the watch request, deleted keys are not notifications so we only need the puts
+        body = {
+            "create_request": {
+                "key": encode(key),
+                "range_end": encode(str(self._incr_last_byte(key), "utf-8")),
+                "start_revision": start_rev,
+                "filters": ["NODELETE"],
+            }
+        }
+        try:
+            # the stream stays open, only the connection is subject to the timeout
+            resp = self._post("watch", body, read=True, stream=True, timeout=(self.timeout, None))
+            resp.raise_for_status()
+        except requests.exceptions.HTTPError as err:
+            if retry_status(resp.status_code):
+                logger.debug(f"Not able to watch key {key}, {str(err)}")
+                return
+            raise EngineException(f"Not able to watch key {key}, {str(err)}")
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+            logger.debug(f"Not able to watch key {key}, {str(err)}")
+            return
+
+        cancelled = threading.Event()
+        connection = getattr(resp.raw, "connection", None)
+        sock = getattr(connection, "sock", None)
+
+        def cancel():
+            cancelled.set()
+            # closing the response would not interrupt a read in progress, shutting down the socket does
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+        self._add_watch(key, cancel)
+        try:
+            for watch_resp in self._decode_stream(resp):
+                kvs = watch_kvs(key, watch_resp)
+                if len(kvs) > 0 or watch_resp.get("result", {}).get("created"):
+                    yield kvs
+        except (requests.exceptions.RequestException, OSError) as err:
+            if cancelled.is_set():
+                logger.debug(f"Watch of key {key} cancelled")
+            else:
+                logger.debug(f"Watch of key {key} interrupted, {str(err)}", exc_info=True)
+        finally:
+            cancel()
+            resp.close()
+            self._remove_watch(key, cancel)
+
+    @staticmethod
+    def _decode_stream(resp: requests.Response) -> Iterator[Dict[str, any]]:
         """
-        Internal method to translate what is coming back from the notification server.
-        The request library returns only string base64 encoded
-        :param string:
-        :return: the payload decoded from the base64 string representation
+        Internal method to decode incrementally the JSON objects streamed by the gRPC gateway. The objects are
+        normally delimited by a new line but the gateway can also concatenate them.
+        :param resp: streaming response
+        :return: iterator of the JSON objects as dictionary
         """
-        return base64.decodebytes(string.encode())
+        utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        buffer = ""
+        for chunk in resp.iter_content(chunk_size=None):
+            objs, buffer = decode_buffer(buffer + utf8_decoder.decode(chunk))
+            yield from objs
 
 
 # Enable HTTPConnection debug logging to the logging framework
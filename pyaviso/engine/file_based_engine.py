@@ -6,35 +6,50 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
-import _thread
 import os
-import threading
-import time
-from datetime import datetime
-from queue import Queue
-from shutil import rmtree
-from typing import Dict, List
-
-import pyinotify
+from typing import Dict, List, Tuple
 
 from .. import logger
 from ..authentication.auth import Auth
+from ..custom_exceptions import EngineException
 from ..user_config import EngineConfig
-from .engine import Engine
+from .etcd_engine import MAX_KV_RETURNED, EtcdEngine
+from .in_memory_engine import KeyVersion
+from .journal import Journal
+from .journal_watcher import JournalWatcher
+
+JOURNAL_PATH = "/tmp/aviso/journal"  # if not configured
 
 
-class FileBasedEngine(Engine):
+class FileBasedEngine(EtcdEngine):
     """
-    This class is a specialisation of the Engine class. It implements a file-based server to be used for testing
+    This class is a specialisation of the Engine class. It implements a file-based server to be used for testing. The
+    changes are appended to a journal file shared by all the processes of the machine, following the revision model
+    of etcd, so the listening can catch up and retrieve past notifications as with a server. The keys listened are
+    notified as soon as the journal is modified, instead of polling it.
     """
 
-    def __init__(self, config: EngineConfig, auth: Auth):
-        super(FileBasedEngine, self).__init__(config, auth)
-        self._listening_list = []
+    def __init__(self, config: EngineConfig, auth: Auth, journal_path: str = None):
+        """
+        :param config: engine configuration
+        :param auth: authentication, ignored
+        :param journal_path: path of the journal file, the one configured if None
+        """
+        # the last revisions processed are the ones of the journal, not of a server
+        super(FileBasedEngine, self).__init__(config, auth, checkpoint_server="file_based")
         logger.warning("TEST MODE")
         self._polling_interval = 1  # for testing we can do a much faster polling time
+        self._min_polling_interval = min(self._min_polling_interval, self._polling_interval)
+        self.watch = False  # the changes are notified by the JournalWatcher below
         self._host = "localhost"
         self._port = ""
+        self._journal = Journal(journal_path or config.journal_path or JOURNAL_PATH)
+        # the keys listened from now are notified by a single thread woken up by the changes to the journal
+        self._scheduler = JournalWatcher(self)
+
+    @property
+    def journal(self) -> Journal:
+        return self._journal
 
     def pull(
         self,
@@ -49,52 +64,56 @@ class FileBasedEngine(Engine):
         This method implements a query to the notification server for all the key-values associated to the key as input.
         This key by default is a prefix, it can therefore return a set of key-values
         :param key: input in the query
-        :param key_only: ignored for TestEngine
-        :param rev: ignored for TestEngine
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
         :param prefix: if true the function will retrieve all the KV pairs starting with the key passed
-        :param min_rev: ignored for TestEngine
-        :param max_rev: ignored for TestEngine
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
         :return: List of key-value pairs formatted as dictionary
         """
-        if key_only:
-            logger.warning("key_only option is disabled in TestMode")
-        if rev:
-            logger.warning("rev option is disabled in TestMode")
-        if min_rev:
-            logger.warning("min_rev option is disabled in TestMode")
-        if max_rev:
-            logger.warning("max_rev option is disabled in TestMode")
-
-        def read_key(k):
-            try:
-                with open(k, "r") as f:
-                    v = f.read()
-            except Exception:
-                logger.warning(f"Reading of the {k} has failed")
-                logger.debug("", exc_info=True)
-                return
-            new_kv = {"key": k, "value": v.encode()}
-            new_kvs.append(new_kv)
-            logger.debug(f"Key: {k} pulled successfully")
-
         logger.debug(f"Calling pull for {key}...")
-        new_kvs: List[Dict[str, bytes]] = []
-        if os.path.exists(key):
-            if os.path.isdir(key):
-                # first list the directory
-                for x in os.walk(key):
-                    for fp in x[2]:  # any file
-                        kk: str = os.path.join(x[0], fp)
-                        read_key(kk)
-                    if not prefix:  # we only look at the current directory, nothing deeper
-                        break
-            else:
-                read_key(key)
-
+        range_end = self._incr_last_byte(key) if prefix else None
+        new_kvs, _, _ = self._range(key, range_end, key_only=key_only, rev=rev, min_rev=min_rev, max_rev=max_rev)
         logger.debug(f"Query for {key} completed")
-        logger.debug(f"{len(new_kvs)} keys found")
         return new_kvs
 
+    def _range(
+        self,
+        key: str,
+        range_end: bytes = None,
+        key_only: bool = False,
+        rev: int = None,
+        min_rev: int = None,
+        max_rev: int = None,
+        limit: int = MAX_KV_RETURNED,
+        sort_order: str = "DESCEND",
+        serializable: bool = False,
+    ) -> Tuple[List[Dict[str, any]], bool, int]:
+        """
+        This method implements a range request to the journal, sorted by key. The records appended since the last
+        request are indexed first
+        :param key: first key of the range
+        :param range_end: end of the range, excluded, if None only the key is requested
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :param limit: max number of key-value pairs to return
+        :param sort_order: ASCEND or DESCEND
+        :param serializable: ignored, the journal is always read up to its last record
+        :return: List of key-value pairs formatted as dictionary, True if more pairs are in the range, revision of
+        the journal when the request was served
+        """
+        self._journal.sync()
+        if range_end is not None:
+            range_end = range_end.decode() if type(range_end) is bytes else range_end
+        kvs, more, revision = self._journal.index.range(
+            key, range_end, rev=rev, min_rev=min_rev, max_rev=max_rev, limit=limit, descend=sort_order == "DESCEND"
+        )
+        new_kvs = [self._parse_raw_kv(k, kv, key_only) for k, kv in kvs]
+        logger.debug(f"{len(new_kvs)} keys found")
+        return new_kvs, more, revision
+
     def delete(self, key: str, prefix: bool = True) -> List[Dict[str, bytes]]:
         """
         This method deletes all the keys associated to this key, the key is a prefix as default
@@ -103,33 +122,10 @@ class FileBasedEngine(Engine):
         :return: kvs deleted
         """
         logger.debug(f"Calling delete for {key}...")
-
-        del_kvs: List[Dict[str, bytes]] = []
-        if os.path.exists(key):
-            if os.path.isdir(key):
-                # first list the directory
-                for x in os.walk(key):
-                    for fp in x[2]:  # any file
-                        k: str = os.path.join(x[0], fp)
-                        new_kv = {"key": k}
-                        del_kvs.append(new_kv)
-            else:
-                new_kv = {"key": key}
-                del_kvs.append(new_kv)
-
-            # now the delete the directory or file
-            try:
-                if os.path.isdir(key):
-                    rmtree(key)
-                else:
-                    os.remove(key)
-            except Exception as e:
-                logger.warning(f"Cannot delete the key {key},  {e}")
-                logger.debug("", exc_info=True)
-
+        range_end = self._incr_last_byte(key).decode() if prefix else None
+        _, deleted = self._journal.append([], [(key, range_end)])
         logger.debug(f"Delete request for key {key} completed")
-
-        return del_kvs
+        return [self._parse_raw_kv(k, kv) for k, kv in deleted]
 
     def push(self, kvs: List[Dict[str, any]], ks_delete: List[str] = None, ttl: int = None) -> bool:
         """
@@ -140,126 +136,72 @@ class FileBasedEngine(Engine):
         :return: True if successful
         """
         logger.debug("Calling push...")
-
-        # first delete the keys requested
-        if ks_delete is not None and len(ks_delete) != 0:
-            for kd in ks_delete:
-                if os.path.exists(kd):
-                    try:
-                        if os.path.isdir(kd):
-                            rmtree(kd)
-                        else:
-                            os.remove(kd)
-                    except Exception as e:
-                        logger.warning(f"Cannot delete the key {kd},  {e}")
-                        logger.debug("", exc_info=True)
-
-        # save the keys to files
-        for kv in kvs:
-            k = kv["key"]
-            v = kv["value"]
-            file_name: str = k.split("/").pop()
-            if not file_name == "":
-                folder_path = k[: -len(file_name)]
-            else:  # if k ends in / it means it the base directory, this is used to saved the status
-                folder_path = k
-                k += "status"
-            if not os.path.exists(folder_path):
-                try:
-                    os.makedirs(folder_path, exist_ok=True)
-                except OSError:
-                    logger.warning(f"Cannot create the directory: {folder_path}")
-                    logger.debug("", exc_info=True)
-                    return False
-            try:
-                with open(k, "w+") as f:
-                    f.write(v)
-            except Exception:
-                logger.warning(f"Saving of the {k} has failed")
-                logger.debug("", exc_info=True)
-                return False
-
-        logger.debug("Transaction completed")
-
+        if ttl:
+            logger.warning("ttl option is disabled in TestMode")
+
+        # every key is deleted with prefix=True
+        delete_ranges = [(kd, self._incr_last_byte(kd).decode()) for kd in ks_delete or []]
+        puts = [(kv["key"], self._encode(kv["value"])) for kv in kvs]
+        rev, _ = self._journal.append(puts, delete_ranges)
+        logger.debug(f"Transaction completed, new journal revision {rev}")
         return True
 
-    def _polling(
-        self,
-        key: str,
-        callback: callable([str, str]),
-        channel: Queue,
-        from_date: datetime = None,
-        to_date: datetime = None,
-    ):
+    def import_files(self, folder: str) -> int:
         """
-        This method implements the active polling
-        :param key: key to watch as a prefix
-        :param callback: function to call if any change happen
-        :param channel: global communication channel among threads
-        :param from_date: ignored for TestMode
-        :param to_date: ignored for TestMode
-        :return:
+        This method imports the keys saved by the versions preceding the journal, one file per key with the key as
+        path, so their notifications can still be pulled. The keys found under the folder are pushed to the journal in
+        a single change, at a new revision, while the files are left in place
+        :param folder: folder of the keys to import
+        :return: number of keys imported
         """
-        if from_date:
-            logger.warning("from_date option is disabled in TestMode")
-        if to_date:
-            logger.warning("to_date option is disabled in TestMode")
-        try:
-            # first create the directory to watch
-            if not os.path.exists(key):
-                try:
-                    os.makedirs(key, exist_ok=True)
-                except OSError:
-                    logger.warning(f"Cannot create the directory: {key}")
-                    logger.debug("", exc_info=True)
-                    return False
-
-            # create a watch manager
-            wm = pyinotify.WatchManager()  # Watch Manager
-            mask = pyinotify.IN_CLOSE_WRITE  # watched events
-
-            # define a class to handle the new events
-            class EventHandler(pyinotify.ProcessEvent):
-                def __init__(self, engine):
-                    super(EventHandler, self).__init__()
-                    self._engine = engine
-
-                def process_IN_CLOSE_WRITE(self, event):
-                    if not os.path.isdir(event.pathname):
-                        kvs = self._engine.pull(key=event.pathname)
-                        for kv in kvs:
-                            k = kv["key"]
-                            v = kv["value"].decode()
-                            # skip the status
-                            if kv["key"].endswith("status"):
-                                continue
-                            logger.debug(f"Notification received for key {k}")
-                            try:
-                                # execute the trigger
-                                callback(k, v)
-                            except Exception as ee:
-                                logger.error(f"Error with notification trigger, exception: {type(ee)} {ee}")
-                                logger.debug("", exc_info=True)
-
-            # add the handler to the watch manager and define the watching task
-            handler = EventHandler(engine=self)
-            notifier = pyinotify.Notifier(wm, handler, read_freq=self._polling_interval)
-            wm.add_watch(key, mask, rec=True, auto_add=True)
+        kvs = []
+        for root, _, files in os.walk(folder):
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                # the journal and its compaction snapshot can be in the same folder
+                if path == self._journal.path or path.startswith(self._journal.path + "."):
+                    continue
+                with open(path, "rb") as f:
+                    kvs.append({"key": path, "value": f.read()})
+        if len(kvs) > 0:
+            self.push(kvs)
+        logger.info(f"{len(kvs)} keys imported from {folder}")
+        return len(kvs)
+
+    # the statuses are read from the local journal, there is no need to cache them on disk
+
+    def _status_cache(self, key: str) -> Dict[str, Dict[str, any]]:
+        return self._status_caches.setdefault(key, {})
+
+    def _save_status_cache(self, key: str) -> bool:
+        return True
 
-            # encapsulate the watcher in a daemon thread so we can stop it
-            def t_run():
-                notifier.loop()
+    def _latest_revision(self, key: str) -> int:
+        """
+        :param: key used for the server request, ignored
+        :return: latest revision of the journal
+        """
+        return self._journal.sync()
 
-            t = threading.Thread(target=t_run)
-            t.setDaemon(True)
-            t.start()
+    def _lease(self, ttl) -> str:
+        raise EngineException("Leases are not supported in TestMode")
 
-            # this is the stop condition
-            while key in self._listeners:
-                time.sleep(0.1)
-            notifier.stop()
+    @staticmethod
+    def _encode(value: any) -> bytes:
+        if type(value) is bytes:
+            return value
+        return str(value).encode()
 
-        except Exception as e:
-            logger.error(f"Error while listening to key {key}, {e}")
-            logger.debug("", exc_info=True)
-            _thread.interrupt_main()
+    def _parse_raw_kv(self, key: str, kv: KeyVersion, key_only: bool = False) -> Dict[str, any]:
+        """
+        Internal method to translate a version of a key of the journal index into a dictionary as returned by the
+        other engines
+        :param key: key
+        :param kv: version of the key, its value is the location in the journal
+        :param key_only: if True the value is not returned
+        :return: translated kv pair as dictionary
+        """
+        new_kv = {"key": key, "version": kv.version, "create_rev": kv.create_rev, "mod_rev": kv.mod_rev}
+        if not key_only:
+            new_kv["value"] = self._journal.read(kv.value)
+        return new_kv
@@ -0,0 +1,537 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import bisect
+import itertools
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .. import logger
+from ..authentication.auth import Auth
+from ..custom_exceptions import EngineException, EngineHistoryNotAvailableError
+from ..user_config import EngineConfig
+from .etcd_engine import MAX_KV_RETURNED, EtcdEngine
+
+WATCH_WAKEUP_INTERVAL = 1  # seconds, max time a watch waits before checking if it has been cancelled
+
+
+class KeyVersion:
+    """
+    This class holds a version of a key of the MemoryStore. A deleted key is recorded as a version without value.
+    The value is stored as it is passed to the store, this can also be where to read it, as done by the Journal
+    """
+
+    __slots__ = ("mod_rev", "create_rev", "version", "value", "lease")
+
+    def __init__(self, mod_rev: int, create_rev: int, version: int, value: Optional[any], lease: Optional[int]):
+        self.mod_rev = mod_rev
+        self.create_rev = create_rev
+        self.version = version
+        self.value = value
+        self.lease = lease
+
+    @property
+    def deleted(self) -> bool:
+        return self.value is None
+
+
+class MemoryStore:
+    """
+    This class implements an in-process key-value store following the etcd data model: every change increments a
+    global revision, each key keeps its version, creation and modification revisions and all its past versions until
+    compacted. The keys can be attached to leases, deleted once their TTL expires. The store is thread-safe and the
+    stores are shared by all the engines of the process configured with the same host and port.
+    """
+
+    _stores: Dict[str, "MemoryStore"] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self):
+        self._revision = 1  # as etcd, the first change is at revision 2
+        self._compact_rev = 0
+        self._history: Dict[str, List[KeyVersion]] = {}  # versions of each key, sorted by revision
+        self._keys: List[str] = []  # keys sorted, for the range requests
+        self._changes: List[Tuple[int, str]] = []  # keys changed, sorted by revision
+        self._leases: Dict[int, Tuple[float, set]] = {}  # expiry time and keys, by lease id
+        self._lease_ids = itertools.count(1)
+        # last revisions processed by the engines listening, by key
+        self.checkpoints: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    @classmethod
+    def get(cls, name: str) -> "MemoryStore":
+        """
+        :param name: name of the store
+        :return: the store of this process with the name passed, created if not existing yet
+        """
+        with cls._stores_lock:
+            if name not in cls._stores:
+                cls._stores[name] = MemoryStore()
+            return cls._stores[name]
+
+    @property
+    def revision(self) -> int:
+        with self._lock:
+            self._expire_leases()
+            return self._revision
+
+    @property
+    def compact_revision(self) -> int:
+        with self._lock:
+            return self._compact_rev
+
+    def range(
+        self,
+        key: str,
+        range_end: Optional[str] = None,
+        rev: int = None,
+        min_rev: int = None,
+        max_rev: int = None,
+        limit: int = None,
+        descend: bool = False,
+    ) -> Tuple[List[Tuple[str, KeyVersion]], bool, int]:
+        """
+        This method returns the keys of the range as they were at the revision requested
+        :param key: first key of the range
+        :param range_end: end of the range, excluded, if None only the key is returned
+        :param rev: revision to read, the current one if None
+        :param min_rev: if provided only the keys modified at or after this revision are returned
+        :param max_rev: if provided only the keys modified at or before this revision are returned
+        :param limit: max number of keys to return
+        :param descend: if True the keys are sorted descending
+        :return: list of keys with their version, True if more keys are in the range, current revision
+        """
+        with self._lock:
+            self._expire_leases()
+            if rev is not None and rev > 0:
+                if rev < self._compact_rev:
+                    raise EngineHistoryNotAvailableError()
+                if rev > self._revision:
+                    raise EngineException(f"Revision {rev} is a future revision")
+            else:
+                rev = self._revision
+
+            if range_end is None:
+                keys = [key] if key in self._history else []
+            elif min_rev and min_rev >= self._compact_rev and rev == self._revision:
+                # only the keys changed since min_rev can match, they are found in the log of the changes
+                start = bisect.bisect_left(self._changes, (min_rev, ""))
+                keys = sorted({k for _, k in self._changes[start:] if key <= k < range_end})
+            else:
+                keys = self._keys[bisect.bisect_left(self._keys, key) : bisect.bisect_left(self._keys, range_end)]
+            if descend:
+                keys = list(reversed(keys))
+
+            result = []
+            more = False
+            for k in keys:
+                kv = self._version_at(k, rev)
+                if kv is None or kv.deleted:
+                    continue
+                if (min_rev and kv.mod_rev < min_rev) or (max_rev and kv.mod_rev > max_rev):
+                    continue
+                if limit and len(result) == limit:
+                    more = True
+                    break
+                result.append((k, kv))
+            return result, more, self._revision
+
+    def changes(self, min_rev: int) -> Tuple[List[Tuple[str, KeyVersion]], int]:
+        """
+        This method returns the keys changed since the revision passed, read from the log of the changes
+        :param min_rev: first revision of the changes
+        :return: list of the keys created or modified with their last version, sorted by revision, current revision
+        """
+        with self._lock:
+            self._expire_leases()
+            if min_rev < self._compact_rev:
+                raise EngineHistoryNotAvailableError()
+            start = bisect.bisect_left(self._changes, (min_rev, ""))
+            result = []
+            seen = set()
+            # a key changed more than once is returned at its last change
+            for _, k in reversed(self._changes[start:]):
+                if k in seen:
+                    continue
+                seen.add(k)
+                kv = self._history[k][-1]
+                if not kv.deleted:
+                    result.append((k, kv))
+            result.reverse()
+            return result, self._revision
+
+    def txn(
+        self,
+        puts: List[Tuple[str, any]],
+        delete_ranges: List[Tuple[str, Optional[str]]] = None,
+        lease: int = None,
+    ) -> Tuple[int, List[Tuple[str, KeyVersion]]]:
+        """
+        This method applies the deletions and then the puts as a single change, at the same revision
+        :param puts: keys and values to put
+        :param delete_ranges: ranges of keys to delete, as first key and end of the range excluded, or None for a key
+        :param lease: lease to attach to the keys put
+        :return: the revision of the change, keys deleted with their previous version
+        """
+        with self._lock:
+            self._expire_leases()
+            if lease is not None and lease not in self._leases:
+                raise EngineException(f"Lease {lease} not found")
+            rev = self._revision + 1
+            deleted = []
+            for key, range_end in delete_ranges or []:
+                deleted.extend(self._delete(key, range_end, rev))
+            for key, value in puts:
+                self._put(key, value, rev, lease)
+            if len(deleted) > 0 or len(puts) > 0:
+                self._commit(rev)
+            return self._revision, deleted
+
+    def grant(self, ttl: int) -> int:
+        """
+        :param ttl: time to live of the lease, in seconds
+        :return: id of the new lease
+        """
+        with self._lock:
+            lease = next(self._lease_ids)
+            self._leases[lease] = (time.time() + ttl, set())
+            return lease
+
+    def compact(self, rev: int):
+        """
+        This method drops the versions of the keys older than the revision passed, only the last version of each key
+        at that revision is kept, if not deleted
+        :param rev: revision to compact
+        """
+        with self._lock:
+            if rev > self._revision:
+                raise EngineException(f"Revision {rev} is a future revision")
+            if rev <= self._compact_rev:
+                return
+            for key in list(self._history):
+                versions = self._history[key]
+                i = bisect.bisect_right([v.mod_rev for v in versions], rev)
+                if i > 0 and versions[i - 1].deleted:
+                    del versions[:i]
+                elif i > 1:
+                    del versions[: i - 1]
+                if len(versions) == 0:
+                    del self._history[key]
+                    self._keys.pop(bisect.bisect_left(self._keys, key))
+            del self._changes[: bisect.bisect_left(self._changes, (rev, ""))]
+            self._compact_rev = rev
+            logger.debug(f"Store compacted at revision {rev}")
+
+    def snapshot(self) -> Tuple[int, List[Tuple[str, KeyVersion]]]:
+        """
+        :return: current revision, last version of each key not deleted, sorted by key
+        """
+        with self._lock:
+            self._expire_leases()
+            kvs = [(k, self._history[k][-1]) for k in self._keys]
+            return self._revision, [(k, kv) for k, kv in kvs if not kv.deleted]
+
+    def restore(self, rev: int, kvs: List[Tuple[str, KeyVersion]]):
+        """
+        This method loads a snapshot in an empty store, as if all the changes up to the revision had been compacted
+        :param rev: revision of the snapshot
+        :param kvs: last version of each key at the revision
+        """
+        with self._lock:
+            if self._revision > 1 or len(self._history) > 0:
+                raise EngineException("A snapshot can only be restored in an empty store")
+            for key, kv in kvs:
+                self._history[key] = [kv]
+            self._keys = sorted(self._history)
+            self._changes = sorted((kv.mod_rev, key) for key, kv in kvs)
+            self._compact_rev = rev
+            self._commit(rev)
+
+    def wait(self, rev: int, timeout: float) -> bool:
+        """
+        This method waits until the store reaches the revision passed
+        :param rev: revision waited
+        :param timeout: max number of seconds to wait
+        :return: True if the revision has been reached
+        """
+        with self._changed:
+            self._expire_leases()
+            return self._changed.wait_for(lambda: self._revision >= rev, timeout)
+
+    def wake_up(self):
+        """
+        This method wakes up the threads waiting for a revision
+        """
+        with self._changed:
+            self._changed.notify_all()
+
+    def _version_at(self, key: str, rev: int) -> Optional[KeyVersion]:
+        versions = self._history.get(key, [])
+        if len(versions) > 0 and versions[-1].mod_rev <= rev:  # most common case
+            return versions[-1]
+        i = bisect.bisect_right([v.mod_rev for v in versions], rev)
+        return versions[i - 1] if i > 0 else None
+
+    def _put(self, key: str, value: any, rev: int, lease: Optional[int]):
+        versions = self._history.get(key)
+        if versions is None:
+            versions = self._history[key] = []
+            bisect.insort(self._keys, key)
+        last = versions[-1] if len(versions) > 0 else None
+        if last is not None and last.lease is not None and last.lease in self._leases:
+            self._leases[last.lease][1].discard(key)
+        if last is None or last.deleted:
+            kv = KeyVersion(rev, rev, 1, value, lease)
+        else:
+            kv = KeyVersion(rev, last.create_rev, last.version + 1, value, lease)
+        if last is not None and last.mod_rev == rev:  # put twice in the same change
+            versions[-1] = kv
+        else:
+            versions.append(kv)
+        if lease is not None:
+            self._leases[lease][1].add(key)
+        self._changes.append((rev, key))
+
+    def _delete(self, key: str, range_end: Optional[str], rev: int) -> List[Tuple[str, KeyVersion]]:
+        if range_end is None:
+            keys = [key] if key in self._history else []
+        else:
+            keys = self._keys[bisect.bisect_left(self._keys, key) : bisect.bisect_left(self._keys, range_end)]
+        deleted = []
+        for k in keys:
+            last = self._history[k][-1]
+            if last.deleted:
+                continue
+            deleted.append((k, last))
+            self._history[k].append(KeyVersion(rev, 0, 0, None, None))
+            self._changes.append((rev, k))
+        return deleted
+
+    def _commit(self, rev: int):
+        # the lock must be held
+        self._revision = rev
+        self._changed.notify_all()
+
+    def _expire_leases(self):
+        # the lock must be held
+        now = time.time()
+        expired = [lease for lease, (expiry, _) in self._leases.items() if expiry <= now]
+        if len(expired) == 0:
+            return
+        rev = self._revision + 1
+        deleted = 0
+        for lease in expired:
+            _, keys = self._leases.pop(lease)
+            for key in keys:
+                deleted += len(self._delete(key, None, rev))
+        if deleted > 0:
+            self._commit(rev)
+            logger.debug(f"{deleted} keys expired at revision {rev}")
+
+
+class InMemoryEngine(EtcdEngine):
+    """
+    This class is a specialisation of the Engine class, storing the key-value pairs in a MemoryStore of the current
+    process. It follows the same revision model of etcd, with history, compaction and leases, so the listening,
+    including catchup and the search of past notifications, works as with a server. It is meant for tests and
+    benchmarks.
+    """
+
+    def __init__(self, config: EngineConfig, auth: Auth):
+        super(InMemoryEngine, self).__init__(config, auth)
+        self._store = MemoryStore.get(f"{self.host}:{self.port}")
+
+    @property
+    def store(self) -> MemoryStore:
+        return self._store
+
+    def pull(
+        self,
+        key: str,
+        key_only: bool = False,
+        rev: int = None,
+        prefix: bool = True,
+        min_rev: int = None,
+        max_rev: int = None,
+    ) -> List[Dict[str, any]]:
+        """
+        This method implements a query to the notification server for all the key-values associated to the key as input.
+        This key by default is a prefix, it can therefore return a set of key-values
+        :param key: input in the query
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param prefix: if true the function will retrieve all the KV pairs starting with the key passed
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :return: List of key-value pairs formatted as dictionary
+        """
+        logger.debug(f"Calling pull for {key}...")
+        range_end = self._incr_last_byte(key) if prefix else None
+        new_kvs, _, _ = self._range(key, range_end, key_only=key_only, rev=rev, min_rev=min_rev, max_rev=max_rev)
+        return new_kvs
+
+    def _range(
+        self,
+        key: str,
+        range_end: bytes = None,
+        key_only: bool = False,
+        rev: int = None,
+        min_rev: int = None,
+        max_rev: int = None,
+        limit: int = MAX_KV_RETURNED,
+        sort_order: str = "DESCEND",
+        serializable: bool = False,
+    ) -> Tuple[List[Dict[str, any]], bool, int]:
+        """
+        This method implements a range request to the notification server, sorted by key
+        :param key: first key of the range
+        :param range_end: end of the range, excluded, if None only the key is requested
+        :param key_only: if True no values are returned
+        :param rev: revision to pull
+        :param min_rev: if provided it filters for only KV pairs with mod_revision >= to min_rev
+        :param max_rev: if provided it filters for only KV pairs with mod_revision <= to max_rev
+        :param limit: max number of key-value pairs to return
+        :param sort_order: ASCEND or DESCEND
+        :param serializable: ignored, the store has a single member
+        :return: List of key-value pairs formatted as dictionary, True if more pairs are in the range, revision of
+        the server when the request was served
+        """
+        if range_end is not None:
+            range_end = range_end.decode() if type(range_end) is bytes else range_end
+        kvs, more, revision = self._store.range(
+            key, range_end, rev=rev, min_rev=min_rev, max_rev=max_rev, limit=limit, descend=sort_order == "DESCEND"
+        )
+        new_kvs = [self._parse_raw_kv(k, kv, key_only) for k, kv in kvs]
+        logger.debug(f"{len(new_kvs)} keys found")
+        return new_kvs, more, revision
+
+    def push(self, kvs: List[Dict[str, any]], ks_delete: List[str] = None, ttl: int = None) -> bool:
+        """
+        Method to submit a list of key-value pairs and delete a list of keys from the server as a single transaction
+        :param kvs: List of KV pair
+        :param ks_delete: List of keys to delete before the push of the new ones. Note that each key is read as a folder
+        :param ttl: time to leave of the keys pushed, once expired the keys will be deleted
+        :return: True if successful
+        """
+        logger.debug("Calling push...")
+        lease = self._lease(ttl) if ttl else None
+        # every key is deleted with prefix=True
+        delete_ranges = [(kd, self._incr_last_byte(kd).decode()) for kd in ks_delete or []]
+        puts = [(kv["key"], self._encode(kv["value"])) for kv in kvs]
+        rev, _ = self._store.txn(puts, delete_ranges, lease)
+        logger.debug(f"New server revision {rev}")
+        return True
+
+    def delete(self, key: str, prefix: bool = True) -> List[Dict[str, bytes]]:
+        """
+        This method deletes all the keys associated to this key, the key is a prefix as default
+        :param key: key prefix to delete
+        :param prefix: if true the function will delete all the KV pairs starting with the key passed
+        :return: kvs deleted
+        """
+        logger.debug(f"Calling delete for {key}...")
+        range_end = self._incr_last_byte(key).decode() if prefix else None
+        _, deleted = self._store.txn([], [(key, range_end)])
+        return [self._parse_raw_kv(k, kv) for k, kv in deleted]
+
+    def compact(self, rev: int):
+        """
+        This method drops the history of the store before the revision passed
+        :param rev: revision to compact
+        """
+        self._store.compact(rev)
+
+    # the store only lives in this process, so the last revisions processed and the statuses are not saved to disk
+
+    def _last_saved_revision(self, name: str) -> int:
+        return self._store.checkpoints.get(name, -1)
+
+    def _save_last_revision(self, name: str, rev: int) -> bool:
+        if rev is not None:
+            self._store.checkpoints[name] = rev
+        return True
+
+    def _delete_saved_revision(self, name: str):
+        self._store.checkpoints.pop(name, None)
+
+    def _status_cache(self, key: str) -> Dict[str, Dict[str, any]]:
+        return self._status_caches.setdefault(key, {})
+
+    def _save_status_cache(self, key: str) -> bool:
+        return True
+
+    def _latest_revision(self, key: str) -> int:
+        """
+        :param: key used for the server request, ignored
+        :return: latest revision of the notification server.
+        """
+        return self._store.revision
+
+    def _lease(self, ttl) -> int:
+        """
+        This method requests a Lease for the TTL specified
+        :param ttl: Lease TTL
+        :return: lease id
+        """
+        return self._store.grant(ttl)
+
+    def _watch(self, key: str, start_rev: int) -> Iterator[List[Dict[str, any]]]:
+        """
+        This method follows the changes of the store for all the keys starting with the key passed, until the watch is
+        cancelled. The changes are read at each new revision, so a key changed more than once in the meantime is
+        returned once, at its last version
+        :param key: key to watch as a prefix
+        :param start_rev: revision from which the changes are requested
+        :return: iterator of the lists of key-value pairs created or modified, formatted as dictionary.
+        An empty list is yielded once the watch is created
+        """
+        logger.debug(f"Calling watch for {key} from revision {start_rev}...")
+        # as etcd, a watch cannot start from a compacted revision, the changes missed are retrieved by the caller
+        if start_rev < self._store.compact_revision:
+            raise EngineHistoryNotAvailableError()
+        cancelled = threading.Event()
+
+        def cancel():
+            cancelled.set()
+            self._store.wake_up()
+
+        self._add_watch(key, cancel)
+        try:
+            yield []
+            next_rev = start_rev
+            while not cancelled.is_set():
+                kvs, _, revision = self._range(key, self._incr_last_byte(key), min_rev=next_rev, limit=None)
+                if len(kvs) > 0:
+                    yield sorted(kvs, key=lambda kv: kv["mod_rev"])
+                next_rev = max(next_rev, revision + 1)
+                self._store.wait(next_rev, WATCH_WAKEUP_INTERVAL)
+        finally:
+            cancel()
+            self._remove_watch(key, cancel)
+
+    @staticmethod
+    def _encode(value: any) -> bytes:
+        if type(value) is bytes:
+            return value
+        return str(value).encode()
+
+    @staticmethod
+    def _parse_raw_kv(key: str, kv: KeyVersion, key_only: bool = False) -> Dict[str, any]:
+        """
+        Internal method to translate a version of a key of the store into a dictionary as returned by the other engines
+        :param key: key
+        :param kv: version of the key
+        :param key_only: if True the value is not returned
+        :return: translated kv pair as dictionary
+        """
+        new_kv = {"key": key, "version": kv.version, "create_rev": kv.create_rev, "mod_rev": kv.mod_rev}
+        if not key_only:
+            new_kv["value"] = kv.value
+        return new_kv
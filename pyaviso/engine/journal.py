@@ -0,0 +1,302 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import List, Optional, Tuple
+
+from .. import logger
+from ..custom_exceptions import EngineException
+from .in_memory_engine import KeyVersion, MemoryStore
+
+JOURNAL_MAGIC = b"AVISO-JOURNAL-1\n"
+# length of the operations, checksum of the operations, revision, number of operations
+RECORD_HEADER = struct.Struct("<IIQI")
+# type, length of the key, length of the value or of the end of the range
+OPERATION_HEADER = struct.Struct("<BII")
+# modification revision, creation revision and version of a key kept by the compaction
+KEY_VERSION = struct.Struct("<QQQ")
+PUT = 1
+DELETE = 2
+KEEP = 3
+DEFAULT_MAX_JOURNAL_SIZE = 64 * 1024 * 1024  # bytes
+
+
+class Journal:
+    """
+    This class implements a key-value store on an append-only file, following the etcd revision model. Each change is
+    appended as a record holding its revision and operations, and the file is memory-mapped to read them. The records
+    are replayed in a MemoryStore used as index, from each key to its versions and to where their values are in the
+    file, so the range requests are served without reading the whole journal. The journal can be shared by several
+    processes: the writers append under an exclusive file lock and the readers index the records appended since their
+    last read under a shared one.
+
+    Once the journal exceeds its max size, and twice the size left by the last compaction, it is compacted as etcd
+    does: it is replaced by a snapshot record holding the last version of each key, so the history before it is not
+    available anymore. The processes find the journal replaced at their next read and index it again from the snapshot.
+    """
+
+    def __init__(self, path: str, max_size: int = DEFAULT_MAX_JOURNAL_SIZE):
+        """
+        :param path: path of the journal file, created if not existing
+        :param max_size: size in bytes above which the journal is compacted
+        """
+        self._path = path
+        self._max_size = max_size
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._fd = -1
+        self._map: Optional[mmap.mmap] = None
+        # the map of the journal replaced is kept, to read the locations found just before the replacement
+        self._previous_map: Optional[mmap.mmap] = None
+        self._generation = -1  # incremented every time the journal file is opened
+        self._lock = threading.Lock()
+        self._open()
+        self.sync()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def index(self) -> MemoryStore:
+        """
+        :return: the index of the records read so far, the values of its keys are their location in the journal
+        """
+        return self._index
+
+    def sync(self) -> int:
+        """
+        This method indexes the records appended to the journal since the last call
+        :return: the current revision of the journal
+        """
+        with self._lock:
+            # the writers do not append while the new records are read
+            self._lock_file(fcntl.LOCK_SH)
+            try:
+                self._sync()
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return self._index.revision
+
+    def append(
+        self, puts: List[Tuple[str, bytes]], delete_ranges: List[Tuple[str, Optional[str]]] = None
+    ) -> Tuple[int, List[Tuple[str, KeyVersion]]]:
+        """
+        This method appends the deletions and then the puts as a single record, at the next revision. No record is
+        appended if nothing changes
+        :param puts: keys and values to put
+        :param delete_ranges: ranges of keys to delete, as first key and end of the range excluded, or None for a key
+        :return: the revision of the change, keys deleted with their previous version
+        """
+        delete_ranges = delete_ranges or []
+        with self._lock:
+            self._lock_file(fcntl.LOCK_EX)
+            try:
+                self._sync(exclusive=True)
+                deleted = []
+                for key, range_end in delete_ranges:
+                    deleted.extend(self._index.range(key, range_end)[0])
+                if len(puts) == 0 and len(deleted) == 0:
+                    return self._index.revision, []
+                rev = self._index.revision + 1
+                record = self._record(rev, puts, delete_ranges)
+                written = 0
+                while written < len(record):
+                    written += os.write(self._fd, record[written:])
+                self._sync()
+                if self._offset > self._max_size and self._offset > 2 * self._snapshot_end:
+                    self._compact()
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return rev, deleted
+
+    def read(self, location: Tuple[int, int, int]) -> bytes:
+        """
+        :param location: generation of the journal file, offset and length of a value, as found in the index
+        :return: the value
+        """
+        generation, offset, length = location
+        with self._lock:
+            if generation == self._generation:
+                return self._map[offset : offset + length]
+            if generation == self._generation - 1 and self._previous_map is not None:
+                return self._previous_map[offset : offset + length]
+        raise EngineException(f"Value not available anymore, {self._path} has been compacted")
+
+    def close(self):
+        with self._lock:
+            for m in (self._map, self._previous_map):
+                if m is not None:
+                    m.close()
+            self._map = None
+            self._previous_map = None
+            os.close(self._fd)
+
+    def _open(self):
+        """
+        This method opens the journal file, to be indexed from its beginning. The lock must be held
+        """
+        if self._fd >= 0:
+            os.close(self._fd)
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        if self._previous_map is not None:
+            self._previous_map.close()
+        self._previous_map = self._map
+        self._map = None
+        self._generation += 1
+        self._offset = 0  # end of the last record indexed
+        self._snapshot_end = 0  # end of the snapshot record, if the journal has been compacted
+        self._index = MemoryStore()
+
+    def _lock_file(self, operation: int):
+        """
+        This method locks the journal file. If the file has been replaced by a compaction, the new one is opened
+        :param operation: LOCK_SH or LOCK_EX
+        """
+        while True:
+            fcntl.flock(self._fd, operation)
+            try:
+                current = os.stat(self._path)
+            except FileNotFoundError:  # the journal has been deleted, the file opened is still valid
+                return
+            opened = os.fstat(self._fd)
+            if (current.st_dev, current.st_ino) == (opened.st_dev, opened.st_ino):
+                return
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            logger.debug(f"{self._path} has been compacted, indexing it again")
+            self._open()
+
+    def _sync(self, exclusive: bool = False):
+        """
+        This method indexes the records appended to the journal, it must be called holding the file lock. An incomplete
+        record can only be left by a writer that has failed, it is discarded by the next writer
+        :param exclusive: True if the file lock is held exclusively
+        """
+        size = os.fstat(self._fd).st_size
+        if size == 0 and exclusive:
+            os.write(self._fd, JOURNAL_MAGIC)
+            size = len(JOURNAL_MAGIC)
+        if size <= self._offset or size < len(JOURNAL_MAGIC):
+            return
+        if self._map is None or len(self._map) < size:
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._fd, size, access=mmap.ACCESS_READ)
+        if self._offset == 0:
+            if self._map[: len(JOURNAL_MAGIC)] != JOURNAL_MAGIC:
+                raise EngineException(f"{self._path} is not a notification journal")
+            self._offset = len(JOURNAL_MAGIC)
+
+        while self._offset < size:
+            end = self._index_record(self._offset, size)
+            if end is None:
+                if exclusive:
+                    logger.warning(f"Incomplete record found in {self._path} at {self._offset}, discarding it")
+                    os.ftruncate(self._fd, self._offset)
+                    self._map.close()
+                    self._map = None
+                break
+            self._offset = end
+
+    def _index_record(self, offset: int, size: int) -> Optional[int]:
+        """
+        :param offset: start of the record
+        :param size: size of the journal
+        :return: end of the record indexed, None if the record is incomplete
+        """
+        start = offset + RECORD_HEADER.size
+        if start > size:
+            return None
+        length, checksum, rev, count = RECORD_HEADER.unpack_from(self._map, offset)
+        end = start + length
+        if end > size or zlib.crc32(self._map[start:end]) != checksum:
+            return None
+
+        puts = []
+        delete_ranges = []
+        kept = []
+        p = start
+        for _ in range(count):
+            op, key_length, value_length = OPERATION_HEADER.unpack_from(self._map, p)
+            p += OPERATION_HEADER.size
+            if op == KEEP:
+                mod_rev, create_rev, version = KEY_VERSION.unpack_from(self._map, p)
+                p += KEY_VERSION.size
+            key = self._map[p : p + key_length].decode()
+            p += key_length
+            if op == PUT:
+                puts.append((key, (self._generation, p, value_length)))
+            elif op == KEEP:
+                kept.append((key, KeyVersion(mod_rev, create_rev, version, (self._generation, p, value_length), None)))
+            else:
+                range_end = self._map[p : p + value_length].decode() if value_length > 0 else None
+                delete_ranges.append((key, range_end))
+            p += value_length
+
+        if len(puts) == 0 and len(delete_ranges) == 0:  # snapshot left by a compaction, always the first record
+            if offset != len(JOURNAL_MAGIC):
+                raise EngineException(f"{self._path} corrupted, snapshot found at revision {rev}")
+            self._index.restore(rev, kept)
+            self._snapshot_end = end
+            return end
+        indexed_rev, _ = self._index.txn(puts, delete_ranges)
+        if indexed_rev != rev:
+            raise EngineException(f"{self._path} corrupted, revision {rev} found after {indexed_rev - 1}")
+        return end
+
+    def _compact(self):
+        """
+        This method replaces the journal with a snapshot of the last version of each key. It must be called holding
+        the file lock exclusively, after indexing the whole journal
+        """
+        rev, kvs = self._index.snapshot()
+        operations = []
+        for key, kv in kvs:
+            k = key.encode()
+            _, offset, length = kv.value
+            operations.append(
+                OPERATION_HEADER.pack(KEEP, len(k), length)
+                + KEY_VERSION.pack(kv.mod_rev, kv.create_rev, kv.version)
+                + k
+                + self._map[offset : offset + length]
+            )
+        body = b"".join(operations)
+        snapshot = JOURNAL_MAGIC + RECORD_HEADER.pack(len(body), zlib.crc32(body), rev, len(operations)) + body
+
+        # the snapshot is written aside and replaces the journal atomically, the other processes keep reading the
+        # file they have open until they acquire its lock
+        tmp_path = f"{self._path}.compacting"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            written = 0
+            while written < len(snapshot):
+                written += os.write(fd, snapshot[written:])
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self._path)
+        logger.debug(f"{self._path} compacted at revision {rev}, from {self._offset} to {len(snapshot)} bytes")
+
+    @staticmethod
+    def _record(rev: int, puts: List[Tuple[str, bytes]], delete_ranges: List[Tuple[str, Optional[str]]]) -> bytes:
+        operations = []
+        for key, range_end in delete_ranges:
+            k = key.encode()
+            e = range_end.encode() if range_end is not None else b""
+            operations.append(OPERATION_HEADER.pack(DELETE, len(k), len(e)) + k + e)
+        for key, value in puts:
+            k = key.encode()
+            operations.append(OPERATION_HEADER.pack(PUT, len(k), len(value)) + k + value)
+        body = b"".join(operations)
+        return RECORD_HEADER.pack(len(body), zlib.crc32(body), rev, len(operations)) + body
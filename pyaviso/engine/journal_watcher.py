@@ -0,0 +1,153 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import os
+import select
+import threading
+from queue import Queue
+from typing import Dict, List
+
+import pyinotify
+
+from .. import logger
+from ..custom_exceptions import EngineHistoryNotAvailableError
+from .polling_scheduler import Subscription
+
+
+class JournalWatcher:
+    """
+    This class implements the listening of the keys of a FileBasedEngine with a single background thread, woken up by
+    inotify when the journal is modified. At each modification only the records appended are indexed, and the keys
+    changed are routed to the subscriptions by prefix, so the cost grows with the changes and the subscriptions
+    matching them, not with the number of keys listened. It has the same interface of the PollingScheduler.
+    """
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._thread = None
+        # written to wake up the thread when the subscriptions change
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_w, False)
+
+    def subscribe(self, keys: List[str], callback: callable([str, str]), channel: Queue, listener: str = None):
+        """
+        This method adds the keys to the ones listened. The watching thread is started if not already running
+        :param keys: keys to listen, each as prefix
+        :param callback: function to call for each change to the keys
+        :param channel: global communication channel among threads
+        :param listener: name of the listener, see checkpoint_name
+        """
+        with self._lock:
+            for key in keys:
+                self._subscriptions.append(Subscription(key, callback, listener))
+            self._wake_up()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._watching, args=(channel,), daemon=True)
+                self._thread.start()
+                logger.debug(f"Thread {self._thread.ident} started to watch {len(self._subscriptions)} keys")
+
+    def unsubscribe(self, key: str = None):
+        """
+        This method removes the subscriptions to the key, so that they are not resumed if the key is listened again
+        :param key: key listened, if None all the subscriptions are removed
+        """
+        with self._lock:
+            for s in self._subscriptions:
+                if key is None or s.key == key:
+                    s.cancelled = True
+            self._subscriptions = [s for s in self._subscriptions if not s.cancelled]
+            self._wake_up()
+
+    def _watching(self, channel: Queue):
+        wm = pyinotify.WatchManager()
+        try:
+            # the folder is watched as the journal file is replaced when compacted
+            folder = os.path.dirname(self._engine.journal.path) or "."
+            wm.add_watch(folder, pyinotify.IN_MODIFY | pyinotify.IN_MOVED_TO)
+            inotify_fd = wm.get_fd()
+            while True:
+                with self._lock:
+                    # the subscriptions are dropped once their key is not listened anymore
+                    self._subscriptions = [s for s in self._subscriptions if self._listened(s)]
+                    if len(self._subscriptions) == 0:  # this is the stop condition
+                        logger.debug("No more keys to watch, stopping the watching thread")
+                        self._thread = None
+                        return
+                    subscriptions = list(self._subscriptions)
+
+                # initialise the new subscriptions, the latest revision of the journal is requested once for all
+                new_subscriptions = [s for s in subscriptions if s.next_rev is None]
+                if len(new_subscriptions) > 0:
+                    latest_rev = self._engine._latest_revision(new_subscriptions[0].key)
+                    for s in new_subscriptions:
+                        s.next_rev = self._engine._initial_revision(s.key, latest_rev, s.listener)
+
+                self._dispatch(subscriptions)
+
+                # wait for the journal to be modified or the subscriptions to change
+                ready, _, _ = select.select([inotify_fd, self._wakeup_r], [], [])
+                for fd in ready:
+                    os.read(fd, 65536)  # the events are not needed, only the records appended are read
+        except Exception as e:
+            logger.error(f"Error while watching the journal: {e}")
+            logger.debug("", exc_info=True)
+            with self._lock:
+                self._thread = None
+            channel.put(False)
+        finally:
+            wm.close()
+
+    def _dispatch(self, subscriptions: List[Subscription]):
+        """
+        This method routes the keys changed since the first revision requested by the subscriptions
+        :param subscriptions: subscriptions to the keys listened
+        """
+        self._engine.journal.sync()
+        index = self._engine.journal.index
+        min_rev = min(s.next_rev for s in subscriptions)
+        try:
+            changes, revision = index.changes(min_rev)
+        except EngineHistoryNotAvailableError:
+            # the journal has been compacted, the last version of the keys changed is still available
+            logger.warning(f"Revision {min_rev} not available anymore, retrieving the keys changed since then...")
+            revision, kvs = index.snapshot()
+            changes = sorted([(k, kv) for k, kv in kvs if kv.mod_rev >= min_rev], key=lambda c: c[1].mod_rev)
+
+        by_prefix: Dict[str, List[Subscription]] = {}
+        for s in subscriptions:
+            by_prefix.setdefault(s.key, []).append(s)
+        lengths = sorted({len(p) for p in by_prefix})
+        routed: Dict[Subscription, List[Dict[str, any]]] = {}
+        for key, kv in changes:
+            parsed = None
+            for length in lengths:
+                if length > len(key):
+                    break
+                for s in by_prefix.get(key[:length], []):
+                    if kv.mod_rev >= s.next_rev:
+                        parsed = parsed or self._engine._parse_raw_kv(key, kv)
+                        routed.setdefault(s, []).append(parsed)
+
+        for s in subscriptions:
+            if s in routed and self._listened(s):
+                s.next_rev = self._engine._process_changes(
+                    s.key, s.callback, routed[s], s.next_rev, listener=s.listener
+                )
+            # the journal has been read up to this revision, even if no change concerns the subscription
+            s.next_rev = max(s.next_rev, revision + 1)
+
+    def _wake_up(self):
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except BlockingIOError:  # the thread has already been woken up
+            pass
+
+    def _listened(self, subscription: Subscription) -> bool:
+        return not subscription.cancelled and subscription.key in self._engine._listeners
@@ -0,0 +1,69 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+from typing import Dict, List
+
+# Each prefix listened costs a range request per polling cycle or a watch stream, while the keys under a prefix that
+# are not requested are pulled and then discarded. The keys are merged into a common prefix only if this lowers the
+# total of the two costs. The keys covered by another key are always dropped, as they would be notified twice.
+RANGE_COST = 1.0  # cost of listening one more prefix
+DISCARDED_KEY_COST = 0.02  # cost of a key pulled under a prefix but not requested, relative to a range
+
+
+def remove_covered(keys: List[str]) -> List[str]:
+    """
+    :param keys: keys to reduce
+    :return: the keys not starting with any other of the keys, sorted
+    """
+    prefixes = []
+    # once sorted, the keys covered by a prefix follow it
+    for key in sorted(set(keys)):
+        if len(prefixes) == 0 or not key.startswith(prefixes[-1]):
+            prefixes.append(key)
+    return prefixes
+
+
+def group_by_prefix(values: List[str], length: int) -> Dict[str, List[str]]:
+    """
+    :param values: values to group
+    :param length: length of the prefixes
+    :return: the prefixes of the values not covered by another prefix, with the values each of them covers
+    """
+    prefixes = remove_covered([v[:length] for v in values])
+    groups: Dict[str, List[str]] = {p: [] for p in prefixes}
+    for value in sorted(set(values)):
+        for p in prefixes:
+            if value.startswith(p):
+                groups[p].append(value)
+                break
+    return groups
+
+
+def estimate_values(values: List[str], length: int) -> int:
+    """
+    This function estimates how many values of a field can be found under a prefix of the given length, as the product
+    of the distinct characters requested at each position following the prefix. Values such as dates or steps are
+    estimated closely, the ones without a common structure are overestimated and therefore hardly merged
+    :param values: values of the field requested
+    :param length: length of the prefix
+    :return: estimated number of values under a prefix
+    """
+    estimate = 1
+    for position in range(length, max(len(v) for v in values)):
+        estimate *= len({v[position] for v in values if len(v) > position})
+    return estimate
+
+
+def listening_cost(ranges: int, listened: int, requested: int) -> float:
+    """
+    :param ranges: number of prefixes listened
+    :param listened: estimated number of keys under the prefixes
+    :param requested: number of keys requested
+    :return: cost of listening the prefixes
+    """
+    return ranges * RANGE_COST + max(listened - requested, 0) * DISCARDED_KEY_COST
@@ -0,0 +1,196 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import random
+import threading
+from queue import Queue
+from typing import Dict, List
+
+from .. import logger
+from ..instrumentation import Stage, instrumentation
+from .checkpoint_store import checkpoint_name
+from .key_prefixes import remove_covered
+
+
+class Subscription:
+    """
+    This class holds the state of a key listened through the PollingScheduler
+    """
+
+    def __init__(self, key: str, callback: callable([str, str]), listener: str = None):
+        self.key = key
+        self.callback = callback
+        self.listener = listener
+        self.next_rev = None  # defined at the first polling cycle
+        self.cancelled = False
+
+
+class AdaptiveInterval:
+    """
+    This class defines the interval between consecutive pollings of the notification server. The interval drops to the
+    minimum as soon as new notifications are found and doubles at each polling without notifications, up to the
+    maximum. Each interval is randomly stretched or shrunk by the jitter fraction, so that the clients started at the
+    same time do not keep polling the server in lockstep.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float, jitter: float = 0):
+        """
+        :param min_interval: interval used while new notifications are found, in seconds
+        :param max_interval: interval reached after a period without notifications, in seconds
+        :param jitter: max fraction of the interval randomly added or subtracted to it
+        """
+        self._min = min(min_interval, max_interval)
+        self._max = max_interval
+        self._jitter = jitter
+        self._interval = self._min
+
+    def next(self, changed: bool) -> float:
+        """
+        :param changed: True if the last polling has found new notifications
+        :return: number of seconds to wait before the next polling
+        """
+        if changed:
+            self._interval = self._min
+        else:
+            self._interval = min(self._interval * 2, self._max)
+        return self._interval * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+
+class PollingScheduler:
+    """
+    This class implements the polling of the notification server for all the keys listened by an engine with a single
+    background thread. The keys covered by another key listened are collapsed into it, each remaining key is pulled
+    once per polling interval and the key-value pairs returned are routed to the subscriptions of the keys they belong
+    to. The number of threads is therefore independent of the number of keys listened.
+    """
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._thread = None
+        # set when new keys are subscribed, so that they are initialised without waiting the polling interval
+        self._wakeup = threading.Event()
+
+    def subscribe(self, keys: List[str], callback: callable([str, str]), channel: Queue, listener: str = None):
+        """
+        This method adds the keys to the ones polled. The polling thread is started if not already running
+        :param keys: keys to listen, each as prefix
+        :param callback: function to call for each change to the keys
+        :param channel: global communication channel among threads
+        :param listener: name of the listener, see checkpoint_name
+        """
+        with self._lock:
+            for key in keys:
+                self._subscriptions.append(Subscription(key, callback, listener))
+            self._wakeup.set()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._polling, args=(channel,), daemon=True)
+                self._thread.start()
+                logger.debug(f"Thread {self._thread.ident} started to poll {len(self._subscriptions)} keys")
+
+    def unsubscribe(self, key: str = None):
+        """
+        This method removes the subscriptions to the key, so that they are not resumed if the key is listened again
+        :param key: key listened, if None all the subscriptions are removed
+        """
+        with self._lock:
+            for s in self._subscriptions:
+                if key is None or s.key == key:
+                    s.cancelled = True
+            self._subscriptions = [s for s in self._subscriptions if not s.cancelled]
+
+    def _polling(self, channel: Queue):
+        interval = self._engine.adaptive_polling_interval()
+        try:
+            while True:
+                with self._lock:
+                    # the subscriptions are dropped once their key is not listened anymore
+                    self._subscriptions = [s for s in self._subscriptions if self._listened(s)]
+                    if len(self._subscriptions) == 0:  # this is the stop condition
+                        logger.debug("No more keys to poll, stopping the polling thread")
+                        self._thread = None
+                        return
+                    subscriptions = list(self._subscriptions)
+
+                # initialise the new subscriptions, the latest revision of the server is requested once for all
+                new_subscriptions = [s for s in subscriptions if s.next_rev is None]
+                if len(new_subscriptions) > 0:
+                    latest_rev = self._engine._latest_revision(new_subscriptions[0].key)
+                    for s in new_subscriptions:
+                        s.next_rev = self._engine._initial_revision(s.key, latest_rev, s.listener)
+
+                # poll each prefix once and route the changes to the subscriptions
+                prefixes = collapse_keys([s.key for s in subscriptions])
+                changed = False
+                for prefix, keys in prefixes.items():
+                    changed |= self._poll(prefix, [s for s in subscriptions if s.key in keys])
+
+                # wait the polling interval before trying again, shorter if new notifications have been found
+                start = instrumentation.start()
+                self._wakeup.wait(interval.next(changed))
+                self._wakeup.clear()
+                instrumentation.stop(Stage.POLL_WAIT, start)
+        except Exception as e:
+            logger.error(f"Error while polling: {e}")
+            logger.debug("", exc_info=True)
+            with self._lock:
+                self._thread = None
+            channel.put(False)
+
+    def _poll(self, prefix: str, subscriptions: List[Subscription]) -> bool:
+        """
+        This method retrieves the changes to the prefix and routes them to the subscriptions
+        :param prefix: prefix to pull
+        :param subscriptions: subscriptions to the keys starting with the prefix
+        :return: True if new notifications have been found
+        """
+        # the revisions requested are fixed before retrieving the changes, as these come sorted by key
+        start_revs = [s.next_rev for s in subscriptions]
+        revision = None
+        kvs = self._engine.pull_pages(prefix, min_rev=min(start_revs), serializable=self._engine.serializable_reads)
+        for page, revision in kvs:
+            for s, start_rev in zip(subscriptions, start_revs):
+                if not self._listened(s):  # stopped in the meantime
+                    continue
+                s_kvs = [kv for kv in page if kv["key"].startswith(s.key) and kv["mod_rev"] >= start_rev]
+                s.next_rev = self._engine._process_changes(s.key, s.callback, s_kvs, s.next_rev, checkpoint=False)
+
+        # the pages are sorted by key, so the revisions reached are saved only once the whole prefix is processed
+        changed = False
+        for s, start_rev in zip(subscriptions, start_revs):
+            if s.next_rev != start_rev:
+                self._engine._save_last_revision(checkpoint_name(s.key, s.listener), s.next_rev)
+                changed = True
+        # all the changes up to the revision read have been received, so the subscriptions without changes move
+        # forward too, otherwise the next pollings would pull again the changes of the other keys since their start
+        for s in subscriptions:
+            s.next_rev = max(s.next_rev, revision + 1)
+        return changed
+
+    def _listened(self, subscription: Subscription) -> bool:
+        return not subscription.cancelled and subscription.key in self._engine._listeners
+
+
+def collapse_keys(keys: List[str]) -> Dict[str, List[str]]:
+    """
+    This function collapses the keys starting with another key into it. The keys are not merged into a common
+    folder here, as this would pull the changes of keys not listened, such as the ones of other destinations that the
+    user may not be authorised to read. The merging is planned by the KeyPlanner of the listeners, which knows the
+    format of the keys, with the policy of the key_prefixes module
+    :param keys: keys to collapse
+    :return: dictionary of the prefixes with the list of keys each of them covers
+    """
+    prefixes = remove_covered(keys)
+    result: Dict[str, List[str]] = {p: [] for p in prefixes}
+    for key in set(keys):
+        for p in prefixes:
+            if key.startswith(p):
+                result[p].append(key)
+                break
+    return result
@@ -0,0 +1,263 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import asyncio
+import random
+import threading
+import time
+from enum import Enum
+from typing import Dict, Optional
+
+from .. import logger
+from ..custom_exceptions import EngineException
+
+BACKOFF_BASE_DELAY = 1  # seconds, max delay of the first retry
+DEFAULT_CIRCUIT_BREAKER_THRESHOLD = 5  # consecutive failures
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"  # the requests are sent to the server
+    OPEN = "open"  # the requests are suspended
+    HALF_OPEN = "half_open"  # a single trial request is sent to the server
+
+
+class CircuitBreaker:
+    """
+    This class suspends the requests to a notification server found unreachable. The circuit opens after a number of
+    consecutive failures and the requests are suspended for the reset timeout. A single trial request is then let
+    through: the circuit closes if this succeeds and opens again otherwise. The changes of state are counted and
+    exposed as metrics.
+    """
+
+    def __init__(self, name: str, threshold: int = DEFAULT_CIRCUIT_BREAKER_THRESHOLD, reset_timeout: float = 15):
+        """
+        :param name: name of the server, used for the logging
+        :param threshold: number of consecutive failures opening the circuit
+        :param reset_timeout: number of seconds the requests are suspended once the circuit is open
+        """
+        self._name = name
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0
+        self._transitions = {state: 0 for state in CircuitState}
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def wait_time(self) -> float:
+        """
+        This method is called before sending a request, once the reset timeout has expired the request is the trial one
+        :return: number of seconds to wait before a request can be sent to the server, 0 if it can be sent now
+        """
+        with self._lock:
+            remaining = self._remaining_time()
+            if remaining > 0:
+                self._rejected += 1
+                return remaining
+            self._take_trial()
+            return 0
+
+    def remaining_time(self) -> float:
+        """
+        This method reads the state of the circuit without changing it, unlike wait_time
+        :return: number of seconds before a request can be sent to the server, 0 if it can be sent now
+        """
+        with self._lock:
+            return self._remaining_time()
+
+    def request_sent(self):
+        """
+        This method records a request sent to the server without waiting for the circuit, as the last member left of
+        a cluster. If the reset timeout has expired, the request is the trial one
+        """
+        with self._lock:
+            if self._remaining_time() == 0:
+                self._take_trial()
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            if self._state != CircuitState.CLOSED:
+                self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitState.HALF_OPEN or (
+                self._state == CircuitState.CLOSED and self._failures >= self._threshold
+            ):
+                self._opened_at = time.time()
+                self._set_state(CircuitState.OPEN)
+
+    def metrics(self) -> Dict[str, any]:
+        """
+        :return: current state of the circuit, number of times each state has been entered and number of requests
+        suspended
+        """
+        with self._lock:
+            metrics = {"state": self._state.value, "consecutive_failures": self._failures, "rejected": self._rejected}
+            for state, count in self._transitions.items():
+                metrics[f"{state.value}_count"] = count
+            return metrics
+
+    def _remaining_time(self) -> float:
+        # the lock must be held
+        if self._state == CircuitState.CLOSED:
+            return 0
+        return max(0, self._opened_at + self._reset_timeout - time.time())
+
+    def _take_trial(self):
+        # the lock must be held, let a single trial request through, the others wait for another timeout
+        if self._state == CircuitState.CLOSED:
+            return
+        self._opened_at = time.time()
+        if self._state == CircuitState.OPEN:
+            self._set_state(CircuitState.HALF_OPEN)
+
+    def _set_state(self, state: CircuitState):
+        # the lock must be held
+        self._state = state
+        self._transitions[state] += 1
+        if state == CircuitState.OPEN:
+            logger.warning(f"Server {self._name} unreachable, requests suspended for {self._reset_timeout}s")
+        elif state == CircuitState.HALF_OPEN:
+            logger.debug(f"Trying to reach server {self._name} again...")
+        else:
+            logger.info(f"Server {self._name} reachable again")
+
+
+class RetryPolicy:
+    """
+    This class defines how the requests to a notification server are retried when this is unreachable. The delay
+    between the retries grows exponentially up to the max delay and it is randomised over its whole range, so that
+    the clients failing together do not retry together. The retries of each operation are bounded by a budget of time
+    and all the operations go through the same circuit breaker.
+    """
+
+    def __init__(
+        self,
+        breaker: CircuitBreaker,
+        max_delay: float,
+        base_delay: float = BACKOFF_BASE_DELAY,
+        budget: Optional[float] = None,
+    ):
+        """
+        :param breaker: circuit breaker of the server
+        :param max_delay: max number of seconds between two retries
+        :param base_delay: max number of seconds before the first retry
+        :param budget: max number of seconds an operation is retried for, None for no limit
+        """
+        self._breaker = breaker
+        self._max_delay = max_delay
+        self._base_delay = min(base_delay, max_delay)
+        self._budget = budget
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        return self._breaker
+
+    def start(self, operation: str) -> "OperationRetry":
+        """
+        :param operation: description of the operation, used for the errors
+        :return: the state of the retries of the operation, with its own budget
+        """
+        return OperationRetry(self, operation, self._budget)
+
+    def check(self, operation: str):
+        """
+        This method is used by the operations that are not retried, they fail immediately if the server is unreachable
+        :param operation: description of the operation, used for the errors
+        """
+        if self._breaker.wait_time() > 0:
+            raise EngineException(f"Not able to {operation}, server unreachable")
+
+    def backoff(self, attempt: int) -> float:
+        """
+        :param attempt: number of retries already done
+        :return: number of seconds to wait before the next retry
+        """
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2 ** min(attempt, 32)))
+
+
+class OperationRetry:
+    """
+    This class holds the state of the retries of a single operation
+    """
+
+    def __init__(self, policy: RetryPolicy, operation: str, budget: Optional[float]):
+        self._policy = policy
+        self._operation = operation
+        self._budget = budget
+        self._deadline = time.time() + budget if budget is not None else None
+        self._attempt = 0
+
+    def before_attempt(self) -> float:
+        """
+        :return: number of seconds to wait before sending the request, 0 if it can be sent now
+        """
+        delay = self._policy.breaker.wait_time()
+        if delay > 0:
+            self._check_budget(delay, "server unreachable")
+        return delay
+
+    def wait(self):
+        """
+        This method waits until the request can be sent to the server
+        """
+        delay = self.before_attempt()
+        while delay > 0:
+            time.sleep(delay)
+            delay = self.before_attempt()
+
+    async def wait_async(self):
+        """
+        This method is the asyncio counterpart of wait
+        """
+        delay = self.before_attempt()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.before_attempt()
+
+    def failed(self, reason: str) -> float:
+        """
+        This method records a failure of the request because the server is unreachable
+        :param reason: description of the failure, used for the logging
+        :return: number of seconds to wait before retrying the request
+        """
+        self._policy.breaker.record_failure()
+        delay = self.backoff(reason)
+        logger.warning(f"{reason}, trying again in {delay:.1f}s...")
+        return delay
+
+    def backoff(self, reason: str) -> float:
+        """
+        This method is used for the requests rejected by a reachable server and worth retrying, as in case of expired
+        token. These are not recorded by the circuit breaker but they are still subject to the retry budget
+        :param reason: description of the failure, used for the errors
+        :return: number of seconds to wait before retrying the request
+        """
+        delay = self._policy.backoff(self._attempt)
+        self._attempt += 1
+        self._check_budget(delay, reason)
+        return delay
+
+    def succeeded(self):
+        """
+        This method records a success of the request
+        """
+        self._policy.breaker.record_success()
+        self._attempt = 0
+
+    def _check_budget(self, delay: float, reason: str):
+        if self._deadline is not None and time.time() + delay > self._deadline:
+            raise EngineException(f"Not able to {self._operation}, {reason}, retry budget of {self._budget}s exhausted")
@@ -6,10 +6,10 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
-import itertools
-import re
+import hashlib
+import json
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import parse
 
@@ -17,8 +17,10 @@ from .. import logger
 from ..custom_exceptions import EventListenerException
 from ..engine import EngineType
 from ..engine.engine import Engine
+from ..instrumentation import Stage, instrumentation
 from ..triggers import trigger_factory as tf
-from .validation import *  # noqa: F403
+from .key_planner import KeyPlanner
+from .validation import RequestValidator
 
 DEFAULT_PAYLOAD_KEY = "payload"
 
@@ -43,12 +45,23 @@ class EventListener:
         self._engine = engine
         self._request = request if request else {}
         self._triggers = triggers
+        self._name = EventListener._listener_name(event_type, self._request, triggers)
         self._listener_schema = listener_schema
         self._trigger_factory = tf.TriggerFactory()
-        self._keys = self.key_expansion(self._request)
-        self._filter = self.filter_expansion(self._request)
         self._from_date = from_date
         self._to_date = to_date
+        self._keys = self.key_plan(self._request)
+        self._filter = self.filter_expansion(self._request)
+        # the key format is resolved and compiled once, each key notified is then only matched against it
+        engine_type = self.engine.engine_type
+        key_base_format = EventListener._key_base_format(self.listener_schema, engine_type)
+        self._key_format: str = key_base_format + EventListener._key_stem_format(self.listener_schema, engine_type)
+        self._key_parser: parse.Parser = parse.compile(self._key_format)
+        self._key_base_parser: parse.Parser = parse.compile(key_base_format)
+        # type of the attributes of the keys notified, inferred from the filter, the default is string
+        self._converters: Dict[str, callable] = {
+            k: int for k, values in self._filter.items() if len(values) > 0 and type(values[0]) is int
+        }
         self.payload_key = payload_key
 
     def __str__(self):
@@ -89,6 +102,21 @@ class EventListener:
     def keys(self) -> List[str]:
         return self._keys
 
+    @property
+    def filter(self) -> Dict[str, List[any]]:
+        return self._filter
+
+    @property
+    def name(self) -> str:
+        """
+        :return: name of the listener, the same for the listeners of the same event, request and triggers
+        """
+        return self._name
+
+    @property
+    def key_format(self) -> str:
+        return self._key_format
+
     @property
     def triggers(self) -> List[Dict[str, any]]:
         return self._triggers
@@ -109,30 +137,22 @@ class EventListener:
         """
         # read the key format from the schema
         key_base = EventListener._key_base_format(self.listener_schema, self.engine.engine_type)
-        try:
-            key: str = key_base.format(**request)
-        except KeyError as e:
-            raise KeyError(f"Wrong listener file: {','.join(e.args)} required")
-
         # compose multiple keys from the list values
-        keys: List[str] = []
-        template = r"\[[^\[\]]*\]"
-        matches = re.findall(template, key)
-        if len(matches) == 0:
-            keys.append(key)
-        else:
-            # Build a list of the possible substitutions
-            ldests = []
-            for m in matches:
-                ldests.append(eval(m))
-            # Generate the various pairings
-            for lproduct in itertools.product(*ldests):
-                k = key
-                for src, dest in itertools.zip_longest(matches, lproduct):
-                    # Replace each term (you could optimise this using a single re.sub)
-                    k = k.replace(src, dest)
-                keys.append(k)
-        return keys
+        return list(KeyPlanner(key_base).expand(request))
+
+    def key_plan(self, request: Dict[str, any]) -> List[str]:
+        """
+        This functions composes the keys to listen using the listener request dictionary. When listening from now,
+        the keys sharing a common prefix are merged into it if the request expands into too many keys, the
+        notifications not requested are then discarded by the filter. The replay of past notifications needs instead
+        the status of each key, so all the keys are listened
+        :param request:
+        :return: List of keys
+        """
+        if self.from_date is not None or self.to_date is not None:
+            return self.key_expansion(request)
+        key_base = EventListener._key_base_format(self.listener_schema, self.engine.engine_type)
+        return KeyPlanner(key_base).plan(request)
 
     def filter_expansion(self, request: Dict[str, any]) -> Dict[str, List[any]]:
         """
@@ -167,18 +187,34 @@ class EventListener:
         :param key:
         :return:
         """
-        # read the key format from the schema
-        key_put_format = EventListener._key_base_format(
-            self.listener_schema, self.engine.engine_type
-        ) + EventListener._key_stem_format(self.listener_schema, self.engine.engine_type)
-
         try:
-            notification: Dict[str, any] = parse.parse(key_put_format, key, extra_types=[str]).named
+            notification: Dict[str, any] = self._key_parser.parse(key).named
         except AttributeError as e:
             logger.debug("", exc_info=True)
             raise EventListenerException(f"Key {key} failed validation, exception: {e}")
         return notification
 
+    def build_notification(self, request: Dict[str, any], value: str) -> Dict[str, any]:
+        """
+        This method builds the notification passed to the triggers for a key that has passed the filter
+        :param request: attributes parsed from the key notified
+        :param value:
+        :return: the notification dictionary to pass to the triggers
+        """
+        notification: Dict[str, any] = {"event": self.event_type, "request": request}
+        if value != "None":
+            notification[self.payload_key] = value
+        return notification
+
+    def is_status(self, key: str) -> bool:
+        """
+        This method recognises the statuses of the base keys, notified when the keys listened are merged
+        into a prefix covering several base keys
+        :param key:
+        :return: True if the key is a base key
+        """
+        return self._key_base_parser.parse(key) is not None
+
     def callback(self, key: str, value: str):
         """
         This callback function first parses the key and build a notification dictionary, it then filters it using the
@@ -188,19 +224,50 @@ class EventListener:
         :param value:
         :return:
         """
-        # parse and filter the key
-        not_request: Dict[str, any] = self.parse_key(key)
-
-        if self._is_expected(not_request):
-            # prepare the notification dictionary to pass to the trigger
-            notification: Dict[str, any] = {"event": self.event_type, "request": not_request}
-            if value != "None":
-                notification[self.payload_key] = value
+        notification = self._notification(key, value)
+        if notification is not None:
             # execute all the triggers defined in the EventListener
             logger.info("A valid notification has been received, executing triggers...")
             logger.debug(f"{notification}")
             self.execute_triggers(notification)
 
+    async def callback_async(self, key: str, value: str):
+        """
+        This callback is the coroutine variant of callback, used by the listeners running on an event loop
+        :param key:
+        :param value:
+        :return:
+        """
+        notification = self._notification(key, value)
+        if notification is not None:
+            # execute all the triggers defined in the EventListener
+            logger.info("A valid notification has been received, executing triggers...")
+            logger.debug(f"{notification}")
+            await self.execute_triggers_async(notification)
+
+    def _notification(self, key: str, value: str) -> Optional[Dict[str, any]]:
+        """
+        :param key:
+        :param value:
+        :return: the notification dictionary to pass to the triggers, or None if it does not pass the filter
+        """
+        start = instrumentation.start()
+        # parse and filter the key
+        try:
+            not_request: Dict[str, any] = self.parse_key(key)
+        except EventListenerException:
+            if self.is_status(key):
+                return None
+            raise
+
+        if not self._is_expected(not_request):
+            instrumentation.count(Stage.DISCARDED, label=self.event_type)
+            instrumentation.stop(Stage.NOTIFICATION, start, self.event_type)
+            return None
+        notification = self.build_notification(not_request, value)
+        instrumentation.stop(Stage.NOTIFICATION, start, self.event_type)
+        return notification
+
     def listen(self) -> bool:
         """
         This method is used to turn a EventListener object to an active notification request to the underlying
@@ -209,7 +276,15 @@ class EventListener:
 
         :return: True if the listener is in execution, False otherwise
         """
-        return self._engine.listen(self.keys, self.callback, self.from_date, self.to_date)
+        return self._engine.listen(self.keys, self.callback, self.from_date, self.to_date, self.name)
+
+    async def listen_async(self) -> bool:
+        """
+        This method is the coroutine variant of listen, for the listeners created with an asyncio engine.
+
+        :return: True if the listener is in execution, False otherwise
+        """
+        return await self._engine.listen(self.keys, self.callback_async, self.from_date, self.to_date, self.name)
 
     def stop(self) -> bool:
         """
@@ -224,28 +299,80 @@ class EventListener:
             logger.warning(f"{self} not currently in execution")
             return False
 
+    async def stop_async(self) -> bool:
+        """
+        This method is the coroutine variant of stop, for the listeners created with an asyncio engine.
+
+        :return: True if the listener has been cancelled
+        """
+        if await self._engine.stop(self.callback_async):
+            logger.debug(f"{self} has been stopped")
+            return True
+        else:
+            logger.warning(f"{self} not currently in execution")
+            return False
+
     def execute_triggers(self, notification: Dict[str, any]):
         """
         This function is used to execute the triggers associated with this EventListener.
         :param notification:
         :return:
         """
+        if instrumentation.enabled:
+            instrumentation.delivered(self.event_type, self.name)
         # execute all the triggers defined in the EventListener in order
         for t in self.triggers:
+            start = instrumentation.start()
             try:
                 # create the trigger
                 trigger = self.trigger_factory.create_trigger(notification, t)
             except Exception as e:
                 logger.error(f"Trigger {t} could not be created, {type(e)}: {e}")
                 logger.debug("", exc_info=True)
+                instrumentation.count(Stage.TRIGGER_FAILURE, label=t.get("type"))
                 break  # the whole triggers execution stop
             else:  # run the trigger
+                start = instrumentation.stop(Stage.TRIGGER_CREATION, start, t.get("type"))
                 try:
                     trigger.execute()
                 except Exception as e:
                     logger.error(f"Trigger {t} could not be executed,  {e}")
                     logger.debug("", exc_info=True)
+                    instrumentation.count(Stage.TRIGGER_FAILURE, label=t.get("type"))
                     break  # the whole triggers execution stop
+                finally:
+                    instrumentation.stop(Stage.TRIGGER_EXECUTION, start, t.get("type"))
+
+    async def execute_triggers_async(self, notification: Dict[str, any]):
+        """
+        This function is the coroutine variant of execute_triggers, the triggers are awaited in order.
+        :param notification:
+        :return:
+        """
+        if instrumentation.enabled:
+            instrumentation.delivered(self.event_type, self.name)
+        # execute all the triggers defined in the EventListener in order
+        for t in self.triggers:
+            start = instrumentation.start()
+            try:
+                # create the trigger
+                trigger = self.trigger_factory.create_trigger(notification, t)
+            except Exception as e:
+                logger.error(f"Trigger {t} could not be created, {type(e)}: {e}")
+                logger.debug("", exc_info=True)
+                instrumentation.count(Stage.TRIGGER_FAILURE, label=t.get("type"))
+                break  # the whole triggers execution stop
+            else:  # run the trigger
+                start = instrumentation.stop(Stage.TRIGGER_CREATION, start, t.get("type"))
+                try:
+                    await trigger.execute_async()
+                except Exception as e:
+                    logger.error(f"Trigger {t} could not be executed,  {e}")
+                    logger.debug("", exc_info=True)
+                    instrumentation.count(Stage.TRIGGER_FAILURE, label=t.get("type"))
+                    break  # the whole triggers execution stop
+                finally:
+                    instrumentation.stop(Stage.TRIGGER_EXECUTION, start, t.get("type"))
 
     @staticmethod
     def derive_notification_keys(params: Dict[str, any], schema: Dict[str, any], engine_type: EngineType):
@@ -292,6 +419,22 @@ class EventListener:
 
         return stem_key, base_key, admin_key
 
+    @staticmethod
+    def _listener_name(event_type: str, request: Dict[str, any], triggers: List[Dict[str, any]]) -> str:
+        """
+        Helper method used to name the listener, it does not change from one execution to the other
+        :param event_type:
+        :param request:
+        :param triggers:
+        :return: event type followed by a digest of the request and triggers
+        """
+        definition = json.dumps(
+            {"request": request, "triggers": triggers},
+            sort_keys=True,
+            default=lambda o: getattr(o, "__qualname__", str(o)),
+        )
+        return f"{event_type}-{hashlib.sha1(definition.encode()).hexdigest()[:10]}"
+
     def _is_expected(self, notification: Dict) -> bool:
         """
         Helper method used to validate the notification received against the filters defined
@@ -302,9 +445,8 @@ class EventListener:
         for f_key, f_values in self._filter.items():
             assert f_key in notification, "Filter attribute not present in the notification"
             n_value = notification[f_key]
-            # infer the type of the attributes from the filter type, the default is string
-            if type(f_values[0]) is int:
-                n_value = int(n_value)
+            if f_key in self._converters:
+                n_value = self._converters[f_key](n_value)
             # now check if it matches the filters
             if n_value not in f_values:
                 # notification does NOT complies with this filter attribute
@@ -388,34 +530,9 @@ class EventListener:
         """
         This private method validates and canonises the parameters passed using the schema.
         Note that the old params values are overwritten by the canonised values.
+        The schema is compiled once into a RequestValidator, reused by the following calls with the same schema.
         :param params:
         :param schema:
         :return:
         """
-        for p in params.keys():
-            # check if this attribute is defined in the schema
-            assert p in schema.keys(), f"Key {p} is not allowed"
-            type_list = schema[p]
-            valid = False
-            for p_schema in type_list:
-                try:
-                    assert "type" in p_schema, f"Wrong schema structure, 'type' could not be located for {p}"
-                    p_schema_c = p_schema.copy()
-                    validator_class = p_schema_c.pop("type")
-                    validator: TypeHandler = eval(f"{validator_class}(key=p, **p_schema_c)")  # noqa: F405
-                    # format the values associated to this attribute
-                    value = params[p]
-                    if type(value) is list:
-                        params[p] = []
-                        for v in value:
-                            params[p].append(validator.process(v))
-                    else:
-                        params[p] = validator.process(value)
-                    # if no ValueError have been generated exit and don't valid against the other type handlers
-                    valid = True
-                    break
-                except ValueError as e:
-                    logger.debug(f"{e}")
-            # check if at least one type handler was valid
-            if not valid:
-                raise ValueError(f"Value {params[p]} is not valid for key {p}")
+        RequestValidator.of(schema).validate(params)
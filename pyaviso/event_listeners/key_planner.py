@@ -0,0 +1,116 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import itertools
+from string import Formatter
+from typing import Dict, Iterator, List, Tuple
+
+from ..engine.key_prefixes import estimate_values, group_by_prefix, listening_cost
+
+
+class KeyPlanner:
+    """
+    This class composes the keys to listen for a request from a key format. A request with list values expands into the
+    cartesian product of the values, which can be thousands of keys, each listened with a range request to the
+    server. The planner can instead merge the keys sharing a common prefix into that prefix, when the ranges saved
+    cost more than the keys not requested that are pulled under the prefix, as estimated by the policy of the
+    key_prefixes module. The keys under a merged prefix that are not requested are then discarded by the filter of the
+    listener. The values of the first field, such as the destination, are never merged so that a prefix never covers
+    the keys of another one, which the user may not be authorised to read.
+    """
+
+    def __init__(self, key_format: str):
+        """
+        :param key_format: format of the keys, with a field for each attribute of the request
+        """
+        self._formatter = Formatter()
+        # the format is split into the literal text preceding each field and the field, the trailing text is last
+        self._fields: List[Tuple[str, str, str, str]] = []
+        self._trailer = ""
+        for literal, field_name, format_spec, conversion in self._formatter.parse(key_format):
+            if field_name is None:
+                self._trailer = literal
+            else:
+                self._fields.append((literal, field_name, format_spec, conversion))
+
+    def expand(self, request: Dict[str, any]) -> Iterator[str]:
+        """
+        This method lazily composes all the keys of the request, one for each combination of its list values
+        :param request: listener request, each value can be a list
+        :return: iterator of the keys
+        """
+        values = self._field_values(request)
+        for combination in itertools.product(*values):
+            yield self._compose(combination) + self._trailer
+
+    def plan(self, request: Dict[str, any]) -> List[str]:
+        """
+        This method composes the keys to listen for the request. The fields are kept in order up to a field whose values
+        are merged by common prefix, as in a trie, the following fields are then not part of the keys. The field and
+        the length of the prefixes are the ones with the lowest listening cost, if lower than the one of the whole
+        expansion. Each key is therefore a prefix covering one or more keys of the expansion
+        :param request: listener request, each value can be a list
+        :return: list of keys, each to listen as prefix
+        """
+        values = self._field_values(request)
+        total = 1
+        for v in values:
+            total *= len(v)
+        if total == 0:
+            return []
+        best_cost = listening_cost(total, total, total)
+        best = None
+        # the first field is never merged, the finest prefixes are preferred at equal cost
+        for cut in range(len(values) - 1, 0, -1):
+            ranges = 1
+            for v in values[:cut]:
+                ranges *= len(v)
+            # the fields following the merged one are not restricted by the keys
+            unrestricted = 1
+            for v in values[cut + 1 :]:
+                unrestricted *= max(estimate_values(v, 0), len(v))
+            for length in range(max(len(v) for v in values[cut]) - 1, -1, -1):
+                groups = group_by_prefix(values[cut], length)
+                estimate = estimate_values(values[cut], length)
+                listened = ranges * sum(max(estimate, len(g)) for g in groups.values()) * unrestricted
+                cost = listening_cost(ranges * len(groups), listened, total)
+                if cost < best_cost:
+                    best_cost = cost
+                    best = cut, list(groups)
+
+        if best is None:
+            return list(dict.fromkeys(self._compose(c) + self._trailer for c in itertools.product(*values)))
+        cut, prefixes = best
+        literal = self._fields[cut][0]
+        return [self._compose(c) + literal + p for c in itertools.product(*values[:cut]) for p in prefixes]
+
+    def _field_values(self, request: Dict[str, any]) -> List[List[str]]:
+        """
+        :param request: listener request
+        :return: the formatted values of each field of the key format, without repetitions
+        """
+        values = []
+        for _, field_name, format_spec, conversion in self._fields:
+            try:
+                value, _ = self._formatter.get_field(field_name, (), request)
+            except KeyError as e:
+                raise KeyError(f"Wrong listener file: {','.join(e.args)} required")
+            value_list = value if type(value) is list else [value]
+            formatted = [
+                self._formatter.format_field(self._formatter.convert_field(v, conversion), format_spec)
+                for v in value_list
+            ]
+            values.append(list(dict.fromkeys(formatted)))
+        return values
+
+    def _compose(self, combination: Tuple[str, ...]) -> str:
+        """
+        :param combination: value of each of the first fields of the key format
+        :return: the key composed up to the last field passed
+        """
+        return "".join(literal + value for (literal, _, _, _), value in zip(self._fields, combination))
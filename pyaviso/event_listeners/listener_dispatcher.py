@@ -0,0 +1,261 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import hashlib
+from typing import Dict, List, Optional, Set, Tuple
+
+import parse
+
+from .. import logger
+from ..custom_exceptions import EventListenerException
+from ..engine.engine import Engine
+from ..engine.key_prefixes import remove_covered
+from ..instrumentation import Stage, instrumentation
+from .event_listener import EventListener
+
+
+class ListenerIndex:
+    """
+    This class matches the keys of a given format against the filters of many listeners. The filters are indexed by
+    attribute and value, so that the listeners expecting a key are found by intersecting the sets of listeners
+    expecting each of its values, instead of checking the filter of every listener
+    """
+
+    def __init__(self, key_format: str, event_type: str):
+        """
+        :param key_format: format of the keys, shared by all the listeners indexed
+        :param event_type: event type of the listeners, used to label the measurements
+        """
+        self._key_parser: parse.Parser = parse.compile(key_format)
+        self._event_type = event_type
+        self._listeners: List[EventListener] = []
+        # (attribute, value) -> positions of the listeners expecting it
+        self._index: Dict[str, Dict[any, Set[int]]] = {}
+        # attribute -> positions of the listeners not filtering it
+        self._unfiltered: Dict[str, Set[int]] = {}
+        # attributes expected as integer by at least one listener
+        self._int_attributes: Set[str] = set()
+
+    @property
+    def event_type(self) -> str:
+        return self._event_type
+
+    @property
+    def listeners(self) -> List[EventListener]:
+        return self._listeners
+
+    def add(self, listener: EventListener):
+        """
+        :param listener: listener to index, its key format must be the one of the index
+        """
+        position = len(self._listeners)
+        self._listeners.append(listener)
+        for attribute in listener.filter.keys() - self._index.keys():
+            # the listeners already indexed do not filter the new attribute
+            self._index[attribute] = {}
+            self._unfiltered[attribute] = set(range(position))
+        for attribute, values in self._index.items():
+            if attribute not in listener.filter:
+                self._unfiltered[attribute].add(position)
+                continue
+            for v in listener.filter[attribute]:
+                values.setdefault(v, set()).add(position)
+                if type(v) is int:
+                    self._int_attributes.add(attribute)
+
+    def parse_key(self, key: str) -> Optional[Dict[str, any]]:
+        """
+        :param key: key notified
+        :return: the attributes parsed from the key, None if the key does not follow the format of the index
+        """
+        result = self._key_parser.parse(key)
+        return result.named if result is not None else None
+
+    def match(self, request: Dict[str, any]) -> List[EventListener]:
+        """
+        :param request: attributes parsed from a key
+        :return: the listeners whose filter is passed by the attributes, in the order they have been added
+        """
+        candidates: List[Set[int]] = []
+        for attribute, values in self._index.items():
+            value = request.get(attribute)
+            expecting = values.get(value, set())
+            if attribute in self._int_attributes and value is not None:
+                try:
+                    expecting = expecting | values.get(int(value), set())
+                except ValueError:
+                    pass
+            if len(self._unfiltered[attribute]) > 0:
+                expecting = expecting | self._unfiltered[attribute]
+            if len(expecting) == 0:
+                return []
+            candidates.append(expecting)
+
+        if len(candidates) == 0:  # no listener filters anything
+            return list(self._listeners)
+        # the intersection starts from the smallest set, so its cost is bound by the listeners matching
+        candidates.sort(key=len)
+        matching = set(candidates[0])
+        for c in candidates[1:]:
+            matching &= c
+            if len(matching) == 0:
+                return []
+        return [self._listeners[i] for i in sorted(matching)]
+
+
+class ListenerDispatcher:
+    """
+    This class listens on behalf of a group of EventListener sharing the same engine. The keys of all the listeners
+    are listened once and each key-value pair notified is parsed once per key format, it is then routed to the
+    listeners whose filter it passes through a ListenerIndex. The cost of a notification grows therefore with the
+    number of listeners expecting it, not with the total number of listeners.
+    """
+
+    def __init__(self, listeners: List[EventListener]):
+        """
+        :param listeners: listeners to dispatch to, they must share the same engine and dates
+        """
+        assert len(listeners) > 0, "At least one listener is required"
+        self._listeners = listeners
+        self._engine = listeners[0].engine
+        self._from_date = listeners[0].from_date
+        self._to_date = listeners[0].to_date
+        for listener in listeners:
+            assert listener.engine is self._engine, "The listeners dispatched must share the same engine"
+            assert (listener.from_date, listener.to_date) == (
+                self._from_date,
+                self._to_date,
+            ), "The listeners dispatched must share the same dates"
+
+        # one index for each key format
+        self._indexes: Dict[str, ListenerIndex] = {}
+        for listener in listeners:
+            if listener.key_format not in self._indexes:
+                self._indexes[listener.key_format] = ListenerIndex(listener.key_format, listener.event_type)
+            self._indexes[listener.key_format].add(listener)
+
+        # the keys covered by another key would be notified twice
+        self._keys: List[str] = remove_covered([k for listener in listeners for k in listener.keys])
+
+    def __str__(self):
+        return f"Dispatcher of {len(self._listeners)} listeners to keys: {self.keys}"
+
+    @property
+    def listeners(self) -> List[EventListener]:
+        return self._listeners
+
+    @property
+    def engine(self) -> Engine:
+        return self._engine
+
+    @property
+    def name(self) -> str:
+        """
+        :return: name of the dispatcher, the same for the same listeners, under which the last revisions processed are
+        saved
+        """
+        names = ",".join(sorted(listener.name for listener in self._listeners))
+        return f"dispatcher-{hashlib.sha1(names.encode()).hexdigest()[:10]}"
+
+    @property
+    def keys(self) -> List[str]:
+        return self._keys
+
+    def callback(self, key: str, value: str):
+        """
+        This callback routes the key-value pair notified to the listeners expecting it, whose triggers are executed
+        :param key:
+        :param value:
+        :return:
+        """
+        for listener, notification in self._notifications(key, value):
+            logger.info("A valid notification has been received, executing triggers...")
+            logger.debug(f"{notification}")
+            listener.execute_triggers(notification)
+
+    async def callback_async(self, key: str, value: str):
+        """
+        This callback is the coroutine variant of callback, used by the listeners running on an event loop
+        :param key:
+        :param value:
+        :return:
+        """
+        for listener, notification in self._notifications(key, value):
+            logger.info("A valid notification has been received, executing triggers...")
+            logger.debug(f"{notification}")
+            await listener.execute_triggers_async(notification)
+
+    def _notifications(self, key: str, value: str) -> List[Tuple[EventListener, Dict[str, any]]]:
+        """
+        :param key:
+        :param value:
+        :return: the listeners expecting the key, each with the notification dictionary to pass to its triggers
+        """
+        parsed = False
+        result = []
+        for index in self._indexes.values():
+            start = instrumentation.start()
+            request = index.parse_key(key)
+            if request is None:
+                continue
+            parsed = True
+            matching = index.match(request)
+            if len(matching) == 0:
+                logger.debug(f"Notification {request} not expected by any listener, therefore it will be ignored")
+                instrumentation.count(Stage.DISCARDED, label=index.event_type)
+            for listener in matching:
+                # each listener gets its own copy of the request
+                result.append((listener, listener.build_notification(dict(request), value)))
+            instrumentation.stop(Stage.NOTIFICATION, start, index.event_type)
+        if not parsed:
+            if any(index.listeners[0].is_status(key) for index in self._indexes.values()):
+                return []
+            raise EventListenerException(f"Key {key} failed validation, it does not match any listener key format")
+        return result
+
+    def listen(self) -> bool:
+        """
+        This method starts the listening of the keys of all the listeners
+
+        :return: True if the listeners are in execution, False otherwise
+        """
+        return self._engine.listen(self.keys, self.callback, self._from_date, self._to_date, self.name)
+
+    async def listen_async(self) -> bool:
+        """
+        This method is the coroutine variant of listen, for the listeners created with an asyncio engine.
+
+        :return: True if the listeners are in execution, False otherwise
+        """
+        return await self._engine.listen(self.keys, self.callback_async, self._from_date, self._to_date, self.name)
+
+    def stop(self) -> bool:
+        """
+        This method stops the listening of the keys of all the listeners
+
+        :return: True if the listeners have been cancelled
+        """
+        if self._engine.stop():
+            logger.debug(f"{self} has been stopped")
+            return True
+        else:
+            logger.warning(f"{self} not currently in execution")
+            return False
+
+    async def stop_async(self) -> bool:
+        """
+        This method is the coroutine variant of stop, for the listeners created with an asyncio engine.
+
+        :return: True if the listeners have been cancelled
+        """
+        if await self._engine.stop(self.callback_async):
+            logger.debug(f"{self} has been stopped")
+            return True
+        else:
+            logger.warning(f"{self} not currently in execution")
+            return False
@@ -15,6 +15,7 @@ from ..custom_exceptions import EventListenerException
 from ..engine import engine_factory as ef
 from . import event_listener_factory as elf
 from .event_listener import EventListener
+from .listener_dispatcher import ListenerDispatcher
 
 
 class ListenerManager:
@@ -24,11 +25,21 @@ class ListenerManager:
 
     def __init__(self):
         self._listeners: List[EventListener] = []
+        # listeners running on an event loop, with the asyncio engine they share
+        self._async_listeners: List[EventListener] = []
+        self._async_engine = None
+        # dispatchers of the listeners sharing an engine
+        self._dispatchers: List[ListenerDispatcher] = []
+        self._async_dispatchers: List[ListenerDispatcher] = []
 
     @property
     def listeners(self) -> List[EventListener]:
         return self._listeners
 
+    @property
+    def async_listeners(self) -> List[EventListener]:
+        return self._async_listeners
+
     def _run_listeners(self) -> bool:
         """
         This method is used to execute all the listeners currently managed
@@ -38,14 +49,23 @@ class ListenerManager:
         logger.debug("Calling run all listeners...")
         result = True
         listener_to_remove: List[EventListener] = []
-        for listener in self._listeners:
-            # Execute the listener
-            if not listener.listen():
+        dispatched = [listener for d in self._dispatchers for listener in d.listeners]
+        for group in self._group_listeners([ls for ls in self._listeners if ls not in dispatched]):
+            # Execute the listeners, through a dispatcher if sharing the engine
+            if len(group) > 1:
+                dispatcher = ListenerDispatcher(group)
+                started = dispatcher.listen()
+                if started:
+                    self._dispatchers.append(dispatcher)
+            else:
+                started = group[0].listen()
+            if not started:
                 result = False
-                listener_to_remove.append(listener)
+                listener_to_remove.extend(group)
             else:
-                keys = ",".join(listener.keys)
-                logger.info(f"Listening to {keys} at {listener.engine.host}:{listener.engine.port}...")
+                for listener in group:
+                    keys = ",".join(listener.keys)
+                    logger.info(f"Listening to {keys} at {listener.engine.host}:{listener.engine.port}...")
 
         # now remove all of the listeners that were not able to start
         for listener in listener_to_remove:
@@ -53,6 +73,19 @@ class ListenerManager:
 
         return result
 
+    @staticmethod
+    def _group_listeners(listeners: List[EventListener]) -> List[List[EventListener]]:
+        """
+        This method groups the listeners that can be dispatched together, as they share the same engine and dates
+
+        :param listeners: EventListener list
+        :return: the groups of listeners, in the order of their first listener
+        """
+        groups: Dict[tuple, List[EventListener]] = {}
+        for listener in listeners:
+            groups.setdefault((id(listener.engine), listener.from_date, listener.to_date), []).append(listener)
+        return list(groups.values())
+
     def _add_listener(self, listener: EventListener) -> None:
         """
         Add a listener to the internal listener list of the manager
@@ -96,6 +129,7 @@ class ListenerManager:
         self._stop_listener(listener)
         # now remove it from the list
         self._listeners.remove(listener)
+        self._dispatchers = [d for d in self._dispatchers if listener not in d.listeners]
 
     def cancel_listeners(self) -> None:
         """
@@ -109,6 +143,7 @@ class ListenerManager:
 
         # now remove all of them from the internal list
         self._listeners.clear()
+        self._dispatchers.clear()
 
     def listen(
         self,
@@ -162,3 +197,101 @@ class ListenerManager:
 
         # return the number of listeners running
         return len(self.listeners)
+
+    async def listen_async(
+        self,
+        listeners: List[Dict[str, any]],
+        listener_schema: Dict[str, any],
+        config: user_config.UserConfig = None,
+        from_date: datetime = None,
+        to_date: datetime = None,
+    ) -> int:
+        """
+        This method is the coroutine variant of listen. The listeners run as tasks of the current event loop and share
+        a single asyncio engine
+        :param listeners: listeners as list of dictionaries
+        :param listener_schema: schema to use to validate the listeners
+        :param config: UserConfig object
+        :param from_date: date from when to request notifications, if None it will be from now
+        :param to_date: date until when to request notifications, if None it will be until now
+        :return: number of listeners running
+        """
+        logger.debug("Calling listen async in ListenerManager...")
+
+        # first check the config
+        if config is None:
+            config = user_config.UserConfig()
+
+        # Create the engine and listener factories
+        engine_factory: ef.EngineFactory = ef.EngineFactory(config.notification_engine, Auth.get_auth(config))
+        listener_factory: elf.EventListenerFactory = elf.EventListenerFactory(engine_factory, listener_schema)
+        if self._async_engine is None:
+            self._async_engine = engine_factory.create_async_engine()
+
+        # read the payload key from the schema
+        payload_key = listener_schema.get("payload")
+
+        # Parse notification listeners
+        event_listeners: List[EventListener] = []
+        for ls in listeners:
+            logger.debug(f"Reading listeners {ls}")
+            try:
+                for ev_listener in listener_factory.create_listeners(
+                    ls, from_date, to_date, payload_key, engine=self._async_engine
+                ):
+                    event_listeners.append(ev_listener)
+                logger.debug("Listener dictionary correctly parsed")
+            except Exception as e:
+                raise EventListenerException(f"Not able to load listener dictionary {ls}: {e}")
+
+        # Add the listeners to the manager and run them
+        logger.debug("Starting listeners...")
+        started = 0
+        for group in self._group_listeners(event_listeners):
+            # the listeners sharing the engine are run through a dispatcher
+            if len(group) > 1:
+                dispatcher = ListenerDispatcher(group)
+                if not await dispatcher.listen_async():
+                    continue
+                self._async_dispatchers.append(dispatcher)
+            elif not await group[0].listen_async():
+                continue
+            started += len(group)
+            for listener in group:
+                self._async_listeners.append(listener)
+                keys = ",".join(listener.keys)
+                logger.info(f"Listening to {keys} at {listener.engine.host}:{listener.engine.port}...")
+        if started < len(event_listeners):
+            if started == 0:
+                raise EventListenerException("Listeners could not start, please check logs")
+            else:
+                logger.error("One or more listeners were not able to start")
+
+        # return the number of listeners running
+        return len(self._async_listeners)
+
+    async def wait_async(self) -> bool:
+        """
+        This method waits for all the listeners running on the event loop to terminate
+
+        :return: True if all the listeners terminated successfully, False otherwise
+        """
+        if self._async_engine is None:
+            return True
+        return await self._async_engine.wait()
+
+    async def cancel_listeners_async(self) -> None:
+        """
+        Stop the execution of any listener running on the event loop and close the connections of their engine
+        """
+        dispatched = [listener for d in self._async_dispatchers for listener in d.listeners]
+        for dispatcher in self._async_dispatchers:
+            await dispatcher.stop_async()
+        for listener in self._async_listeners:
+            if listener not in dispatched:
+                await listener.stop_async()
+        self._async_listeners.clear()
+        self._async_dispatchers.clear()
+        if self._async_engine is not None:
+            await self._async_engine.close()
+            self._async_engine = None
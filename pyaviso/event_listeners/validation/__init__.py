@@ -11,6 +11,7 @@ from .enum_handler import EnumHandler
 from .float_handler import FloatHandler
 from .int_handler import IntHandler
 from .regex_handler import RegexHandler
+from .request_validator import RequestValidator
 from .string_handler import StringHandler
 from .time_handler import TimeHandler
 from .type_handler import TypeHandler
@@ -24,4 +25,5 @@ __all__ = [
     "TypeHandler",
     "FloatHandler",
     "RegexHandler",
+    "RequestValidator",
 ]
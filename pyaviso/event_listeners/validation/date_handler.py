@@ -7,26 +7,43 @@
 # nor does it submit to any jurisdiction.
 
 import datetime
+from functools import lru_cache
 
 from .type_handler import TypeHandler
 
+# number of dates canonised kept by each handler
+DATE_CACHE_SIZE = 1024
+
 
 class DateHandler(TypeHandler):
     def __init__(self, key, canonic, required=False):
         super(DateHandler, self).__init__(key, required)
         self._canonic = canonic
+        # the same dates are validated again and again, each is parsed once
+        self._canonise_str = lru_cache(maxsize=DATE_CACHE_SIZE)(self._parse_and_format)
 
     @property
     def canonic(self) -> str:
         return self._canonic
 
+    def process(self, value: any = None) -> str:
+        if value is None:
+            return super(DateHandler, self).process(value)
+        return self._canonise_str(str(value))
+
     def valid(self, value: any) -> bool:
+        self._parse(str(value))
+        return True
+
+    def canonise(self, value: any) -> str:
+        # strptime tolerates months or days with no leading zero, we need to format it again to be sure they are there
+        return self._parse(str(value)).strftime(self.canonic)
+
+    def _parse(self, value: str) -> datetime.datetime:
         try:
-            self._d_datetime = datetime.datetime.strptime(str(value), self.canonic)
-            return True
+            return datetime.datetime.strptime(value, self.canonic)
         except ValueError as e:
             raise ValueError("Date attribute is not complying with the format defined", e)
 
-    def canonise(self, value: any) -> str:
-        # strptime tolerates months or days with no leading zero, we need to format it again to be sure they are there
-        return self._d_datetime.strftime(self.canonic)
+    def _parse_and_format(self, value: str) -> str:
+        return self._parse(value).strftime(self.canonic)
@@ -16,6 +16,9 @@ class EnumHandler(TypeHandler):
         super(EnumHandler, self).__init__(key, required)
         self._valid_values = values
         self._default = default
+        # the values are checked against a set, after conversion to the type of the enums
+        self._valid_set = frozenset(values)
+        self._value_type = type(values[0]) if len(values) > 0 else str
 
     @property
     def valid_values(self) -> List[str]:
@@ -26,11 +29,11 @@ class EnumHandler(TypeHandler):
             value = self._default
         # convert the value to the same type of the enums otherwise it will not be able to validate
         try:
-            value = type(self.valid_values[0])(value)
+            value = self._value_type(value)
         except ValueError as e:
             raise ValueError(f"Key {self.key} is not of a valid type", e)
 
-        if value in self.valid_values:
+        if value in self._valid_set:
             return True
         else:
             valid_values_str = ",".join(map(lambda x: str(x), self.valid_values))
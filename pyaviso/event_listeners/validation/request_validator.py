@@ -0,0 +1,111 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import copy
+import json
+import threading
+from typing import Dict, List
+
+from ... import logger
+from .date_handler import DateHandler
+from .enum_handler import EnumHandler
+from .float_handler import FloatHandler
+from .int_handler import IntHandler
+from .regex_handler import RegexHandler
+from .string_handler import StringHandler
+from .time_handler import TimeHandler
+from .type_handler import TypeHandler
+
+HANDLERS = {
+    h.__name__: h
+    for h in [DateHandler, EnumHandler, FloatHandler, IntHandler, RegexHandler, StringHandler, TimeHandler]
+}
+# number of compiled request schemas kept
+MAX_CACHED_VALIDATORS = 64
+
+
+class RequestValidator:
+    """
+    This class validates and canonises the requests of an event with its request schema. The type handlers of each key
+    are created the first time the key is validated and then reused for all the requests, so each validation only
+    runs the checks of the handlers
+    """
+
+    _cache: Dict[str, "RequestValidator"] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, schema: Dict[str, List[Dict[str, any]]]):
+        """
+        :param schema: request schema, the list of the alternative types of each key
+        """
+        # the validator is shared, it must not change with the schema of the caller
+        self._schema = copy.deepcopy(schema)
+        self._handlers: Dict[str, List[TypeHandler]] = {}
+
+    @classmethod
+    def of(cls, schema: Dict[str, List[Dict[str, any]]]) -> "RequestValidator":
+        """
+        :param schema: request schema
+        :return: the validator compiled for the schema, shared by the callers passing a schema with the same content,
+        as the schemas are loaded again for each notification
+        """
+        content = json.dumps(schema, sort_keys=True, default=str)
+        validator = cls._cache.get(content)
+        if validator is not None:
+            return validator
+        validator = cls(schema)
+        with cls._cache_lock:
+            if len(cls._cache) >= MAX_CACHED_VALIDATORS:
+                cls._cache.pop(next(iter(cls._cache)))
+            cls._cache[content] = validator
+        return validator
+
+    def handlers(self, key: str) -> List[TypeHandler]:
+        """
+        :param key: key of the request
+        :return: the type handlers of the key, in the order they are tried
+        """
+        handlers = self._handlers.get(key)
+        if handlers is None:
+            assert key in self._schema.keys(), f"Key {key} is not allowed"
+            handlers = []
+            for p_schema in self._schema[key]:
+                assert "type" in p_schema, f"Wrong schema structure, 'type' could not be located for {key}"
+                p_schema_c = p_schema.copy()
+                validator_class = p_schema_c.pop("type")
+                if validator_class not in HANDLERS:
+                    raise NameError(f"Type handler {validator_class} not recognised")
+                handlers.append(HANDLERS[validator_class](key=key, **p_schema_c))
+            self._handlers[key] = handlers
+        return handlers
+
+    def validate(self, params: Dict[str, any]):
+        """
+        This method validates and canonises the parameters passed. Note that the old params values are overwritten by
+        the canonised values.
+        :param params:
+        :return:
+        """
+        for p in params.keys():
+            value = params[p]
+            valid = False
+            for validator in self.handlers(p):
+                try:
+                    # format the values associated to this attribute
+                    if type(value) is list:
+                        params[p] = validator.process_list(value)
+                    else:
+                        params[p] = validator.process(value)
+                    # if no ValueError have been generated exit and don't valid against the other type handlers
+                    valid = True
+                    break
+                except ValueError as e:
+                    logger.debug(f"{e}")
+            # check if at least one type handler was valid
+            if not valid:
+                raise ValueError(f"Value {value} is not valid for key {p}")
@@ -7,6 +7,7 @@
 # nor does it submit to any jurisdiction.
 
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class TypeHandler(ABC):
@@ -35,6 +36,13 @@ class TypeHandler(ABC):
             else:
                 raise ValueError(f"Value {value} is not valid for key {self.key}")
 
+    def process_list(self, values: List[any]) -> List[str]:
+        """
+        :param values: values of the key
+        :return: the values validated and canonised, in one pass
+        """
+        return [self.process(v) for v in values]
+
     @abstractmethod
     def valid(self, value: any) -> bool:
         pass
@@ -0,0 +1,345 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import contextvars
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from enum import Enum
+from timeit import default_timer as timer
+from typing import Dict, List, Optional, Tuple
+
+from . import logger
+
+# upper bounds of the buckets of the histograms, in seconds, from 10 microseconds to about 1.5 minutes
+BUCKETS = [0.00001 * 2**i for i in range(24)]
+MONITORING_COMPONENT_NAME = "aviso_client"
+# submission time and key listened of the notification being passed to the callbacks, in the current thread or task
+_delivery: contextvars.ContextVar = contextvars.ContextVar("aviso_delivery", default=None)
+
+
+class Stage(Enum):
+    """
+    This Enum describes the stages of the listening pipeline that are timed or counted
+    """
+
+    POLL_WAIT = "poll_wait"  # time waited between two pollings of the server
+    RANGE = "range"  # range request to the server, for each page
+    DISPATCH = "dispatch"  # processing of the key-value pairs changed, callbacks included
+    NOTIFICATION = "notification"  # parsing and filtering of a key by a listener
+    TRIGGER_CREATION = "trigger_creation"
+    TRIGGER_EXECUTION = "trigger_execution"
+    # lags from the submission of a notification, measured with the clock of the machine submitting it
+    RECEIPT_LAG = "receipt_lag"  # until retrieved by the engine, by key listened
+    DELIVERY_LAG = "delivery_lag"  # until its triggers are fired, by event type of the listener
+    LISTENER_DELIVERY_LAG = "listener_delivery_lag"  # the same, by name of the listener
+    KEY_DELIVERY_LAG = "key_delivery_lag"  # the same, by key listened
+    # counters
+    RECEIVED = "received"  # key-value pairs passed to the callbacks
+    DISCARDED = "discarded"  # keys not passing the filter of a listener
+    TRIGGER_FAILURE = "trigger_failure"
+
+
+class Sink(ABC):
+    """
+    This class is the destination of the measurements taken by the Instrumentation
+    """
+
+    @abstractmethod
+    def record(self, stage: Stage, value: float, label: str = None):
+        """
+        :param stage: stage measured
+        :param value: time taken by the stage, in seconds
+        :param label: optional sub-category of the measurement, such as the event type of a listener
+        """
+        pass
+
+    @abstractmethod
+    def count(self, stage: Stage, n: int = 1, label: str = None):
+        """
+        :param stage: stage counted
+        :param n: number of occurrences
+        :param label: optional sub-category of the occurrences
+        """
+        pass
+
+    def close(self):
+        pass
+
+
+class Histogram:
+    """
+    This class aggregates the values recorded in buckets of exponential width, so that its size does not depend on the
+    number of values and the percentiles can be estimated within a factor of 2
+    """
+
+    def __init__(self):
+        self.buckets: List[int] = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float):
+        self.buckets[bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        :param q: percentile requested, between 0 and 100
+        :return: upper bound of the bucket holding the percentile, capped to the max value recorded
+        """
+        if self.count == 0:
+            return None
+        rank = q / 100 * self.count
+        cumulative = 0
+        for i, n in enumerate(self.buckets):
+            cumulative += n
+            if cumulative >= rank and n > 0:
+                return min(BUCKETS[i], self.max) if i < len(BUCKETS) else self.max
+        return self.max
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class HistogramSink(Sink):
+    """
+    This sink keeps the measurements in process, as a histogram and a counter per stage and label
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[Stage, Optional[str]], Histogram] = {}
+        self._counters: Dict[Tuple[Stage, Optional[str]], int] = {}
+
+    def record(self, stage: Stage, value: float, label: str = None):
+        with self._lock:
+            h = self._histograms.get((stage, label))
+            if h is None:
+                h = self._histograms[(stage, label)] = Histogram()
+            h.add(value)
+
+    def count(self, stage: Stage, n: int = 1, label: str = None):
+        with self._lock:
+            self._counters[(stage, label)] = self._counters.get((stage, label), 0) + n
+
+    def histogram(self, stage: Stage, label: str = None) -> Optional[Histogram]:
+        return self._histograms.get((stage, label))
+
+    def counter(self, stage: Stage, label: str = None) -> int:
+        return self._counters.get((stage, label), 0)
+
+    def labels(self, stage: Stage) -> List[str]:
+        """
+        :param stage: stage measured or counted
+        :return: the labels recorded for the stage, None included if recorded without label
+        """
+        with self._lock:
+            return list({label for s, label in list(self._histograms) + list(self._counters) if s == stage})
+
+    def snapshot(self) -> Dict[str, Dict[str, any]]:
+        """
+        :return: the statistics of each stage and label, keyed by stage or by stage:label
+        """
+        result = {}
+        with self._lock:
+            for (stage, label), h in self._histograms.items():
+                result[stage.value + (f":{label}" if label else "")] = h.stats()
+            for (stage, label), n in self._counters.items():
+                result[stage.value + (f":{label}" if label else "")] = {"count": n}
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+class LogSink(Sink):
+    """
+    This sink logs each measurement
+    """
+
+    def __init__(self, level: int = logging.INFO):
+        self._level = level
+
+    def record(self, stage: Stage, value: float, label: str = None):
+        logger.log(self._level, f"{stage.value}{f' {label}' if label else ''} took {value * 1000:.3f} ms")
+
+    def count(self, stage: Stage, n: int = 1, label: str = None):
+        logger.log(self._level, f"{stage.value}{f' {label}' if label else ''}: {n}")
+
+
+class MonitoringSink(Sink):
+    """
+    This sink sends the measurements to the Aviso monitoring server, through a TimeCollector of aviso_monitoring per
+    stage. The transmitter is configured by the AVISO_MONITORING_* environment variables. The labels and the counters
+    are not sent, the number of measurements of each stage is sent by its collector
+    """
+
+    def __init__(self, component_name: str = MONITORING_COMPONENT_NAME):
+        try:
+            from aviso_monitoring.collector.config import Config
+            from aviso_monitoring.collector.time_collector import TimeCollector
+        except ImportError:
+            raise ImportError("aviso_monitoring is required by the monitoring instrumentation, please install it")
+        self._config = Config(transmitter={"component_name": component_name}, enabled=True)
+        self._time_collector = TimeCollector
+        self._lock = threading.Lock()
+        self._collectors = {}
+
+    def record(self, stage: Stage, value: float, label: str = None):
+        collector = self._collectors.get(stage)
+        if collector is None:
+            with self._lock:
+                if stage not in self._collectors:
+                    self._collectors[stage] = self._time_collector(
+                        self._config, tlm_type=f"{MONITORING_COMPONENT_NAME}_{stage.value}"
+                    )
+                collector = self._collectors[stage]
+        collector.tlm_buffer.append(value)
+
+    def count(self, stage: Stage, n: int = 1, label: str = None):
+        pass
+
+
+class SinkType(Enum):
+    """
+    This Enum describes the sinks that can be configured for the instrumentation
+    """
+
+    HISTOGRAM = "HistogramSink"
+    LOG = "LogSink"
+    MONITORING = "MonitoringSink"
+
+    def sink(self) -> Sink:
+        return eval(self.value + "()")
+
+
+class Instrumentation:
+    """
+    This class times and counts the stages of the listening pipeline and passes the measurements to the sinks added.
+    With no sink the measurements are not taken, each hook then costs a single check
+    """
+
+    def __init__(self):
+        self._sinks: List[Sink] = []
+        self.enabled = False
+
+    @property
+    def sinks(self) -> List[Sink]:
+        return list(self._sinks)
+
+    def add_sink(self, sink: Sink):
+        # the list is replaced, so that the threads recording do not need a lock
+        self._sinks = self._sinks + [sink]
+        self.enabled = True
+
+    def use(self, sink_type: SinkType):
+        """
+        This method adds a sink of the type requested, unless one has already been added
+        :param sink_type: type of sink
+        """
+        if not any(type(s).__name__ == sink_type.value for s in self._sinks):
+            self.add_sink(sink_type.sink())
+
+    def remove_sinks(self):
+        sinks, self._sinks = self._sinks, []
+        self.enabled = False
+        for sink in sinks:
+            sink.close()
+
+    def start(self) -> Optional[float]:
+        """
+        :return: the current time if enabled, None otherwise
+        """
+        return timer() if self.enabled else None
+
+    def stop(self, stage: Stage, start: Optional[float], label: str = None) -> Optional[float]:
+        """
+        This method records the time taken by the stage
+        :param stage: stage measured
+        :param start: value returned by start when the stage began, nothing is recorded if None
+        :param label: optional sub-category of the measurement
+        :return: the current time, to be used as start of the next stage, None if not enabled
+        """
+        if start is None:
+            return None
+        now = timer()
+        self.record(stage, now - start, label)
+        return now
+
+    def record(self, stage: Stage, value: float, label: str = None):
+        for sink in self._sinks:
+            sink.record(stage, value, label)
+
+    def lag(self, stage: Stage, submit_time: Optional[float], label: str = None):
+        """
+        This method records the time elapsed since the submission of a notification
+        :param stage: lag measured
+        :param submit_time: submission time as UNIX timestamp, nothing is recorded if None
+        :param label: optional sub-category of the measurement
+        """
+        if submit_time is not None:
+            self.record(stage, time.time() - submit_time, label)
+
+    def delivering(self, submit_time: Optional[float], key: str = None):
+        """
+        This method records the notification passed to the callbacks by the current thread, or by the current task
+        when running on an event loop, so that its delivery lag is measured once its triggers are fired
+        :param submit_time: submission time of the notification, None once passed
+        :param key: key listened
+        """
+        _delivery.set((submit_time, key) if submit_time is not None else None)
+
+    @property
+    def submit_time(self) -> Optional[float]:
+        """
+        :return: submission time of the notification the current thread or task is passing to the callbacks, if known
+        """
+        delivery = _delivery.get()
+        return delivery[0] if delivery is not None else None
+
+    def delivered(self, event_type: str, listener: str):
+        """
+        This method records the delivery lag of the notification the current thread or task is passing to the
+        callbacks, if known, by event type, by listener and by key listened
+        :param event_type: event type of the listener
+        :param listener: name of the listener
+        """
+        delivery = _delivery.get()
+        if delivery is None:
+            return
+        submit_time, key = delivery
+        lag = time.time() - submit_time
+        self.record(Stage.DELIVERY_LAG, lag, event_type)
+        self.record(Stage.LISTENER_DELIVERY_LAG, lag, listener)
+        self.record(Stage.KEY_DELIVERY_LAG, lag, key)
+
+    def count(self, stage: Stage, n: int = 1, label: str = None):
+        if self.enabled:
+            for sink in self._sinks:
+                sink.count(stage, n, label)
+
+
+# instrumentation of this process, disabled until a sink is added
+instrumentation = Instrumentation()
@@ -7,7 +7,7 @@
 # nor does it submit to any jurisdiction.
 
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 import yaml
 
@@ -18,6 +18,9 @@ from .engine import engine_factory as ef
 from .event_listeners.event_listener import DEFAULT_PAYLOAD_KEY, EventListener
 from .event_listeners.listener_manager import ListenerManager
 
+# maximum number of operations accepted by the etcd server in a single transaction, this is the server default
+MAX_TXN_OPS = 128
+
 
 class NotificationManager:
     """
@@ -44,6 +47,21 @@ class NotificationManager:
         :param to_date: date until when to request notifications, if None it will be until now
         :return: number of listeners running
         """
+        listeners_list, listener_schema = self._load_listeners(config, listeners_file_paths, listeners)
+
+        # Call the listener manager
+        return self.listener_manager.listen(listeners_list, listener_schema, config, from_date, to_date)
+
+    def _load_listeners(
+        self, config: user_config.UserConfig, listeners_file_paths: List[str] = None, listeners: Dict[str, any] = None
+    ) -> Tuple[List[Dict[str, any]], Dict[str, any]]:
+        """
+        This method parses the listeners passed, or the ones of the configuration, and loads the listener schema
+        :param config: UserConfig object
+        :param listeners_file_paths: list of file paths to YAML listener files
+        :param listeners: listeners as dictionaries
+        :return: list of listeners as dictionaries, listener schema
+        """
         # check we have listeners
         listeners_list = []
         if listeners_file_paths is not None and len(listeners_file_paths) > 0:
@@ -58,9 +76,7 @@ class NotificationManager:
 
         # retrieve listener schema
         listener_schema = config.schema_parser.parser().load(config)
-
-        # Call the listener manager
-        return self.listener_manager.listen(listeners_list, listener_schema, config, from_date, to_date)
+        return listeners_list, listener_schema
 
     def listen(
         self,
@@ -86,6 +102,66 @@ class NotificationManager:
         """
         logger.debug("Calling listen...")
 
+        config = self._listen_config(config, from_date, to_date, now, catchup)
+
+        # Call the listener manager
+        self._listen(config, listeners_file_paths, listeners, from_date, to_date)
+
+        # keep the main process running and wait for the listening thread to terminate
+        l_exit = exit_channel.get()  # this is blocking until all listener ends or there is an error
+        if l_exit:  # it exits successful
+            return
+        else:  # it exits with errors
+            raise EventListenerException("Error in one of the listening process")
+
+    async def listen_async(
+        self,
+        config: user_config.UserConfig = None,
+        listeners_file_paths: List[str] = None,
+        listeners: Dict[str, any] = None,
+        from_date: datetime = None,
+        to_date: datetime = None,
+        now: bool = False,
+        catchup: bool = False,
+    ):
+        """
+        This method is the coroutine variant of listen. The listeners run on the current event loop and this coroutine
+        returns when all of them terminate. Cancelling it stops the listeners.
+        :param config: UserConfig object
+        :param listeners_file_paths: list of file paths to YAML listener files
+        :param listeners: listeners as dictionaries
+        :param from_date: date from when to request notifications, if None it will be from now
+        :param to_date: date until when to request notifications, if None it will be until now
+        :param now: if True ignore missed notifications, only listen to new ones
+        :param catchup: if True retrieve first the missed notifications
+        :return:
+        """
+        logger.debug("Calling listen async...")
+
+        config = self._listen_config(config, from_date, to_date, now, catchup)
+        listeners_list, listener_schema = self._load_listeners(config, listeners_file_paths, listeners)
+
+        try:
+            # Call the listener manager and wait for the listening tasks to terminate
+            await self.listener_manager.listen_async(listeners_list, listener_schema, config, from_date, to_date)
+            l_exit = await self.listener_manager.wait_async()
+        finally:
+            await self.listener_manager.cancel_listeners_async()
+        if not l_exit:  # it exits with errors
+            raise EventListenerException("Error in one of the listening process")
+
+    def _listen_config(
+        self, config: user_config.UserConfig, from_date: datetime, to_date: datetime, now: bool, catchup: bool
+    ) -> user_config.UserConfig:
+        """
+        This method checks the listening inputs and sets the catchup behaviour in the configuration
+        :param config: UserConfig object
+        :param from_date: date from when to request notifications, if None it will be from now
+        :param to_date: date until when to request notifications, if None it will be until now
+        :param now: if True ignore missed notifications, only listen to new ones
+        :param catchup: if True retrieve first the missed notifications
+        :return: the configuration to use
+        """
         # first check the config
         if config is None:
             config = user_config.UserConfig()
@@ -106,16 +182,7 @@ class NotificationManager:
         else:
             if now:
                 config.notification_engine.catchup = False
-
-        # Call the listener manager
-        self._listen(config, listeners_file_paths, listeners, from_date, to_date)
-
-        # keep the main process running and wait for the listening thread to terminate
-        l_exit = exit_channel.get()  # this is blocking until all listener ends or there is an error
-        if l_exit:  # it exits successful
-            return
-        else:  # it exits with errors
-            raise EventListenerException("Error in one of the listening process")
+        return config
 
     def key(
         self, params: Dict, config: user_config.UserConfig = None, listener_schema: Dict = None
@@ -203,6 +270,145 @@ class NotificationManager:
         logger.debug("Getting schema...")
         listener_schema = config.schema_parser.parser().load(config)
 
+        # validate the input and generate the key
+        key, base_key, admin_key, value, ttl = self._prepare_notification(notification, config, listener_schema)
+
+        # create the engine
+        engine_factory: ef.EngineFactory = ef.EngineFactory(config.notification_engine, Auth.get_auth(config))
+        engine = engine_factory.create_engine()
+
+        # submit the notification with status update
+        logger.debug(f"Submit key {key}, value {value} with status update")
+        kvs = [{"key": key, "value": value}]
+        engine.push_with_status(
+            kvs, base_key=base_key, admin_key=admin_key, message=f"notification to key {key}", ttl=ttl
+        )
+
+        return True
+
+    async def notify_async(self, notification: Dict, config: user_config.UserConfig = None) -> bool:
+        """
+        This method is the coroutine variant of notify, the notification is submitted with the asyncio engine
+        :param notification: dictionary of the notification ready to submit
+        :param config: UserConfig object
+        :return: True if the notification has been submitted
+        """
+        logger.debug(f"Calling notify async with the following notification {notification}...")
+
+        # first check the config
+        if config is None:
+            config = user_config.UserConfig()
+
+        # retrieve listener schema
+        logger.debug("Getting schema...")
+        listener_schema = config.schema_parser.parser().load(config)
+
+        # validate the input and generate the key
+        key, base_key, admin_key, value, ttl = self._prepare_notification(notification, config, listener_schema)
+
+        # create the engine
+        engine_factory: ef.EngineFactory = ef.EngineFactory(config.notification_engine, Auth.get_auth(config))
+        engine = engine_factory.create_async_engine()
+
+        # submit the notification with status update
+        logger.debug(f"Submit key {key}, value {value} with status update")
+        kvs = [{"key": key, "value": value}]
+        try:
+            await engine.push_with_status(
+                kvs, base_key=base_key, admin_key=admin_key, message=f"notification to key {key}", ttl=ttl
+            )
+        finally:
+            await engine.close()
+
+        return True
+
+    def notify_many(
+        self, notifications: Iterable[Dict], config: user_config.UserConfig = None, txn_size: int = MAX_TXN_OPS
+    ) -> int:
+        """
+        Send a batch of notifications to the server. The notifications are grouped by base key and submitted in
+        transactions of at most txn_size operations. The status of each base key is updated only once, with the last
+        transaction of its group. The notifications are consumed lazily, the groups reaching txn_size are submitted
+        while the others are read, therefore this method can be used to stream the notifications.
+        :param notifications: iterable of dictionaries of the notifications ready to submit
+        :param config: UserConfig object
+        :param txn_size: maximum number of operations in a single transaction
+        :return: number of notifications submitted
+        """
+        logger.debug("Calling notify many...")
+
+        # first check the config
+        if config is None:
+            config = user_config.UserConfig()
+        # the last transaction of each group also carries the status and the admin key
+        assert txn_size > 2, "Transaction size must be greater than 2"
+
+        # retrieve listener schema
+        logger.debug("Getting schema...")
+        listener_schema = config.schema_parser.parser().load(config)
+
+        # create the engine
+        engine_factory: ef.EngineFactory = ef.EngineFactory(config.notification_engine, Auth.get_auth(config))
+        engine = engine_factory.create_engine()
+
+        # kvs waiting to be submitted and number of notifications submitted, for each group
+        groups: Dict[Tuple[str, str, int], List[Dict[str, str]]] = {}
+        counts: Dict[Tuple[str, str, int], int] = {}
+        try:
+            for index, notification in enumerate(notifications):
+                try:
+                    key, base_key, admin_key, value, ttl = self._prepare_notification(
+                        notification, config, listener_schema
+                    )
+                except (InvalidInputError, AssertionError, KeyError, ValueError) as e:
+                    raise InvalidInputError(f"Invalid notification {index}, {e}")
+                group = (base_key, admin_key, ttl)
+                kvs = groups.setdefault(group, [])
+                # a transaction cannot update the same key twice, the previous updates are submitted first
+                if len(kvs) == txn_size - 2 or any(kv["key"] == key for kv in kvs):
+                    logger.debug(f"Submit {len(kvs)} keys under {base_key}")
+                    engine.push(kvs, ttl=ttl)
+                    kvs.clear()
+                kvs.append({"key": key, "value": value})
+                counts[group] = counts.get(group, 0) + 1
+        except InvalidInputError:
+            # the notifications preceding the invalid one are submitted anyway
+            self._push_groups(engine, groups, counts)
+            raise
+
+        self._push_groups(engine, groups, counts)
+        total = sum(counts.values())
+        logger.debug(f"{total} notifications submitted")
+        return total
+
+    @staticmethod
+    def _push_groups(engine, groups: Dict[Tuple[str, str, int], List[Dict[str, str]]], counts: Dict):
+        """
+        Submit the kvs waiting in each group together with the status update of its base key
+        :param engine: engine to use
+        :param groups: kvs waiting to be submitted for each group of base key, admin key and ttl
+        :param counts: number of notifications for each group, used for the status message
+        """
+        for (base_key, admin_key, ttl), kvs in groups.items():
+            if counts[(base_key, admin_key, ttl)] == 1:
+                message = f"notification to key {kvs[0]['key']}"
+            else:
+                message = f"{counts[(base_key, admin_key, ttl)]} notifications to keys under {base_key}"
+            logger.debug(f"Submit {len(kvs)} keys under {base_key} with status update")
+            engine.push_with_status(kvs, base_key=base_key, admin_key=admin_key, message=message, ttl=ttl)
+        groups.clear()
+
+    def _prepare_notification(
+        self, notification: Dict, config: user_config.UserConfig, listener_schema: Dict
+    ) -> Tuple[str, str, str, str, int]:
+        """
+        Validate the notification and generate the keys and value to submit
+        :param notification: dictionary of the notification ready to submit
+        :param config: UserConfig object
+        :param listener_schema: event listener schema are loaded as dictionary
+        :return: tuple of leaf key, root key, admin key, value and ttl
+        """
+        notification = notification.copy()
         # validate the input
         try:
             # check the payload key
@@ -216,10 +422,6 @@ class NotificationManager:
         except AssertionError as e:
             raise InvalidInputError(e)
 
-        # first check the config
-        if config is None:
-            config = user_config.UserConfig()
-
         # read the TTL for this key
         ttl = config.key_ttl
         if "ttl" in notification:
@@ -229,19 +431,7 @@ class NotificationManager:
 
         # generate the key
         key, base_key, admin_key = self.key(notification, config, listener_schema)
-
-        # create the engine
-        engine_factory: ef.EngineFactory = ef.EngineFactory(config.notification_engine, Auth.get_auth(config))
-        engine = engine_factory.create_engine()
-
-        # submit the notification with status update
-        logger.debug(f"Submit key {key}, value {value} with status update")
-        kvs = [{"key": key, "value": value}]
-        engine.push_with_status(
-            kvs, base_key=base_key, admin_key=admin_key, message=f"notification to key {key}", ttl=ttl
-        )
-
-        return True
+        return key, base_key, admin_key, value, ttl
 
     def _load_listener_files(self, listener_files: List[str]):
         """
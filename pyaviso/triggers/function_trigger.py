@@ -6,6 +6,7 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import asyncio
 from typing import Callable, Dict
 
 from .. import logger
@@ -31,6 +32,27 @@ class FunctionTrigger(trigger.Trigger):
 
         # run the function
         logger.debug("Running function trigger")
-        self.function(self.notification)
+        if asyncio.iscoroutinefunction(self.function):
+            # no event loop is running in the listening thread, the coroutine runs in a new one
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(self.function(self.notification))
+            finally:
+                loop.close()
+        else:
+            self.function(self.notification)
+
+        logger.info("Function Trigger completed")
+
+    async def execute_async(self):
+        if not asyncio.iscoroutinefunction(self.function):
+            return await super(FunctionTrigger, self).execute_async()
+
+        logger.info("Starting Function Trigger...")
+        logger.debug(f"calling coroutine function {self.function.__name__}")
+
+        # run the coroutine on the current event loop
+        logger.debug("Running function trigger")
+        await self.function(self.notification)
 
         logger.info("Function Trigger completed")
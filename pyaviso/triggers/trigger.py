@@ -6,6 +6,7 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import asyncio
 import importlib
 import json
 import os
@@ -65,6 +66,13 @@ class Trigger(ABC):
         """
         pass
 
+    async def execute_async(self):
+        """
+        Method called by the listeners running on an event loop. The trigger is executed in a separate thread so that
+        the event loop is not blocked. The child classes can override it with a native coroutine.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.execute)
+
     def replace_template(self, text: str) -> str:
         """
         This method scans the text as input looking for the template pattern and replace it each match with the relative
@@ -14,14 +14,16 @@ import logging.handlers
 import os
 import re
 import sys
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import yaml
 
 from . import HOME_FOLDER, SYSTEM_FOLDER, logger
 from .authentication import AuthType
-from .engine import EngineType
+from .engine import EngineType, LoadBalancing
 from .event_listeners.listener_schema_parser import ListenerSchemaParserType
+from .instrumentation import SinkType
+from .instrumentation import instrumentation as listening_instrumentation
 
 # Default configuration location
 CONF_FILE = "config.yaml"
@@ -35,36 +37,80 @@ class EngineConfig:
         port: int,
         type: str,
         polling_interval: Optional[int] = None,
+        min_polling_interval: Optional[int] = None,
+        polling_jitter: Optional[float] = None,
         max_file_size: Optional[int] = None,
         timeout: Optional[int] = None,
         service: Optional[str] = None,
         https: bool = False,
         catchup: Optional[bool] = None,
         automatic_retry_delay: Optional[int] = None,
+        watch: bool = False,
+        serializable_reads: bool = True,
+        pool_size: Optional[int] = None,
+        keep_alive: Optional[bool] = None,
+        max_retries: Optional[int] = None,
+        page_size: Optional[int] = None,
+        checkpoint_interval: Optional[int] = None,
+        retry_budget: Optional[int] = None,
+        circuit_breaker_threshold: Optional[int] = None,
+        endpoints: Optional[List[str]] = None,
+        load_balancing: Optional[str] = None,
+        journal_path: Optional[str] = None,
     ):
         """
         :param host: endpoint host of the notification server
         :param port: endpoint port of the notification server
         :param type: interface to use to communicate to the notification and configuration servers
-        :param polling_interval: interval between consecutive requests for new notifications, in seconds
+        :param polling_interval: max interval between consecutive requests for new notifications, in seconds
+        :param min_polling_interval: min interval between consecutive requests for new notifications, in seconds
+        :param polling_jitter: max fraction of the polling interval randomly added or subtracted to it
         :param max_file_size: max file size allowed to push to the configuration server, in KiB
         :param timeout: number of seconds of waiting before timing-out the request to the server
         :param service: location in the configuration server associated to the notification service
         for the event listeners validation
         :param https: if True the connection will go through HTTPS
         :param catchup: if True the notification engine will first look for the missed notifications
-        :param automatic_retry_delay: Number of seconds to wait before retrying to connect to the engine
+        :param automatic_retry_delay: Max number of seconds to wait before retrying to connect to the engine
+        :param watch: if True the notification engine will listen by watching the server instead of polling it
+        :param serializable_reads: if True the polling requests can be served by any member of the cluster, without
+        going through the leader
+        :param pool_size: max number of connections kept open with the server
+        :param keep_alive: if True the connections are reused across requests
+        :param max_retries: number of times a request is retried if the connection to the server fails
+        :param page_size: max number of key-value pairs retrieved by each request when listening
+        :param checkpoint_interval: max interval between the saving of the last revisions processed, in seconds
+        :param retry_budget: max number of seconds a request is retried for if the server is unreachable, None for no
+        limit
+        :param circuit_breaker_threshold: number of consecutive connection failures suspending the requests
+        :param endpoints: other members of the cluster of the server, as host:port
+        :param load_balancing: strategy to spread the read requests across the members of the cluster
+        :param journal_path: path of the journal file of the file_based engine
         """
         self.host = host
         self.port = port
         self.type = EngineType[type.upper()]
         self.polling_interval = polling_interval
+        self.min_polling_interval = min_polling_interval
+        self.polling_jitter = polling_jitter
         self.max_file_size = max_file_size
         self.timeout = timeout
         self.https = https
         self.service = service
         self.catchup = catchup
         self.automatic_retry_delay = automatic_retry_delay
+        self.watch = watch
+        self.serializable_reads = serializable_reads
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.max_retries = max_retries
+        self.page_size = page_size
+        self.checkpoint_interval = checkpoint_interval
+        self.retry_budget = retry_budget
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.endpoints = endpoints
+        self.load_balancing = LoadBalancing[load_balancing.upper()] if load_balancing else None
+        self.journal_path = journal_path
 
     def __str__(self):
         config_string = (
@@ -73,11 +119,25 @@ class EngineConfig:
             + f", https: {self.https}"
             + f", type: {self.type.name}"
             + f", polling_interval: {self.polling_interval}"
+            + f", min_polling_interval: {self.min_polling_interval}"
+            + f", polling_jitter: {self.polling_jitter}"
             + f", timeout: {self.timeout}"
             + f", max_file_size: {self.max_file_size}"
             + f", service: {self.service}"
             + f", catchup: {self.catchup}"
             + f", automatic_retry_delay: {self.automatic_retry_delay}"
+            + f", watch: {self.watch}"
+            + f", serializable_reads: {self.serializable_reads}"
+            + f", pool_size: {self.pool_size}"
+            + f", keep_alive: {self.keep_alive}"
+            + f", max_retries: {self.max_retries}"
+            + f", page_size: {self.page_size}"
+            + f", checkpoint_interval: {self.checkpoint_interval}"
+            + f", retry_budget: {self.retry_budget}"
+            + f", circuit_breaker_threshold: {self.circuit_breaker_threshold}"
+            + f", endpoints: {self.endpoints}"
+            + f", load_balancing: {self.load_balancing.value if self.load_balancing else None}"
+            + f", journal_path: {self.journal_path}"
         )
         return config_string
 
@@ -106,6 +166,7 @@ class UserConfig:
         schema_parser: Optional[str] = None,
         remote_schema: Optional[bool] = None,
         listeners: Optional[Dict[str, any]] = None,
+        instrumentation: Optional[str] = None,
     ):
         """
         :param conf_path: path to the system configuration file. If not provided,
@@ -128,6 +189,7 @@ class UserConfig:
         :param remote_schema: flag to activate the dynamic retrieval of the listener schema from the configuration
         server
         :param listeners: listeners configuration
+        :param instrumentation: sink of the timings of the listening stages, if None they are not taken
         """
         try:
             # we build the configuration in priority order from the lower to the higher
@@ -164,6 +226,7 @@ class UserConfig:
             self.schema_parser = schema_parser
             self.remote_schema = remote_schema
             self.listeners = listeners
+            self.instrumentation = instrumentation
 
             logger.debug("Loading configuration completed")
 
@@ -181,10 +244,24 @@ class UserConfig:
         notification_engine["https"] = False
         notification_engine["type"] = "etcd_rest"
         notification_engine["polling_interval"] = 30  # seconds
+        notification_engine["min_polling_interval"] = 1  # seconds
+        notification_engine["polling_jitter"] = 0.1
         notification_engine["timeout"] = 60  # seconds
         notification_engine["service"] = "aviso/v1"
         notification_engine["catchup"] = True
         notification_engine["automatic_retry_delay"] = 15  # seconds
+        notification_engine["watch"] = False
+        notification_engine["serializable_reads"] = True
+        notification_engine["pool_size"] = 10
+        notification_engine["keep_alive"] = True
+        notification_engine["max_retries"] = 0
+        notification_engine["page_size"] = 1000
+        notification_engine["checkpoint_interval"] = 5  # seconds
+        notification_engine["retry_budget"] = None  # no limit
+        notification_engine["circuit_breaker_threshold"] = 5
+        notification_engine["endpoints"] = []  # only host:port
+        notification_engine["load_balancing"] = "round_robin"
+        notification_engine["journal_path"] = "/tmp/aviso/journal"  # only for file_based
 
         # configuration engine
         configuration_engine = {}
@@ -195,6 +272,13 @@ class UserConfig:
         configuration_engine["max_file_size"] = 500  # KiB
         configuration_engine["timeout"] = 60  # seconds
         configuration_engine["automatic_retry_delay"] = 15  # seconds
+        configuration_engine["pool_size"] = 10
+        configuration_engine["keep_alive"] = True
+        configuration_engine["max_retries"] = 0
+        configuration_engine["retry_budget"] = None  # no limit
+        configuration_engine["circuit_breaker_threshold"] = 5
+        configuration_engine["endpoints"] = []  # only host:port
+        configuration_engine["load_balancing"] = "round_robin"
 
         # main config
         config = {}
@@ -210,6 +294,7 @@ class UserConfig:
         config["key_ttl"] = -1  # not expiring
         config["schema_parser"] = "generic"
         config["remote_schema"] = False
+        config["instrumentation"] = None  # disabled
         return config
 
     def _read_key(self) -> str:
@@ -282,6 +367,12 @@ class UserConfig:
             config["notification_engine"]["host"] = os.environ["AVISO_NOTIFICATION_HOST"]
         if "AVISO_NOTIFICATION_PORT" in os.environ:
             config["notification_engine"]["port"] = int(os.environ["AVISO_NOTIFICATION_PORT"])
+        if "AVISO_NOTIFICATION_ENDPOINTS" in os.environ:  # comma-separated list of host:port
+            config["notification_engine"]["endpoints"] = [
+                e.strip() for e in os.environ["AVISO_NOTIFICATION_ENDPOINTS"].split(",") if e.strip()
+            ]
+        if "AVISO_NOTIFICATION_LOAD_BALANCING" in os.environ:
+            config["notification_engine"]["load_balancing"] = os.environ["AVISO_NOTIFICATION_LOAD_BALANCING"]
         if "AVISO_NOTIFICATION_HTTPS" in os.environ:
             config["notification_engine"]["https"] = os.environ["AVISO_NOTIFICATION_HTTPS"]
         if "AVISO_NOTIFICATION_ENGINE" in os.environ:
@@ -290,16 +381,50 @@ class UserConfig:
             config["notification_engine"]["service"] = os.environ["AVISO_NOTIFICATION_SERVICE"]
         if "AVISO_NOTIFICATION_CATCHUP" in os.environ:
             config["notification_engine"]["catchup"] = os.environ["AVISO_NOTIFICATION_CATCHUP"]
+        if "AVISO_NOTIFICATION_WATCH" in os.environ:
+            config["notification_engine"]["watch"] = os.environ["AVISO_NOTIFICATION_WATCH"]
+        if "AVISO_NOTIFICATION_SERIALIZABLE_READS" in os.environ:
+            config["notification_engine"]["serializable_reads"] = os.environ["AVISO_NOTIFICATION_SERIALIZABLE_READS"]
+        if "AVISO_NOTIFICATION_POOL_SIZE" in os.environ:
+            config["notification_engine"]["pool_size"] = int(os.environ["AVISO_NOTIFICATION_POOL_SIZE"])
+        if "AVISO_NOTIFICATION_KEEP_ALIVE" in os.environ:
+            config["notification_engine"]["keep_alive"] = os.environ["AVISO_NOTIFICATION_KEEP_ALIVE"]
+        if "AVISO_NOTIFICATION_MAX_RETRIES" in os.environ:
+            config["notification_engine"]["max_retries"] = int(os.environ["AVISO_NOTIFICATION_MAX_RETRIES"])
+        if "AVISO_NOTIFICATION_PAGE_SIZE" in os.environ:
+            config["notification_engine"]["page_size"] = int(os.environ["AVISO_NOTIFICATION_PAGE_SIZE"])
+        if "AVISO_NOTIFICATION_CHECKPOINT_INTERVAL" in os.environ:
+            config["notification_engine"]["checkpoint_interval"] = int(
+                os.environ["AVISO_NOTIFICATION_CHECKPOINT_INTERVAL"]
+            )
+        if "AVISO_NOTIFICATION_JOURNAL_PATH" in os.environ:
+            config["notification_engine"]["journal_path"] = os.environ["AVISO_NOTIFICATION_JOURNAL_PATH"]
         if "AVISO_POLLING_INTERVAL" in os.environ:
             config["notification_engine"]["polling_interval"] = int(os.environ["AVISO_POLLING_INTERVAL"])
+        if "AVISO_MIN_POLLING_INTERVAL" in os.environ:
+            config["notification_engine"]["min_polling_interval"] = int(os.environ["AVISO_MIN_POLLING_INTERVAL"])
+        if "AVISO_POLLING_JITTER" in os.environ:
+            config["notification_engine"]["polling_jitter"] = float(os.environ["AVISO_POLLING_JITTER"])
         if "AVISO_CONFIGURATION_HOST" in os.environ:
             config["configuration_engine"]["host"] = os.environ["AVISO_CONFIGURATION_HOST"]
         if "AVISO_CONFIGURATION_PORT" in os.environ:
             config["configuration_engine"]["port"] = int(os.environ["AVISO_CONFIGURATION_PORT"])
+        if "AVISO_CONFIGURATION_ENDPOINTS" in os.environ:  # comma-separated list of host:port
+            config["configuration_engine"]["endpoints"] = [
+                e.strip() for e in os.environ["AVISO_CONFIGURATION_ENDPOINTS"].split(",") if e.strip()
+            ]
+        if "AVISO_CONFIGURATION_LOAD_BALANCING" in os.environ:
+            config["configuration_engine"]["load_balancing"] = os.environ["AVISO_CONFIGURATION_LOAD_BALANCING"]
         if "AVISO_CONFIGURATION_HTTPS" in os.environ:
             config["configuration_engine"]["https"] = os.environ["AVISO_CONFIGURATION_HTTPS"]
         if "AVISO_CONFIGURATION_ENGINE" in os.environ:
             config["configuration_engine"]["type"] = os.environ["AVISO_CONFIGURATION_ENGINE"]
+        if "AVISO_CONFIGURATION_POOL_SIZE" in os.environ:
+            config["configuration_engine"]["pool_size"] = int(os.environ["AVISO_CONFIGURATION_POOL_SIZE"])
+        if "AVISO_CONFIGURATION_KEEP_ALIVE" in os.environ:
+            config["configuration_engine"]["keep_alive"] = os.environ["AVISO_CONFIGURATION_KEEP_ALIVE"]
+        if "AVISO_CONFIGURATION_MAX_RETRIES" in os.environ:
+            config["configuration_engine"]["max_retries"] = int(os.environ["AVISO_CONFIGURATION_MAX_RETRIES"])
         if "AVISO_MAX_FILE_SIZE" in os.environ:
             config["configuration_engine"]["max_file_size"] = int(os.environ["AVISO_MAX_FILE_SIZE"])
         if "AVISO_USERNAME" in os.environ:
@@ -322,6 +447,8 @@ class UserConfig:
             config["remote_schema"] = os.environ["AVISO_REMOTE_SCHEMA"]
         if "AVISO_SCHEMA_PARSER" in os.environ:
             config["schema_parser"] = os.environ["AVISO_SCHEMA_PARSER"]
+        if "AVISO_INSTRUMENTATION" in os.environ:
+            config["instrumentation"] = os.environ["AVISO_INSTRUMENTATION"]
         if "AVISO_TIMEOUT" in os.environ:  # one variable for both engine
             timeout = None if os.environ["AVISO_TIMEOUT"] == "null" else int(os.environ["AVISO_TIMEOUT"])
             config["notification_engine"]["timeout"] = timeout
@@ -334,6 +461,14 @@ class UserConfig:
             )
             config["notification_engine"]["automatic_retry_delay"] = automatic_retry_delay
             config["configuration_engine"]["automatic_retry_delay"] = automatic_retry_delay
+        if "AVISO_RETRY_BUDGET" in os.environ:  # one variable for both engine
+            retry_budget = None if os.environ["AVISO_RETRY_BUDGET"] == "null" else int(os.environ["AVISO_RETRY_BUDGET"])
+            config["notification_engine"]["retry_budget"] = retry_budget
+            config["configuration_engine"]["retry_budget"] = retry_budget
+        if "AVISO_CIRCUIT_BREAKER_THRESHOLD" in os.environ:  # one variable for both engine
+            threshold = int(os.environ["AVISO_CIRCUIT_BREAKER_THRESHOLD"])
+            config["notification_engine"]["circuit_breaker_threshold"] = threshold
+            config["configuration_engine"]["circuit_breaker_threshold"] = threshold
         return config
 
     def logging_setup(self, logging_conf_path: str):
@@ -390,12 +525,34 @@ class UserConfig:
         assert "service" in ne, "notification_engine service has not been configured"
         assert "catchup" in ne, "notification_engine catchup has not been configured"
         assert "automatic_retry_delay" in ne, "notification_engine automatic_retry_delay has not been configured"
+        assert "pool_size" in ne, "notification_engine pool_size has not been configured"
+        assert "keep_alive" in ne, "notification_engine keep_alive has not been configured"
+        assert "max_retries" in ne, "notification_engine max_retries has not been configured"
+        assert "page_size" in ne, "notification_engine page_size has not been configured"
+        assert "checkpoint_interval" in ne, "notification_engine checkpoint_interval has not been configured"
+        assert "retry_budget" in ne, "notification_engine retry_budget has not been configured"
+        assert (
+            "circuit_breaker_threshold" in ne
+        ), "notification_engine circuit_breaker_threshold has not been configured"
+        assert "endpoints" in ne, "notification_engine endpoints has not been configured"
+        assert "load_balancing" in ne, "notification_engine load_balancing has not been configured"
+        assert "journal_path" in ne, "notification_engine journal_path has not been configured"
         assert "polling_interval" in ne, "notification_engine polling_interval has not been configured"
+        assert "min_polling_interval" in ne, "notification_engine min_polling_interval has not been configured"
+        assert "polling_jitter" in ne, "notification_engine polling_jitter has not been configured"
         assert "timeout" in ne, "notification_engine timeout has not been configured"
+        assert "watch" in ne, "notification_engine watch has not been configured"
+        assert "serializable_reads" in ne, "notification_engine serializable_reads has not been configured"
         if type(ne["https"]) is str:
             ne["https"] = ne["https"].casefold() == "true".casefold()
         if type(ne["catchup"]) is str:
             ne["catchup"] = ne["catchup"].casefold() == "true".casefold()
+        if type(ne["watch"]) is str:
+            ne["watch"] = ne["watch"].casefold() == "true".casefold()
+        if type(ne["serializable_reads"]) is str:
+            ne["serializable_reads"] = ne["serializable_reads"].casefold() == "true".casefold()
+        if type(ne["keep_alive"]) is str:
+            ne["keep_alive"] = ne["keep_alive"].casefold() == "true".casefold()
 
         # translate the ne in a NotificationEngineConfig
         self._notification_engine = EngineConfig(
@@ -403,11 +560,25 @@ class UserConfig:
             ne["port"],
             ne["type"],
             polling_interval=ne["polling_interval"],
+            min_polling_interval=ne["min_polling_interval"],
+            polling_jitter=ne["polling_jitter"],
             timeout=ne["timeout"],
             https=ne["https"],
             service=ne["service"],
             catchup=ne["catchup"],
             automatic_retry_delay=ne["automatic_retry_delay"],
+            watch=ne["watch"],
+            serializable_reads=ne["serializable_reads"],
+            pool_size=ne["pool_size"],
+            keep_alive=ne["keep_alive"],
+            max_retries=ne["max_retries"],
+            page_size=ne["page_size"],
+            checkpoint_interval=ne["checkpoint_interval"],
+            retry_budget=ne["retry_budget"],
+            circuit_breaker_threshold=ne["circuit_breaker_threshold"],
+            endpoints=ne["endpoints"],
+            load_balancing=ne["load_balancing"],
+            journal_path=ne["journal_path"],
         )
 
     @property
@@ -430,8 +601,19 @@ class UserConfig:
         assert "max_file_size" in ce, "configuration_engine max_file_size has not been configured"
         assert "timeout" in ce, "configuration_engine timeout has not been configured"
         assert "automatic_retry_delay" in ce, "configuration_engine automatic_retry_delay has not been configured"
+        assert "pool_size" in ce, "configuration_engine pool_size has not been configured"
+        assert "keep_alive" in ce, "configuration_engine keep_alive has not been configured"
+        assert "max_retries" in ce, "configuration_engine max_retries has not been configured"
+        assert "retry_budget" in ce, "configuration_engine retry_budget has not been configured"
+        assert (
+            "circuit_breaker_threshold" in ce
+        ), "configuration_engine circuit_breaker_threshold has not been configured"
+        assert "endpoints" in ce, "configuration_engine endpoints has not been configured"
+        assert "load_balancing" in ce, "configuration_engine load_balancing has not been configured"
         if type(ce["https"]) is str:
             ce["https"] = ce["https"].casefold() == "true".casefold()
+        if type(ce["keep_alive"]) is str:
+            ce["keep_alive"] = ce["keep_alive"].casefold() == "true".casefold()
 
         # exclude file_based from the options for the configuration engine
         assert ce["type"].casefold() != "file_based", "File_based engine not available as configuration engine"
@@ -444,6 +626,13 @@ class UserConfig:
             timeout=ce["timeout"],
             https=ce["https"],
             automatic_retry_delay=ce["automatic_retry_delay"],
+            pool_size=ce["pool_size"],
+            keep_alive=ce["keep_alive"],
+            max_retries=ce["max_retries"],
+            retry_budget=ce["retry_budget"],
+            circuit_breaker_threshold=ce["circuit_breaker_threshold"],
+            endpoints=ce["endpoints"],
+            load_balancing=ce["load_balancing"],
         )
 
     @property
@@ -464,6 +653,17 @@ class UserConfig:
         if type(self._remote_schema) is str:
             self._remote_schema = self._remote_schema.casefold() == "true".casefold()
 
+    @property
+    def instrumentation(self) -> Optional[SinkType]:
+        return self._instrumentation
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation: str):
+        sink_type = self._configure_property(instrumentation, "instrumentation", nullable=True)
+        self._instrumentation = SinkType[sink_type.upper()] if sink_type else None
+        if self._instrumentation is not None:
+            listening_instrumentation.use(self._instrumentation)
+
     @property
     def key_ttl(self):
         return self._key_ttl
@@ -582,6 +782,7 @@ class UserConfig:
             + f", key_ttl: {self.key_ttl}"
             + f", schema_parser: {self.schema_parser}"
             + f", remote_schema: {self.remote_schema}"
+            + f", instrumentation: {self.instrumentation}"
         )
         return config_string
 
@@ -0,0 +1,67 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import json
+import os
+
+import pytest
+
+from pyaviso import user_config
+from pyaviso.authentication import auth
+from pyaviso.engine import EngineType
+from pyaviso.engine.engine_factory import EngineFactory
+from pyaviso.event_listeners.event_listener import EventListener
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture(scope="session")
+def diss_key() -> str:
+    """
+    :return: format of the keys recorded in the fixtures of the etcd responses, by step
+    """
+    return "/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step={step}"
+
+
+@pytest.fixture(scope="session")
+def config() -> user_config.UserConfig:
+    return user_config.UserConfig(conf_path="tests/config.yaml")
+
+
+@pytest.fixture(scope="session")
+def schema():
+    with open(os.path.join(FIXTURES, "listener_schema.json")) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def engine(config):
+    config.notification_engine.type = EngineType.IN_MEMORY
+    config.notification_engine.host = "benchmark"
+    return EngineFactory(config.notification_engine, auth.Auth.get_auth(config)).create_engine()
+
+
+@pytest.fixture
+def diss_listener(engine, schema):
+    request = {
+        "destination": "SCL",
+        "target": "E1",
+        "class": "od",
+        "expver": 1,
+        "domain": "g",
+        "time": [0, 12],
+        "stream": ["enfo", "oper"],
+        "step": list(range(0, 500)),
+    }
+    return EventListener("dissemination", engine, request, [{"type": "echo"}], schema["dissemination"])
+
+
+@pytest.fixture
+def mars_listener(engine, schema):
+    request = {"date": "20210101", "class": "od", "expver": 1, "domain": "g", "time": 0, "stream": "enfo"}
+    return EventListener("mars", engine, request, [{"type": "echo"}], schema["mars"])
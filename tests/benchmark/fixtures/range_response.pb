@@ -0,0 +1,502 @@
+
+񔃆ґҸώ: 
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000001
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000011
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000101
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001001
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001011
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001021
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001031
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001041
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001051
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001061
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001071
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001081
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=10977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001091
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000111
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001101
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001111
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001121
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001131
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001141
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001151
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001161
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001171
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001181
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=11977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001191
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000121
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001201
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001211
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001221
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001231
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001241
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001251
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001261
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001271
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001281
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=12977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001291
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000131
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001301
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001311
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001321
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001331
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001341
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001351
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001361
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001371
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001381
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=13977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001391
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000141
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001401
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001411
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001421
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001431
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001441
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001451
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001461
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001471
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001481
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=14977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001491
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000151
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001501
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001511
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001521
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001531
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001541
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001551
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001561
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001571
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001581
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=15977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001591
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000161
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001601
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001611
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001621
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001631
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001641
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001651
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001661
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001671
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001681
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=16977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001691
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000171
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001701
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001711
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001721
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001731
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001741
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001751
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001761
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001771
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001781
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=17977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001791
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000181
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001801
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001811
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001821
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001831
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001841
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001851
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001861
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001871
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001881
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=18977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001891
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=1966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000191
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001901
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001911
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001921
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001931
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001941
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001951
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001961
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001971
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001981
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=19977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000001991
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000021
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000201
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002001
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002011
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002021
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002031
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002041
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002051
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002061
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002071
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002081
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=20977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002091
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000211
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002101
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002111
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002121
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002131
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002141
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002151
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002161
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002171
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002181
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=21977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002191
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000221
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002201
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22177 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002211
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22277 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002221
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22377 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002231
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22477 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002241
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22577 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002251
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22677 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002261
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22777 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002271
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22877 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002281
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=22977 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002291
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000231
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23077 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002301
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002311
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002321
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002331
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002341
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002351
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002361
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002371
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002381
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=23988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002391
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000241
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002401
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002411
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002421
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002431
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002441
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002451
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002461
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002471
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002481
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=24988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002491
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000251
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002501
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002511
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002521
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002531
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002541
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002551
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002561
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002571
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002581
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=25988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002591
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000261
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002601
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002611
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002621
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002631
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002641
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002651
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002661
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002671
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002681
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=26988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002691
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000271
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002701
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002711
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002721
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002731
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002741
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002751
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002761
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002771
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002781
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=27988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002791
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000281
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002801
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002811
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002821
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002831
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002841
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002851
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002861
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002871
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002881
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=28988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002891
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=2966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000291
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002901
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002911
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002921
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002931
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002941
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002951
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002961
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002971
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002981
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=29988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000002991
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000031
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000301
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003001
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003011
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003021
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003031
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003041
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003051
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003061
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003071
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003081
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=30988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003091
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000311
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003101
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003111
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003121
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003131
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003141
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003151
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003161
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003171
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003181
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=31988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003191
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000321
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003201
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003211
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003221
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003231
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003241
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003251
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003261
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003271
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003281
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=32988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003291
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000331
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003301
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003311
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003321
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003331
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003341
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003351
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003361
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003371
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003381
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=33988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003391
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000341
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003401
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003411
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003421
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003431
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003441
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003451
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003461
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003471
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003481
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=34988 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003491
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000351
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35088 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003501
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35188 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003511
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35288 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003521
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35388 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003531
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35488 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003541
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35588 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003551
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35688 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003561
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35788 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003571
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35888 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003581
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=35999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003591
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000361
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003601
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003611
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003621
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003631
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003641
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003651
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003661
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003671
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003681
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=36999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003691
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000371
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003701
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003711
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003721
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003731
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003741
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003751
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003761
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003771
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003781
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=37999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003791
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000381
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003801
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003811
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003821
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003831
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003841
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003851
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003861
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003871
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003881
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=38999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003891
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=3966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000391
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003901
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003911
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003921
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003931
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003941
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003951
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003961
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003971
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003981
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=39999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000003991
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000041
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000401
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004001
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004011
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004021
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004031
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004041
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004051
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004061
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004071
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004081
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=40999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004091
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000411
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004101
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004111
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004121
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004131
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004141
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004151
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004161
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004171
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004181
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=41999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004191
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000421
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004201
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004211
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004221
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004231
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004241
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004251
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004261
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004271
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004281
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=42999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004291
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000431
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004301
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004311
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004321
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004331
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004341
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004351
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004361
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004371
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004381
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=43999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004391
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000441
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004401
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004411
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004421
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004431
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004441
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004451
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004461
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004471
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004481
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=44999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004491
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000451
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004501
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004511
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004521
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004531
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004541
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004551
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004561
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004571
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004581
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=45999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004591
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000461
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004601
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004611
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004621
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004631
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004641
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004651
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004661
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004671
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004681
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=46999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004691
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000471
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004701
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004711
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004721
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004731
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004741
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004751
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004761
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47799 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004771
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47899 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004781
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=47999 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004791
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000481
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=48099 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004801
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=48199 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004811
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=48299 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004821
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=48399 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004831
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=48499 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004841
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=48599 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004851
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=48699 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004861
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=487:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004871
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=488:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004881
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=489:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004891
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=4966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000491
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=490:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004901
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=491:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004911
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=492:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004921
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=493:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004931
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=494:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004941
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=495:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004951
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=496:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004961
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=497:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004971
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=498:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004981
+a/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=499:: *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000004991
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000051
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000501
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000511
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000521
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000531
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000541
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000551
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000561
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000571
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000581
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=5966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000591
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000061
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000601
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000611
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000621
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000631
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000641
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000651
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000661
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000671
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000681
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=6966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000691
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000071
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000701
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000711
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000721
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000731
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000741
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000751
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000761
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000771
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000781
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=7966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000791
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000081
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000801
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000811
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000821
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000831
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000841
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000851
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000861
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000871
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000881
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=8966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000891
+_/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000091
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9066 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000901
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9166 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000911
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9266 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000921
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9366 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000931
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9466 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000941
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9566 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000951
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9666 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000961
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9766 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000971
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9866 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000981
+`/ec/diss/SCL/date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step=9966 *4https://xxx.ecmwf.int/xxx/20210101/E1X01010000000991 
\ No newline at end of file
@@ -0,0 +1,60 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+"""
+This script records the range responses of an etcd server used by the benchmarks of the engines. It requires an etcd
+server on localhost:2379 and pyaviso installed, it is run from the root of the repository with:
+
+    python tests/benchmark/record_responses.py
+"""
+
+import base64
+import json
+import os
+
+import etcd3
+import requests
+from etcd3 import etcdrpc
+
+from pyaviso import user_config
+from pyaviso.authentication import auth
+from pyaviso.engine.etcd_rest_engine import EtcdRestEngine
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+BASE_KEY = "/ec/diss/SCL/"
+NOTIFICATIONS = 500
+
+
+def record():
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    engine = EtcdRestEngine(c.notification_engine, auth.Auth.get_auth(c))
+    engine.delete(BASE_KEY)
+    for i in range(NOTIFICATIONS):
+        key = f"{BASE_KEY}date=20210101,target=E1,class=od,expver=0001,domain=g,time=0000,stream=enfo,step={i}"
+        location = f"https://xxx.ecmwf.int/xxx/20210101/E1X01010000{i:05d}1"
+        engine.push([{"key": key, "value": location}])
+
+    # REST gateway response, keys and values are base64 encoded
+    range_end = base64.b64encode(engine._incr_last_byte(BASE_KEY)).decode()
+    body = {"key": base64.b64encode(BASE_KEY.encode()).decode(), "range_end": range_end}
+    resp = requests.post(f"http://{c.notification_engine.host}:{c.notification_engine.port}/v3/kv/range", json=body)
+    resp.raise_for_status()
+    with open(os.path.join(FIXTURES, "range_response.json"), "w") as f:
+        json.dump(resp.json(), f)
+
+    # gRPC response, serialised as protocol buffer
+    client = etcd3.client(host=c.notification_engine.host, port=c.notification_engine.port)
+    request = etcdrpc.RangeRequest(key=BASE_KEY.encode(), range_end=engine._incr_last_byte(BASE_KEY))
+    response = client.kvstub.Range(request)
+    with open(os.path.join(FIXTURES, "range_response.pb"), "wb") as f:
+        f.write(response.SerializeToString())
+    engine.delete(BASE_KEY)
+
+
+if __name__ == "__main__":
+    record()
@@ -0,0 +1,56 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import threading
+import time
+import uuid
+
+import pytest
+
+from pyaviso.authentication import auth
+from pyaviso.engine import EngineType
+from pyaviso.engine.engine_factory import EngineFactory
+from pyaviso.event_listeners.event_listener import EventListener
+from pyaviso.instrumentation import HistogramSink, Stage, instrumentation
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("watch", [False, True])
+def test_delivery_lag(benchmark, config, schema, diss_key, watch):
+    config.notification_engine.type = EngineType.IN_MEMORY
+    config.notification_engine.host = f"benchmark-{uuid.uuid4()}"
+    config.notification_engine.polling_interval = 1
+    config.notification_engine.catchup = False
+    config.notification_engine.watch = watch
+    engine = EngineFactory(config.notification_engine, auth.Auth.get_auth(config)).create_engine()
+    delivered = threading.Event()
+    triggers = [{"type": "function", "function": lambda n: delivered.set()}]
+    listener = EventListener("dissemination", engine, {"destination": "SCL"}, triggers, schema["dissemination"])
+    sink = HistogramSink()
+    instrumentation.add_sink(sink)
+    assert listener.listen()
+    time.sleep(0.5)  # the listening starts from the latest revision of the server
+    steps = iter(range(1000000))
+
+    def notify():
+        # a notification is submitted as with aviso notify, and the time is taken until its trigger is fired
+        delivered.clear()
+        engine.push_with_status([{"key": diss_key.format(step=next(steps)), "value": "location"}], "/ec/diss/SCL/")
+        assert delivered.wait(5)
+
+    try:
+        benchmark.pedantic(notify, rounds=10, warmup_rounds=1)
+    finally:
+        listener.stop()
+        instrumentation.remove_sinks()
+    # the lag measured by the listener is reported with the benchmark
+    for stage in (Stage.RECEIPT_LAG, Stage.DELIVERY_LAG, Stage.LISTENER_DELIVERY_LAG, Stage.KEY_DELIVERY_LAG):
+        for label in sink.labels(stage):
+            benchmark.extra_info[f"{stage.value}:{label}"] = sink.histogram(stage, label).stats()
+    assert sink.histogram(Stage.DELIVERY_LAG, "dissemination").count == 11
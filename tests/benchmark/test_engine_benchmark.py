@@ -0,0 +1,42 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import json
+import os
+
+import pytest
+from etcd3 import etcdrpc
+
+from pyaviso.authentication import auth
+from pyaviso.engine.etcd_gateway import parse_kv
+from pyaviso.engine.etcd_grpc_engine import EtcdGrpcEngine
+
+pytest.importorskip("pytest_benchmark")
+
+# the responses are recorded with record_responses.py, no etcd server is needed to run these benchmarks
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+NOTIFICATIONS = 500
+
+
+def test_rest_parse_raw_kv(benchmark, diss_key):
+    with open(os.path.join(FIXTURES, "range_response.json")) as f:
+        response = json.load(f)
+
+    kvs = benchmark(lambda: [parse_kv(kv) for kv in response["kvs"]])
+    assert len(kvs) == NOTIFICATIONS
+    assert kvs[0]["key"] == diss_key.format(step=0)
+
+
+def test_grpc_parse_raw_kv(benchmark, config, diss_key):
+    with open(os.path.join(FIXTURES, "range_response.pb"), "rb") as f:
+        response = etcdrpc.RangeResponse.FromString(f.read())
+    engine = EtcdGrpcEngine(config.notification_engine, auth.Auth.get_auth(config))
+
+    kvs = benchmark(lambda: [engine._parse_raw_kv(kv) for kv in response.kvs])
+    assert len(kvs) == NOTIFICATIONS
+    assert kvs[0]["key"] == diss_key.format(step=0)
@@ -0,0 +1,117 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import pytest
+
+from pyaviso.event_listeners.event_listener import EventListener
+from pyaviso.event_listeners.listener_dispatcher import ListenerDispatcher
+
+pytest.importorskip("pytest_benchmark")
+
+# one schema and one list of values for each type handler
+HANDLERS = {
+    "DateHandler": ({"type": "DateHandler", "canonic": "%Y%m%d"}, [f"202101{d:02d}" for d in range(1, 31)]),
+    "EnumHandler": (
+        {"type": "EnumHandler", "values": [f"v{i}" for i in range(100)]},
+        [f"v{i}" for i in range(0, 100, 4)],
+    ),
+    "FloatHandler": ({"type": "FloatHandler", "canonic": "{:2.2f}"}, [i / 3 for i in range(30)]),
+    "IntHandler": ({"type": "IntHandler", "canonic": "{0:0>4}", "range": [0, 1000]}, list(range(30))),
+    "RegexHandler": ({"type": "RegexHandler", "regex": "^[A-Z][0-9]$"}, [f"E{i % 10}" for i in range(30)]),
+    "StringHandler": ({"type": "StringHandler", "canonic": "upper"}, [f"e{i}" for i in range(30)]),
+    "TimeHandler": ({"type": "TimeHandler", "canonic": "{0:0>2}00", "values": [0, 6, 12, 18]}, [0, 6, 12, 18]),
+}
+
+
+def test_parse_key(benchmark, diss_listener, diss_key):
+    notification = benchmark(diss_listener.parse_key, diss_key.format(step=12))
+    assert notification["step"] == "12"
+
+
+def test_is_expected(benchmark, diss_listener, diss_key):
+    notification = diss_listener.parse_key(diss_key.format(step=499))
+    assert benchmark(diss_listener._is_expected, notification)
+
+
+def test_notification(benchmark, diss_listener, diss_key):
+    notification = benchmark(diss_listener._notification, diss_key.format(step=12), b"location")
+    assert notification is not None
+
+
+@pytest.mark.parametrize("dispatch", ["listeners", "dispatcher"])
+def test_dispatch(benchmark, engine, schema, diss_key, dispatch):
+    # near-identical listeners, each expecting 10 steps, 10 of them expect the key
+    listeners = []
+    for i in range(300):
+        request = {"destination": "SCL", "target": "E1", "class": "od", "step": list(range(i, i + 10))}
+        listeners.append(EventListener("dissemination", engine, request, [], schema["dissemination"]))
+    key = diss_key.format(step=12)
+    if dispatch == "listeners":
+        notifications = benchmark(lambda: [n for n in (ls._notification(key, "v") for ls in listeners) if n])
+    else:
+        notifications = benchmark(ListenerDispatcher(listeners)._notifications, key, "v")
+    assert len(notifications) == 10
+
+
+def test_filter_expansion(benchmark, diss_listener):
+    request = {
+        "destination": "scl",
+        "target": "E1",
+        "class": ["od", "ea"],
+        "expver": 1,
+        "domain": "g",
+        "date": "20210101",
+        "time": [0, 6, 12, 18],
+        "stream": ["enfo", "oper", "waef"],
+        "step": list(range(0, 360, 3)),
+    }
+    # the request is canonised in place, each round is given a new copy
+    request_filter = benchmark.pedantic(
+        diss_listener.filter_expansion, setup=lambda: ((dict(request),), {}), rounds=1000, warmup_rounds=10
+    )
+    assert request_filter["destination"] == ["SCL"]
+
+
+@pytest.mark.parametrize("handler", sorted(HANDLERS))
+def test_validate(benchmark, handler):
+    schema, values = HANDLERS[handler]
+
+    def validate():
+        params = {"test": list(values)}
+        # the request schema is loaded again for every request, as when notifying
+        EventListener._validate(params, {"test": [dict(schema)]})
+        return params
+
+    assert len(benchmark(validate)["test"]) == len(values)
+
+
+def test_key_expansion(benchmark, mars_listener):
+    request = {
+        "date": [f"202101{d:02d}" for d in range(1, 31)],
+        "class": ["od", "ea"],
+        "expver": "0001",
+        "domain": "g",
+        "time": ["0000", "0600", "1200", "1800"],
+        "stream": ["enfo", "oper", "waef", "wave", "scda"],
+    }
+    keys = benchmark(mars_listener.key_expansion, request)
+    assert len(keys) == 30 * 2 * 4 * 5
+
+
+def test_key_plan(benchmark, mars_listener):
+    request = {
+        "date": [f"202101{d:02d}" for d in range(1, 31)],
+        "class": ["od", "ea"],
+        "expver": "0001",
+        "domain": "g",
+        "time": ["0000", "0600", "1200", "1800"],
+        "stream": "enfo",
+    }
+    keys = benchmark(mars_listener.key_plan, request)
+    # the classes, times and streams of each date are merged into a single prefix
+    assert len(keys) == 30
@@ -0,0 +1,53 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import pytest
+
+from pyaviso.triggers.trigger_factory import TriggerFactory
+
+pytest.importorskip("pytest_benchmark")
+
+NOTIFICATION = {
+    "event": "dissemination",
+    "request": {
+        "destination": "SCL",
+        "target": "E1",
+        "class": "od",
+        "expver": "0001",
+        "domain": "g",
+        "date": "20210101",
+        "time": "0000",
+        "stream": "enfo",
+        "step": "12",
+    },
+    "location": "https://xxx.ecmwf.int/xxx/20210101/E1X0101000000121",
+}
+
+TRIGGERS = {
+    "echo": {"type": "echo"},
+    "log": {"type": "log", "path": "/tmp/aviso/benchmark.log"},
+    "command": {"type": "command", "command": "echo ${request.date} ${location}"},
+    "function": {"type": "function", "function": print},
+}
+
+
+@pytest.mark.parametrize("trigger_type", sorted(TRIGGERS))
+def test_create_trigger(benchmark, trigger_type):
+    factory = TriggerFactory()
+    trigger = benchmark(factory.create_trigger, NOTIFICATION, TRIGGERS[trigger_type])
+    assert trigger.notification is NOTIFICATION
+
+
+def test_replace_template(benchmark):
+    trigger = TriggerFactory().create_trigger(NOTIFICATION, TRIGGERS["command"])
+    text = (
+        "retrieve.sh --date ${request.date} --time ${request.time} --class ${request.class} "
+        "--stream ${request.stream} --step ${request.step} --event ${event} --location ${location}"
+    )
+    result = benchmark(trigger.replace_template, text)
+    assert "--step 12" in result and NOTIFICATION["location"] in result
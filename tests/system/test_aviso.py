@@ -7,6 +7,7 @@
 # nor does it submit to any jurisdiction.
 
 import contextlib
+import json
 import logging
 import os
 import time
@@ -19,6 +20,7 @@ from click.testing import CliRunner
 from pyaviso import HOME_FOLDER, NotificationManager, logger, user_config
 from pyaviso.authentication import auth
 from pyaviso.cli_aviso import _parse_inline_params, key, notify, value
+from pyaviso.custom_exceptions import InvalidInputError
 from pyaviso.engine.engine_factory import EngineType
 from pyaviso.engine.etcd_engine import LOCAL_STATE_FOLDER
 from pyaviso.engine.etcd_grpc_engine import EtcdGrpcEngine
@@ -131,7 +133,7 @@ def reset_previous_run():
     return full_path
 
 
-@pytest.mark.parametrize("config", [c1, c2])
+@pytest.mark.parametrize("config", configs)
 def test_command_listener(config):
     logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
 
@@ -222,6 +224,53 @@ def test_notify_test(config):
     assert "Done" in result.output
 
 
+@pytest.mark.parametrize("config", configs)
+def test_notify_batch(config):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    # more notifications than a single transaction can hold
+    lines = []
+    for airport in ["fco", "lhr"]:
+        for n in range(150):
+            lines.append(
+                f'{{"event": "flight", "country": "Italy", "airport": "{airport}", "date": 20210101, '
+                f'"number": "AZ{n}", "payload": "Landed"}}'
+            )
+    lines.insert(10, "")
+    runner = CliRunner()
+    result = runner.invoke(notify, ["--batch", "-"], input="\n".join(lines))
+
+    assert result.exit_code == 0
+    assert "Done" in result.output
+
+    # now test the values and the single status update of the base key
+    eng = engine(config)
+    for airport in ["FCO", "LHR"]:
+        kvs = eng.pull(f"/tmp/aviso/flight/20210101/italy/{airport}/")
+        assert len([kv for kv in kvs if kv["key"].endswith("/AZ149")]) == 1
+        assert len(kvs) >= 150
+    kvs = eng.pull("/tmp/aviso/flight/", prefix=False)
+    assert len(kvs) == 1
+    status = json.loads(kvs[0]["value"].decode())
+    assert "300 notifications to keys under /tmp/aviso/flight/" in status["message"]
+
+
+@pytest.mark.parametrize("config", configs)
+def test_notify_many_invalid(config):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    notifications = [
+        {"event": "flight", "country": "italy", "date": "20210101", "airport": "FCO", "number": "AZ1"},
+        {"event": "flight", "country": "italy", "date": "20210101", "airport": "FCO"},
+    ]
+    with pytest.raises(InvalidInputError) as e:
+        aviso.notify_many(notifications, config=config)
+    assert "Invalid notification 1" in str(e.value)
+
+    # the notifications preceding the invalid one are submitted
+    eng = engine(config)
+    kvs = eng.pull("/tmp/aviso/flight/20210101/italy/FCO/AZ1", prefix=False)
+    assert len(kvs) == 1
+
+
 @pytest.mark.parametrize("config", [c1, c2])
 def test_notify_ttl(config):
     logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
@@ -7,8 +7,11 @@
 # nor does it submit to any jurisdiction.
 
 import os
+import time
+from threading import Thread
 
 import pytest
+from flask import Flask, request
 
 from pyaviso import logger, user_config
 from pyaviso.authentication import auth, ecmwf_auth, etcd_auth, none_auth
@@ -61,3 +64,56 @@ def test_etcd_auth_fail(conf):
     except Exception:
         pass
     assert auth1.token is None
+
+
+# fake gRPC gateway of an etcd server with authentication enabled
+test_etcd_gateway = Flask("Test_Etcd_Gateway")
+gateway_state = {"token": None, "authentications": 0}
+
+
+@test_etcd_gateway.route("/v3/auth/authenticate", methods=["POST"])
+def authenticate():
+    time.sleep(0.2)  # give time to the other requests to pile up
+    gateway_state["authentications"] += 1
+    gateway_state["token"] = f"token.{gateway_state['authentications']}"
+    return {"header": {}, "token": gateway_state["token"]}
+
+
+@test_etcd_gateway.route("/v3/kv/range", methods=["POST"])
+def kv_range():
+    if request.headers.get("Authorization") != gateway_state["token"]:
+        return {"error": "etcdserver: invalid auth token", "code": 16, "message": "etcdserver: invalid auth token"}, 401
+    return {"header": {"revision": "1"}}
+
+
+@pytest.mark.parametrize("conf", [conf()])
+def test_etcd_auth_token_cache(conf):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    server = Thread(target=test_etcd_gateway.run, daemon=True, kwargs={"host": "127.0.0.1", "port": 8052})
+    server.start()
+    time.sleep(1)
+
+    conf.auth_type = "etcd"
+    conf.password = "tests"
+    conf.notification_engine.host = "127.0.0.1"
+    conf.notification_engine.port = 8052
+    auth1 = auth.Auth.get_auth(conf)
+    eng = engine_factory.EngineFactory(conf.notification_engine, auth1).create_engine()
+
+    # concurrent requests authenticate only once
+    threads = [Thread(target=eng.pull, args=("test",)) for i in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert gateway_state["authentications"] == 1
+
+    # the token is then reused
+    eng.pull("test")
+    assert gateway_state["authentications"] == 1
+
+    # and renewed only when rejected by the server
+    gateway_state["token"] = "revoked"
+    eng.pull("test")
+    assert gateway_state["authentications"] == 2
+    assert auth1.token == "token.2"
@@ -0,0 +1,104 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import asyncio
+import os
+
+from pyaviso import logger
+from pyaviso.engine.changes import (
+    ChangeTracker,
+    deliveries,
+    pages,
+    prefix_range_end,
+    range_pages,
+    range_pages_async,
+)
+
+KVS = [{"key": f"test/{i}", "value": str(i).encode(), "mod_rev": 10 + i} for i in range(5)]
+
+
+class FakeRange:
+    """
+    Range requests served from a list of key-value pairs, recording the arguments received
+    """
+
+    def __init__(self, kvs, revision=20):
+        self.kvs = kvs
+        self.revision = revision
+        self.requests = []
+
+    def __call__(self, key, range_end, rev=None, limit=None, sort_order=None, serializable=False, **filters):
+        self.requests.append({"key": key, "rev": rev, "serializable": serializable, **filters})
+        in_range = [kv for kv in self.kvs if key <= kv["key"] < range_end.decode()]
+        return in_range[:limit], len(in_range) > limit, self.revision
+
+    async def coroutine(self, **kwargs):
+        return self(**kwargs)
+
+
+def test_range_pages():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    fake = FakeRange(KVS)
+    result = list(range_pages(fake, "test/", 2, serializable=True, min_rev=11))
+    assert [[kv["key"] for kv in kvs] for kvs, _ in result] == [["test/0", "test/1"], ["test/2", "test/3"], ["test/4"]]
+    assert {rev for _, rev in result} == {20}
+    # the next pages start after the last key, at the revision of the first page and through the leader
+    assert [r["key"] for r in fake.requests] == ["test/", "test/1\0", "test/3\0"]
+    assert [r["rev"] for r in fake.requests] == [None, 20, 20]
+    assert [r["serializable"] for r in fake.requests] == [True, False, False]
+    assert all(r["min_rev"] == 11 for r in fake.requests)
+
+    # the first page is returned even if empty
+    assert list(range_pages(FakeRange([]), "test/", 2)) == [([], 20)]
+
+
+def test_range_pages_async():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    fake = FakeRange(KVS)
+
+    async def pull():
+        return [kvs async for kvs, _ in range_pages_async(fake.coroutine, "test/", 2, rev=15)]
+
+    result = asyncio.run(pull())
+    assert [len(kvs) for kvs in result] == [2, 2, 1]
+    assert [r["rev"] for r in fake.requests] == [15, 15, 15]
+
+
+def test_pages():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    assert [len(p) for p in pages(iter(KVS), 2)] == [2, 2, 1]
+    assert list(pages([], 2)) == []
+    assert prefix_range_end("test/") == b"test0"
+
+
+def test_change_tracker():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    saved = []
+    status = {"key": "test/", "value": b"{}", "mod_rev": 30}
+    tracker = ChangeTracker("test/", 5)
+    # the status of the key is not a notification
+    notifications, _ = tracker.page([KVS[3], status, KVS[1]])
+    assert notifications == [KVS[3], KVS[1]]
+    assert tracker.next_rev == 14
+    # the pages are sorted by key, the revision reached never moves back
+    tracker.page([KVS[0]])
+    assert tracker.next_rev == 14
+    assert tracker.checkpoint(lambda k, r: saved.append((k, r))) == 14
+    assert saved == [("test/", 14)]
+
+    # nothing is saved without changes
+    tracker = ChangeTracker("test/", 5)
+    tracker.page([status])
+    assert not tracker.changed
+    assert tracker.checkpoint(lambda k, r: saved.append((k, r))) == 5
+    assert len(saved) == 1
+
+
+def test_deliveries():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    assert list(deliveries(KVS[:2], {10: 1.0}, "test/")) == [("test/0", "0"), ("test/1", "1")]
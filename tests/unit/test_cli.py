@@ -290,3 +290,23 @@ def test_notify_missing_params(conf):
 
     assert result.exit_code == 2
     assert "Missing argument" in result.output
+
+
+def test_notify_params_and_batch(conf):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    runner = CliRunner()
+    result = runner.invoke(
+        notify, ["event=flight,country=Italy,airport=fco,date=20210101,number=AZ203", "--batch", "-"], input=""
+    )
+
+    assert result.exit_code == 2
+    assert "mutually exclusive" in result.output
+
+
+def test_notify_bad_batch(conf):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    runner = CliRunner()
+    result = runner.invoke(notify, ["--batch", "-", "--test"], input='{"event": "flight"\n')
+
+    assert result.exit_code == -1
+    assert "line 1" in result.output
@@ -0,0 +1,138 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import os
+import time
+
+import pytest
+
+from pyaviso import logger
+from pyaviso.engine import LoadBalancing
+from pyaviso.engine.endpoint_pool import EndpointPool, member_failed
+
+
+def names(endpoints):
+    return [str(e) for e in endpoints]
+
+
+def test_from_config():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    pool = EndpointPool.from_config("host1", 2379, ["host2:2379", "host1:2379", "host3:2380"], None, 1)
+    assert names(pool.endpoints) == ["host1:2379", "host2:2379", "host3:2380"]
+    assert pool.endpoints[2].port == 2380
+
+    pool = EndpointPool.from_config("host1", 2379, None, None, 1)
+    assert names(pool.read_order()) == ["host1:2379"]
+    assert names(pool.write_order()) == ["host1:2379"]
+
+    with pytest.raises(AssertionError):
+        EndpointPool.from_config("host1", 2379, ["host2"], None, 1)
+
+
+def test_round_robin():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    pool = EndpointPool.from_config("host1", 1, ["host2:2", "host3:3"], LoadBalancing.ROUND_ROBIN, 0.2)
+    assert names(pool.read_order()) == ["host1:1", "host2:2", "host3:3"]
+    assert names(pool.read_order()) == ["host2:2", "host3:3", "host1:1"]
+    assert names(pool.read_order()) == ["host3:3", "host1:1", "host2:2"]
+
+    # the members unreachable are tried last until their reset timeout expires
+    pool.failed(pool.endpoints[0])
+    assert names(pool.read_order()) == ["host2:2", "host3:3", "host1:1"]
+    assert names(pool.read_order()) == ["host2:2", "host3:3", "host1:1"]
+    time.sleep(0.25)
+    assert names(pool.read_order()) == ["host3:3", "host1:1", "host2:2"]
+
+
+def test_least_latency():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    pool = EndpointPool.from_config("host1", 1, ["host2:2", "host3:3"], LoadBalancing.LEAST_LATENCY, 1)
+    host1, host2, host3 = pool.endpoints
+    pool.succeeded(host1, 0.3)
+    pool.succeeded(host2, 0.1)
+    # the members never used are tried first
+    assert names(pool.read_order()) == ["host3:3", "host2:2", "host1:1"]
+    pool.succeeded(host3, 0.2)
+    assert names(pool.read_order()) == ["host2:2", "host3:3", "host1:1"]
+
+    # the latency is a moving average of the response times
+    for _ in range(5):
+        pool.succeeded(host2, 1)
+    assert names(pool.read_order()) == ["host3:3", "host1:1", "host2:2"]
+
+
+def test_write_order():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    pool = EndpointPool.from_config("host1", 1, ["host2:2", "host3:3"], None, 1)
+    host1, host2, host3 = pool.endpoints
+    assert names(pool.write_order()) == ["host1:1", "host2:2", "host3:3"]
+
+    # the writes stick to the member that accepted the last one
+    pool.failed(host1)
+    assert names(pool.write_order()) == ["host2:2", "host3:3", "host1:1"]
+    pool.succeeded(host2, 0.1, write=True)
+    assert names(pool.write_order()) == ["host2:2", "host3:3", "host1:1"]
+    # the reads do not move the writes
+    pool.succeeded(host3, 0.1)
+    assert names(pool.write_order()) == ["host2:2", "host3:3", "host1:1"]
+
+
+def test_trial_request():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    pool = EndpointPool.from_config("host1", 1, ["host2:2"], None, 0.2)
+    host1, host2 = pool.endpoints
+    pool.failed(host1)
+    assert names(pool.write_order()) == ["host2:2", "host1:1"]
+
+    # ordering the members only reads their state, the member avoided keeps its trial request once the timeout expires
+    time.sleep(0.3)
+    for _ in range(3):
+        assert names(pool.write_order()) == ["host1:1", "host2:2"]
+    metrics = host1.breaker.metrics()
+    assert metrics["state"] == "open" and metrics["rejected"] == 0 and metrics["half_open_count"] == 0
+
+    # the trial request is taken when sent, the member is then avoided until it responds
+    pool.sending(host1)
+    assert host1.breaker.metrics()["state"] == "half_open"
+    assert names(pool.write_order()) == ["host2:2", "host1:1"]
+    pool.succeeded(host1, 0.1)
+    assert names(pool.write_order()) == ["host1:1", "host2:2"]
+
+
+def test_member_failed():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    # the errors of the member count against its breaker, the errors of the request do not
+    assert member_failed(408) and member_failed(500) and member_failed(503)
+    assert not member_failed(200) and not member_failed(400) and not member_failed(404)
+
+
+def test_attempts():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    pool = EndpointPool.from_config("host1", 1, ["host2:2"], None, 1)
+    host1, host2 = pool.endpoints
+    attempts = pool.attempts(read=False)
+
+    # a write not reaching the member moves to the next one, otherwise it may have been executed
+    endpoint, next_endpoint = next(attempts)
+    assert endpoint is host1 and next_endpoint is host2
+    assert not pool.unreachable(endpoint, next_endpoint, False, "timeout")
+    assert pool.unreachable(endpoint, next_endpoint, True, "refused")
+    assert not host1.available()
+
+    # the last member returns its response, even if failing
+    endpoint, next_endpoint = next(attempts)
+    assert endpoint is host2 and next_endpoint is None
+    assert not pool.responded(endpoint, next_endpoint, 503, 0.1, read=False)
+    assert not host2.available() and host2.latency is None
+
+    # a read moves to the next member if one is failing
+    pool = EndpointPool.from_config("host1", 1, ["host2:2"], None, 1)
+    endpoint, next_endpoint = next(pool.attempts(read=True))
+    assert pool.responded(endpoint, next_endpoint, 500, 0.1, read=True)
+    assert not pool.responded(next_endpoint, None, 404, 0.1, read=True)
+    assert next_endpoint.latency == 0.1
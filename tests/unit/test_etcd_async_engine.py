@@ -0,0 +1,151 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import asyncio
+import datetime
+import os
+from shutil import rmtree
+
+import pytest
+
+from pyaviso import HOME_FOLDER, NotificationManager, logger, user_config
+from pyaviso.authentication import auth
+from pyaviso.engine.engine_factory import EngineFactory
+from pyaviso.engine.etcd_engine import LOCAL_STATE_FOLDER, STATUS_CACHE_FOLDER
+
+pytest.importorskip("aiohttp")
+
+
+def conf(watch: bool = False) -> user_config.UserConfig:  # this automatically configure the logging
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.watch = watch
+    return c
+
+
+def async_engine(watch: bool = False):
+    c = conf(watch)
+    return EngineFactory(c.notification_engine, auth.Auth.get_auth(c)).create_async_engine()
+
+
+@pytest.fixture(autouse=True)
+def pre_post_test():
+    # delete the revision state and the status cache
+    full_home_path = os.path.expanduser(HOME_FOLDER)
+    for folder in [LOCAL_STATE_FOLDER, STATUS_CACHE_FOLDER]:
+        full_path = os.path.join(full_home_path, folder)
+        if os.path.exists(full_path):
+            rmtree(full_path, ignore_errors=True)
+    yield
+
+    # delete all the keys at the end of the test
+    async def clean():
+        engine = async_engine()
+        await engine.delete("test")
+        await engine.close()
+
+    asyncio.run(clean())
+
+
+def test_push_pull_delete():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+
+    async def run():
+        engine = async_engine()
+        try:
+            kvs = [{"key": "test/1", "value": "1"}, {"key": "test/2", "value": "2"}]
+            assert await engine.push(kvs, ttl=10)
+            kvs = await engine.pull("test/")
+            assert [kv["key"] for kv in kvs] == ["test/2", "test/1"]
+            assert kvs[1]["value"] == b"1"
+            # paged pull in key order
+            engine._page_size = 1
+            assert [kv["key"] async for kv in engine.pull_iter("test/")] == ["test/1", "test/2"]
+            deleted = await engine.delete("test/")
+            assert len(deleted) == 2
+            assert await engine.pull("test/") == []
+        finally:
+            await engine.close()
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("watch", [False, True])
+def test_listen(watch):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+
+    async def run():
+        engine = async_engine(watch)
+        received = []
+
+        async def callback(key, value):
+            await asyncio.sleep(0)
+            received.append((key, value))
+
+        try:
+            # many keys are listened on the same event loop
+            keys = [f"test/{i}/" for i in range(50)]
+            assert await engine.listen(keys, callback)
+            await asyncio.sleep(0.5)
+
+            assert await engine.push([{"key": "test/3/a", "value": "1"}, {"key": "test/42/b", "value": "2"}])
+            await asyncio.sleep(2)
+            assert sorted(received) == [("test/3/a", "1"), ("test/42/b", "2")]
+
+            # stop listening
+            assert await engine.stop(callback)
+            assert await engine.push([{"key": "test/3/a", "value": "3"}])
+            await asyncio.sleep(1.5)
+            assert len(received) == 2
+        finally:
+            await engine.close()
+
+    asyncio.run(run())
+
+
+def test_listen_async_replay():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    c = conf()
+    aviso = NotificationManager()
+    notifications = []
+
+    async def trigger_function(notification):
+        notifications.append(notification["payload"])
+
+    async def run():
+        from_date = datetime.datetime.utcnow()
+        for n in range(3):
+            notification = {
+                "event": "flight",
+                "country": "italy",
+                "date": "20210101",
+                "airport": "FCO",
+                "number": f"AZ{n}",
+                "payload": f"Landed {n}",
+            }
+            assert await aviso.notify_async(notification, config=c)
+        await asyncio.sleep(0.1)
+        to_date = datetime.datetime.utcnow()
+
+        listener = {
+            "event": "flight",
+            "request": {"country": "italy"},
+            "triggers": [{"type": "function", "function": trigger_function}],
+        }
+        # the replay terminates once the notifications in the time window have been retrieved
+        await asyncio.wait_for(
+            aviso.listen_async(config=c, listeners={"listeners": [listener]}, from_date=from_date, to_date=to_date),
+            timeout=30,
+        )
+
+        # clean the notifications
+        engine = async_engine()
+        await engine.delete("/tmp/aviso/flight/")
+        await engine.close()
+
+    asyncio.run(run())
+    assert sorted(notifications) == ["Landed 0", "Landed 1", "Landed 2"]
@@ -14,15 +14,17 @@ import os
 import subprocess
 import time
 from shutil import rmtree
-from threading import Thread
+from threading import Thread, active_count
 
 import pytest
 
 from pyaviso import HOME_FOLDER, logger, user_config
 from pyaviso.authentication import auth
-from pyaviso.engine.etcd_engine import LOCAL_STATE_FOLDER
+from pyaviso.engine.checkpoint_store import CheckpointStore
+from pyaviso.engine.etcd_engine import LOCAL_STATE_FOLDER, STATUS_CACHE_FOLDER
 from pyaviso.engine.etcd_grpc_engine import EtcdGrpcEngine
 from pyaviso.engine.etcd_rest_engine import EtcdRestEngine
+from pyaviso.engine.retry_policy import CircuitState
 
 
 def rest_engine():  # this automatically configure the logging
@@ -39,8 +41,38 @@ def grpc_engine():  # this automatically configure the logging
     return engine
 
 
+def rest_watch_engine():  # this automatically configure the logging
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.watch = True
+    authenticator = auth.Auth.get_auth(c)
+    engine = EtcdRestEngine(c.notification_engine, authenticator)
+    return engine
+
+
+def grpc_watch_engine():  # this automatically configure the logging
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.watch = True
+    authenticator = auth.Auth.get_auth(c)
+    engine = EtcdGrpcEngine(c.notification_engine, authenticator)
+    return engine
+
+
+def engine_config(engine):
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.type = engine.engine_type
+    return c.notification_engine
+
+
+def paged_engines():  # this automatically configure the logging
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.page_size = 2
+    authenticator = auth.Auth.get_auth(c)
+    return [EtcdRestEngine(c.notification_engine, authenticator), EtcdGrpcEngine(c.notification_engine, authenticator)]
+
+
 # setting up multiple engines to test
 engines = [rest_engine(), grpc_engine()]
+watch_engines = [rest_watch_engine(), grpc_watch_engine()]
 
 
 @pytest.mark.parametrize("engine", engines)
@@ -54,6 +86,13 @@ def pre_post_test(engine):
             rmtree(full_state_path)
         except Exception:
             pass
+    # delete the status cache
+    full_cache_path = os.path.join(full_home_path, STATUS_CACHE_FOLDER)
+    if os.path.exists(full_cache_path):
+        try:
+            rmtree(full_cache_path)
+        except Exception:
+            pass
     yield
     # delete all the keys at the end of the test
     try:
@@ -69,6 +108,21 @@ def test_authenticate(engine):
     assert engine._authenticate()
 
 
+@pytest.mark.parametrize("engine", [rest_engine()])
+def test_connection_reuse(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    kvs = [{"key": "test1", "value": "1"}]
+    assert engine.push(kvs)
+    for i in range(5):
+        assert len(engine.pull("test")) == 1
+        engine._latest_revision("test")
+
+    # all the requests went through the same connection
+    pools = engine._session.get_adapter(engine._base_url).poolmanager.pools
+    assert len(pools) == 1
+    assert pools[list(pools.keys())[0]].num_connections == 1
+
+
 @pytest.mark.parametrize("engine", [grpc_engine()])
 def test_locks(engine):
     # acquire lock
@@ -130,6 +184,79 @@ def test_pull(engine):
     assert len(resp) == 0
 
 
+@pytest.mark.parametrize("engine", paged_engines())
+def test_pull_iter(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    kvs = [{"key": f"test{i}", "value": str(i)} for i in range(5)]
+    assert engine.push(kvs)
+    rev = engine._latest_revision("test")
+    kvs = [{"key": "test2", "value": "new"}]
+    assert engine.push(kvs)
+
+    # all the pages are retrieved, sorted by key and at the revision of the first page
+    kvs = engine.pull_iter("test")
+    assert next(kvs)["key"] == "test0"
+    assert engine.push([{"key": "test5", "value": "5"}])
+    assert [kv["key"] for kv in kvs] == ["test1", "test2", "test3", "test4"]
+
+    # filters are applied to all the pages
+    assert [kv["value"] for kv in engine.pull_iter("test", min_rev=rev + 1)] == [b"new", b"5"]
+    assert len(list(engine.pull_iter("test", rev=rev))) == 5
+
+    # the pages tell the revision they are read at, even if empty
+    assert {r for _, r in engine.pull_pages("test", rev=rev)} == {rev}
+    assert list(engine.pull_pages("test/")) == [([], engine._latest_revision("test"))]
+
+
+@pytest.mark.parametrize("engine", paged_engines())
+def test_pull_iter_serializable(engine, monkeypatch):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    kvs = [{"key": f"test{i}", "value": str(i)} for i in range(5)]
+    assert engine.push(kvs)
+
+    requests = []
+    _range = engine._range
+
+    def spy_range(*args, **kwargs):
+        requests.append(kwargs.get("serializable"))
+        return _range(*args, **kwargs)
+
+    monkeypatch.setattr(engine, "_range", spy_range)
+    # only the first page is serializable, the next ones are pinned to its revision and read through the leader
+    assert [kv["key"] for kv in engine.pull_iter("test", serializable=True)] == [f"test{i}" for i in range(5)]
+    assert requests == [True, False, False]
+    requests.clear()
+    assert len(list(engine.pull_iter("test"))) == 5
+    assert requests == [False, False, False]
+
+
+@pytest.mark.parametrize("engine", paged_engines())
+def test_listen_paged(engine, monkeypatch):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append(key)
+
+    saved = []
+    _save_last_revision = engine._save_last_revision
+
+    def spy_save_last_revision(key, rev):
+        saved.append(rev)
+        return _save_last_revision(key, rev)
+
+    monkeypatch.setattr(engine, "_save_last_revision", spy_save_last_revision)
+    assert engine.listen(["test"], callback)
+    time.sleep(0.5)
+    kvs = [{"key": f"test{i}", "value": str(i)} for i in range(5)]
+    assert engine.push(kvs)
+    time.sleep(1.5)
+    assert callback_list == ["test0", "test1", "test2", "test3", "test4"]
+    # the revision is saved once all the pages have been processed
+    assert saved == [engine._latest_revision("test") + 1]
+    engine.stop()
+
+
 @pytest.mark.parametrize("engine", engines)
 def test_push_delete(engine):
     logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
@@ -228,6 +355,142 @@ def test_listen(engine):
     assert len(callback_list) == 2
 
 
+@pytest.mark.parametrize("engine", engines)
+def test_listen_many_keys(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append(key)
+
+    # listen to many keys, they are all polled by the same thread
+    engine._checkpoints.flush()  # no pending checkpoint writing
+    threads = active_count()
+    keys = [f"test/{i}/" for i in range(50)]
+    assert engine.listen(keys, callback)
+    assert engine.listen(["test/0/x/"], callback)
+    assert active_count() <= threads + 1
+    time.sleep(0.5)
+
+    # each notification is routed only to the keys it belongs to
+    kvs = [{"key": "test/0/x/1", "value": "1"}, {"key": "test/49/b", "value": "2"}]
+    assert engine.push(kvs)
+    time.sleep(1.5)
+    assert sorted(callback_list) == ["test/0/x/1", "test/0/x/1", "test/49/b"]
+    # the keys without changes move forward too, so the changes of the other keys are not pulled again
+    latest_rev = engine._latest_revision("test")
+    assert all(s.next_rev == latest_rev + 1 for s in engine._scheduler._subscriptions)
+
+    # stop one key, the others are still polled
+    assert engine.stop("test/0/")
+    kvs = [{"key": "test/0/x/1", "value": "3"}, {"key": "test/1/c", "value": "4"}]
+    assert engine.push(kvs)
+    time.sleep(1.5)
+    assert sorted(callback_list) == ["test/0/x/1", "test/0/x/1", "test/0/x/1", "test/1/c", "test/49/b"]
+
+    # stopping all the keys stops the polling thread
+    assert engine.stop()
+    time.sleep(1.5)
+    assert active_count() == threads
+
+
+@pytest.mark.parametrize("engine", watch_engines)
+def test_listen_watch(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append(1)
+
+    # watch a test key
+    assert engine.listen(["test"], callback)
+    time.sleep(0.5)
+
+    # create independent change to the test key to trigger the notification
+    kvs = [{"key": "test1", "value": "1"}]
+    assert engine.push(kvs)
+    # the notification is pushed by the server, no need to wait a polling interval
+    time.sleep(0.2)
+    assert len(callback_list) == 1
+
+    # deleting the key is not a notification
+    engine.delete("test1")
+    time.sleep(0.2)
+    assert len(callback_list) == 1
+
+    # stop watching
+    resp = engine.stop()
+    assert resp
+
+    # repeat the push operation
+    kvs = [{"key": "test1", "value": "2"}]
+    assert engine.push(kvs)
+
+    # wait a fraction and check the function has NOT been triggered
+    time.sleep(0.5)
+    assert len(callback_list) == 1
+
+
+@pytest.mark.parametrize("engine", watch_engines)
+def test_watch_compacted_revision(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    changes_list = []
+
+    def process_changes(kvs, next_rev):
+        changes_list.extend(kvs)
+        return max([next_rev] + [kv["mod_rev"] + 1 for kv in kvs])
+
+    kvs = [{"key": "test1", "value": "1"}]
+    assert engine.push(kvs)
+    start_revision = engine._latest_revision("test")
+    kvs = [{"key": "test2", "value": "2"}]
+    assert engine.push(kvs)
+
+    # compact the history so the start revision is no longer accessible
+    import etcd3
+
+    etcd = etcd3.client(host=engine.host, port=engine.port)
+    etcd.compact(engine._latest_revision("test"))
+
+    # watch from the compacted revision, the keys changed are retrieved anyway
+    engine._add_listener("test")
+    t = Thread(target=engine._watching, daemon=True, args=("test", start_revision, process_changes))
+    t.start()
+    time.sleep(0.5)
+    assert len(changes_list) == 2
+
+    # the watch is then resumed from the latest revision
+    kvs = [{"key": "test3", "value": "3"}]
+    assert engine.push(kvs)
+    time.sleep(0.2)
+    assert len(changes_list) == 3
+    engine.stop()
+
+
+@pytest.mark.parametrize("engine", [rest_watch_engine()])
+def test_watch_resume(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append(key)
+
+    assert engine.listen(["test"], callback)
+    time.sleep(0.5)
+    kvs = [{"key": "test1", "value": "1"}]
+    assert engine.push(kvs)
+    time.sleep(0.2)
+    assert callback_list == ["test1"]
+
+    # drop the stream as if the connection was lost, the watch is resumed from the last revision notified
+    engine._cancel_watches("test")
+    kvs = [{"key": "test2", "value": "2"}]
+    assert engine.push(kvs)
+    time.sleep(engine.automatic_retry_delay + 0.5)
+    assert callback_list == ["test1", "test2"]
+    engine.stop()
+
+
 @pytest.mark.parametrize("engine", engines)
 def test_listen_old_state(engine):
     logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
@@ -306,7 +569,7 @@ def test_find_revisions(engine):
     assert engine.push_with_status(kvs, base_key="test2/", message="test2/test2")
     assert engine.push(kvs)
 
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=from_date, to_date=to_date)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=from_date, to_date=to_date)
     assert from_rev_found == first_revision
     assert to_rev_found == second_revision
 
@@ -317,7 +580,7 @@ def test_find_revisions_limits_from(engine):
     time.sleep(0.1)
 
     # search for revisions when no point is present
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time1)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time1)
     assert from_rev_found is None
 
     kvs = [{"key": "test/test", "value": "0"}]
@@ -325,7 +588,7 @@ def test_find_revisions_limits_from(engine):
     revision = engine._latest_revision("test/")
 
     # search for revisions with one point after from
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time1)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time1)
     assert from_rev_found == revision
     assert len(engine.pull("test/", min_rev=from_rev_found, max_rev=to_rev_found)) == 2
 
@@ -334,7 +597,7 @@ def test_find_revisions_limits_from(engine):
     time.sleep(0.1)
 
     # search for revisions with one point before from
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time2)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time2)
     assert from_rev_found == revision + 1
     assert len(engine.pull("test/", min_rev=from_rev_found, max_rev=to_rev_found)) == 0
 
@@ -343,7 +606,7 @@ def test_find_revisions_limits_from(engine):
     revision = engine._latest_revision("test/")
 
     # search for revisions with from between points
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time2)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time2)
     assert from_rev_found == revision
     assert len(engine.pull("test/", min_rev=from_rev_found, max_rev=to_rev_found)) == 2
 
@@ -354,7 +617,7 @@ def test_find_revisions_limits_from_to(engine):
     time.sleep(0.1)
 
     # search for revisions when no point is present
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time1, to_date=time1)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time1, to_date=time1)
     assert from_rev_found is None
     assert to_rev_found is None
 
@@ -363,7 +626,7 @@ def test_find_revisions_limits_from_to(engine):
     revision = engine._latest_revision("test/")
 
     # search for revisions with one point after the interval
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time1, to_date=time1)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time1, to_date=time1)
     assert from_rev_found == revision - 1
     assert to_rev_found == revision - 1
     assert len(engine.pull("test/", min_rev=from_rev_found, max_rev=to_rev_found)) == 0
@@ -373,13 +636,13 @@ def test_find_revisions_limits_from_to(engine):
     time.sleep(0.1)
 
     # search for revisions with one point before the interval
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time2, to_date=time2)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time2, to_date=time2)
     assert from_rev_found == revision + 1
     assert to_rev_found == revision + 1
     assert len(engine.pull("test/", min_rev=from_rev_found, max_rev=to_rev_found)) == 0
 
     # search for revisions with one point in the interval
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time1, to_date=time2)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time1, to_date=time2)
     assert from_rev_found == revision
     assert to_rev_found == revision
     assert len(engine.pull("test/", min_rev=from_rev_found, max_rev=to_rev_found)) == 2  # one is the status
@@ -389,12 +652,68 @@ def test_find_revisions_limits_from_to(engine):
     revision = engine._latest_revision("test/")
 
     # search for revisions with the interval between points
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time2, to_date=time2)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time2, to_date=time2)
     assert from_rev_found == revision
     assert to_rev_found == revision - 1
     assert len(engine.pull("test/", min_rev=from_rev_found, max_rev=to_rev_found)) == 0
 
 
+@pytest.mark.parametrize("engine", engines)
+def test_find_revisions_long_history(engine):
+    dates = []
+    revisions = []
+    for i in range(64):
+        dates.append(datetime.datetime.utcnow())
+        kvs = [{"key": f"test/test{i}", "value": "0"}]
+        assert engine.push_with_status(kvs, base_key="test/", message=f"test/test{i}")
+        revisions.append(engine._latest_revision("test/"))
+
+    # count the status requested during the search
+    requests = []
+    retrieve_status = engine._retrieve_status
+
+    def counted_retrieve_status(key, rev=None):
+        requests.append(rev)
+        return retrieve_status(key, rev)
+
+    engine._retrieve_status = counted_retrieve_status
+    try:
+        for i in [1, 10, 33, 60]:
+            requests.clear()
+            from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=dates[i], to_date=dates[i + 2])
+            assert from_rev_found == revisions[i]
+            assert to_rev_found == revisions[i + 1]
+            # the search follows the skip revisions instead of each previous status
+            assert len(requests) <= 16
+    finally:
+        engine._retrieve_status = retrieve_status
+
+
+@pytest.mark.parametrize("engine", engines)
+def test_find_revisions_cached(engine):
+    dates = []
+    revisions = []
+    for i in range(10):
+        dates.append(datetime.datetime.utcnow())
+        kvs = [{"key": f"test/test{i}", "value": "0"}]
+        assert engine.push_with_status(kvs, base_key="test/", message=f"test/test{i}")
+        revisions.append(engine._latest_revision("test/"))
+    assert engine.from_to_revisions("test/", from_date=dates[1], to_date=dates[3]) == (revisions[1], revisions[2])
+
+    # a new engine finds the same window without requesting any past status to the server
+    new_engine = engine.__class__(engine_config(engine), engine.auth)
+    pulled_revs = []
+    pull = new_engine.pull
+
+    def counted_pull(key, **kwargs):
+        pulled_revs.append(kwargs.get("rev"))
+        return pull(key, **kwargs)
+
+    new_engine.pull = counted_pull
+    assert new_engine.from_to_revisions("test/", from_date=dates[1], to_date=dates[3]) == (revisions[1], revisions[2])
+    assert pulled_revs == [None]  # only the current status
+
+
 @pytest.mark.parametrize("engine", engines)
 def test_find_compacted_revision(engine):
     time0 = datetime.datetime.utcnow()
@@ -421,10 +740,12 @@ def test_find_compacted_revision(engine):
     time.sleep(0.1)
 
     # search for revisions with one point after the interval
-    from_rev_found, to_rev_found = engine._from_to_revisions("test/", from_date=time0, to_date=time2)
+    from_rev_found, to_rev_found = engine.from_to_revisions("test/", from_date=time0, to_date=time2)
     assert from_rev_found == revision1
     assert to_rev_found == revision1
     assert len(engine.pull("test/", min_rev=from_rev_found, max_rev=to_rev_found)) == 2
+    # the statuses compacted are not kept in cache
+    assert all([int(rev) >= revision1 for rev in engine._status_caches["test/"]])
 
 
 @pytest.mark.parametrize("engine", engines)
@@ -475,18 +796,48 @@ def test_status_as_linked_list(engine):
     assert status4.get("prev_rev") == "103"
     assert status4.get("last_prev_day_rev") == "102"
 
+    # the skip revisions point to the last status with sequence number multiple of 2^level
+    assert status1["seq"] == 1
+    assert status1["skip_revs"] == [["100", status0["date_time"]]]
+    assert status2["skip_revs"] == [["101", status1["date_time"]]]
+    assert status3["skip_revs"] == [["102", status2["date_time"]], ["102", status2["date_time"]]]
+    assert status4["seq"] == 4
+    assert status4["skip_revs"] == [["103", status3["date_time"]], ["102", status2["date_time"]]]
+    kv4 = {"mod_rev": "104", "value": json.dumps(status4).encode()}
+
+    status5 = {"date_time": "2020-08-29T16:58:17.829Z"}
+    engine._status_as_linked_list(status5, [kv4])
+    assert status5["skip_revs"] == [["104", status4["date_time"]]] * 3
+
 
 @pytest.mark.parametrize("engine", engines)
 def test_save_delete_state(engine):
     logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
     # first save state revision
     last_rev = 10
-    assert engine._save_last_revision(last_rev)
-    assert engine._last_saved_revision() == last_rev
+    assert engine._save_last_revision("test/1", last_rev)
+    assert engine._save_last_revision("test/2", last_rev + 5)
+    assert engine._last_saved_revision("test/1") == last_rev
+
+    # the checkpoints of all the keys are written together
+    assert engine._checkpoints.flush()
+    with open(engine._checkpoints.path) as f:
+        checkpoints = json.load(f)
+    assert checkpoints["test/1"]["last_revision"] == last_rev
+    assert checkpoints["test/2"]["last_revision"] == last_rev + 5
+
+    # a process behind does not move back the revision saved
+    other = CheckpointStore(os.path.dirname(engine._checkpoints.path), f"{engine.host}_{engine.port}")
+    other.update("test/2", last_rev)
+    assert other.flush()
+    assert engine._last_saved_revision("test/2") == last_rev + 5
 
     # delete it
-    engine._delete_saved_revision()
-    assert engine._last_saved_revision() == -1
+    engine._delete_saved_revision("test/1")
+    assert engine._last_saved_revision("test/1") == -1
+    assert engine._checkpoints.flush()
+    assert engine._last_saved_revision("test/1") == -1
+    assert engine._last_saved_revision("test/2") == last_rev + 5
 
 
 @contextlib.contextmanager
@@ -507,16 +858,64 @@ def test_automatic_retry(engine, caplog):
     subprocess.Popen(
         f"nc -l {10001}", shell=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
     )
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.host = "127.0.0.1"
+    c.notification_engine.port = 10001
     # set timeout to 1s
-    engine.timeout = 1
-    engine._base_url = "http://127.0.0.1:10001/v3/"
+    c.notification_engine.timeout = 1
+    unreachable_engine = engine.__class__(c.notification_engine, auth.Auth.get_auth(c))
 
-    # run a basic pull as background thread and check the log
-    server = Thread(target=engine.pull, daemon=True, kwargs={"key": "test1"})
-    server.start()
-    time.sleep(2)
+    with caplog_for_logger(caplog):  # the configuration above resets the logging
+        # run a basic pull as background thread and check the log
+        server = Thread(target=unreachable_engine.pull, daemon=True, kwargs={"key": "test1"})
+        server.start()
+        time.sleep(2)
 
     for record in caplog.records:
         assert record.levelname != "ERROR"
     # check that it's trying again in the system log
     assert "Unable to connect to http://127.0.0.1:10001/v3/kv/range, trying again in" in caplog.text
+
+
+@pytest.mark.parametrize("engine", engines)
+def test_endpoints_failover(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    server = f"{c.notification_engine.host}:{c.notification_engine.port}"
+    # the first member is not reachable
+    c.notification_engine.host = "127.0.0.1"
+    c.notification_engine.port = 1
+    c.notification_engine.endpoints = [server]
+    c.notification_engine.timeout = 1
+    cluster_engine = engine.__class__(c.notification_engine, auth.Auth.get_auth(c))
+    first, second = cluster_engine._endpoints.endpoints
+
+    # the reads move to the next member
+    assert cluster_engine.pull("test/failover") == []
+    assert not first.available()
+    assert second.latency is not None
+
+    # the writes are sent to the members available
+    assert cluster_engine.push([{"key": "test/failover/1", "value": "1"}])
+    assert len(cluster_engine.pull("test/failover")) == 1
+    assert cluster_engine.circuit_breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.parametrize("engine", engines)
+def test_write_failover_not_sent(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    server = f"{c.notification_engine.host}:{c.notification_engine.port}"
+    # the first member refuses the connection
+    c.notification_engine.host = "127.0.0.1"
+    c.notification_engine.port = 1
+    c.notification_engine.endpoints = [server]
+    c.notification_engine.timeout = 1
+    cluster_engine = engine.__class__(c.notification_engine, auth.Auth.get_auth(c))
+    first, second = cluster_engine._endpoints.endpoints
+    assert cluster_engine._endpoints.write_order()[0] is first
+
+    # the write has not reached the first member, so it moves to the next one
+    assert cluster_engine.push([{"key": "test/failover/1", "value": "1"}])
+    assert not first.available()
+    assert len(cluster_engine.pull("test/failover")) == 1
@@ -0,0 +1,73 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import base64
+import json
+import os
+import time
+
+import pytest
+
+from pyaviso import logger, user_config
+from pyaviso.authentication.etcd_auth import EtcdAuth
+from pyaviso.custom_exceptions import EngineHistoryNotAvailableError
+from pyaviso.engine.etcd_gateway import (
+    GatewayToken,
+    decode_buffer,
+    encode,
+    parse_kv,
+    watch_kvs,
+)
+
+
+def test_parse_kv():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    raw_kv = {
+        "key": encode("test/1"),
+        "value": encode("1"),
+        "version": "1",
+        "create_revision": "5",
+        "mod_revision": "7",
+    }
+    assert parse_kv(raw_kv) == {"key": "test/1", "value": b"1", "version": 1, "create_rev": 5, "mod_rev": 7}
+    assert "value" not in parse_kv(raw_kv, key_only=True)
+    # the puts are read from the watch responses, the compaction is reported
+    assert watch_kvs("test/", {"result": {"events": [{"kv": raw_kv}, {"type": "DELETE", "kv": raw_kv}]}}) == [
+        parse_kv(raw_kv)
+    ]
+    with pytest.raises(EngineHistoryNotAvailableError):
+        watch_kvs("test/", {"result": {"compact_revision": "3"}})
+
+
+def test_decode_buffer():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    objs, buffer = decode_buffer('{"a": 1}{"b": 2}\n{"c":')
+    assert objs == [{"a": 1}, {"b": 2}]
+    assert buffer == '{"c":'
+
+
+def test_gateway_token():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.password = "tests"
+    auth = EtcdAuth(c)
+    token = GatewayToken(auth)
+    assert not token.valid()
+    # the simple tokens are valid until rejected
+    token.update("simple")
+    assert auth.token == "simple"
+    assert token.valid() and not token.valid(invalid_token="simple")
+    # the JWT tokens expire
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": time.time() - 1}).encode()).decode().rstrip("=")
+    token.update(f"header.{payload}.signature")
+    assert not token.valid()
+
+    # the tokens are shared by authentication and server
+    assert GatewayToken.get(auth, "server:1") is GatewayToken.get(auth, "server:1")
+    assert GatewayToken.get(auth, "server:1") is not GatewayToken.get(auth, "server:2")
+    assert GatewayToken.get(auth, "server:1") is not GatewayToken.get(EtcdAuth(c), "server:1")
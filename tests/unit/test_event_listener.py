@@ -0,0 +1,95 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import datetime
+import os
+
+import pytest
+
+from pyaviso import logger, user_config
+from pyaviso.authentication import auth
+from pyaviso.custom_exceptions import EventListenerException
+from pyaviso.engine import EngineType
+from pyaviso.engine.engine_factory import EngineFactory
+from pyaviso.event_listeners.event_listener import EventListener
+
+SCHEMA = {
+    "endpoint": [
+        {"engine": ["in_memory"], "base": "/test/{destination}", "stem": "date={date},step={step}"},
+        {"engine": ["etcd_rest"], "base": "/other/{destination}", "stem": "{date}/{step}"},
+    ],
+    "request": {
+        "destination": [{"type": "StringHandler", "canonic": "upper", "required": True}],
+        "date": [{"type": "DateHandler", "canonic": "%Y%m%d"}],
+        "step": [{"type": "IntHandler"}],
+        "time": [{"type": "EnumHandler", "values": [0, 12]}],
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def engine():
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.type = EngineType.IN_MEMORY
+    return EngineFactory(c.notification_engine, auth.Auth.get_auth(c)).create_engine()
+
+
+def listener(engine, request):
+    return EventListener("test", engine, request, [{"type": "echo"}], SCHEMA)
+
+
+def test_parse_key(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    listener_a = listener(engine, {"destination": "a"})
+    # the key format is the one of the engine
+    assert listener_a.parse_key("/test/A/date=20210101,step=12") == {
+        "destination": "A",
+        "date": "20210101",
+        "step": "12",
+    }
+    with pytest.raises(EventListenerException):
+        listener_a.parse_key("/other/A/20210101/12")
+
+
+def test_filter(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    listener_a = listener(engine, {"destination": "A", "date": "20210101", "step": [1, 2]})
+    assert listener_a.keys == ["/test/A/"]
+    assert listener_a._notification("/test/A/date=20210101,step=1", "value") == {
+        "event": "test",
+        "request": {"destination": "A", "date": "20210101", "step": "1"},
+        "payload": "value",
+    }
+    assert listener_a._notification("/test/A/date=20210101,step=3", "value") is None
+    # the notification of a request is built without filtering it, as done by the ListenerDispatcher
+    assert listener_a.build_notification({"destination": "A"}, "None") == {
+        "event": "test",
+        "request": {"destination": "A"},
+    }
+    assert listener_a._notification("/test/A/date=20210102,step=1", "value") is None
+
+
+def test_merged_keys(engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    schema = {
+        "endpoint": [{"engine": ["in_memory"], "base": "/test/{destination}/{date}", "stem": "{step}"}],
+        "request": SCHEMA["request"],
+    }
+    dates = [f"202101{d:02d}" for d in range(1, 31)]
+    request = {"destination": [f"D{i}" for i in range(10)], "date": dates, "step": 1}
+    listener_a = EventListener("test", engine, request, [{"type": "echo"}], schema)
+    # the 300 base keys are merged by date prefix, never across destinations
+    assert listener_a.keys == [f"/test/D{i}/202101" for i in range(10)]
+    # the notifications under the keys listened that are not requested are discarded, as the statuses
+    assert listener_a._notification("/test/D0/20210101/1", "value") is not None
+    assert listener_a._notification("/test/D0/20210109/2", "value") is None
+    assert listener_a._notification("/test/D0/20210109/", "status") is None
+    assert listener_a.is_status("/test/D0/20210109/")
+    # the past notifications are retrieved with the status of each base key
+    listener_b = EventListener("test", engine, request, [], schema, from_date=datetime.datetime.now())
+    assert len(listener_b.keys) == 300
@@ -6,7 +6,9 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import datetime
 import os
+import threading
 import time
 from shutil import rmtree
 
@@ -14,18 +16,26 @@ import pytest
 
 from pyaviso import HOME_FOLDER, logger, user_config
 from pyaviso.authentication import auth
+from pyaviso.custom_exceptions import EngineHistoryNotAvailableError
 from pyaviso.engine.etcd_engine import LOCAL_STATE_FOLDER
 from pyaviso.engine.file_based_engine import FileBasedEngine
+from pyaviso.engine.journal import Journal
 
+TEST_JOURNAL = "/tmp/aviso/test_journal"
 
-@pytest.fixture()
-def test_engine():  # this automatically configure the logging
+
+def file_based_engine():  # this automatically configure the logging
     c = user_config.UserConfig(conf_path="tests/config.yaml")
     authenticator = auth.Auth.get_auth(c)
-    engine = FileBasedEngine(c.notification_engine, authenticator)
+    engine = FileBasedEngine(c.notification_engine, authenticator, journal_path=TEST_JOURNAL)
     return engine
 
 
+@pytest.fixture()
+def test_engine():
+    return file_based_engine()
+
+
 @pytest.fixture(autouse=True)
 def pre_post_test(test_engine):
     # delete the revision state
@@ -37,9 +47,10 @@ def pre_post_test(test_engine):
         except Exception:
             pass
     yield
-    # delete all the keys at the end of the test
-    test_engine.delete("/tmp/aviso/test")
+    # delete the journal at the end of the test
     test_engine.stop()
+    test_engine.journal.close()
+    os.remove(TEST_JOURNAL)
 
 
 def test_push_pull_delete(test_engine):
@@ -104,3 +115,167 @@ def test_listen(test_engine):
     # wait a fraction and check the function has NOT been triggered
     time.sleep(1)
     assert len(callback_list) == 2
+
+
+def test_revisions(test_engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    assert test_engine.push([{"key": "/tmp/aviso/test/test1", "value": "1"}])
+    rev1 = test_engine._latest_revision("/tmp/aviso/test")
+    assert test_engine.push(
+        [{"key": "/tmp/aviso/test/test2", "value": "2"}, {"key": "/tmp/aviso/test/test1", "value": "3"}]
+    )
+    rev2 = test_engine._latest_revision("/tmp/aviso/test")
+    assert rev2 == rev1 + 1
+
+    kvs = test_engine.pull("/tmp/aviso/test/test1", prefix=False)
+    assert kvs[0]["value"] == b"3" and kvs[0]["version"] == 2 and kvs[0]["mod_rev"] == rev2
+    assert test_engine.pull("/tmp/aviso/test/", rev=rev1)[0]["value"] == b"1"
+    assert len(test_engine.pull("/tmp/aviso/test/", min_rev=rev2)) == 2
+    assert len(test_engine.pull("/tmp/aviso/test/", max_rev=rev1)) == 0
+
+    # another engine, as in another process, reads the same journal
+    other = file_based_engine()
+    assert other._latest_revision("/tmp/aviso/test") == rev2
+    assert other.push([{"key": "/tmp/aviso/test/test3", "value": "4"}])
+    assert len(test_engine.pull("/tmp/aviso/test/", min_rev=rev2 + 1)) == 1
+    other.journal.close()
+
+
+def test_incomplete_record(test_engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    assert test_engine.push([{"key": "/tmp/aviso/test/test1", "value": "1"}])
+    rev = test_engine._latest_revision("/tmp/aviso/test")
+    # simulate a writer failing in the middle of a record
+    record = Journal._record(rev + 1, [("/tmp/aviso/test/test2", b"2")], [])
+    with open(TEST_JOURNAL, "ab") as f:
+        f.write(record[:-1])
+    assert test_engine._latest_revision("/tmp/aviso/test") == rev
+
+    # the next writer discards it
+    assert test_engine.push([{"key": "/tmp/aviso/test/test3", "value": "3"}])
+    assert [kv["key"] for kv in test_engine.pull("/tmp/aviso/test/")] == [
+        "/tmp/aviso/test/test3",
+        "/tmp/aviso/test/test1",
+    ]
+    assert test_engine._latest_revision("/tmp/aviso/test") == rev + 1
+
+
+def test_compaction(test_engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    # another process writes to the journal with a small max size
+    journal = Journal(TEST_JOURNAL, max_size=1024)
+    first_rev = test_engine._latest_revision("/tmp/aviso/test") + 1
+    for i in range(100):
+        journal.append([(f"/tmp/aviso/test/test{i % 5}", str(i).encode())])
+    journal.append([], [("/tmp/aviso/test/test0", None)])
+    assert os.path.getsize(TEST_JOURNAL) < 2048
+
+    # the journal replaced is indexed again, only the last version of each key is kept
+    assert test_engine._latest_revision("/tmp/aviso/test") == journal.sync() == first_rev + 100
+    kvs = test_engine.pull("/tmp/aviso/test/")
+    assert [(kv["key"], kv["value"], kv["version"]) for kv in kvs] == [
+        (f"/tmp/aviso/test/test{i}", str(95 + i).encode(), 20) for i in range(4, 0, -1)
+    ]
+    with pytest.raises(EngineHistoryNotAvailableError):
+        test_engine.pull("/tmp/aviso/test/", rev=first_rev)
+    journal.close()
+
+
+def test_listen_from_date(test_engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append(key)
+
+    for i in range(3):
+        time.sleep(0.1)
+        if i == 1:
+            from_date = datetime.datetime.utcnow()
+        kvs = [{"key": f"/tmp/aviso/test/test{i}", "value": str(i)}]
+        assert test_engine.push_with_status(kvs, base_key="/tmp/aviso/test/", message=f"test{i}")
+    to_date = datetime.datetime.utcnow()
+
+    # the past notifications are replayed from the journal
+    assert test_engine.listen(["/tmp/aviso/test/"], callback, from_date=from_date, to_date=to_date)
+    time.sleep(1)
+    assert callback_list == ["/tmp/aviso/test/test1", "/tmp/aviso/test/test2"]
+
+
+def test_catchup(test_engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append(key)
+
+    assert test_engine.listen(["/tmp/aviso/test/"], callback)
+    time.sleep(0.5)
+    assert test_engine.push([{"key": "/tmp/aviso/test/test1", "value": "1"}])
+    time.sleep(1.5)
+    assert test_engine.stop()
+    test_engine._checkpoints.flush()
+
+    # the notifications sent while not listening are received once listening again
+    assert test_engine.push([{"key": "/tmp/aviso/test/test2", "value": "2"}])
+    test_engine.catchup = True
+    assert test_engine.listen(["/tmp/aviso/test/"], callback)
+    time.sleep(1.5)
+    assert callback_list == ["/tmp/aviso/test/test1", "/tmp/aviso/test/test2"]
+
+
+def test_listen_many_keys(test_engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append(key)
+
+    # all the keys are listened by a single thread
+    test_engine._checkpoints.flush()  # no pending checkpoint writing
+    # the threads left by the previous tests may end meanwhile, only the new ones are counted
+    threads = set(threading.enumerate())
+    assert test_engine.listen([f"/tmp/aviso/test/{i}/" for i in range(1000)], callback)
+    time.sleep(0.2)
+    assert len(set(threading.enumerate()) - threads) == 1
+
+    # the notifications are delivered as soon as the journal is modified, only to the keys matching
+    assert test_engine.push(
+        [{"key": "/tmp/aviso/test/10/a", "value": "1"}, {"key": "/tmp/aviso/test/999/b", "value": "2"}]
+    )
+    assert test_engine.push([{"key": "/tmp/aviso/test/other", "value": "3"}])
+    time.sleep(0.2)
+    assert sorted(callback_list) == ["/tmp/aviso/test/10/a", "/tmp/aviso/test/999/b"]
+
+    # the thread stops with the listening
+    assert test_engine.stop()
+    time.sleep(0.5)
+    assert len(set(threading.enumerate()) - threads) == 0
+
+
+def test_journal_path(test_engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    assert test_engine.journal.path == TEST_JOURNAL
+    # the journal configured is used if no path is passed
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.journal_path = TEST_JOURNAL
+    engine = FileBasedEngine(c.notification_engine, auth.Auth.get_auth(c))
+    assert engine.journal.path == TEST_JOURNAL
+    engine.journal.close()
+
+
+def test_import_files(test_engine):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    # the keys saved by the previous versions, one file per key
+    folder = "/tmp/aviso/test_import"
+    os.makedirs(f"{folder}/a", exist_ok=True)
+    with open(f"{folder}/a/1", "w") as f:
+        f.write("1")
+    with open(f"{folder}/2", "w") as f:
+        f.write("2")
+    try:
+        assert test_engine.import_files(folder) == 2
+        kvs = test_engine.pull(folder)
+        assert sorted((kv["key"], kv["value"]) for kv in kvs) == [(f"{folder}/2", b"2"), (f"{folder}/a/1", b"1")]
+    finally:
+        rmtree(folder)
@@ -0,0 +1,230 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import datetime
+import os
+import time
+import uuid
+
+import pytest
+
+from pyaviso import logger, user_config
+from pyaviso.authentication import auth
+from pyaviso.custom_exceptions import EngineHistoryNotAvailableError
+from pyaviso.engine import EngineType
+from pyaviso.engine.checkpoint_store import checkpoint_name
+from pyaviso.engine.engine_factory import EngineFactory
+from pyaviso.engine.in_memory_engine import InMemoryEngine
+
+
+def in_memory_engine(watch=False, page_size=None):
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.type = EngineType.IN_MEMORY
+    # each test has its own store
+    c.notification_engine.host = f"test-{uuid.uuid4()}"
+    c.notification_engine.polling_interval = 1
+    c.notification_engine.watch = watch
+    if page_size:
+        c.notification_engine.page_size = page_size
+    return EngineFactory(c.notification_engine, auth.Auth.get_auth(c)).create_engine()
+
+
+def test_create_engine():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    assert isinstance(engine, InMemoryEngine)
+    # the engines with the same host and port share the store
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.type = EngineType.IN_MEMORY
+    c.notification_engine.host = engine.host
+    other = EngineFactory(c.notification_engine, auth.Auth.get_auth(c)).create_engine()
+    assert other.store is engine.store
+
+
+def test_revisions():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    assert engine.push([{"key": "test/test0", "value": "0"}])
+    rev0 = engine._latest_revision("test/")
+    assert engine.push([{"key": "test/test1", "value": "1"}, {"key": "test/test0", "value": "2"}])
+    rev1 = engine._latest_revision("test/")
+    assert rev1 == rev0 + 1
+
+    kvs = {kv["key"]: kv for kv in engine.pull("test/")}
+    assert kvs["test/test0"]["value"] == b"2"
+    assert kvs["test/test0"]["version"] == 2
+    assert kvs["test/test0"]["create_rev"] == rev0
+    assert kvs["test/test0"]["mod_rev"] == rev1
+
+    # the past revisions are still readable
+    kvs = engine.pull("test/", rev=rev0)
+    assert len(kvs) == 1 and kvs[0]["value"] == b"0"
+    assert len(engine.pull("test/", min_rev=rev1)) == 2
+    assert len(engine.pull("test/", max_rev=rev0)) == 0
+    assert "value" not in engine.pull("test/test1", key_only=True, prefix=False)[0]
+
+    # a key deleted and created again starts a new version
+    assert len(engine.delete("test/test0", prefix=False)) == 1
+    assert engine.pull("test/test0", prefix=False) == []
+    assert engine.push([{"key": "test/test0", "value": "3"}])
+    kv = engine.pull("test/test0", prefix=False)[0]
+    assert kv["version"] == 1 and kv["create_rev"] == engine._latest_revision("test/")
+
+
+def test_pull_iter_pages():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine(page_size=2)
+    for i in range(5):
+        assert engine.push([{"key": f"test/test{i}", "value": str(i)}])
+    pages = []
+    _range = engine._range
+
+    def counted_range(*args, **kwargs):
+        kvs, more, revision = _range(*args, **kwargs)
+        pages.append(len(kvs))
+        return kvs, more, revision
+
+    engine._range = counted_range
+    assert [kv["key"] for kv in engine.pull_iter("test/")] == [f"test/test{i}" for i in range(5)]
+    assert pages == [2, 2, 1]
+
+
+def test_push_with_lease():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    assert engine.push_with_status([{"key": "test/test0", "value": "0"}], base_key="test/", message="test0", ttl=1)
+    assert engine.push_with_status([{"key": "test/test1", "value": "0"}], base_key="test/", message="test1")
+    assert len(engine.pull("test/")) == 3
+    rev = engine._latest_revision("test/")
+
+    time.sleep(1.5)
+
+    # the expiring key has gone at a new revision, not the status
+    assert len(engine.pull("test/")) == 2
+    assert engine._latest_revision("test/") == rev + 1
+
+
+def test_compaction():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    assert engine.push([{"key": "test/test0", "value": "0"}])
+    rev0 = engine._latest_revision("test/")
+    assert engine.push([{"key": "test/test0", "value": "1"}])
+    assert engine.delete("test/test0")
+    assert engine.push([{"key": "test/test1", "value": "1"}])
+    engine.compact(engine._latest_revision("test/"))
+
+    with pytest.raises(EngineHistoryNotAvailableError):
+        engine.pull("test/", rev=rev0)
+    # the deleted keys are dropped, the others keep their last version
+    assert [kv["key"] for kv in engine.pull("test/")] == ["test/test1"]
+    assert engine.store.range("test/test0") == ([], False, engine._latest_revision("test/"))
+
+
+def test_find_revisions():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    dates = []
+    revisions = []
+    for i in range(10):
+        dates.append(datetime.datetime.utcnow())
+        time.sleep(0.01)
+        assert engine.push_with_status([{"key": f"test/test{i}", "value": "0"}], base_key="test/", message=f"{i}")
+        revisions.append(engine._latest_revision("test/"))
+    assert engine.from_to_revisions("test/", from_date=dates[2], to_date=dates[5]) == (revisions[2], revisions[4])
+
+
+@pytest.mark.parametrize("watch", [False, True])
+def test_listen(watch):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine(watch=watch)
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append(key)
+
+    assert engine.listen(["test/"], callback)
+    time.sleep(0.5)
+    assert engine.push([{"key": "test/test1", "value": "1"}])
+    time.sleep(1.5)
+    assert callback_list == ["test/test1"]
+
+    assert engine.push([{"key": "test/test2", "value": "2"}])
+    time.sleep(1.5)
+    assert callback_list == ["test/test1", "test/test2"]
+
+    assert engine.stop()
+    assert engine.push([{"key": "test/test3", "value": "3"}])
+    time.sleep(1.5)
+    assert len(callback_list) == 2
+
+
+def test_listen_checkpoint_per_listener():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    engine.catchup = True
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append(key)
+
+    # the last revision processed is saved for the listener only
+    assert engine.listen(["test/"], callback, listener="a")
+    time.sleep(0.5)
+    assert engine.push([{"key": "test/test1", "value": "1"}])
+    time.sleep(1.5)
+    assert engine.stop()
+    assert callback_list == ["test/test1"]
+    assert engine._last_saved_revision(checkpoint_name("test/", "a")) == engine._latest_revision("test/") + 1
+    assert engine._last_saved_revision(checkpoint_name("test/", "b")) == -1
+    assert engine._last_saved_revision("test/") == -1
+
+    # the notifications received by another listener of the key are not skipped
+    time.sleep(1)  # the listening thread terminates
+    assert engine.push([{"key": "test/test2", "value": "2"}])
+    assert engine.listen(["test/"], lambda k, v: None, listener="b")
+    time.sleep(0.5)
+    assert engine.push([{"key": "test/test3", "value": "3"}])
+    time.sleep(1.5)
+    assert engine.stop()
+    time.sleep(1)
+    assert engine.listen(["test/"], callback, listener="a")
+    time.sleep(1.5)
+    assert engine.stop()
+    assert callback_list == ["test/test1", "test/test2", "test/test3"]
+    time.sleep(1)
+
+
+def test_watch_compacted():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine(watch=True)
+    assert engine.push([{"key": "test/test0", "value": "0"}])
+    rev0 = engine._latest_revision("test/")
+    assert engine.push([{"key": "test/test0", "value": "1"}])
+    assert engine.push([{"key": "test/test1", "value": "1"}])
+    engine.compact(engine._latest_revision("test/"))
+
+    with pytest.raises(EngineHistoryNotAvailableError):
+        next(engine._watch("test/", rev0))
+
+    # the listening resumed from a compacted revision retrieves the changes missed and then watches the new ones
+    callback_list = []
+
+    def callback(key, value):
+        callback_list.append((key, value))
+
+    engine.catchup = True
+    engine._save_last_revision("test/", rev0)
+    assert engine.listen(["test/"], callback)
+    time.sleep(0.5)
+    assert callback_list == [("test/test0", "1"), ("test/test1", "1")]
+    assert engine.push([{"key": "test/test2", "value": "2"}])
+    time.sleep(1.5)
+    assert callback_list[-1] == ("test/test2", "2")
+    assert engine.stop()
+    time.sleep(1)  # the listening thread terminates
@@ -0,0 +1,190 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+
+from pyaviso import logger, user_config
+from pyaviso.authentication import auth
+from pyaviso.engine import EngineType
+from pyaviso.engine.engine import RECENT_STATUSES
+from pyaviso.engine.engine_factory import EngineFactory
+from pyaviso.event_listeners.event_listener import EventListener
+from pyaviso.instrumentation import (
+    Histogram,
+    HistogramSink,
+    SinkType,
+    Stage,
+    instrumentation,
+)
+
+SCHEMA = {
+    "endpoint": [{"engine": ["in_memory"], "base": "/test/{destination}", "stem": "{step}"}],
+    "request": {
+        "destination": [{"type": "StringHandler", "required": True}],
+        "step": [{"type": "IntHandler"}],
+    },
+}
+
+
+@pytest.fixture
+def sink():
+    sink = HistogramSink()
+    instrumentation.add_sink(sink)
+    yield sink
+    instrumentation.remove_sinks()
+
+
+def in_memory_engine():
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.type = EngineType.IN_MEMORY
+    c.notification_engine.host = f"test-{uuid.uuid4()}"
+    c.notification_engine.polling_interval = 1
+    c.notification_engine.catchup = False
+    return EngineFactory(c.notification_engine, auth.Auth.get_auth(c)).create_engine()
+
+
+def test_histogram():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    h = Histogram()
+    assert h.stats()["count"] == 0 and h.percentile(50) is None
+    for i in range(1, 101):
+        h.add(i / 1000)
+    stats = h.stats()
+    assert stats["count"] == 100
+    assert stats["min"] == 0.001 and stats["max"] == 0.1
+    assert stats["mean"] == pytest.approx(0.0505)
+    # the percentiles are estimated within a factor of 2
+    assert 0.05 <= stats["p50"] <= 0.1
+    assert 0.09 <= stats["p90"] <= 0.1
+    assert stats["p99"] == 0.1
+
+
+def test_disabled():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    assert not instrumentation.enabled
+    assert instrumentation.start() is None
+    assert instrumentation.stop(Stage.RANGE, None) is None
+
+
+def test_listener_stages(sink):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    triggers = [{"type": "echo"}, {"type": "command"}]  # the second cannot be created
+    listener = EventListener("test", engine, {"destination": "A", "step": 1}, triggers, SCHEMA)
+
+    listener.callback("/test/A/1", "value")
+    listener.callback("/test/A/2", "value")
+
+    assert sink.histogram(Stage.NOTIFICATION, "test").count == 2
+    assert sink.counter(Stage.DISCARDED, "test") == 1
+    assert sink.histogram(Stage.TRIGGER_CREATION, "echo").count == 1
+    assert sink.histogram(Stage.TRIGGER_EXECUTION, "echo").count == 1
+    assert sink.counter(Stage.TRIGGER_FAILURE, "command") == 1
+    assert "notification:test" in sink.snapshot()
+
+
+def test_engine_stages(sink):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    received = []
+
+    assert engine.listen(["/test/"], lambda k, v: received.append(k))
+    time.sleep(0.5)
+    assert engine.push([{"key": "/test/A/1", "value": "1"}, {"key": "/test/A/2", "value": "2"}])
+    time.sleep(2)
+    assert engine.stop()
+
+    assert len(received) == 2
+    assert sink.histogram(Stage.RANGE).count > 0
+    assert sink.histogram(Stage.POLL_WAIT).count > 0
+    assert sink.histogram(Stage.DISPATCH).count == 1
+    assert sink.counter(Stage.RECEIVED) == 2
+
+
+def test_config(monkeypatch):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    try:
+        c = user_config.UserConfig(conf_path="tests/config.yaml")
+        assert c.instrumentation is None and not instrumentation.enabled
+
+        monkeypatch.setenv("AVISO_INSTRUMENTATION", "histogram")
+        c = user_config.UserConfig(conf_path="tests/config.yaml")
+        assert c.instrumentation == SinkType.HISTOGRAM
+        # the sink is added once per process
+        user_config.UserConfig(conf_path="tests/config.yaml")
+        assert len(instrumentation.sinks) == 1 and type(instrumentation.sinks[0]) is HistogramSink
+    finally:
+        instrumentation.remove_sinks()
+
+
+def test_recent_statuses():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    revisions = []
+    for i in range(RECENT_STATUSES + 2):
+        assert engine.push_with_status([{"key": f"/test/A/{i}", "value": str(i)}], base_key="/test/")
+        revisions.append(engine._latest_revision("/test/"))
+    status = engine.pull("/test/", prefix=False)[0]
+    submit_times = engine.submit_times(status)
+    # the status keeps the submission time of the last statuses
+    assert sorted(submit_times) == revisions[-RECENT_STATUSES - 1 :]
+    assert all(t <= time.time() for t in submit_times.values())
+
+
+def test_delivery_lag(sink):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    received = []
+    triggers = [{"type": "function", "function": lambda n: received.append(n)}]
+    listener = EventListener("test", engine, {"destination": "A"}, triggers, SCHEMA)
+
+    assert listener.listen()
+    time.sleep(0.5)
+    # the notifications submitted within a polling interval are retrieved with the status of the last one
+    for i in range(3):
+        assert engine.push_with_status([{"key": f"/test/A/{i}", "value": str(i)}], base_key="/test/A/")
+    assert engine.push([{"key": "/test/A/3", "value": "3"}])  # not stamped
+    time.sleep(2)
+    assert listener.stop()
+
+    assert len(received) == 4
+    assert sink.histogram(Stage.RECEIPT_LAG, "/test/A/").count == 3
+    lag = sink.histogram(Stage.DELIVERY_LAG, "test")
+    assert lag.count == 3
+    assert 0 < lag.min and lag.max < 3
+    # the same lag is recorded by listener and by key listened
+    assert sink.labels(Stage.LISTENER_DELIVERY_LAG) == [listener.name] and listener.name.startswith("test-")
+    assert sink.histogram(Stage.LISTENER_DELIVERY_LAG, listener.name).total == lag.total
+    assert sink.histogram(Stage.KEY_DELIVERY_LAG, "/test/A/").total == lag.total
+
+
+def test_delivery_lag_tasks(sink):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    submit_times = []
+
+    async def deliver(submit_time: float, key: str):
+        # the tasks interleave on the same thread, each one keeps the notification it is delivering
+        instrumentation.delivering(submit_time, key)
+        await asyncio.sleep(0.01)
+        submit_times.append(instrumentation.submit_time)
+        instrumentation.delivered("test", key)
+        instrumentation.delivering(None)
+
+    async def deliver_all():
+        await asyncio.gather(deliver(time.time() - 10, "/test/A/"), deliver(time.time() - 20, "/test/B/"))
+
+    asyncio.run(deliver_all())
+    assert len(submit_times) == 2 and submit_times[0] != submit_times[1]
+    assert 10 <= sink.histogram(Stage.KEY_DELIVERY_LAG, "/test/A/").max < 15
+    assert 20 <= sink.histogram(Stage.KEY_DELIVERY_LAG, "/test/B/").max < 25
+    assert instrumentation.submit_time is None
@@ -0,0 +1,68 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import os
+import types
+
+import pytest
+
+from pyaviso import logger
+from pyaviso.event_listeners.key_planner import KeyPlanner
+
+KEY_FORMAT = "/ec/mars/date={date},class={class},time={time:0>4},stream={stream}/"
+REQUEST = {
+    "date": [f"202101{d:02d}" for d in range(1, 31)],
+    "class": ["od", "ea"],
+    "time": [0, 600, 1200, 1800],
+    "stream": ["enfo", "oper", "waef", "wave", "scda"],
+}
+
+
+def test_expand():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    keys = KeyPlanner(KEY_FORMAT).expand(REQUEST)
+    assert isinstance(keys, types.GeneratorType)
+    keys = list(keys)
+    assert len(keys) == 30 * 2 * 4 * 5
+    assert keys[0] == "/ec/mars/date=20210101,class=od,time=0000,stream=enfo/"
+    assert keys[-1] == "/ec/mars/date=20210130,class=ea,time=1800,stream=scda/"
+    # the values are not evaluated
+    assert list(KeyPlanner("/test/{a}/").expand({"a": "[1, 2]"})) == ["/test/[1, 2]/"]
+    assert list(KeyPlanner("/test/{a}/").expand({"a": []})) == []
+    with pytest.raises(KeyError):
+        list(KeyPlanner(KEY_FORMAT).expand({"date": "20210101"}))
+
+
+def test_plan_small_request():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    request = {"date": "20210101", "class": "od", "time": 0, "stream": ["enfo", "enfo"]}
+    assert KeyPlanner(KEY_FORMAT).plan(request) == ["/ec/mars/date=20210101,class=od,time=0000,stream=enfo/"]
+    # two times are cheaper to listen as one prefix, the times estimated under it are 0000, 0200, 1000 and 1200
+    request["time"] = [0, 1200]
+    assert KeyPlanner(KEY_FORMAT).plan(request) == ["/ec/mars/date=20210101,class=od,time="]
+
+
+def test_plan_large_request():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    planner = KeyPlanner(KEY_FORMAT)
+    # the streams have no common structure, they are estimated as too many to be merged
+    assert planner.plan(REQUEST) == list(planner.expand(REQUEST))
+    # with a single stream the classes, times and streams of each date are listened as one prefix
+    request = dict(REQUEST, stream="enfo")
+    keys = planner.plan(request)
+    assert keys == [f"/ec/mars/date=202101{d:02d},class=" for d in range(1, 31)]
+    assert all(any(k.startswith(p) for p in keys) for k in planner.expand(request))
+
+
+def test_plan_first_field():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    planner = KeyPlanner("/ec/diss/{destination}/date={date},step={step}/")
+    request = {"destination": [f"D{i}" for i in range(30)], "date": "20210101", "step": list(range(0, 145, 3))}
+    keys = planner.plan(request)
+    # the steps are merged but the keys of the destinations are never merged together
+    assert keys == [f"/ec/diss/D{i}/date=20210101,step=" for i in range(30)]
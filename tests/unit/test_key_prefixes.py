@@ -0,0 +1,45 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import os
+
+from pyaviso import logger
+from pyaviso.engine.key_prefixes import (
+    estimate_values,
+    group_by_prefix,
+    listening_cost,
+    remove_covered,
+)
+
+DATES = [f"202101{d:02d}" for d in range(1, 31)]
+
+
+def test_remove_covered():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    assert remove_covered(["/a/b/", "/a/", "/b/", "/a/c/", "/b/"]) == ["/a/", "/b/"]
+    assert remove_covered([]) == []
+
+
+def test_group_by_prefix():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    groups = group_by_prefix(DATES, 7)
+    assert list(groups) == ["2021010", "2021011", "2021012", "2021013"]
+    assert len(groups["2021010"]) == 9 and groups["2021013"] == ["20210130"]
+    assert group_by_prefix(["1", "12", "2"], 2) == {"1": ["1", "12"], "2": ["2"]}
+
+
+def test_estimate_values():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    # the dates are estimated closely, the words are overestimated
+    assert estimate_values(DATES, 6) == 40
+    assert estimate_values(DATES, 7) == 10
+    assert estimate_values(DATES, 8) == 1
+    assert estimate_values(["enfo", "oper", "waef"], 0) == 54
+    # a range is worth 50 keys discarded
+    assert listening_cost(10, 400, 300) == 12
+    assert listening_cost(10, 300, 300) == 10
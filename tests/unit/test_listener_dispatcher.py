@@ -0,0 +1,98 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import itertools
+import os
+import time
+import uuid
+
+import pytest
+
+from pyaviso import logger, user_config
+from pyaviso.authentication import auth
+from pyaviso.custom_exceptions import EventListenerException
+from pyaviso.engine import EngineType
+from pyaviso.engine.engine_factory import EngineFactory
+from pyaviso.event_listeners.event_listener import EventListener
+from pyaviso.event_listeners.listener_dispatcher import ListenerDispatcher
+from pyaviso.event_listeners.listener_manager import ListenerManager
+
+SCHEMA = {
+    "endpoint": [{"engine": ["in_memory"], "base": "/test/{destination}", "stem": "date={date},step={step}"}],
+    "request": {
+        "destination": [{"type": "StringHandler", "required": True}],
+        "date": [{"type": "DateHandler", "canonic": "%Y%m%d"}],
+        "step": [{"type": "IntHandler"}],
+    },
+}
+
+
+def in_memory_engine():
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.type = EngineType.IN_MEMORY
+    c.notification_engine.host = f"test-{uuid.uuid4()}"
+    c.notification_engine.polling_interval = 1
+    c.notification_engine.catchup = False
+    return EngineFactory(c.notification_engine, auth.Auth.get_auth(c)).create_engine()
+
+
+def listener(engine, request, received=None):
+    triggers = [{"type": "function", "function": lambda n: received.append(n)}] if received is not None else []
+    return EventListener("test", engine, request, triggers, SCHEMA)
+
+
+def test_match():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    requests = [
+        {"destination": "A"},
+        {"destination": "A", "step": 1},
+        {"destination": "A", "step": [1, 2], "date": "20210101"},
+        {"destination": "B", "step": [2, 3]},
+        {"destination": ["A", "B"], "date": ["20210101", "20210102"]},
+        {"destination": "A", "step": []},
+    ]
+    listeners = [listener(engine, r) for r in requests]
+    dispatcher = ListenerDispatcher(listeners)
+    assert dispatcher.keys == ["/test/A/", "/test/B/"]
+    # the name does not depend on the order of the listeners, so the last revisions saved are found at the next run
+    assert dispatcher.name == ListenerDispatcher(list(reversed(listeners))).name
+    assert dispatcher.name != ListenerDispatcher(listeners[1:]).name
+
+    # the listeners matched are the ones whose own filter is passed
+    for dest, date, step in itertools.product(["A", "B", "C"], ["20210101", "20210102"], [1, 2, 3]):
+        key = f"/test/{dest}/date={date},step={step}"
+        expected = [ls for ls in listeners if ls._notification(key, "v") is not None]
+        assert [ls for ls, _ in dispatcher._notifications(key, "v")] == expected
+
+    with pytest.raises(EventListenerException):
+        dispatcher._notifications("/other/A/1", "v")
+
+
+def test_dispatch():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    engine = in_memory_engine()
+    received_a, received_b = [], []
+    listeners = [
+        listener(engine, {"destination": "A", "step": 1}, received_a),
+        listener(engine, {"destination": ["A", "B"], "step": [1, 2]}, received_b),
+    ]
+    manager = ListenerManager()
+    manager._add_listeners(listeners)
+    assert manager._run_listeners()
+    assert len(manager._dispatchers) == 1
+    time.sleep(0.5)
+
+    assert engine.push([{"key": f"/test/{d}/date=20210101,step={s}", "value": "v"} for d in "AB" for s in (1, 2, 3)])
+    time.sleep(2)
+    manager.cancel_listeners()
+
+    assert [n["request"] for n in received_a] == [{"destination": "A", "date": "20210101", "step": "1"}]
+    assert len(received_b) == 4
+    # each listener receives its own notification
+    assert received_a[0] is not received_b[0] and received_a[0]["request"] is not received_b[0]["request"]
@@ -0,0 +1,38 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import os
+
+from pyaviso import logger
+from pyaviso.engine.polling_scheduler import AdaptiveInterval, collapse_keys
+
+
+def test_collapse_keys():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    keys = ["/ec/diss/A/", "/ec/diss/A/x/", "/ec/diss/B/", "/ec/mars/date=1/", "/tmp/a/", "test"]
+    prefixes = collapse_keys(keys)
+    assert sorted(prefixes.keys()) == ["/ec/diss/A/", "/ec/diss/B/", "/ec/mars/date=1/", "/tmp/a/", "test"]
+    assert sorted(prefixes["/ec/diss/A/"]) == ["/ec/diss/A/", "/ec/diss/A/x/"]
+    # the sibling keys are not merged into their folder
+    assert sorted(collapse_keys(["/ec/diss/SCL", "/ec/diss/SCM"]).keys()) == ["/ec/diss/SCL", "/ec/diss/SCM"]
+
+
+def test_adaptive_interval():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    interval = AdaptiveInterval(1, 10)
+    # back off while no notification is found, up to the max
+    assert [interval.next(False) for _ in range(5)] == [2, 4, 8, 10, 10]
+    # back to the min as soon as notifications are found
+    assert interval.next(True) == 1
+    assert interval.next(False) == 2
+
+    # the jitter keeps the interval within the fraction requested
+    interval = AdaptiveInterval(4, 4, jitter=0.5)
+    intervals = [interval.next(False) for _ in range(100)]
+    assert all(2 <= i <= 6 for i in intervals)
+    assert len(set(intervals)) > 1
@@ -0,0 +1,98 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+import os
+import time
+
+import pytest
+
+from pyaviso import logger, user_config
+from pyaviso.authentication import auth
+from pyaviso.custom_exceptions import EngineException
+from pyaviso.engine.engine_factory import EngineFactory
+from pyaviso.engine.retry_policy import CircuitBreaker, CircuitState, RetryPolicy
+
+
+def test_circuit_breaker():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    breaker = CircuitBreaker("test", threshold=3, reset_timeout=0.2)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.wait_time() == 0
+
+    # the circuit opens after the threshold of consecutive failures
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert 0 < breaker.wait_time() <= 0.2
+
+    # once the timeout expires a single trial request is let through
+    time.sleep(0.25)
+    assert breaker.wait_time() == 0
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.wait_time() > 0
+
+    # the trial failing opens the circuit again, succeeding closes it
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    time.sleep(0.25)
+    assert breaker.wait_time() == 0
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+    metrics = breaker.metrics()
+    assert metrics["state"] == "closed"
+    assert metrics["open_count"] == 2
+    assert metrics["half_open_count"] == 2
+    assert metrics["closed_count"] == 1
+    assert metrics["rejected"] == 2
+
+
+def test_retry_policy():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    policy = RetryPolicy(CircuitBreaker("test", threshold=100), max_delay=8, base_delay=1)
+    # the delay is randomised up to an exponentially growing bound
+    for attempt, bound in [(0, 1), (1, 2), (2, 4), (3, 8), (10, 8)]:
+        delays = [policy.backoff(attempt) for _ in range(50)]
+        assert all(0 <= d <= bound for d in delays)
+        assert max(delays) > bound / 2
+
+    # the retries of an operation stop once its budget is exhausted
+    policy = RetryPolicy(CircuitBreaker("test", threshold=100), max_delay=0.1, budget=0.3)
+    retry = policy.start("test operation")
+    with pytest.raises(EngineException):
+        while True:
+            time.sleep(retry.failed("Unable to connect"))
+
+    # the operations not retried fail immediately while the circuit is open
+    policy = RetryPolicy(CircuitBreaker("test", threshold=1, reset_timeout=10), max_delay=1)
+    policy.check("test operation")
+    policy.start("test operation").failed("Unable to connect")
+    with pytest.raises(EngineException):
+        policy.check("test operation")
+
+
+def test_server_unreachable():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    c = user_config.UserConfig(conf_path="tests/config.yaml")
+    c.notification_engine.port = 1  # nothing is listening here
+    c.notification_engine.automatic_retry_delay = 1
+    c.notification_engine.retry_budget = 2
+    c.notification_engine.circuit_breaker_threshold = 2
+    engine = EngineFactory(c.notification_engine, auth.Auth.get_auth(c)).create_engine()
+
+    # the pull is retried within the budget, then it fails
+    with pytest.raises(EngineException):
+        engine.pull("test")
+    assert engine.circuit_breaker.state != CircuitState.CLOSED
+
+    # the push fails immediately while the requests are suspended
+    start = time.time()
+    with pytest.raises(EngineException):
+        engine.push([{"key": "test", "value": "1"}])
+    assert time.time() - start < 1
@@ -6,6 +6,7 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import asyncio
 import contextlib
 import logging
 import os
@@ -103,6 +104,34 @@ def test_function_trigger(conf, listener_factory, caplog):
     assert trigger_list.__len__() == 1
 
 
+def test_coroutine_function_trigger(conf, listener_factory, caplog):
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    # create a list that increments every time there is a new event
+    trigger_list = []
+
+    async def trigger_function(notification):
+        await asyncio.sleep(0.1)
+        trigger_list.append(notification["payload"])
+
+    trigger = {"type": "function", "function": trigger_function}
+
+    # create a listener that uses that trigger
+    request = {"country": "Italy"}
+    listener = {"event": "flight", "request": request, "triggers": [trigger]}
+    listeners = {"listeners": [listener]}
+
+    # parse it
+    listeners: list = listener_factory.create_listeners(listeners)
+    assert listeners.__len__() == 1
+    listener = listeners.pop()
+
+    # the coroutine runs both from the listening threads and from an event loop
+    listener.callback("/tmp/aviso/flight/20210101/italy/FCO/AZ203", "Landed")
+    assert trigger_list.__len__() == 1
+    asyncio.run(listener.callback_async("/tmp/aviso/flight/20210101/italy/FCO/AZ203", "Landed"))
+    assert trigger_list.__len__() == 2
+
+
 def test_logger_listener(conf, listener_factory, caplog):
     logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
     with caplog_for_logger(caplog):  # this allows to assert over the logging output
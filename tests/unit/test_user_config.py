@@ -12,7 +12,7 @@ import pytest
 
 from pyaviso import SYSTEM_FOLDER, logger
 from pyaviso.authentication import AuthType
-from pyaviso.engine import EngineType
+from pyaviso.engine import EngineType, LoadBalancing
 from pyaviso.event_listeners.listener_schema_parser import ListenerSchemaParserType
 from pyaviso.user_config import KEY_FILE, UserConfig
 
@@ -90,10 +90,62 @@ def clear_environment():
         os.environ.pop("AVISO_NO_FAIL")
     except KeyError:
         pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_WATCH")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_SERIALIZABLE_READS")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_POOL_SIZE")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_KEEP_ALIVE")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_MAX_RETRIES")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_PAGE_SIZE")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_CHECKPOINT_INTERVAL")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_JOURNAL_PATH")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_CONFIGURATION_POOL_SIZE")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_CONFIGURATION_KEEP_ALIVE")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_CONFIGURATION_MAX_RETRIES")
+    except KeyError:
+        pass
     try:
         os.environ.pop("AVISO_POLLING_INTERVAL")
     except KeyError:
         pass
+    try:
+        os.environ.pop("AVISO_MIN_POLLING_INTERVAL")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_POLLING_JITTER")
+    except KeyError:
+        pass
     try:
         os.environ.pop("AVISO_MAX_FILE_SIZE")
     except KeyError:
@@ -122,6 +174,30 @@ def clear_environment():
         os.environ.pop("AVISO_AUTOMATIC_RETRY_DELAY")
     except KeyError:
         pass
+    try:
+        os.environ.pop("AVISO_RETRY_BUDGET")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_CIRCUIT_BREAKER_THRESHOLD")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_ENDPOINTS")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_NOTIFICATION_LOAD_BALANCING")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_CONFIGURATION_ENDPOINTS")
+    except KeyError:
+        pass
+    try:
+        os.environ.pop("AVISO_CONFIGURATION_LOAD_BALANCING")
+    except KeyError:
+        pass
 
 
 def test_default():
@@ -130,14 +206,35 @@ def test_default():
     assert not c["debug"]
     assert c["notification_engine"]["timeout"] == 60
     assert c["notification_engine"]["polling_interval"] == 30
+    assert c["notification_engine"]["min_polling_interval"] == 1
+    assert c["notification_engine"]["polling_jitter"] == 0.1
     assert c["notification_engine"]["type"] == "etcd_rest"
     assert c["notification_engine"]["port"] == 2379
     assert c["notification_engine"]["host"] == "localhost"
     assert c["notification_engine"]["service"] == "aviso/v1"
     assert c["notification_engine"]["automatic_retry_delay"] == 15
     assert c["configuration_engine"]["automatic_retry_delay"] == 15
+    assert c["notification_engine"]["retry_budget"] is None
+    assert c["configuration_engine"]["retry_budget"] is None
+    assert c["notification_engine"]["circuit_breaker_threshold"] == 5
+    assert c["configuration_engine"]["circuit_breaker_threshold"] == 5
+    assert c["notification_engine"]["endpoints"] == []
+    assert c["notification_engine"]["load_balancing"] == "round_robin"
+    assert c["configuration_engine"]["endpoints"] == []
+    assert c["configuration_engine"]["load_balancing"] == "round_robin"
     assert not c["notification_engine"]["https"]
     assert c["notification_engine"]["catchup"]
+    assert not c["notification_engine"]["watch"]
+    assert c["notification_engine"]["serializable_reads"]
+    assert c["notification_engine"]["pool_size"] == 10
+    assert c["notification_engine"]["keep_alive"]
+    assert c["notification_engine"]["max_retries"] == 0
+    assert c["notification_engine"]["page_size"] == 1000
+    assert c["notification_engine"]["checkpoint_interval"] == 5
+    assert c["notification_engine"]["journal_path"] == "/tmp/aviso/journal"
+    assert c["configuration_engine"]["pool_size"] == 10
+    assert c["configuration_engine"]["keep_alive"]
+    assert c["configuration_engine"]["max_retries"] == 0
     assert c["configuration_engine"]["timeout"] == 60
     assert c["configuration_engine"]["port"] == 2379
     assert c["configuration_engine"]["host"] == "localhost"
@@ -225,6 +322,15 @@ def test_env_variables():
     os.environ["AVISO_NOTIFICATION_ENGINE"] = "ETCD_GRPC"
     os.environ["AVISO_NOTIFICATION_HTTPS"] = "True"
     os.environ["AVISO_NOTIFICATION_SERVICE"] = "aviso/v3"
+    os.environ["AVISO_NOTIFICATION_WATCH"] = "True"
+    os.environ["AVISO_NOTIFICATION_SERIALIZABLE_READS"] = "False"
+    os.environ["AVISO_NOTIFICATION_POOL_SIZE"] = "20"
+    os.environ["AVISO_NOTIFICATION_KEEP_ALIVE"] = "False"
+    os.environ["AVISO_NOTIFICATION_MAX_RETRIES"] = "3"
+    os.environ["AVISO_NOTIFICATION_PAGE_SIZE"] = "100"
+    os.environ["AVISO_NOTIFICATION_CHECKPOINT_INTERVAL"] = "1"
+    os.environ["AVISO_NOTIFICATION_JOURNAL_PATH"] = "/tmp/aviso/env_journal"
+    os.environ["AVISO_CONFIGURATION_MAX_RETRIES"] = "2"
     os.environ["AVISO_CONFIGURATION_HTTPS"] = "True"
     os.environ["AVISO_CONFIGURATION_ENGINE"] = "ETCD_GRPC"
     os.environ["AVISO_CONFIGURATION_HOST"] = "test_env"
@@ -235,9 +341,17 @@ def test_env_variables():
     os.environ["AVISO_USERNAME"] = "test_env"
     os.environ["AVISO_KEY_FILE"] = "tests/unit/fixtures/bad_key"
     os.environ["AVISO_POLLING_INTERVAL"] = "3"
+    os.environ["AVISO_MIN_POLLING_INTERVAL"] = "2"
+    os.environ["AVISO_POLLING_JITTER"] = "0.5"
     os.environ["AVISO_MAX_FILE_SIZE"] = "300"
     os.environ["AVISO_TIMEOUT"] = "null"
     os.environ["AVISO_AUTOMATIC_RETRY_DELAY"] = "60"
+    os.environ["AVISO_RETRY_BUDGET"] = "300"
+    os.environ["AVISO_CIRCUIT_BREAKER_THRESHOLD"] = "10"
+    os.environ["AVISO_NOTIFICATION_ENDPOINTS"] = "test_env2:3, test_env3:3"
+    os.environ["AVISO_NOTIFICATION_LOAD_BALANCING"] = "least_latency"
+    os.environ["AVISO_CONFIGURATION_ENDPOINTS"] = "test_env2:3"
+    os.environ["AVISO_CONFIGURATION_LOAD_BALANCING"] = "ROUND_ROBIN"
     os.environ["AVISO_AUTH_TYPE"] = "etcd"
     os.environ["AVISO_KEY_TTL"] = "20"
     os.environ["AVISO_USERNAME_FILE"] = "tests/unit/fixtures/username"
@@ -248,6 +362,8 @@ def test_env_variables():
     c = UserConfig()
     assert c.debug
     assert c.notification_engine.polling_interval == 3
+    assert c.notification_engine.min_polling_interval == 2
+    assert c.notification_engine.polling_jitter == 0.5
     assert c.notification_engine.type == EngineType.ETCD_GRPC
     assert c.configuration_engine.type == EngineType.ETCD_GRPC
     assert c.auth_type == AuthType.ETCD
@@ -258,9 +374,26 @@ def test_env_variables():
     assert c.notification_engine.timeout is None
     assert c.notification_engine.automatic_retry_delay == 60
     assert c.configuration_engine.automatic_retry_delay == 60
+    assert c.notification_engine.retry_budget == 300
+    assert c.configuration_engine.retry_budget == 300
+    assert c.notification_engine.circuit_breaker_threshold == 10
+    assert c.configuration_engine.circuit_breaker_threshold == 10
+    assert c.notification_engine.endpoints == ["test_env2:3", "test_env3:3"]
+    assert c.notification_engine.load_balancing == LoadBalancing.LEAST_LATENCY
+    assert c.configuration_engine.endpoints == ["test_env2:3"]
+    assert c.configuration_engine.load_balancing == LoadBalancing.ROUND_ROBIN
     assert c.notification_engine.https
     assert not c.notification_engine.catchup
     assert c.notification_engine.service == "aviso/v3"
+    assert c.notification_engine.watch
+    assert not c.notification_engine.serializable_reads
+    assert c.notification_engine.pool_size == 20
+    assert not c.notification_engine.keep_alive
+    assert c.notification_engine.max_retries == 3
+    assert c.notification_engine.page_size == 100
+    assert c.notification_engine.checkpoint_interval == 1
+    assert c.notification_engine.journal_path == "/tmp/aviso/env_journal"
+    assert c.configuration_engine.max_retries == 2
     assert c.configuration_engine.https
     assert c.configuration_engine.port == 3
     assert c.configuration_engine.host == "test_env"
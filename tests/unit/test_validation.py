@@ -6,6 +6,7 @@
 # granted to it by virtue of its status as an intergovernmental organisation
 # nor does it submit to any jurisdiction.
 
+import json
 import os
 
 from pyaviso import logger
@@ -16,6 +17,7 @@ from pyaviso.event_listeners.validation import (
     FloatHandler,
     IntHandler,
     RegexHandler,
+    RequestValidator,
     StringHandler,
     TimeHandler,
 )
@@ -210,3 +212,39 @@ def test_multiple_types():
     params = {"postproc": 12.5}
     EventListener._validate(params, schema)
     assert params["postproc"] == "12"
+
+
+def test_request_validator():
+    logger.debug(os.environ.get("PYTEST_CURRENT_TEST").split(":")[-1].split(" ")[0])
+    schema = {
+        "date": [{"type": "DateHandler", "canonic": "%Y%m%d"}],
+        "stream": [{"type": "EnumHandler", "values": ["enfo", "oper"]}],
+        "step": [{"type": "IntHandler", "range": [0, 10]}, {"type": "EnumHandler", "values": ["all"]}],
+    }
+    validator = RequestValidator.of(schema)
+    # the schema is compiled once, also when loaded again
+    assert RequestValidator.of(schema) is validator
+    assert RequestValidator.of(json.loads(json.dumps(schema))) is validator
+    assert RequestValidator.of(dict(schema, stream=[{"type": "EnumHandler", "values": ["enfo"]}])) is not validator
+
+    params = {"date": ["2021011", "20210102"], "stream": ["enfo", "oper"], "step": [1, "2"]}
+    validator.validate(params)
+    assert params == {"date": ["20210101", "20210102"], "stream": ["enfo", "oper"], "step": ["1", "2"]}
+    handlers = validator.handlers("step")
+    params = {"date": "20210101", "step": "all"}
+    validator.validate(params)
+    assert params == {"date": "20210101", "step": "all"}
+    assert validator.handlers("step") is handlers
+
+    # a list is valid only if all its values are valid for the same type
+    params = {"step": [1, "all"]}
+    try:
+        validator.validate(params)
+        assert False
+    except ValueError as e:
+        assert e.args[0] == "Value [1, 'all'] is not valid for key step"
+    try:
+        RequestValidator({"test": [{"type": "UnknownHandler"}]}).validate({"test": 1})
+        assert False
+    except NameError as e:
+        assert e.args[0] == "Type handler UnknownHandler not recognised"